@@ -1,20 +1,55 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 import atexit
+import importlib
 import os
 
 try:
-    from aworld.utils.import_package import import_package
-
-    import_package("dotenv", install_name="python-dotenv")
     from dotenv import load_dotenv
 
     sucess = load_dotenv()
     if not sucess:
         load_dotenv(os.path.join(os.getcwd(), ".env"))
+except ImportError:
+    pass
 except Exception as e:
     print(e)
 
+# Public API, the modules are imported on first access (PEP 562), `import aworld` stays cheap.
+_LAZY_ATTRS = {
+    "Runners": "aworld.runner",
+    "Agent": "aworld.agents.llm_agent",
+    "Swarm": "aworld.core.agent.swarm",
+    "Task": "aworld.core.task",
+    "TaskResponse": "aworld.core.task",
+    "Context": "aworld.core.context.base",
+    "Message": "aworld.core.event.base",
+    "Tool": "aworld.core.tool.base",
+    "AsyncTool": "aworld.core.tool.base",
+    "ConfigDict": "aworld.config.conf",
+    "AgentConfig": "aworld.config.conf",
+    "ModelConfig": "aworld.config.conf",
+    "TaskConfig": "aworld.config.conf",
+    "ToolConfig": "aworld.config.conf",
+    "RunConfig": "aworld.config.conf",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'aworld' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_name), name)
+    # cached, the next access does not go through `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 def cleanup():
     import re
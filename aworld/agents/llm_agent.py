@@ -27,12 +27,14 @@ from aworld.memory.main import MemoryFactory
 from aworld.memory.models import MemoryItem, MemoryAIMessage, MemoryMessage
 from aworld.models.llm import get_llm_model, acall_llm_model, acall_llm_model_stream, apply_chat_template
 from aworld.models.model_response import ModelResponse, ToolCall
+from aworld.models.stream_accumulator import StreamAccumulator
 from aworld.models.utils import tool_desc_transform, agent_desc_transform, usage_process
 from aworld.output import Outputs
-from aworld.output.base import MessageOutput, Output
+from aworld.output.base import MessageOutput, Output, TextDeltaOutput
+from aworld.runners.hook.hook_factory import HookFactory
 from aworld.runners.hook.hooks import HookPoint
 from aworld.sandbox.base import Sandbox
-from aworld.utils.common import sync_exec, nest_dict_counter
+from aworld.utils.common import sync_exec
 from aworld.utils.serialized_util import to_serializable
 
 
@@ -659,8 +661,7 @@ class Agent(BaseAgent[Observation, List[ActionModel]]):
                                      False) or self.conf.llm_config.llm_stream_call if self.conf.llm_config else False
             float_temperature = float(self.conf.llm_config.llm_temperature)
             if stream_mode:
-                llm_response = ModelResponse(
-                    id="", model="", content="", tool_calls=[])
+                accumulator = StreamAccumulator()
                 resp_stream = acall_llm_model_stream(
                     self.llm,
                     messages=messages,
@@ -672,18 +673,12 @@ class Agent(BaseAgent[Observation, List[ActionModel]]):
                     **kwargs
                 )
 
+                stream_text_delta = self.conf.get("stream_text_delta", False)
                 async for chunk in resp_stream:
-                    if chunk.content:
-                        llm_response.content += chunk.content
-                    if chunk.tool_calls:
-                        llm_response.tool_calls.extend(chunk.tool_calls)
-                    if chunk.error:
-                        llm_response.error = chunk.error
-                    llm_response.id = chunk.id
-                    llm_response.model = chunk.model
-                    llm_response.usage = nest_dict_counter(
-                        llm_response.usage, chunk.usage, ignore_zero=False)
-                    llm_response.message.update(chunk.message)
+                    accumulator.add(chunk)
+                    if chunk.content and stream_text_delta:
+                        await self.send_text_delta_output(chunk.content, message.context, kwargs.get("outputs"))
+                llm_response = accumulator.response()
 
             else:
                 llm_response = await acall_llm_model(
@@ -731,12 +726,10 @@ class Agent(BaseAgent[Observation, List[ActionModel]]):
 
     async def run_hooks(self, context: Context, hook_point: str):
         """Execute hooks asynchronously"""
-        from aworld.runners.hook.hook_factory import HookFactory
-        from aworld.core.event.base import Message
-
-        # Get all hooks for the specified hook point
-        all_hooks = HookFactory.hooks(hook_point)
-        hooks = all_hooks.get(hook_point, [])
+        # Get all hooks for the specified hook point, cached until a hook is registered
+        hooks = HookFactory.hooks_of(hook_point)
+        if not hooks:
+            return
 
         for hook in hooks:
             try:
@@ -747,7 +740,7 @@ class Agent(BaseAgent[Observation, List[ActionModel]]):
                     sender=self.id(),
                     session_id=context.session_id if hasattr(
                         context, 'session_id') else None,
-                    headers={"context": message.context}
+                    headers={"context": context}
                 )
 
                 # Execute hook
@@ -806,6 +799,20 @@ class Agent(BaseAgent[Observation, List[ActionModel]]):
         elif not self.event_driven and outputs:
             await outputs.add_output(llm_resp_output)
 
+    async def send_text_delta_output(self, delta: str, context: Context, outputs: Outputs = None):
+        """Add a text delta of the streamed LLM response to the task outputs, unread deltas are merged by the outputs.
+
+        Deltas are written to the outputs directly, not as messages of the event bus.
+        """
+        if outputs is None and context is not None and context.get_task() is not None:
+            outputs = context.outputs
+        if outputs is None:
+            return
+        await outputs.add_output(TextDeltaOutput(
+            delta=delta,
+            metadata={"agent_id": self.id(), "agent_name": self.name()}
+        ))
+
     def is_agent_finished(self, llm_response: ModelResponse, agent_result: AgentResult) -> bool:
         if not agent_result.is_call_tool:
             self._finished = True
@@ -34,6 +34,8 @@ class Checkpoint(BaseModel):
         version (str): Version of the checkpoint format.
         parent_id (Optional[str]): Parent checkpoint identifier, if any.
         namespace (str): Namespace for the checkpoint, default is 'aworld'.
+        delta (Optional[dict]): Changes from the parent checkpoint, `values` is empty for a delta checkpoint.
+        base_id (Optional[str]): Full checkpoint the delta chain starts from, if this is a delta checkpoint.
     """
     id: str = Field(..., description="Unique identifier for the checkpoint.")
     ts: str = Field(..., description="Timestamp of the checkpoint.")
@@ -42,6 +44,11 @@ class Checkpoint(BaseModel):
     version: int = Field(..., description="Version of the checkpoint format.")
     parent_id: Optional[str] = Field(default=None, description="Parent checkpoint identifier, if any.")
     namespace: str = Field(default="aworld", description="Namespace for the checkpoint, default is 'aworld'.")
+    delta: Optional[Dict[str, Any]] = Field(default=None, description="Changes from the parent checkpoint.")
+    base_id: Optional[str] = Field(default=None, description="Full checkpoint the delta chain starts from.")
+
+    def is_delta(self) -> bool:
+        return self.delta is not None
 
 def empty_checkpoint() -> Checkpoint:
     """
@@ -140,6 +147,15 @@ class BaseCheckpointRepository(ABC):
         """
         pass
 
+    def delete(self, checkpoint_id: str) -> None:
+        """
+        Delete a checkpoint by its unique identifier.
+
+        Args:
+            checkpoint_id (str): The unique identifier of the checkpoint.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support deleting a checkpoint.")
+
     @abstractmethod
     def get_by_session(self, session_id: str) -> Optional[Checkpoint]:
         """
@@ -0,0 +1,267 @@
+import copy
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
+
+from . import (
+    Checkpoint, CheckpointMetadata, BaseCheckpointRepository, VersionUtils, create_checkpoint
+)
+
+# Delta keys, only the non empty ones are present.
+SET = "set"
+DELETE = "del"
+APPEND = "append"
+NESTED = "nested"
+
+
+def diff_values(old: Dict[Any, Any], new: Dict[Any, Any], strict: bool = True) -> Dict[str, Any]:
+    """
+    Structural diff of two state dicts.
+
+    Changed and added keys are copied, nested dicts are diffed recursively and lists that grew are
+    stored as their appended tail when their previous items are unchanged. Without `strict` only the
+    last item before the tail is compared, in place changes of the other items are missed, for lists
+    that are only appended to.
+
+    Args:
+        old (dict): Previous state, not modified.
+        new (dict): Current state, not modified.
+        strict (bool): Compare all the previous items of the lists.
+    Returns:
+        dict: The delta, empty if nothing changed.
+    """
+    sets, appends, nested = {}, {}, {}
+    for key, value in new.items():
+        if key not in old:
+            sets[key] = copy.deepcopy(value)
+            continue
+        prev = old[key]
+        if prev is value:
+            # the old state is a private copy, the same object is an immutable value
+            continue
+        if isinstance(value, dict) and isinstance(prev, dict):
+            sub = diff_values(prev, value, strict)
+            if sub:
+                nested[key] = sub
+        elif isinstance(value, list) and isinstance(prev, list):
+            size = len(prev)
+            if len(value) >= size and _is_prefix(prev, value, strict):
+                if len(value) > size:
+                    appends[key] = copy.deepcopy(value[size:])
+            else:
+                sets[key] = copy.deepcopy(value)
+        elif type(prev) is not type(value) or prev != value:
+            sets[key] = copy.deepcopy(value)
+
+    delta = {}
+    deleted = [key for key in old if key not in new]
+    if sets:
+        delta[SET] = sets
+    if deleted:
+        delta[DELETE] = deleted
+    if appends:
+        delta[APPEND] = appends
+    if nested:
+        delta[NESTED] = nested
+    return delta
+
+
+def _is_prefix(prev: List[Any], value: List[Any], strict: bool) -> bool:
+    if not prev:
+        return True
+    if strict:
+        return value[:len(prev)] == prev
+    return value[len(prev) - 1] == prev[-1]
+
+
+def apply_delta(values: Dict[Any, Any], delta: Dict[str, Any]) -> Dict[Any, Any]:
+    """
+    Apply a delta in place, the values of the delta are copied.
+
+    Args:
+        values (dict): State the delta was computed from, updated in place.
+        delta (dict): Delta of `diff_values`.
+    Returns:
+        dict: The updated `values`.
+    """
+    for key in delta.get(DELETE, ()):
+        values.pop(key, None)
+    for key, value in delta.get(SET, {}).items():
+        values[key] = copy.deepcopy(value)
+    for key, tail in delta.get(APPEND, {}).items():
+        values[key].extend(copy.deepcopy(tail))
+    for key, sub in delta.get(NESTED, {}).items():
+        apply_delta(values[key], sub)
+    return values
+
+
+class DeltaCheckpointer:
+    """
+    Saves the states of sessions as a full base checkpoint followed by delta checkpoints.
+
+    A delta only holds the changed keys and the appended list tails, nothing else of the state is copied.
+    A full base is written every `full_every` checkpoints, restoring replays the deltas of the chain over
+    its base, and `compact` folds a chain into a new base.
+
+    By default a list that grew is compared on its last previous item only, so a save costs the size of the
+    change plus the number of keys, not the length of the lists; items modified in place are then missed.
+    `strict` compares all the previous items, a save then costs the size of the whole state.
+    The last state of at most `max_sessions` sessions is kept, the next save of an evicted session is a base.
+
+    Examples:
+        >>> checkpointer = DeltaCheckpointer(InMemoryCheckpointRepository())
+        >>> checkpoint = checkpointer.save(context.to_dict(), CheckpointMetadata(session_id="s"))
+        >>> values = checkpointer.restore(checkpoint.id)
+    """
+
+    def __init__(self,
+                 repository: BaseCheckpointRepository,
+                 full_every: int = 20,
+                 strict: bool = False,
+                 max_sessions: int = 256):
+        """
+        Args:
+            repository (BaseCheckpointRepository): Where the checkpoints are stored, `get` is used to replay.
+            full_every (int): Number of checkpoints of a chain, base included.
+            strict (bool): Compare all the previous items of the lists that grew, see `diff_values`.
+            max_sessions (int): Number of sessions whose last state is kept, least recently saved are evicted.
+        """
+        self.repository = repository
+        self.full_every = max(full_every, 1)
+        self.strict = strict
+        self.max_sessions = max(max_sessions, 1)
+        # session id -> (last checkpoint, private copy of its state, length of its chain), in save order
+        self._last: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def save(self, values: Dict[str, Any], metadata: CheckpointMetadata, namespace: str = 'aworld') -> Checkpoint:
+        """
+        Store the state as a delta of the last checkpoint of the session, or as a full base.
+
+        Args:
+            values (dict): Current state, not modified.
+            metadata (CheckpointMetadata): Metadata for the checkpoint.
+            namespace (str): Namespace for the checkpoint.
+        Returns:
+            Checkpoint: The stored checkpoint.
+        """
+        session_id = metadata.session_id
+        last = self._last.get(session_id)
+        if last is None or last[2] >= self.full_every:
+            previous = last[0] if last else self.repository.get_by_session(session_id)
+            return self._save_base(values, metadata, namespace,
+                                   version=VersionUtils.get_next_version(previous.version) if previous else 1,
+                                   parent_id=previous.id if previous else None)
+
+        parent, shadow, length = last
+        delta = diff_values(shadow, values, self.strict)
+        checkpoint = create_checkpoint(values={},
+                                       metadata=metadata,
+                                       parent_id=parent.id,
+                                       version=VersionUtils.get_next_version(parent.version),
+                                       namespace=namespace)
+        checkpoint.delta = delta
+        checkpoint.base_id = parent.base_id or parent.id
+        self.repository.put(checkpoint)
+        self._remember(session_id, (checkpoint, apply_delta(shadow, delta), length + 1))
+        return checkpoint
+
+    def _remember(self, session_id: str, last: tuple):
+        self._last[session_id] = last
+        self._last.move_to_end(session_id)
+        while len(self._last) > self.max_sessions:
+            self._last.popitem(last=False)
+
+    def discard(self, session_id: str):
+        """Drop the last state kept for a session, e.g. when its checkpoints are deleted."""
+        self._last.pop(session_id, None)
+
+    def _save_base(self,
+                   values: Dict[str, Any],
+                   metadata: CheckpointMetadata,
+                   namespace: str,
+                   version: int,
+                   parent_id: Optional[str]) -> Checkpoint:
+        checkpoint = create_checkpoint(values=copy.deepcopy(values),
+                                       metadata=metadata,
+                                       parent_id=parent_id,
+                                       version=version,
+                                       namespace=namespace)
+        self.repository.put(checkpoint)
+        # private copy of the state, the next delta is computed against it
+        self._remember(metadata.session_id, (checkpoint, copy.deepcopy(values), 1))
+        return checkpoint
+
+    def restore(self, checkpoint: Union[str, Checkpoint]) -> Optional[Dict[str, Any]]:
+        """
+        State of a checkpoint, the deltas are replayed over the base of the chain.
+
+        Args:
+            checkpoint (str | Checkpoint): The checkpoint or its identifier.
+        Returns:
+            Optional[dict]: A new copy of the state, None if the checkpoint is not found.
+        """
+        if isinstance(checkpoint, str):
+            checkpoint = self.repository.get(checkpoint)
+        if checkpoint is None:
+            return None
+
+        chain = []
+        while checkpoint.is_delta():
+            chain.append(checkpoint.delta)
+            parent = self.repository.get(checkpoint.parent_id)
+            if parent is None:
+                raise ValueError(f"Parent checkpoint {checkpoint.parent_id} of {checkpoint.id} is not found.")
+            checkpoint = parent
+
+        values = copy.deepcopy(checkpoint.values)
+        for delta in reversed(chain):
+            apply_delta(values, delta)
+        return values
+
+    def restore_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        State of the latest checkpoint of a session.
+
+        Args:
+            session_id (str): The session identifier.
+        Returns:
+            Optional[dict]: A new copy of the state, None if the session has no checkpoint.
+        """
+        last = self._last.get(session_id)
+        if last:
+            return copy.deepcopy(last[1])
+        return self.restore(self.repository.get_by_session(session_id))
+
+    def compact(self, session_id: str, prune: bool = True) -> Optional[Checkpoint]:
+        """
+        Fold the delta chain of the latest checkpoint of a session into a new full base.
+
+        Args:
+            session_id (str): The session identifier.
+            prune (bool): Delete the checkpoints of the folded chain, if the repository supports it.
+        Returns:
+            Optional[Checkpoint]: The new base, None if the session has no checkpoint.
+        """
+        last = self._last.get(session_id)
+        latest = last[0] if last else self.repository.get_by_session(session_id)
+        if latest is None:
+            return None
+        if not latest.is_delta():
+            return latest
+
+        values = last[1] if last else self.restore(latest)
+        chain = []
+        checkpoint = latest
+        while checkpoint is not None:
+            chain.append(checkpoint.id)
+            checkpoint = self.repository.get(checkpoint.parent_id) if checkpoint.is_delta() else None
+
+        base = self._save_base(values, latest.metadata, latest.namespace,
+                               version=VersionUtils.get_next_version(latest.version),
+                               parent_id=None if prune else latest.id)
+        if prune:
+            try:
+                for checkpoint_id in chain:
+                    self.repository.delete(checkpoint_id)
+            except NotImplementedError:
+                pass
+        return base
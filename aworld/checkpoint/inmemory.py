@@ -90,6 +90,18 @@ class InMemoryCheckpointRepository(BaseCheckpointRepository):
         last_id = ids[-1]
         return self._checkpoints.get(last_id)
 
+    def delete(self, checkpoint_id: str) -> None:
+        """
+        Delete a checkpoint by its unique identifier.
+        Args:
+            checkpoint_id (str): The unique identifier of the checkpoint.
+        """
+        checkpoint = self._checkpoints.pop(checkpoint_id, None)
+        if checkpoint and checkpoint.metadata.session_id in self._session_index:
+            ids = self._session_index[checkpoint.metadata.session_id]
+            if checkpoint_id in ids:
+                ids.remove(checkpoint_id)
+
     def delete_by_session(self, session_id: str) -> None:
         """
         Delete all checkpoints related to a session.
@@ -11,7 +11,7 @@ from aworld.output import (
     WorkSpace,
 )
 from aworld.output.artifact import Artifact, ArtifactType
-from aworld.output.base import StepOutput, ToolResultOutput
+from aworld.output.base import StepOutput, TextDeltaOutput, ToolResultOutput
 from aworld.output.utils import consume_content
 from abc import ABC, abstractmethod
 from typing_extensions import override
@@ -248,6 +248,10 @@ class AWorldWebAgentUI(AworldUI):
         else:
             return f"\n\n{output.name} ❓❓❓UNKNOWN#{output.status} {emptyLine}"
 
+    @override
+    async def text_delta(self, output: TextDeltaOutput):
+        return output.delta
+
     @override
     async def custom_output(self, output: Output):
         return output.data
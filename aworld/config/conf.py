@@ -206,6 +206,8 @@ class AgentConfig(BaseConfig):
     exit_on_failure: bool = False
     human_tools: List[str] = []
     skill_configs: Dict[str, Any] = None
+    # emit the text deltas of a streamed llm response (`llm_stream_call`) to the task outputs
+    stream_text_delta: bool = False
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -242,7 +244,11 @@ class TaskConfig(BaseConfig):
     task_id: str = str(uuid.uuid4())
     task_name: str | None = None
     max_steps: int = 100
+    # maximum number of agents of a workflow running concurrently
+    max_parallel_agents: int = 8
     trajectory_strategy: ClassVar[Type['TrajectoryStrategy']] = None
+    # TrajectorySink instance receiving trajectory rows as agent steps complete
+    trajectory_sink: Any = None
     stream: bool = False
     resp_carry_context: bool = True
     resp_carry_raw_llm_resp: bool = False
@@ -300,6 +306,10 @@ class DataLoaderConfig(BaseConfig):
     seed: Optional[int] = None
     batch_sampler: Optional[Iterable[List[int]]] = None
     collate_fn: Optional[Callable[..., Any]] = None
+    num_workers: int = 0
+    prefetch_factor: Optional[int] = None
+    # thread or process
+    worker_mode: str = "thread"
 
 
 class DatasetConfig(BaseConfig):
@@ -192,6 +192,7 @@ class BaseAgent(Generic[INPUT, OUTPUT]):
 
     def run(self, message: Message, **kwargs) -> Message:
         message.context.agent_info.current_agent_id = self.id()
+        message.context.mark_changed()
         task = message.context.get_task()
         if task.conf.get("run_mode") == TaskRunMode.INTERACTIVAE:
             agent = task.swarm.ordered_agents[0] if task.agent is None else task.agent
@@ -231,6 +232,7 @@ class BaseAgent(Generic[INPUT, OUTPUT]):
 
     async def async_run(self, message: Message, **kwargs) -> Message:
         message.context.agent_info.current_agent_id = self.id()
+        message.context.mark_changed()
         task = message.context.get_task()
         if task.conf.get("run_mode") == TaskRunMode.INTERACTIVAE:
             agent = task.swarm.ordered_agents[0] if task.agent is None else task.agent
@@ -457,6 +457,8 @@ class AgentGraph:
         self.successor = successor if successor else {}
         self.has_cycle = False
         self.root_agent = root_agent
+        # agent ids of each topological level, agents in the same level have no dependency on each other
+        self.levels: List[List[str]] = []
 
     def topological_sequence(self) -> List[List[str]]:
         """Obtain the agent sequence of topology, and be able to determine whether the topology has cycle during the process.
@@ -491,6 +493,7 @@ class AgentGraph:
             # sequence may be incomplete
             res.clear()
             self.has_cycle = True
+        self.levels = res
 
         if not self.ordered_agents:
             for agent_ids in res:
@@ -39,6 +39,14 @@ DEFAULT_VALUE = None
 SKILL_LIST_KEY = "skill_list"
 ACTIVE_SKILLS_KEY = "active_skills"
 
+
+class StateScopes:
+    """Parts of the context state with a version, see `ApplicationContext.get_state_version`."""
+    WORKING_STATE = "working_state"
+    FACTS = "facts"
+    TASK = "task"
+    WORKSPACE = "workspace"
+
 class AmniContext(Context):
     """
     AmniContext - Ant Mind Neuro-Intelligence Context Engine
@@ -462,8 +470,11 @@ class ApplicationContext(AmniContext):
         self.task_state = task_state
         self._workspace = workspace
         self._parent = parent
+        # generation counter cell shared with the parent, see `get_hierarchy_generation`
+        self._generation = parent._hierarchy_generation() if parent is not None else [0]
         self._config = context_config
         self._working_dir = working_dir
+        self._state_versions: Dict[str, int] = {}
 
     def get_config(self) -> AmniContextConfig:
         return self._config
@@ -500,6 +511,8 @@ class ApplicationContext(AmniContext):
                     user_profiles = await get_context_manager().get_user_profiles(task_input)
                     context.task_state.working_state.user_profiles = user_profiles
                     logger.info(f"[CONTEXT RESTORE]user_profiles: len = {len(context.task_state.working_state.user_profiles) if context.task_state.working_state.user_profiles else 0}")
+                    context.bump_state_version(StateScopes.TASK)
+                    context.bump_state_version(StateScopes.WORKING_STATE)
 
                     context._workspace = workspace
 
@@ -585,6 +598,7 @@ class ApplicationContext(AmniContext):
                 status='INIT'
             )
             self.task_state.working_state.sub_task_list.append(sub_task)
+        self.bump_state_version(StateScopes.TASK)
 
     async def build_sub_task_context(self, sub_task_input: TaskInput,
                                      sub_task_history: list[MemoryMessage] = None,
@@ -691,6 +705,7 @@ class ApplicationContext(AmniContext):
         if sub_task_context.task_state.working_state.kv_store:
             self.task_state.working_state.kv_store.update(
                 sub_task_context.task_state.working_state.kv_store)
+            self.bump_state_version(StateScopes.WORKING_STATE)
 
         # merge sub task status & result
         sub_task_id = sub_task_context.task_state.task_input.task_id
@@ -725,6 +740,7 @@ class ApplicationContext(AmniContext):
 
     def set_agent_state(self, agent_id: str, agent_state: ApplicationAgentState):
         self.task_state.set_agent_state(agent_id, agent_state)
+        self.bump_state_version(StateScopes.WORKING_STATE)
 
     def get_agent_state(self, agent_id: str) -> Optional[ApplicationAgentState]:
         return self.task_state.get_agent_state(agent_id)
@@ -755,6 +771,7 @@ class ApplicationContext(AmniContext):
         if task_id is not None:
             self._task_id = task_id
             self.task_state.task_input.task_id = task_id
+            self.bump_state_version(StateScopes.TASK)
 
     @property
     def task_input(self):
@@ -765,6 +782,7 @@ class ApplicationContext(AmniContext):
         if self._task:
             self._task.input = new_task_input
         self.task_state.task_input.task_content = new_task_input
+        self.bump_state_version(StateScopes.TASK)
 
     @property
     def origin_user_input(self):
@@ -773,6 +791,7 @@ class ApplicationContext(AmniContext):
     @origin_user_input.setter
     def origin_user_input(self, new_origin_user_input: str):
         self.task_state.task_input.origin_user_input = new_origin_user_input
+        self.bump_state_version(StateScopes.TASK)
 
     @property
     def task_output(self) -> str:
@@ -781,6 +800,7 @@ class ApplicationContext(AmniContext):
     @task_output.setter
     def task_output(self, result):
         self.task_state.task_output.result = result
+        self.bump_state_version(StateScopes.TASK)
 
     @property
     def task_status(self) -> Literal['INIT', 'PROCESSING', 'SUCCESS', 'FAILED']:
@@ -789,6 +809,7 @@ class ApplicationContext(AmniContext):
     @task_status.setter
     def task_status(self, status: Literal['INIT', 'PROCESSING', 'SUCCESS', 'FAILED']):
         self.task_state.working_state.status = status
+        self.bump_state_version(StateScopes.TASK)
 
     @property
     def task_input_object(self) -> TaskInput:
@@ -1089,27 +1110,40 @@ class ApplicationContext(AmniContext):
                 if value is not None:
                     return str(value)
 
-            # 2. get key from agent context
-            agent_state = None
-            if context.task_state.working_state and context.task_state.working_state.agent_states:
-                agent_state = context.task_state.working_state.agent_states.get(agent_id)
-            value = context.get_from_agent_state(key, agent_state)
-            if value is not None:
-                return value
-
-            # 3. get key from Context parent
-            value = context.get_from_context_hierarchy(key, context, recursive)
-            if value is not None and value != DEFAULT_VALUE:
-                return value
-
-            result = str(value) if value is not None else DEFAULT_VALUE
-            logger.debug(f"Field retrieval: '{key}' -> '{result}'")
-            return result
+            # 2-3. agent context and context parents, memoized until the context hierarchy is written
+            cache = context._field_cache()
+            cache_key = (key, recursive, agent_id)
+            if cache_key not in cache:
+                cache[cache_key] = ApplicationContext._resolve_logical_schema_field(key, context, recursive, agent_id)
+            # callers get their own container, changing it must not change the memoized value
+            value = cache[cache_key]
+            if isinstance(value, (list, dict, set)):
+                return copy.copy(value)
+            return value
 
         except Exception as e:
             logger.warning(f"Error getting field '{key}': {e} {traceback.format_exc()}")
             return DEFAULT_VALUE
 
+    @staticmethod
+    def _resolve_logical_schema_field(key: str, context: "ApplicationContext", recursive: bool, agent_id: str):
+        # 2. get key from agent context
+        agent_state = None
+        if context.task_state.working_state and context.task_state.working_state.agent_states:
+            agent_state = context.task_state.working_state.agent_states.get(agent_id)
+        value = context.get_from_agent_state(key, agent_state)
+        if value is not None:
+            return value
+
+        # 3. get key from Context parent
+        value = context.get_from_context_hierarchy(key, context, recursive)
+        if value is not None and value != DEFAULT_VALUE:
+            return value
+
+        result = str(value) if value is not None else DEFAULT_VALUE
+        logger.debug(f"Field retrieval: '{key}' -> '{result}'")
+        return result
+
     ####################### Context Long Term Memory Processor Event #######################
 
     async def pub_and_wait_system_prompt_event(self, system_prompt: str, user_query: str, agent_id: str,
@@ -1341,6 +1375,7 @@ class ApplicationContext(AmniContext):
 
     def put(self, key: str, value: Any, namespace: str = "default") -> None:
         logger.debug(f"{id(self)}#put key: {key}, value: {value}, namespace: {namespace}")
+        self.bump_state_version(StateScopes.WORKING_STATE)
         if self._is_default_namespace(namespace):
             self.task_state.working_state.kv_store[key] = value
             return
@@ -1364,6 +1399,7 @@ class ApplicationContext(AmniContext):
     async def add_knowledge(self, knowledge: Artifact, namespace: str = "default", index=True) -> None:
         logger.debug(f"add knowledge #{knowledge.artifact_id} start")
         self._get_working_state(namespace).save_knowledge(knowledge)
+        self.bump_state_version(StateScopes.WORKING_STATE)
         if self._workspace:
             await self._workspace.add_artifact(knowledge, index=index)
             logger.info(f"add knowledge to#{knowledge.artifact_id} workspace finished")
@@ -1371,6 +1407,7 @@ class ApplicationContext(AmniContext):
 
     async def update_knowledge(self, knowledge: Artifact, namespace: str = "default") -> None:
         self._get_working_state(namespace).save_knowledge(knowledge)
+        self.bump_state_version(StateScopes.WORKING_STATE)
         if self._workspace:
             await self._workspace.update_artifact(artifact_id=knowledge.artifact_id, content=knowledge.content)
 
@@ -1467,12 +1504,14 @@ class ApplicationContext(AmniContext):
     def add_history_message(self, memory_message: MemoryMessage, namespace: str = "default") -> None:
         # Hook call processor such as tool_node_with_pruning
         self._get_working_state(namespace).history_messages.append(memory_message)
+        self.bump_state_version(StateScopes.WORKING_STATE)
 
 
     ################################ Long Term Memory #####################################
 
     def add_fact(self, fact: Fact, namespace: str = "default", **kwargs):
         self.root._get_working_state(namespace).facts.append(fact)
+        self.root.bump_state_version(StateScopes.FACTS)
 
     async def retrival_facts(self, namespace: str = "default", **kwargs) -> Optional[list[Fact]]:
         if not self._get_working_state(namespace):
@@ -1592,6 +1631,59 @@ class ApplicationContext(AmniContext):
                                                                 top_k=top_k)
         return None
 
+    ####################### Context State Version #######################
+
+    def bump_state_version(self, scope: str) -> None:
+        """Mark a part of the context state as changed, prompt sections rendered from it are re-rendered and the
+        fields resolved in the context hierarchy are resolved again."""
+        versions = self.__dict__.setdefault("_state_versions", {})
+        versions[scope] = versions.get(scope, 0) + 1
+        self._hierarchy_generation()[0] += 1
+
+    def get_hierarchy_generation(self) -> int:
+        """Generation of the context hierarchy, shared by the root and all its sub contexts and changed whenever
+        any of them is written (`bump_state_version`). Field resolutions are memoized per generation."""
+        return self._hierarchy_generation()[0]
+
+    @property
+    def revision(self) -> int:
+        # the writes of the task state bump the hierarchy generation
+        return super().revision + self.get_hierarchy_generation()
+
+    def _hierarchy_generation(self) -> List[int]:
+        # one counter cell for the whole tree, taken from the parent on first use
+        generation = self.__dict__.get("_generation")
+        if generation is None:
+            generation = self._parent._hierarchy_generation() if self.__dict__.get("_parent") is not None else [0]
+            self.__dict__["_generation"] = generation
+        return generation
+
+    def _field_cache(self) -> Dict[tuple, Any]:
+        """Resolved logical schema fields of this context, dropped when the hierarchy generation changes."""
+        generation = self._hierarchy_generation()[0]
+        cache = self.__dict__.get("_resolved_fields")
+        if cache is None or cache[0] != generation:
+            cache = (generation, {})
+            self.__dict__["_resolved_fields"] = cache
+        return cache[1]
+
+    def get_state_version(self, scope: str) -> Any:
+        """Version of a part of the context state (see `StateScopes`), changes whenever that part is written.
+
+        Workspace artifacts are versioned by the workspace update time, facts by the root context. The other
+        parts include the versions of the ancestors, a sub context reads the state of its parents through.
+        """
+        if scope == StateScopes.WORKSPACE:
+            if not self._workspace:
+                return None
+            return self._workspace.workspace_id, self._workspace.updated_at
+        if scope == StateScopes.FACTS and self._parent is not None:
+            return self.root.get_state_version(scope)
+        version = self.__dict__.get("_state_versions", {}).get(scope, 0)
+        if self._parent is not None:
+            return version, self._parent.get_state_version(scope)
+        return version
+
     ####################### Context Internal Method #######################
 
     async def build_knowledge_context(self, namespace: str = "default", search_filter:dict = None, top_k=20) -> str:
@@ -1618,6 +1710,7 @@ class ApplicationContext(AmniContext):
                 for key, value in other_context.task_state.items():
                     # If key already exists, the value will be overwritten
                     self.task_state[key] = value
+                self.bump_state_version(StateScopes.WORKING_STATE)
             except Exception as e:
                 logger.warning(f"Failed to merge task_state: {e}")
 
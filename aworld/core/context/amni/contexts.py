@@ -7,6 +7,7 @@ from typing import Optional
 from pydantic import BaseModel, ConfigDict
 
 from aworld.checkpoint import create_checkpoint, CheckpointMetadata, Checkpoint, VersionUtils
+from aworld.checkpoint.delta import DeltaCheckpointer
 from aworld.checkpoint.inmemory import InMemoryCheckpointRepository
 from aworld.core.memory import AgentMemoryConfig
 from aworld.logs.util import logger
@@ -25,11 +26,19 @@ class ContextManager(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     checkpoint_repo: InMemoryCheckpointRepository = None
+    # checkpoints saved as deltas of the last one, in its repository; the workspace repository keeps the
+    # latest checkpoint of a session only, the chain of a delta can't be replayed from it
+    delta_checkpointer: Optional[DeltaCheckpointer] = None
 
-    def __init__(self, checkpoint_repo: Optional[InMemoryCheckpointRepository] = None):
+    def __init__(self,
+                 checkpoint_repo: Optional[InMemoryCheckpointRepository] = None,
+                 delta_checkpointer: Optional[DeltaCheckpointer] = None):
         super().__init__()
         from aworld.memory.main import MemoryFactory
         self._memory = MemoryFactory.instance()
+        self.delta_checkpointer = delta_checkpointer
+        if delta_checkpointer:
+            checkpoint_repo = delta_checkpointer.repository
         self.checkpoint_repo = checkpoint_repo or WorkspaceCheckpointRepository(workspaces=workspace_repo)
 
     ###########################  Memory Backend ###########################
@@ -271,6 +280,12 @@ class ContextManager(BaseModel):
             session_id=session_id,
             task_id=task_id
         )
+        if self.delta_checkpointer:
+            checkpoint = self.delta_checkpointer.save(values, metadata)
+            logger.info(f"[ContextManager] {'Delta' if checkpoint.is_delta() else 'Complete'} checkpoint saved "
+                        f"for session {metadata.session_id}, task {metadata.task_id}")
+            return checkpoint
+
         # Find last version checkpoint by session_id
         last_checkpoint = await self.checkpoint_repo.aget_by_session(session_id)
 
@@ -294,7 +309,8 @@ class ContextManager(BaseModel):
 
         # Restore Context from checkpoint
         from . import ApplicationContext
-        context = ApplicationContext.from_dict(checkpoint.values)
+        values = self.delta_checkpointer.restore(checkpoint) if checkpoint.is_delta() else checkpoint.values
+        context = ApplicationContext.from_dict(values)
 
         workspace = await workspace_repo.get_session_workspace(session_id=context.session_id)
         context.workspace = workspace
@@ -307,6 +323,8 @@ class ContextManager(BaseModel):
 
     def delete_checkpoint(self, session_id: str) -> None:
         self.checkpoint_repo.delete_by_session(session_id)
+        if self.delta_checkpointer:
+            self.delta_checkpointer.discard(session_id)
         logger.info(f"[ContextManager] Deleted checkpoint for session {session_id}")
 
     def list_checkpoints(self, **params) -> list:
@@ -25,6 +25,9 @@ Operation Categories:
    - Graph Memory: ExtractToolMemoryNodeOp, ExtractToolMemoryLinkOp
    - Entity & Keywords: ExtractEntityOp (NLTK-based NER and TF-IDF)
 
+Background (`is_async`) processors run on ProcessorWorkerPool, a bounded pool of long-lived event loop
+threads coalescing jobs per (session, processor).
+
 Design: Factory, Template Method, Command, and Pipeline patterns
 """
 
@@ -32,9 +35,12 @@ from .base import BaseArtifactProcessor
 from .base_processor import BaseContextProcessor
 from .memory_processor import PipelineMemoryProcessor
 from .processor_factory import ProcessorFactory
+from .worker_pool import ProcessorWorkerPool, get_processor_worker_pool
 
 __all__ = [
     "ProcessorFactory",
+    "ProcessorWorkerPool",
+    "get_processor_worker_pool",
     "BaseContextProcessor",
     "BaseArtifactProcessor",
     "PipelineMemoryProcessor",
@@ -1,11 +1,15 @@
+import asyncio
 import os
 import time
 import traceback
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from aworld.memory.main import MemoryFactory
 from aworld.memory.models import MemorySystemMessage, MessageMetadata
-from ... import ApplicationContext
+from aworld.metrics.context_manager import MetricContext
+from aworld.metrics.metric import MetricType
+from aworld.metrics.template import MetricTemplate
+from ... import ApplicationContext, StateScopes
 from ...payload import SystemPromptMessagePayload
 from aworld.logs.util import logger
 from .base import BaseOp, MemoryCommand
@@ -15,6 +19,14 @@ from ...prompt.prompt_ext import ContextPromptTemplate
 from ...retrieval.reranker import RerankResult
 from ...retrieval.reranker.factory import RerankerFactory
 
+neuron_duration_histogram = MetricTemplate(
+    type=MetricType.HISTOGRAM,
+    name="context_neuron_render_duration",
+    unit="s",
+    description="Duration of rendering a prompt neuron in system prompt augment",
+    labels=["neuron", "cached"]
+)
+
 
 @memory_op("system_prompt_augment")
 class SystemPromptAugmentOp(BaseOp):
@@ -63,6 +75,9 @@ class SystemPromptAugmentOp(BaseOp):
         """
         Process prompt components, supporting both rerank and append strategies
         Supports filtering components configured in component_neuron based on namespace
+
+        Neurons are rendered concurrently, a neuron declaring `state_scopes` reuses its last prompt
+        while the versions of those context state scopes are unchanged.
         """
         agent_id = getattr(event, 'agent_id', None)
 
@@ -70,11 +85,7 @@ class SystemPromptAugmentOp(BaseOp):
             logger.info(f"[SYSTEM_PROMPT_AUGMENT_OP] switch is disabled")
             return None
 
-
         augment_prompts = {}
-
-        # Record timing for each component
-        component_timings = []
         total_start_time = time.time()
 
         # Get namespace (from event)
@@ -83,40 +94,15 @@ class SystemPromptAugmentOp(BaseOp):
         # Process components
         neurons = neuron_factory.get_neurons_by_names(names=context.get_config().get_agent_context_config(agent_id).neuron_names)
 
-        # Process components with rerank strategy
+        component_timings = []
         if neurons:
-            # Desc
-            for neuron in neurons:
-                augment_prompts[neuron.name] = await neuron.desc(context=context, namespace=namespace)
-
-            # Context
-
-            for neuron in neurons:
-                component_start_time = time.time()
-                component_name = neuron.__class__.__name__
-
-                try:
-                    # Context augment
-                    st = time.time()
-                    augment_prompts[neuron.name] = (augment_prompts[neuron.name] + '\n\n'
-                                                    + await self.rerank_items(neuron=neuron,
-                                                                   context=context, namespace=namespace))
-                    t1 = time.time() - st
-                    logger.debug(
-                        f"🧠 _process_prompt_components rerank strategy: {component_name} rerank time: start_time={st}s format_time={t1:.3f}s")
-
-                    component_end_time = time.time()
-                    component_duration = component_end_time - component_start_time
-                    component_timings.append(f"{component_name}:{component_duration:.3f}s")
-
-                except Exception as e:
-                    component_end_time = time.time()
-                    component_duration = component_end_time - component_start_time
-                    component_timings.append(f"{component_name}:{component_duration:.3f}s(error)")
-                    logger.error(f"Error processing rerank component {component_name}: {e} {traceback.format_exc()}")
-
-        total_end_time = time.time()
-        total_duration = total_end_time - total_start_time
+            results = await asyncio.gather(*(self._render_neuron(neuron, context, namespace) for neuron in neurons))
+            for neuron, (prompt, timing) in zip(neurons, results):
+                component_timings.append(timing)
+                if prompt is not None:
+                    augment_prompts[neuron.name] = prompt
+
+        total_duration = time.time() - total_start_time
 
         # Format timing information
         timing_info = f"total:{total_duration:.3f}s, " + ", ".join(component_timings)
@@ -126,6 +112,57 @@ class SystemPromptAugmentOp(BaseOp):
 
         return augment_prompts
 
+    def _neuron_version(self, neuron: Neuron, context: ApplicationContext) -> Optional[tuple]:
+        if neuron.state_scopes is None:
+            return None
+        # rerank queries with the task input
+        scopes = tuple(neuron.state_scopes) + (StateScopes.TASK,)
+        return tuple(context.get_state_version(scope) for scope in scopes)
+
+    @staticmethod
+    def _neuron_cache(context: ApplicationContext) -> Dict[tuple, tuple]:
+        # kept on the context, the op is shared by the tasks of a worker thread (`ProcessorFactory.get_or_create`)
+        # (namespace, neuron name) -> (state version, rendered prompt)
+        return context.__dict__.setdefault("_neuron_prompts", {})
+
+    async def _render_neuron(self, neuron: Neuron, context: ApplicationContext, namespace: str) -> Tuple[Optional[str], str]:
+        """Render desc and context augment of a neuron, return the prompt (None on error) and its timing info."""
+        component_name = neuron.__class__.__name__
+        start_time = time.time()
+        cache_key = (namespace, neuron.name)
+        version = self._neuron_version(neuron, context)
+        cached = self._neuron_cache(context).get(cache_key) if version is not None else None
+        if cached and cached[0] == version:
+            self._record_neuron_metric(neuron, time.time() - start_time, cached=True)
+            return cached[1], f"{component_name}:cached"
+
+        try:
+            desc = await neuron.desc(context=context, namespace=namespace)
+        except Exception as e:
+            logger.error(f"Error processing desc of component {component_name}: {e} {traceback.format_exc()}")
+            return None, f"{component_name}:{time.time() - start_time:.3f}s(error)"
+
+        try:
+            # Context augment
+            st = time.time()
+            prompt = desc + '\n\n' + await self.rerank_items(neuron=neuron, context=context, namespace=namespace)
+            logger.debug(
+                f"🧠 _process_prompt_components rerank strategy: {component_name} rerank time: start_time={st}s format_time={time.time() - st:.3f}s")
+        except Exception as e:
+            logger.error(f"Error processing rerank component {component_name}: {e} {traceback.format_exc()}")
+            return desc, f"{component_name}:{time.time() - start_time:.3f}s(error)"
+
+        duration = time.time() - start_time
+        if version is not None:
+            self._neuron_cache(context)[cache_key] = (version, prompt)
+        self._record_neuron_metric(neuron, duration, cached=False)
+        return prompt, f"{component_name}:{duration:.3f}s"
+
+    def _record_neuron_metric(self, neuron: Neuron, duration: float, cached: bool):
+        if MetricContext.metric_initialized():
+            MetricContext.histogram_record(neuron_duration_histogram, duration,
+                                           labels={"neuron": neuron.name, "cached": str(cached).lower()})
+
     async def rerank_items(self, neuron: Neuron, context: ApplicationContext,
                            namespace: str) -> str:
         user_query = context.task_input
@@ -1,6 +1,7 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 
+import threading
 import traceback
 from typing import Dict, List, Optional, Type
 
@@ -13,6 +14,8 @@ class ProcessorFactory:
     """Processor factory class"""
     
     _processors: Dict[str, Type[BaseContextProcessor]] = {}
+    # processor instances are cached per thread, each event loop thread reuses its own instances
+    _instances = threading.local()
     
     @classmethod
     def register(cls, processor_type: str, processor_class: Type[BaseContextProcessor]):
@@ -34,6 +37,20 @@ class ProcessorFactory:
             logger.warn(f"Failed to create processor {processor_type}: {traceback.format_exc()}")
             return None
     
+    @classmethod
+    def get_or_create(cls, processor_config: AmniContextProcessorConfig) -> Optional[BaseContextProcessor]:
+        """Get the cached processor of the config for the current thread, create it on first use."""
+        cache = getattr(cls._instances, "processors", None)
+        if cache is None:
+            cache = cls._instances.processors = {}
+        key = processor_config.model_dump_json()
+        processor = cache.get(key)
+        if processor is None:
+            processor = cls.create(processor_config)
+            if processor is not None:
+                cache[key] = processor
+        return processor
+
     @classmethod
     def list_all_types(cls) -> List[str]:
         """Get all registered processor types"""
@@ -0,0 +1,246 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+import asyncio
+import os
+import threading
+import time
+import traceback
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from aworld.logs.util import logger
+from aworld.metrics.context_manager import MetricContext
+from aworld.metrics.metric import MetricType
+from aworld.metrics.template import MetricTemplate
+from ..config import AmniContextProcessorConfig
+from ..payload import BaseMessagePayload
+from .processor_factory import ProcessorFactory
+
+processor_queue_depth_gauge = MetricTemplate(
+    type=MetricType.GAUGE,
+    name="context_processor_queue_depth",
+    unit="1",
+    description="Number of background context processor jobs waiting to run",
+)
+
+processor_backlog_gauge = MetricTemplate(
+    type=MetricType.GAUGE,
+    name="context_processor_backlog",
+    unit="s",
+    description="Age of the oldest background context processor job waiting to run",
+)
+
+processor_wait_histogram = MetricTemplate(
+    type=MetricType.HISTOGRAM,
+    name="context_processor_queue_wait",
+    unit="s",
+    description="Time a background context processor job waited in the queue",
+    labels=["processor"]
+)
+
+processor_job_counter = MetricTemplate(
+    type=MetricType.COUNTER,
+    name="context_processor_jobs",
+    unit="1",
+    description="Background context processor jobs by outcome",
+    labels=["processor", "status"]
+)
+
+JobKey = Tuple[Optional[str], str]
+
+
+class _ProcessorJob:
+    __slots__ = ("key", "processor_config", "event", "enqueued_at")
+
+    def __init__(self, key: JobKey, processor_config: AmniContextProcessorConfig, event: BaseMessagePayload):
+        self.key = key
+        self.processor_config = processor_config
+        self.event = event
+        self.enqueued_at = time.monotonic()
+
+
+class _Worker:
+    """A daemon thread running an event loop for the whole process lifetime."""
+
+    def __init__(self, index: int, max_concurrency: int):
+        self.index = index
+        self.max_concurrency = max_concurrency
+        self.loop = asyncio.new_event_loop()
+        self.queue: Optional[asyncio.Queue] = None
+        self._ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f"context-processor-worker-{index}", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.queue = asyncio.Queue()
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+
+    def put(self, key: JobKey):
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, key)
+
+    def stop(self, timeout: float = None):
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+
+
+class ProcessorWorkerPool:
+    """Bounded pool of long-lived event loop threads running background (`is_async`) context processors.
+
+    Jobs are keyed by (session id, processor name). A job submitted while another job of the same key
+    is still waiting replaces the waiting event, so a busy session only runs the latest snapshot;
+    jobs of one key always run on the same worker, one at a time and in submission order.
+    """
+
+    def __init__(self, num_workers: int = None, max_concurrency: int = 8, max_backlog: int = 1024):
+        self.num_workers = num_workers or int(os.environ.get("AWORLD_CONTEXT_PROCESSOR_WORKERS", 2))
+        self.max_concurrency = max_concurrency
+        self.max_backlog = max_backlog
+        self._lock = threading.Lock()
+        self._workers: List[_Worker] = []
+        self._pending: Dict[JobKey, _ProcessorJob] = {}
+        self._running: Set[JobKey] = set()
+        self._stats = {"submitted": 0, "coalesced": 0, "dropped": 0, "completed": 0, "failed": 0}
+
+    def _worker_of(self, key: JobKey) -> _Worker:
+        if not self._workers:
+            self._workers = [_Worker(i, self.max_concurrency) for i in range(self.num_workers)]
+            for worker in self._workers:
+                worker.loop.call_soon_threadsafe(worker.loop.create_task, self._consume(worker))
+        return self._workers[zlib.crc32(repr(key).encode()) % len(self._workers)]
+
+    def submit(self, processor_config: AmniContextProcessorConfig, event: BaseMessagePayload) -> bool:
+        """Queue a processor run for the event, return False if it was dropped because the backlog is full."""
+        session_id = getattr(getattr(event, "context", None), "session_id", None)
+        key = (session_id, processor_config.name)
+        with self._lock:
+            self._stats["submitted"] += 1
+            job = self._pending.get(key)
+            if job is not None:
+                job.event = event
+                job.processor_config = processor_config
+                self._stats["coalesced"] += 1
+                logger.debug(f"Coalesced context processor job {key}")
+                return True
+            if len(self._pending) >= self.max_backlog:
+                self._stats["dropped"] += 1
+                logger.warning(f"Context processor backlog is full ({self.max_backlog}), dropped job {key}")
+                self._count_job(processor_config.name, "dropped")
+                return False
+            self._pending[key] = _ProcessorJob(key, processor_config, event)
+            running = key in self._running
+            worker = self._worker_of(key)
+            self._report_queue()
+        if not running:
+            worker.put(key)
+        return True
+
+    async def _consume(self, worker: _Worker):
+        semaphore = asyncio.Semaphore(worker.max_concurrency)
+        while True:
+            key = await worker.queue.get()
+            await semaphore.acquire()
+            task = asyncio.create_task(self._run_job(worker, key))
+            task.add_done_callback(lambda _: semaphore.release())
+
+    async def _run_job(self, worker: _Worker, key: JobKey):
+        with self._lock:
+            job = self._pending.pop(key, None)
+            if job is None or key in self._running:
+                if job is not None:
+                    self._pending[key] = job
+                return
+            self._running.add(key)
+            self._report_queue()
+
+        name = job.processor_config.name
+        status = "success"
+        try:
+            if MetricContext.metric_initialized():
+                MetricContext.histogram_record(processor_wait_histogram, time.monotonic() - job.enqueued_at,
+                                               labels={"processor": name})
+            processor = ProcessorFactory.get_or_create(job.processor_config)
+            if not processor:
+                logger.warning(f"Failed to create async processor: {name}")
+                status = "failed"
+                return
+            logger.info(f"Processing async with {processor.__class__.__name__}")
+            await processor.process(job.event.context, event=job.event)
+            logger.info(f"Async processor {processor.__class__.__name__} completed")
+        except Exception as e:
+            status = "failed"
+            logger.error(f"Async processor {name} failed: {e} {traceback.format_exc()}")
+        finally:
+            with self._lock:
+                self._running.discard(key)
+                self._stats["completed" if status == "success" else "failed"] += 1
+                # a job of the key was submitted while running
+                resubmit = key in self._pending
+            self._count_job(name, status)
+            if resubmit:
+                worker.queue.put_nowait(key)
+
+    def _count_job(self, processor_name: str, status: str):
+        if MetricContext.metric_initialized():
+            MetricContext.count(processor_job_counter, 1, labels={"processor": processor_name, "status": status})
+
+    def _report_queue(self):
+        if not MetricContext.metric_initialized():
+            return
+        oldest = min((job.enqueued_at for job in self._pending.values()), default=None)
+        MetricContext.gauge_set(processor_queue_depth_gauge, len(self._pending))
+        MetricContext.gauge_set(processor_backlog_gauge, time.monotonic() - oldest if oldest is not None else 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters of the pool with the current queue depth, running jobs and backlog age."""
+        with self._lock:
+            oldest = min((job.enqueued_at for job in self._pending.values()), default=None)
+            return {
+                **self._stats,
+                "queue_depth": len(self._pending),
+                "running": len(self._running),
+                "backlog_seconds": time.monotonic() - oldest if oldest is not None else 0.0,
+            }
+
+    async def drain(self, timeout: float = None) -> bool:
+        """Wait until no job is waiting or running, return False on timeout."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                if not self._pending and not self._running:
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+
+    def shutdown(self, timeout: float = 5):
+        """Stop the worker loops, waiting jobs are discarded."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._pending.clear()
+        for worker in workers:
+            worker.stop(timeout)
+
+
+_POOL: Optional[ProcessorWorkerPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_processor_worker_pool() -> ProcessorWorkerPool:
+    """Process wide pool shared by all runners."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ProcessorWorkerPool()
+    return _POOL
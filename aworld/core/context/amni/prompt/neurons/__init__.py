@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 
 from ... import ApplicationContext
 
@@ -24,6 +24,10 @@ class Neuron(ABC):
     Abstract base class for neurons
     """
 
+    # Context state scopes (see `StateScopes`) the rendered prompt depends on, the prompt is reused while
+    # their versions are unchanged. `()` for a constant prompt, None to render on every call.
+    state_scopes: Optional[Tuple[str, ...]] = None
+
     async def desc(self, context: ApplicationContext, namespace: str = None, **kwargs) -> str:
         return ""
 
@@ -1,6 +1,6 @@
 from typing import List
 
-from ... import ApplicationContext, logger
+from ... import ApplicationContext, StateScopes, logger
 from . import Neuron
 from .neuron_factory import neuron_factory
 
@@ -9,6 +9,8 @@ from .neuron_factory import neuron_factory
 class ActionInfoNeuron(Neuron):
     """Neuron for handling action information related properties"""
 
+    state_scopes = (StateScopes.WORKSPACE,)
+
     async def format_items(self, context: ApplicationContext, namespace: str = None, **kwargs) -> List[str]:
         """Format action information"""
         context._workspace._load_workspace_data()
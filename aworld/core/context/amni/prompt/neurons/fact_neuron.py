@@ -1,6 +1,6 @@
 from typing import List
 
-from ... import ApplicationContext
+from ... import ApplicationContext, StateScopes
 from . import Neuron
 from .neuron_factory import neuron_factory
 
@@ -9,6 +9,9 @@ from .neuron_factory import neuron_factory
 class FactsNeuron(Neuron):
     """Neuron for handling fact related properties"""
 
+    # facts are retrieved with the task input and todo as query
+    state_scopes = (StateScopes.FACTS, StateScopes.TASK, StateScopes.WORKSPACE)
+
     async def format_items(self, context: ApplicationContext, namespace: str = None, **kwargs) -> List[str]:
         """Format fact information"""
         facts = await context.retrival_facts()
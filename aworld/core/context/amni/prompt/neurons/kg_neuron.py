@@ -13,6 +13,8 @@ class AugmentKgKeywordsNeuron(Neuron):
     - Micro concepts
     """
 
+    state_scopes = ()
+
     async def desc(self, context: ApplicationContext, namespace: str = None, **kwargs) -> str:
         return await super().desc(context, namespace, **kwargs)
 
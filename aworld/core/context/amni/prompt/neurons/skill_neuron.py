@@ -2,7 +2,7 @@ from typing import List
 
 from . import Neuron
 from .neuron_factory import neuron_factory
-from ... import ApplicationContext
+from ... import ApplicationContext, StateScopes
 
 SKILLS_PROMPT = """
 <skills_guide>
@@ -34,6 +34,8 @@ SKILLS_PROMPT = """
 class SkillsNeuron(Neuron):
     """Neuron for handling plan related properties"""
 
+    state_scopes = (StateScopes.WORKING_STATE,)
+
     async def format_items(self, context: ApplicationContext, namespace: str = None, **kwargs) -> List[str]:
         total_skills = await context.get_skill_list(namespace)
         if not total_skills:
@@ -92,5 +92,7 @@ TODO_PROMPT = """
 class TodoNeuron(Neuron):
     """Neuron for handling plan related properties"""
 
+    state_scopes = ()
+
     async def desc(self, context: ApplicationContext, namespace: str = None, **kwargs):
         return TODO_PROMPT
@@ -1,6 +1,6 @@
 from typing import List
 
-from ... import ApplicationContext
+from ... import ApplicationContext, StateScopes
 from . import Neuron
 from .neuron_factory import neuron_factory
 
@@ -9,6 +9,8 @@ from .neuron_factory import neuron_factory
 class WorkspaceNeuron(Neuron):
     """Neuron for handling workspace related properties"""
 
+    state_scopes = (StateScopes.WORKSPACE,)
+
     async def format_items(self, context: ApplicationContext, namespace: str = None, **kwargs) -> List[str]:
         """Format workspace information"""
         items = []
@@ -2,8 +2,10 @@
 # Copyright (c) 2025 inclusionAI.
 import copy
 import time
+from array import array
 from collections import OrderedDict
-from dataclasses import dataclass, field, asdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
 from typing import Dict, Any, TYPE_CHECKING, List, Literal
 
@@ -19,6 +21,9 @@ if TYPE_CHECKING:
     from aworld.events.manager import EventManager
     from aworld.core.agent import BaseAgent
 
+# 4-byte signed ints cover the vocabulary of any tokenizer
+TOKEN_ID_TYPECODE = "i"
+
 
 @dataclass
 class ContextUsage:
@@ -30,12 +35,59 @@ class ContextUsage:
         self.used_context_length = used_context_length
 
 
+class TokenIdView(Sequence):
+    """Read-only window over a `TokenIdBuffer`, created without copying token ids.
+
+    Valid as long as the viewed range of the append-only buffer is not rolled back.
+    """
+    __slots__ = ("_buffer", "_start", "_stop")
+
+    def __init__(self, buffer: array, start: int, stop: int):
+        self._buffer = buffer
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("token id view index out of range")
+        return self._buffer[self._start + index]
+
+    def __iter__(self):
+        buffer = self._buffer
+        for i in range(self._start, self._stop):
+            yield buffer[i]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TokenIdView, list, tuple, array)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __add__(self, other) -> List[int]:
+        return self.tolist() + list(other)
+
+    def __repr__(self) -> str:
+        return f"TokenIdView({self.tolist()!r})"
+
+    def tolist(self) -> List[int]:
+        return self._buffer[self._start:self._stop].tolist()
+
+    def copy(self) -> List[int]:
+        return self.tolist()
+
+
 @dataclass
 class AgentTokenIdStep:
     step: int
     tool_call_ids: List[str] = field(default_factory=list)
     # Prompt token ids of the current llm call, including historical messages.
-    prompt_token_ids: List[int] = field(default_factory=list)
+    prompt_token_ids: Sequence[int] = field(default_factory=list)
     # Input token ids of the step, without tokens of previous steps.
     input_token_ids: List[int] = field(default_factory=list)
     output_token_ids: List[int] = field(default_factory=list)
@@ -46,6 +98,11 @@ class AgentTokenIdStep:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the AgentTokenIdStep to a dictionary."""
+        if isinstance(self.prompt_token_ids, TokenIdView):
+            # views share the trajectory buffer, avoid deep copying it through asdict
+            data = asdict(replace(self, prompt_token_ids=[]))
+            data["prompt_token_ids"] = self.prompt_token_ids.tolist()
+            return data
         return asdict(self)
 
 
@@ -53,8 +110,36 @@ class AgentTokenIdStep:
 class AgentTokenIdTrajectory:
     agent_id: str
     tool_call_id: str = None
-    all_token_id_seq: List[int] = field(default_factory=list)
     token_id_steps: List[AgentTokenIdStep] = field(default_factory=list)
+    # Append-only buffer of all token ids of the trajectory, read as a list through `all_token_id_seq`.
+    _token_ids: array = field(default_factory=lambda: array(TOKEN_ID_TYPECODE), repr=False)
+    # Buffer length before the staged input of the in-flight llm call, if any.
+    _staged_from: int = field(default=None, repr=False, compare=False)
+
+    def __init__(self,
+                 agent_id: str,
+                 tool_call_id: str = None,
+                 all_token_id_seq: List[int] = None,
+                 token_id_steps: List[AgentTokenIdStep] = None):
+        self.agent_id = agent_id
+        self.tool_call_id = tool_call_id
+        self.token_id_steps = token_id_steps if token_id_steps is not None else []
+        self._token_ids = array(TOKEN_ID_TYPECODE, all_token_id_seq or ())
+        self._staged_from = None
+
+    @property
+    def all_token_id_seq(self) -> List[int]:
+        """All token ids of the trajectory, a copy of the buffer, `extend_token_ids` appends to it."""
+        return self._token_ids.tolist()
+
+    @all_token_id_seq.setter
+    def all_token_id_seq(self, token_ids: List[int]):
+        self._token_ids = array(TOKEN_ID_TYPECODE, token_ids)
+        self._staged_from = None
+
+    def extend_token_ids(self, token_ids: Sequence[int]):
+        """Append token ids to the trajectory, e.g. of tool responses."""
+        self._token_ids.extend(token_ids)
 
     def new_step(self):
         """Add a new step to the trajectory."""
@@ -66,9 +151,37 @@ class AgentTokenIdTrajectory:
         """Get the current step of the trajectory."""
         return self.token_id_steps[-1] if self.token_id_steps else None
 
+    def stage_input(self, input_token_ids: Sequence[int]) -> TokenIdView:
+        """Append the input of the next llm call and return its full prompt as a view of the buffer.
+
+        Costs O(len(input_token_ids)); `commit_llm_call` or `rollback_input` ends the staging.
+        """
+        self.rollback_input()
+        self._staged_from = len(self._token_ids)
+        self._token_ids.extend(input_token_ids)
+        return TokenIdView(self._token_ids, 0, len(self._token_ids))
+
+    def rollback_input(self):
+        """Drop the staged input of a failed llm call."""
+        if self._staged_from is not None:
+            del self._token_ids[self._staged_from:]
+            self._staged_from = None
+
+    def commit_llm_call(self, input_token_ids: Sequence[int], output_token_ids: Sequence[int]):
+        """Append the input (unless staged) and output token ids of an llm call."""
+        if self._staged_from is None:
+            self._token_ids.extend(input_token_ids)
+        self._staged_from = None
+        self._token_ids.extend(output_token_ids)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the AgentTokenIdTrajectory to a dictionary."""
-        return asdict(self)
+        return {
+            "agent_id": self.agent_id,
+            "tool_call_id": self.tool_call_id,
+            "all_token_id_seq": self.all_token_id_seq,
+            "token_id_steps": [step.to_dict() for step in self.token_id_steps],
+        }
 
 
 class Context:
@@ -142,6 +255,8 @@ class Context:
                    session=session, engine=engine, **kwargs)
 
     def _init(self, *, task_id: str = None, trace_id: str = None, session: Session = None, engine: str = None):
+        # a reset context is a change too
+        revision = self.revision + 1 if "_revision" in self.__dict__ else 0
         self._task_id = task_id
         self._task = None
         self._engine = engine
@@ -161,6 +276,18 @@ class Context:
         self._start = time.time()
         # agent_id -> token_id trajectory
         self._agent_token_id_traj: Dict[str, List[AgentTokenIdTrajectory]] = {}
+        self._revision = revision
+
+    @property
+    def revision(self) -> int:
+        """Change counter of the context, bumped by its setters and by the writes of `context_info`.
+
+        Code writing `agent_info` or `trajectories` directly calls `mark_changed`.
+        """
+        return self.__dict__.get("_revision", 0) + getattr(self.context_info, "revision", 0)
+
+    def mark_changed(self):
+        self._revision = self.__dict__.get("_revision", 0) + 1
 
     @property
     def start_time(self) -> float:
@@ -168,6 +295,7 @@ class Context:
 
     def add_token(self, usage: Dict[str, int]):
         self._token_usage = nest_dict_counter(self._token_usage, usage)
+        self.mark_changed()
 
     def reset(self, **kwargs):
         self._init(**kwargs)
@@ -185,6 +313,7 @@ class Context:
     @trace_id.setter
     def trace_id(self, trace_id):
         self._trace_id = trace_id
+        self.mark_changed()
 
     @property
     def token_usage(self):
@@ -197,6 +326,7 @@ class Context:
     @engine.setter
     def engine(self, engine: str):
         self._engine = engine
+        self.mark_changed()
 
     @property
     def user(self):
@@ -206,6 +336,7 @@ class Context:
     def user(self, user):
         if user is not None:
             self._user = user
+            self.mark_changed()
 
     @property
     def task_id(self):
@@ -215,6 +346,7 @@ class Context:
     def task_id(self, task_id):
         if task_id is not None:
             self._task_id = task_id
+            self.mark_changed()
 
     @property
     def session_id(self):
@@ -230,6 +362,7 @@ class Context:
     @session.setter
     def session(self, session: Session):
         self._session = session
+        self.mark_changed()
 
     @property
     def swarm(self):
@@ -255,6 +388,7 @@ class Context:
     def task_input(self, task_input):
         if self._task:
             self._task.input = task_input
+            self.mark_changed()
 
     @property
     def outputs(self):
@@ -437,6 +571,7 @@ class Context:
             self.context_info.set('last_merge_info', merge_info)
         except Exception as e:
             logger.warning(f"Failed to record merge info: {e}")
+        self.mark_changed()
 
     def save_action_trajectory(self,
                                step,
@@ -454,6 +589,7 @@ class Context:
             "tool_name": tool_name
         }
         self.trajectories[step_key] = step_data
+        self.mark_changed()
 
     async def update_task_after_run(self, task_response: 'TaskResponse'):
         pass
@@ -550,7 +686,8 @@ class Context:
         step.output_logprobs = response.output_logprobs
         step.output_versions = response.output_versions
         step.finish_reason = response.finish_reason
-        token_id_traj.all_token_id_seq.extend(step.input_token_ids + step.output_token_ids)
+        token_id_traj.commit_llm_call(step.input_token_ids, step.output_token_ids)
+        self.mark_changed()
 
     def add_tool_resp_token_ids(self,
                                 tool_resp_token_ids: List[int],
@@ -576,7 +713,8 @@ class Context:
         step.output_token_ids.extend(tool_resp_token_ids)
         step.output_logprobs.extend([0.0] * len(tool_resp_token_ids))
         step.output_versions.extend([-1] * len(tool_resp_token_ids))
-        token_id_traj.all_token_id_seq.extend(step.tool_resp_token_ids)
+        token_id_traj.extend_token_ids(step.tool_resp_token_ids)
+        self.mark_changed()
 
     def new_trajectory_step(self, agent_id: str = None, tool_call_id: str = None):
         """Add a new trajectory step to the context.
@@ -586,6 +724,7 @@ class Context:
         """
         token_id_traj = self.get_agent_token_id_traj(agent_id, tool_call_id)
         token_id_traj.new_step()
+        self.mark_changed()
 
     def get_current_step_of_trajectory(self, agent_id: str = None, tool_call_id: str = None) -> AgentTokenIdStep:
         """Get the current step of the trajectory.
@@ -605,3 +744,4 @@ class Context:
         for agent_id, token_id_trajs in sub_task_context._agent_token_id_traj.items():
             for traj in token_id_trajs:
                 self._agent_token_id_traj[agent_id].append(traj)
+        self.mark_changed()
@@ -31,6 +31,15 @@ class ContextState:
         """
         self._data: Dict[str, Any] = {}
         self._parent_state: Optional['ContextState'] = parent_state
+        self._revision = 0
+
+    @property
+    def revision(self) -> int:
+        """Change counter of the local state, bumped by every write."""
+        return self.__dict__.get("_revision", 0)
+
+    def _changed(self) -> None:
+        self._revision = self.revision + 1
 
     def __getitem__(self, key: str) -> Any:
         """Get state value with parent state inheritance support"""
@@ -45,11 +54,13 @@ class ContextState:
     def __setitem__(self, key: str, value: Any) -> None:
         """Set state value, only writes to local state"""
         self._data[key] = value
+        self._changed()
 
     def __delitem__(self, key: str) -> None:
         """Delete state value, only deletes from local state"""
         if key in self._data:
             del self._data[key]
+            self._changed()
         else:
             logger.error(f"Key '{key}' not found in local state")
 
@@ -98,6 +109,7 @@ class ContextState:
             value: The value to set
         """
         self._data[key] = value
+        self._changed()
 
     def update(self, other: Union[Dict[str, Any], 'ContextState'] = None, **kwargs) -> None:
         """
@@ -134,6 +146,7 @@ class ContextState:
             # Handle keyword arguments
             if kwargs:
                 self._data.update(kwargs)
+            self._changed()
 
         except Exception as e:
             logger.error(f"Error updating state: {e}")
@@ -149,11 +162,13 @@ class ContextState:
         Returns:
             The deleted value or default value
         """
+        self._changed()
         return self._data.pop(key, default)
 
     def clear(self) -> None:
         """Clear local state (does not affect parent state)"""
         self._data.clear()
+        self._changed()
 
     def keys(self) -> List[str]:
         """Return list of all accessible keys (including parent state)"""
@@ -0,0 +1,113 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+import itertools
+import threading
+import uuid
+import weakref
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aworld.core.context.base import Context
+
+
+class ContextRef:
+    """Lightweight reference of a context carried by messages instead of the context itself.
+
+    Identified by the task id and the version the registry assigned to the context object, it pickles
+    as these two values. In the process that created or received the context the reference holds it, so a
+    context lives exactly as long as the messages referencing it; a reference unpickled in another process is
+    resolved through the `ContextRegistry` (e.g. after a cross-process bus attached the context).
+    """
+    __slots__ = ("task_id", "version", "_context", "__weakref__")
+
+    def __init__(self, task_id: str, version: int, context: 'Context' = None):
+        self.task_id = task_id
+        self.version = version
+        self._context = context
+
+    @property
+    def context(self) -> Optional['Context']:
+        context = self._context
+        if context is None:
+            context = context_registry.resolve(self)
+        return context
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ContextRef) and (self.task_id, self.version) == (other.task_id, other.version)
+
+    def __hash__(self):
+        return hash((self.task_id, self.version))
+
+    def __reduce__(self):
+        return ContextRef, (self.task_id, self.version)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        return f"ContextRef(task_id={self.task_id!r}, version={self.version})"
+
+
+class ContextRegistry:
+    """Contexts of the running tasks by (task id, version).
+
+    The registry only references the contexts weakly: the messages keep their context alive through their
+    `ContextRef`, a context superseded by a newer copy (e.g. the deep copy of a handler step) is dropped as soon
+    as no message references it anymore, so the registry does not grow with the steps of a task.
+    """
+
+    def __init__(self):
+        # versions are unique across processes, contexts of one task can be registered by several of them
+        self._versions = itertools.count(((uuid.uuid4().int >> 97) << 32) + 1)
+        self._contexts: Dict[str, weakref.WeakValueDictionary] = {}
+        self._lock = threading.Lock()
+
+    def register(self, context: 'Context', ref: ContextRef = None) -> Optional[ContextRef]:
+        """Register the context and return its reference, None if the context has no task id.
+
+        Registering the same context object again returns a reference of the same version while its task id
+        is unchanged. `ref` binds the context to an existing reference, e.g. a context received
+        from another process.
+        """
+        task_id = getattr(context, "task_id", None)
+        if ref is None:
+            if not task_id:
+                return None
+            # (task id, version, object id) kept on the context, copies of the context get their own version
+            key = getattr(context, "_registry_key", None)
+            if key is not None and key[0] == task_id and key[2] == id(context):
+                ref = ContextRef(task_id, key[1], context)
+            else:
+                ref = ContextRef(task_id, next(self._versions), context)
+        else:
+            ref._context = context
+        with self._lock:
+            self._contexts.setdefault(ref.task_id, weakref.WeakValueDictionary())[ref.version] = context
+        context._registry_key = (ref.task_id, ref.version, id(context))
+        return ref
+
+    def resolve(self, ref: ContextRef) -> Optional['Context']:
+        versions = self._contexts.get(ref.task_id)
+        if not versions:
+            return None
+        return versions.get(ref.version)
+
+    def release(self, task_id: str):
+        """Forget the contexts of the task, called when the task finished."""
+        with self._lock:
+            self._contexts.pop(task_id, None)
+
+    def size(self, task_id: str = None) -> int:
+        """Number of the registered contexts still alive."""
+        if task_id is not None:
+            return len(self._contexts.get(task_id, {}))
+        return sum(len(versions) for versions in list(self._contexts.values()))
+
+
+context_registry = ContextRegistry()
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 from aworld.config.conf import ConfigDict
 from aworld.core.common import Config, Observation, ActionModel, TaskItem
 from aworld.core.context.base import Context
+from aworld.core.context.registry import ContextRef, context_registry
 
 
 class Constants:
@@ -83,6 +84,9 @@ class Message(Generic[DataType]):
         context = self.headers.get("context")
         if not context:
             self.headers['context'] = Context()
+        elif isinstance(context, Context):
+            # carry a reference, it holds the context in this process and pickles as (task id, version)
+            self.headers['context'] = context_registry.register(context) or context
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Message):
@@ -101,16 +105,31 @@ class Message(Generic[DataType]):
 
     @property
     def task_id(self):
-        return self.context.get_task().id
+        context = self.context
+        if context is None:
+            ref = self.headers.get('context')
+            return ref.task_id if isinstance(ref, ContextRef) else None
+        return context.get_task().id
 
     @property
     def context(self) -> Context:
-        return self.headers.get('context')
+        context = self.headers.get('context')
+        if isinstance(context, ContextRef):
+            return context.context
+        return context
 
     @context.setter
     def context(self, context: Context):
+        if isinstance(context, Context):
+            context = context_registry.register(context) or context
         self.headers['context'] = context
 
+    @property
+    def context_ref(self) -> Optional[ContextRef]:
+        """The reference of the message context, None if the context is carried inline."""
+        context = self.headers.get('context')
+        return context if isinstance(context, ContextRef) else None
+
     @property
     def group_id(self) -> str:
         return self.headers.get('group_id')
@@ -9,6 +9,7 @@ from typing import (
 )
 
 from aworld.models.model_response import ModelResponse
+from aworld.models.stream_accumulator import ToolCallDeltas
 from aworld.core.context.base import Context
 
 
@@ -41,7 +42,7 @@ class LLMProviderBase(abc.ABC):
         # Initialize providers based on flags
         self.provider = self._init_provider() if self.need_sync else None
         self.async_provider = self._init_async_provider() if self.need_async else None
-        self.stream_tool_buffer = []
+        self.stream_tool_buffer = ToolCallDeltas()
 
     @abc.abstractmethod
     def _init_provider(self):
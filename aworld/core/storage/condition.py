@@ -1,7 +1,7 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 import abc
-from typing import Any, Literal, TypedDict, List, Union, Dict
+from typing import Any, Literal, TypedDict, List, Union, Dict, Callable, Optional, Iterable
 
 from aworld.core.exceptions import AWorldRuntimeException
 from aworld.core.storage.data import Data as DataItem
@@ -109,16 +109,237 @@ class ConditionBuilder:
         return self
 
 
+def get_field_value(data: DataItem, field: str) -> Any:
+    """Get the field value from the value of data, an attribute or a dict key."""
+    value = data.value
+    if not value:
+        raise AWorldRuntimeException(f"{data} no value to get.")
+    if isinstance(value, dict):
+        return value.get(field)
+    return getattr(value, field, None)
+
+
+def _compile_op(field: str, op: str, target: Any) -> Callable[[DataItem], bool]:
+    def get(data):
+        value = data.value
+        if not value:
+            raise AWorldRuntimeException(f"{data} no value to get.")
+        if value.__class__ is dict:
+            return value.get(field)
+        return getattr(value, field, None)
+
+    if op == "eq":
+        return lambda data: get(data) == target
+    if op == "ne":
+        return lambda data: get(data) != target
+    if op == "gt":
+        return lambda data: get(data) > target
+    if op == "gte":
+        return lambda data: get(data) >= target
+    if op == "lt":
+        return lambda data: get(data) < target
+    if op == "lte":
+        return lambda data: get(data) <= target
+    if op in ("in", "not_in"):
+        try:
+            lookup = frozenset(target)
+        except TypeError:
+            lookup = None
+
+        def contains(data):
+            val = get(data)
+            if lookup is not None:
+                try:
+                    return val in lookup
+                except TypeError:
+                    pass
+            return val in target
+
+        return contains if op == "in" else lambda data: not contains(data)
+    if op == "like":
+        return lambda data: target in get(data)
+    if op == "not_like":
+        return lambda data: target not in get(data)
+    if op == "is_null":
+        return lambda data: get(data) is None
+    if op == "is_not_null":
+        return lambda data: get(data) is not None
+    return lambda data: False
+
+
+def _compile_all(predicates: List[Callable[[DataItem], bool]]) -> Callable[[DataItem], bool]:
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda data: first(data) and second(data)
+
+    def check(data):
+        for predicate in predicates:
+            if not predicate(data):
+                return False
+        return True
+
+    return check
+
+
+def _compile_any(predicates: List[Callable[[DataItem], bool]]) -> Callable[[DataItem], bool]:
+    if not predicates:
+        return lambda data: False
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda data: first(data) or second(data)
+
+    def check(data):
+        for predicate in predicates:
+            if predicate(data):
+                return True
+        return False
+
+    return check
+
+
+def compile_condition(condition: Optional[Condition]) -> Callable[[DataItem], bool]:
+    """Compile the condition tree once into a predicate, same semantics as `ConditionFilter.check_condition`."""
+    if condition is None:
+        return lambda data: True
+    if "field" in condition and "op" in condition:
+        return _compile_op(condition["field"], condition["op"], condition.get("value"))
+    if "and_" in condition:
+        predicates = [compile_condition(c) for c in condition["and_"]]
+        return _compile_all(predicates) if predicates else (lambda data: True)
+    if "or_" in condition:
+        return _compile_any([compile_condition(c) for c in condition["or_"]])
+    return lambda data: False
+
+
+class FieldIndex:
+    """Per-field hash indexes of data items, answering `eq` and `in` conditions without a scan.
+
+    Items are tracked by identity, items whose field value is not hashable are candidates of every lookup.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        self.fields = list(fields)
+        self._index: Dict[str, Dict[Any, Dict[int, DataItem]]] = {field: {} for field in self.fields}
+        self._unhashable: Dict[str, Dict[int, DataItem]] = {field: {} for field in self.fields}
+        # sort key of items, candidates keep its order, the insertion order by default
+        self._order: Dict[int, Any] = {}
+        # indexed values of items, None for unhashable ones
+        self._entries: Dict[int, List[tuple]] = {}
+        self._seq = 0
+
+    def _values(self, data: DataItem):
+        value = getattr(data, "value", None)
+        for field in self.fields:
+            if not value:
+                yield field, None
+            elif isinstance(value, dict):
+                yield field, value.get(field)
+            else:
+                yield field, getattr(value, field, None)
+
+    def add(self, data: DataItem, order: Any = None):
+        """Index the item, `order` is its sort key among the candidates (comparable with the keys of the other
+        items), the insertion order if None."""
+        key = id(data)
+        if key in self._order:
+            self.remove(data)
+        if order is None:
+            self._seq += 1
+            order = self._seq
+        self._order[key] = order
+        entries = []
+        for field, val in self._values(data):
+            try:
+                self._index[field].setdefault(val, {})[key] = data
+                entries.append((field, val))
+            except TypeError:
+                self._unhashable[field][key] = data
+                entries.append((field, None))
+        self._entries[key] = entries
+
+    def order(self, data: DataItem) -> Any:
+        """Sort key of an indexed item, None if it is not indexed."""
+        return self._order.get(id(data))
+
+    def remove(self, data: DataItem):
+        key = id(data)
+        if self._order.pop(key, None) is None:
+            return
+        for field, val in self._entries.pop(key):
+            if self._unhashable[field].pop(key, None) is not None:
+                continue
+            items = self._index[field].get(val)
+            if items is not None:
+                items.pop(key, None)
+                if not items:
+                    del self._index[field][val]
+
+    def clear(self):
+        for field in self.fields:
+            self._index[field].clear()
+            self._unhashable[field].clear()
+        self._order.clear()
+        self._entries.clear()
+
+    def _lookup(self, condition: Condition) -> Optional[Dict[int, DataItem]]:
+        if "field" in condition and "op" in condition:
+            field, op = condition["field"], condition["op"]
+            if field not in self._index or op not in ("eq", "in"):
+                return None
+            values = [condition.get("value")] if op == "eq" else condition.get("value")
+            result = dict(self._unhashable[field])
+            try:
+                for val in values:
+                    result.update(self._index[field].get(val, {}))
+            except TypeError:
+                return None
+            return result
+        if "and_" in condition:
+            result = None
+            for child in condition["and_"]:
+                found = self._lookup(child)
+                if found is not None:
+                    result = found if result is None else {k: v for k, v in result.items() if k in found}
+            return result
+        if "or_" in condition:
+            result = {}
+            for child in condition["or_"]:
+                found = self._lookup(child)
+                if found is None:
+                    return None
+                result.update(found)
+            return result
+        return None
+
+    def candidates(self, condition: Condition) -> Optional[List[DataItem]]:
+        """Items which may match the condition ordered by their sort key, None if the indexes can not narrow it."""
+        if not condition:
+            return None
+        found = self._lookup(condition)
+        if found is None:
+            return None
+        return [found[key] for key in sorted(found, key=self._order.__getitem__)]
+
+
 class ConditionFilter:
     def __init__(self, condition: Condition) -> None:
         self.condition = condition
+        self._predicate = None
 
     def _get_field_value(self, data: DataItem, field: str) -> Any:
         """Get the field value from data."""
-        if data.value:
-            return getattr(data.value, field, None)
-        else:
-            raise AWorldRuntimeException(f"{data} no value to get.")
+        return get_field_value(data, field)
+
+    @property
+    def predicate(self) -> Callable[[DataItem], bool]:
+        """The compiled condition of the filter."""
+        if self._predicate is None:
+            self._predicate = compile_condition(self.condition)
+        return self._predicate
 
     def check_condition(self, data: DataItem, condition: Condition) -> bool:
         """Data match condition check."""
@@ -176,4 +397,5 @@ class ConditionFilter:
         if not condition:
             return data
 
-        return [row for row in data if self.check_condition(row, condition)]
+        predicate = self.predicate if condition is self.condition else compile_condition(condition)
+        return [row for row in data if predicate(row)]
@@ -1,11 +1,12 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
+import asyncio
 import hashlib
 import json
+import os
+import threading
 from pathlib import Path
-from typing import List
-
-import aiofiles
+from typing import List, Dict, Tuple, Optional, Any
 
 from aworld.config import StorageConfig
 from aworld.core.storage.base import Storage, DataItem, DataBlock
@@ -13,20 +14,330 @@ from aworld.core.storage.condition import Condition, ConditionFilter
 from aworld.core.storage.data import Data
 from aworld.logs.util import logger
 
+_PUT = "put"
+_DEL = "del"
+
+# id -> (segment, offset, length)
+Location = Tuple[int, int, int]
+
 
 class FileConfig(StorageConfig):
     name: str = "file"
     root_dir: str = "."
+    # segment size to roll over to a new segment file
+    segment_max_bytes: int = 16 * 1024 * 1024
+    # compact a block in the background when the ratio of dead bytes is above it
+    compact_dead_ratio: float = 0.5
+    compact_min_bytes: int = 1024 * 1024
+
+
+def _encode_record(op: str, data_id: str, payload: str = "") -> bytes:
+    # the id is readable without parsing the payload, e.g. when a block is opened
+    return f"{op}\t{json.dumps(data_id)}\t{payload}\n".encode("utf-8")
+
+
+def _decode_record(line: bytes) -> Tuple[str, str, str]:
+    op, data_id, payload = line.decode("utf-8").rstrip("\n").split("\t", 2)
+    return op, json.loads(data_id), payload
+
+
+def _update_zones(zones: Optional[Dict[str, Any]], value: Any) -> Optional[Dict[str, Any]]:
+    """Track the min/max of the scalar fields of the values in a block, None means no pruning is possible."""
+    if zones is None:
+        return None
+    if not isinstance(value, dict):
+        return None
+    for key, val in value.items():
+        if val is None:
+            continue
+        if not isinstance(val, (str, int, float, bool)):
+            zones[key] = None
+            continue
+        zone = zones.get(key, ...)
+        if zone is ...:
+            zones[key] = [val, val]
+        elif zone is not None:
+            try:
+                zones[key] = [min(zone[0], val), max(zone[1], val)]
+            except TypeError:
+                zones[key] = None
+    return zones
+
+
+def _merge_zones(zones: Optional[Dict[str, Any]], other: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if zones is None or other is None:
+        return None
+    for key, zone in other.items():
+        if zone is None:
+            zones[key] = None
+        else:
+            zones = _update_zones(zones, {key: zone[0]})
+            zones = _update_zones(zones, {key: zone[1]})
+    return zones
+
+
+def _may_match(zones: Optional[Dict[str, Any]], condition: Condition) -> bool:
+    """Whether a block with the zones can hold data matching the condition, conservative."""
+    if zones is None or not condition:
+        return True
+    if "field" in condition and "op" in condition:
+        op = condition["op"]
+        target = condition.get("value")
+        if op not in ("eq", "gt", "gte", "lt", "lte", "in") or target is None:
+            return True
+        if condition["field"] not in zones:
+            # no value of the field in the block
+            return False
+        zone = zones[condition["field"]]
+        if zone is None:
+            return True
+        low, high = zone
+        try:
+            if op == "eq":
+                return low <= target <= high
+            if op == "gt":
+                return high > target
+            if op == "gte":
+                return high >= target
+            if op == "lt":
+                return low < target
+            if op == "lte":
+                return low <= target
+            return any(val is not None and low <= val <= high for val in target)
+        except TypeError:
+            return True
+    if "and_" in condition:
+        return all(_may_match(zones, c) for c in condition["and_"])
+    if "or_" in condition:
+        return any(_may_match(zones, c) for c in condition["or_"])
+    return True
+
+
+class _Segments:
+    """Append-only segment files of a block with the in-memory offset index of the live data."""
+
+    def __init__(self, block_dir: Path, conf: FileConfig):
+        self.dir = block_dir / "segments"
+        self.conf = conf
+        self.lock = threading.RLock()
+        self.index: Dict[str, Location] = {}
+        # segment -> size and dead bytes
+        self.sizes: Dict[int, int] = {}
+        self.dead: Dict[int, int] = {}
+        self.zones: Optional[Dict[str, Any]] = {}
+        self.active = 0
+        self.compacting = False
+        self._writer = None
+        self._readers: Dict[int, int] = {}
+
+    def _path(self, seq: int) -> Path:
+        return self.dir / f"{seq:08d}.log"
+
+    def _hint_path(self, seq: int) -> Path:
+        return self.dir / f"{seq:08d}.idx"
+
+    def open(self):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        seqs = sorted(int(path.stem) for path in self.dir.glob("*.log"))
+        for seq in seqs:
+            hint = self._hint_path(seq)
+            if hint.exists():
+                self._load_hint(seq, hint)
+            else:
+                self._scan(seq)
+        self.active = seqs[-1] if seqs else 0
+        if seqs and self._hint_path(self.active).exists():
+            # sealed, appending would invalidate its hint
+            self.active += 1
+        self.sizes.setdefault(self.active, 0)
+        self.dead.setdefault(self.active, 0)
+
+    def _apply(self, seq: int, op: str, data_id: str, offset: int, length: int):
+        old = self.index.pop(data_id, None)
+        if old is not None:
+            self.dead[old[0]] = self.dead.get(old[0], 0) + old[2]
+        if op == _PUT:
+            self.index[data_id] = (seq, offset, length)
+        else:
+            # the tombstone itself is dead
+            self.dead[seq] = self.dead.get(seq, 0) + length
+
+    def _load_hint(self, seq: int, hint: Path):
+        with open(hint, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for op, data_id, offset, length in data["records"]:
+            self._apply(seq, op, data_id, offset, length)
+        self.sizes[seq] = data["size"]
+        self.zones = _merge_zones(self.zones, data.get("zones"))
+
+    def _scan(self, seq: int):
+        offset = 0
+        with open(self._path(seq), "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # torn write at the tail
+                    logger.warning(f"FileStorage: truncate incomplete record of {self._path(seq)} at {offset}")
+                    break
+                try:
+                    op, data_id, payload = _decode_record(line)
+                except ValueError:
+                    logger.warning(f"FileStorage: skip invalid record of {self._path(seq)} at {offset}")
+                    offset += len(line)
+                    continue
+                self._apply(seq, op, data_id, offset, len(line))
+                if op == _PUT:
+                    self.zones = _update_zones(self.zones, json.loads(payload).get("value"))
+                offset += len(line)
+        if offset != self._path(seq).stat().st_size:
+            with open(self._path(seq), "r+b") as f:
+                f.truncate(offset)
+        self.sizes[seq] = offset
+
+    def _write_hint(self, seq: int, records: List[list], zones: Optional[Dict[str, Any]]):
+        tmp = self._hint_path(seq).with_suffix(".idx.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"size": self.sizes[seq], "records": records, "zones": zones}, f)
+        os.replace(tmp, self._hint_path(seq))
+
+    def _records_of(self, seq: int) -> List[list]:
+        records = []
+        offset = 0
+        with open(self._path(seq), "rb") as f:
+            for line in f:
+                op, data_id, _ = _decode_record(line)
+                records.append([op, data_id, offset, len(line)])
+                offset += len(line)
+        return records
+
+    def _roll(self):
+        """Seal the active segment and start a new one."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        sealed = self.active
+        self.active = max(self.sizes) + 1
+        self.sizes[self.active] = 0
+        self.dead[self.active] = 0
+        if self.sizes.get(sealed):
+            # zones are block wide, a sealed segment hint keeps the zones at the time it was sealed
+            self._write_hint(sealed, self._records_of(sealed), self.zones)
+
+    def append(self, op: str, data_id: str, payload: str = "", value: Any = None):
+        record = _encode_record(op, data_id, payload)
+        with self.lock:
+            if self.sizes[self.active] and self.sizes[self.active] + len(record) > self.conf.segment_max_bytes:
+                self._roll()
+            if self._writer is None:
+                self._writer = open(self._path(self.active), "ab")
+            offset = self.sizes[self.active]
+            self._writer.write(record)
+            self._writer.flush()
+            self.sizes[self.active] += len(record)
+            self._apply(self.active, op, data_id, offset, len(record))
+            if op == _PUT:
+                self.zones = _update_zones(self.zones, value)
+
+    def read(self, location: Location) -> dict:
+        seq, offset, length = location
+        fd = self._readers.get(seq)
+        if fd is None:
+            fd = os.open(self._path(seq), os.O_RDONLY)
+            self._readers[seq] = fd
+        _, _, payload = _decode_record(os.pread(fd, length, offset))
+        return json.loads(payload)
+
+    def get(self, data_id: str) -> Optional[dict]:
+        with self.lock:
+            location = self.index.get(data_id)
+            return self.read(location) if location else None
+
+    def items(self) -> List[dict]:
+        with self.lock:
+            return [self.read(location) for location in self.index.values()]
+
+    def need_compaction(self) -> bool:
+        total = sum(self.sizes.values())
+        dead = sum(self.dead.values())
+        return (not self.compacting and total >= self.conf.compact_min_bytes
+                and dead >= total * self.conf.compact_dead_ratio)
+
+    def compact(self):
+        """Rewrite the live data of the sealed segments into one segment, concurrent writes go to the new active one."""
+        with self.lock:
+            self.compacting = True
+            old = sorted(self.sizes)
+            # the compacted segment replays after the old ones and before the new writes
+            self._roll()
+            target = self.active
+            self._roll()
+            self.sizes.pop(target)
+            self.dead.pop(target)
+            old_set = set(old)
+            entries = [(data_id, loc) for data_id, loc in self.index.items() if loc[0] in old_set]
+
+        try:
+            records, moved, offset = [], {}, 0
+            tmp = self._path(target).with_suffix(".log.tmp")
+            with open(tmp, "wb") as f:
+                for data_id, loc in entries:
+                    fd = os.open(self._path(loc[0]), os.O_RDONLY)
+                    try:
+                        line = os.pread(fd, loc[2], loc[1])
+                    finally:
+                        os.close(fd)
+                    f.write(line)
+                    records.append([_PUT, data_id, offset, len(line)])
+                    moved[data_id] = (loc, (target, offset, len(line)))
+                    offset += len(line)
+            os.replace(tmp, self._path(target))
+        except Exception:
+            with self.lock:
+                self.compacting = False
+            raise
+
+        with self.lock:
+            self.sizes[target] = offset
+            self.dead[target] = 0
+            for data_id, (old_loc, new_loc) in moved.items():
+                if self.index.get(data_id) == old_loc:
+                    self.index[data_id] = new_loc
+                else:
+                    # changed while compacting, the later record wins at replay
+                    self.dead[target] += new_loc[2]
+            self._write_hint(target, records, self.zones)
+            for seq in old:
+                fd = self._readers.pop(seq, None)
+                if fd is not None:
+                    os.close(fd)
+                self.sizes.pop(seq, None)
+                self.dead.pop(seq, None)
+                self._path(seq).unlink(missing_ok=True)
+                self._hint_path(seq).unlink(missing_ok=True)
+            self.compacting = False
+
+    def close(self):
+        with self.lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            for fd in self._readers.values():
+                os.close(fd)
+            self._readers.clear()
 
 
 class FileStorage(Storage[DataItem]):
-    """Simple local file-based storage.
-    TODO: add index
+    """Local file-based storage, log structured.
 
     Layout: root_dir/ -> block_id/ -> meta.json
-                                   -> data/ -> data_id.json
+                                   -> segments/ -> 00000000.log, 00000000.idx ...
+
+    Data of a block is appended to segment files, deletes append tombstones. The offset index of the
+    live data of a block is loaded when the block is first used (from the `.idx` hint of sealed
+    segments), reads are one positioned read per item. Blocks with mostly dead bytes are compacted
+    in the background. Blocks of the legacy layout (data/ -> data_id.json) are imported when opened.
 
-    Note: Does not support data sharding, structuring, etc.
+    Note: Does not support data sharding, structuring, etc. Not safe for concurrent writers
+    in several processes.
     """
 
     def __init__(self, conf: FileConfig = None):
@@ -35,12 +346,16 @@ class FileStorage(Storage[DataItem]):
         super().__init__(conf)
         self._blocks_dir = Path(conf.root_dir).resolve()
         self._blocks_dir.mkdir(parents=True, exist_ok=True)
+        self._segments: Dict[str, _Segments] = {}
+        self._lock = threading.Lock()
+        self._compactions = set()
 
     def backend(self):
         return self
 
     async def delete_all(self):
         """Delete ALL data under the root directory (use with caution)."""
+        self._close_blocks()
         if self._blocks_dir.exists():
             for child in self._blocks_dir.glob("**/*"):
                 try:
@@ -56,6 +371,14 @@ class FileStorage(Storage[DataItem]):
                 except Exception:
                     pass
 
+    def _close_blocks(self, block_id: str = None):
+        with self._lock:
+            block_ids = [block_id] if block_id is not None else list(self._segments)
+            for key in block_ids:
+                segments = self._segments.pop(key, None)
+                if segments is not None:
+                    segments.close()
+
     def _block_dir(self, block_id: str) -> Path:
         return self._blocks_dir / block_id
 
@@ -65,10 +388,39 @@ class FileStorage(Storage[DataItem]):
     def _data_dir(self, block_id: str) -> Path:
         return self._block_dir(block_id) / "data"
 
+    def _block_segments(self, block_id: str) -> _Segments:
+        segments = self._segments.get(block_id)
+        if segments is not None:
+            return segments
+        with self._lock:
+            segments = self._segments.get(block_id)
+            if segments is None:
+                segments = _Segments(self._block_dir(block_id), self.conf)
+                segments.open()
+                self._import_legacy(block_id, segments)
+                self._segments[block_id] = segments
+        return segments
+
+    def _import_legacy(self, block_id: str, segments: _Segments):
+        data_dir = self._data_dir(block_id)
+        if not data_dir.exists():
+            return
+        for fp in sorted(data_dir.glob("*.json"), key=lambda p: p.stat().st_mtime):
+            try:
+                with open(fp, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                segments.append(_PUT, fp.stem, json.dumps(data, ensure_ascii=False), data.get("value"))
+                fp.unlink()
+            except Exception as e:
+                logger.warning(f"failed to import {fp}: {e}")
+        try:
+            data_dir.rmdir()
+        except OSError:
+            pass
+
     async def create_block(self, block_id: str, overwrite: bool = True) -> bool:
         block_id = str(block_id)
         self._block_dir(block_id).mkdir(parents=True, exist_ok=True)
-        self._data_dir(block_id).mkdir(parents=True, exist_ok=True)
 
         block_meta = self._block_meta_path(block_id)
         if block_meta.exists() and not overwrite:
@@ -76,8 +428,8 @@ class FileStorage(Storage[DataItem]):
 
         meta = DataBlock(id=block_id)
         try:
-            async with aiofiles.open(block_meta, "w", encoding="utf-8") as f:
-                await f.write(
+            with open(block_meta, "w", encoding="utf-8") as f:
+                f.write(
                     json.dumps(obj={"id": meta.id, "create_at": meta.create_at, "meta_info": meta.meta_info},
                                ensure_ascii=False)
                 )
@@ -87,7 +439,9 @@ class FileStorage(Storage[DataItem]):
             return False
 
     async def delete_block(self, block_id: str, exists: bool = False) -> bool:
-        block_dir = self._block_dir(str(block_id))
+        block_id = str(block_id)
+        block_dir = self._block_dir(block_id)
+        self._close_blocks(block_id)
         if not block_dir.exists():
             return exists
         try:
@@ -122,22 +476,19 @@ class FileStorage(Storage[DataItem]):
                 logger.warning(f"get_block: failed to read meta for {block_id}, err={e}")
         return DataBlock(id=block_id)
 
-    def _data_path(self, block_id: str, data_id: str) -> Path:
-        return self._data_dir(block_id) / f"{data_id}.json"
-
     async def create_data(self, data: DataItem, block_id: str = None, overwrite: bool = True) -> bool:
         block_id = str(data.block_id if hasattr(data, "block_id") and data.block_id else block_id)
         data_id = data.id if hasattr(data, "id") else hashlib.md5(data.model_dump_json().encode()).hexdigest()
-        await self.create_block(block_id, overwrite=False)
-        path = self._data_path(block_id, data_id)
-        if path.exists() and not overwrite:
+        if not self._block_meta_path(block_id).exists():
+            await self.create_block(block_id, overwrite=False)
+        segments = self._block_segments(block_id)
+        if not overwrite and data_id in segments.index:
             logger.warning(f"create_data: exists and overwrite=False, block_id={block_id}, id={data_id}")
             return False
 
         try:
-            async with aiofiles.open(path, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(data.model_dump(), ensure_ascii=False))
-            logger.info(f"create_data: {data_id} store to the {path}")
+            self._append(block_id, segments, data)
+            logger.debug(f"create_data: {data_id} store to the block {block_id}")
             return True
         except Exception as e:
             logger.warning(f"create_data: failed for block={block_id}, id={data_id}, err={e}")
@@ -146,19 +497,24 @@ class FileStorage(Storage[DataItem]):
     async def update_data(self, data: DataItem, block_id: str = None, exists: bool = False) -> bool:
         block_id = str(data.block_id if hasattr(data, "block_id") and data.block_id else block_id)
         data_id = data.id if hasattr(data, "id") else hashlib.md5(data.model_dump_json().encode()).hexdigest()
-        path = self._data_path(block_id, data_id)
-        if not path.exists() and not exists:
-            return await self.create_data(data, block_id=block_id, overwrite=True)
+        if not self._block_meta_path(block_id).exists() or data_id not in self._block_segments(block_id).index:
+            if not exists:
+                return await self.create_data(data, block_id=block_id, overwrite=True)
 
         try:
-            async with aiofiles.open(path, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(data.model_dump(), ensure_ascii=False))
-            logger.info(f"update_data: {data_id} overwrite store to the {path}")
+            self._append(block_id, self._block_segments(block_id), data)
+            logger.debug(f"update_data: {data_id} overwrite store to the block {block_id}")
             return True
         except Exception as e:
             logger.warning(f"update_data: failed for block={block_id}, id={data_id}, err={e}")
             return False
 
+    def _append(self, block_id: str, segments: _Segments, data: DataItem):
+        data_id = data.id if hasattr(data, "id") else hashlib.md5(data.model_dump_json().encode()).hexdigest()
+        dumped = data.model_dump()
+        segments.append(_PUT, data_id, json.dumps(dumped, ensure_ascii=False), dumped.get("value"))
+        self._maybe_compact(block_id, segments)
+
     async def delete_data(self,
                           data_id: str = None,
                           data: DataItem = None,
@@ -167,44 +523,80 @@ class FileStorage(Storage[DataItem]):
         # data_id can not None
         data_id = data_id if data_id else hashlib.md5(data.model_dump_json().encode()).hexdigest()
         block_id = str(block_id)
-        path = self._data_path(block_id, data_id)
-        if not path.exists():
+        if not self._block_meta_path(block_id).exists():
+            return exists
+        segments = self._block_segments(block_id)
+        if data_id not in segments.index:
             return exists
 
         try:
-            path.unlink(missing_ok=True)
-            logger.info(f"delete_data: {path} deleted")
+            segments.append(_DEL, data_id)
+            logger.debug(f"delete_data: {data_id} of block {block_id} deleted")
+            self._maybe_compact(block_id, segments)
             return True
         except Exception as e:
             logger.warning(f"delete_data: failed for block={block_id}, id={data_id}, err={e}")
             return False
 
+    def _maybe_compact(self, block_id: str, segments: _Segments):
+        if not segments.need_compaction():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            segments.compact()
+            return
+        # mark before the thread starts, so one compaction runs per block
+        segments.compacting = True
+        task = loop.create_task(asyncio.to_thread(self._compact_block, block_id, segments))
+        self._compactions.add(task)
+        task.add_done_callback(self._compactions.discard)
+
+    def _compact_block(self, block_id: str, segments: _Segments):
+        try:
+            segments.compact()
+            logger.debug(f"FileStorage: compacted block {block_id}")
+        except Exception as e:
+            segments.compacting = False
+            logger.warning(f"FileStorage: failed to compact block {block_id}: {e}")
+
+    async def compact(self, block_id: str = None):
+        """Compact the block, or all opened blocks, now."""
+        await asyncio.gather(*self._compactions, return_exceptions=True)
+        block_ids = [str(block_id)] if block_id is not None else list(self._segments)
+        for key in block_ids:
+            await asyncio.to_thread(self._compact_block, key, self._block_segments(key))
+
+    def _to_item(self, data: dict, block_id: str) -> DataItem:
+        item = Data.from_dict(data)
+        # BaseModel
+        if not item.value:
+            item = data
+        elif not item.block_id:
+            item.block_id = block_id
+        return item
+
     def _load_all_data_in_block(self, block_id: str) -> List[DataItem]:
         items: List[DataItem] = []
-        data_dir = self._data_dir(block_id)
-        if not data_dir.exists():
+        if not self._block_dir(block_id).exists():
             return items
 
-        for fp in data_dir.glob("*.json"):
+        for data in self._block_segments(block_id).items():
             try:
-                with open(fp, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                item = Data.from_dict(data)
-                # BaseModel
-                if not item.value:
-                    item = data
-                elif not item.block_id:
-                    item.block_id = block_id
-                items.append(item)
+                items.append(self._to_item(data, block_id))
             except Exception as e:
-                logger.warning(f"failed to parse {fp}: {e}")
+                logger.warning(f"failed to parse data of block {block_id}: {e}")
         return items
 
+    def _block_ids(self) -> List[str]:
+        return [block_meta.parent.name for block_meta in self._blocks_dir.glob("*/meta.json")]
+
     async def select_data(self, condition: Condition = None) -> List[DataItem]:
-        # Scan all blocks
         items: List[DataItem] = []
-        for block_meta in self._blocks_dir.glob("*/meta.json"):
-            block_id = block_meta.parent.name
+        for block_id in self._block_ids():
+            # skip the blocks whose value ranges can not match
+            if not _may_match(self._block_segments(block_id).zones, condition):
+                continue
             items.extend(self._load_all_data_in_block(block_id))
         return ConditionFilter(condition).filter(items, condition)
 
@@ -213,4 +605,6 @@ class FileStorage(Storage[DataItem]):
         return self._load_all_data_in_block(block_id)
 
     async def size(self, condition: Condition = None) -> int:
+        if not condition:
+            return sum(len(self._block_segments(block_id).index) for block_id in self._block_ids())
         return len(await self.select_data(condition))
@@ -5,7 +5,7 @@ from typing import List, Dict, Union
 
 from aworld.config import StorageConfig
 from aworld.core.storage.base import Storage, DataItem, DataBlock
-from aworld.core.storage.condition import Condition, ConditionBuilder, ConditionFilter
+from aworld.core.storage.condition import Condition, ConditionBuilder, ConditionFilter, FieldIndex
 from aworld.logs.util import logger
 from aworld.utils.serialized_util import to_serializable
 
@@ -13,6 +13,8 @@ from aworld.utils.serialized_util import to_serializable
 class InmemoryConfig(StorageConfig):
     name: str = "inmemory"
     max_capacity: int = 10000
+    # value fields with a hash index, `eq` and `in` conditions on them are answered without a scan
+    index_fields: List[str] = []
 
 
 class InmemoryConditionBuilder(ConditionBuilder):
@@ -71,6 +73,10 @@ class InmemoryStorage(Storage[DataItem]):
         self.blocks: Dict[str, DataBlock] = OrderedDict()
         self.datas: Dict[str, List[DataItem]] = OrderedDict()
         self.max_capacity = conf.max_capacity
+        self._field_index = FieldIndex(conf.index_fields) if conf.index_fields else None
+        # indexed items are ordered like a scan: by the rank of their block in `datas`, then by position
+        self._block_ranks: Dict[str, int] = {}
+        self._position = 0
 
     def backend(self):
         return self
@@ -104,19 +110,36 @@ class InmemoryStorage(Storage[DataItem]):
         if data in block_data:
             if overwrite:
                 idx = block_data.index(data)
+                self._reindex(block_data[idx], data, block_id)
                 block_data.__setitem__(idx, data)
             else:
                 logger.warning(f"Data {data.id} has exists.")
                 return False
         else:
             self.datas[block_id].append(data)
+            self._reindex(None, data, block_id)
         return True
 
+    def _reindex(self, old: DataItem = None, new: DataItem = None, block_id: str = None):
+        """Replace `old` by `new` in the field index, `new` takes the position of `old` or is appended to the block."""
+        if self._field_index is None:
+            return
+        order = None
+        if old is not None:
+            order = self._field_index.order(old)
+            self._field_index.remove(old)
+        if new is not None:
+            if order is None:
+                self._position += 1
+                order = (self._block_ranks.setdefault(block_id, len(self._block_ranks)), self._position)
+            self._field_index.add(new, order)
+
     async def update_data(self, data: DataItem, block_id: str = None, exists: bool = False) -> bool:
         block_id = str(data.block_id if hasattr(data, "block_id") and data.block_id else block_id)
         block_data = await self.get_data_items(block_id)
         if data in block_data:
             idx = block_data.index(data)
+            self._reindex(block_data[idx], data, block_id)
             block_data.__setitem__(idx, data)
         elif exists:
             logger.warning(f"Data {data.id} not exists to update.")
@@ -142,12 +165,18 @@ class InmemoryStorage(Storage[DataItem]):
 
         if del_data:
             block_data.remove(del_data)
+            self._reindex(del_data)
         elif exists:
             logger.warning(f"Data {data_id} not exists to delete.")
             return False
         return True
 
     async def select_data(self, condition: Condition = None) -> List[DataItem]:
+        if condition and self._field_index is not None:
+            candidates = self._field_index.candidates(condition)
+            if candidates is not None:
+                return ConditionFilter(condition).filter(candidates)
+
         datas = []
         for _, data in self.datas.items():
             datas.extend(data)
@@ -160,11 +189,15 @@ class InmemoryStorage(Storage[DataItem]):
         block_id = str(block_id)
         if block_id not in self.datas:
             self.datas[block_id] = []
+            self._block_ranks[block_id] = len(self._block_ranks)
         return self.datas.get(block_id, [])
 
     async def delete_all(self):
         self.blocks.clear()
         self.datas.clear()
+        self._block_ranks.clear()
+        if self._field_index is not None:
+            self._field_index.clear()
 
     async def size(self, query_condition: Condition = None) -> int:
         return len(await self.select_data(query_condition))
@@ -1,9 +1,12 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
+import hashlib
 import multiprocessing
-import traceback
 import pickle
-from typing import Dict, List
+import struct
+import uuid
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
 
 from aworld.config import StorageConfig
 from aworld.core.storage.base import Storage, DataItem
@@ -11,106 +14,262 @@ from aworld.core.storage.condition import Condition, ConditionFilter
 from aworld.core.storage.data import DataBlock
 from aworld.logs.util import logger
 
+_PUT = 1
+_DEL = 2
+
 
 class MultiProcessConfig(StorageConfig):
     name: str = "multi_process"
     max_capacity: int = 10000
+    # size of a shared memory segment of a block arena, larger items get a segment of their own size
+    arena_segment_bytes: int = 4 * 1024 * 1024
+    # an arena is compacted when its overwritten and deleted records take more than this and than its live records
+    arena_compact_bytes: int = 4 * 1024 * 1024
+
+
+class _Arena:
+    """Append-only records in a chain of named shared memory segments.
+
+    Segment layout: header (used bytes, capacity, segment count - maintained in the first segment)
+    followed by records (payload length, op, id length, id, payload). Writers append under the
+    storage lock and publish a record by advancing `used` after writing it, readers are lock free
+    and keep a per-process offset table of the live records, synced incrementally. Overwritten and
+    deleted records are dead bytes, the storage rewrites the live records into a new arena generation
+    when there are too many of them (`MultiProcessStorage._compact`).
+    """
+
+    HEADER = struct.Struct("<QQQ")
+    RECORD = struct.Struct("<IBH")
+
+    def __init__(self, name: str, segment_bytes: int, create: bool = False):
+        self.name = name
+        self.segment_bytes = segment_bytes
+        self._segments: List[shared_memory.SharedMemory] = []
+        # id -> (segment, payload offset, payload length)
+        self.table: Dict[str, Tuple[int, int, int]] = {}
+        # read position (segment, offset) and the number of records read
+        self._cursor = (0, self.HEADER.size)
+        self.records = 0
+        self.live_bytes = 0
+        self.dead_bytes = 0
+        if create:
+            self._create_segment(0, segment_bytes)
+        else:
+            self._segments.append(shared_memory.SharedMemory(name=self._segment_name(0)))
+
+    def _segment_name(self, index: int) -> str:
+        return f"{self.name}_{index}"
+
+    def _create_segment(self, index: int, capacity: int) -> shared_memory.SharedMemory:
+        shm = shared_memory.SharedMemory(name=self._segment_name(index), create=True, size=capacity)
+        self.HEADER.pack_into(shm.buf, 0, self.HEADER.size, capacity, 0)
+        self._segments.append(shm)
+        self._set_segment_count(index + 1)
+        return shm
+
+    def _segment_count(self) -> int:
+        return self.HEADER.unpack_from(self._segments[0].buf, 0)[2]
+
+    def _set_segment_count(self, count: int):
+        used, capacity, _ = self.HEADER.unpack_from(self._segments[0].buf, 0)
+        self.HEADER.pack_into(self._segments[0].buf, 0, used, capacity, count)
+
+    def _attach_segments(self):
+        for index in range(len(self._segments), self._segment_count()):
+            self._segments.append(shared_memory.SharedMemory(name=self._segment_name(index)))
+
+    def append(self, op: int, data_id: str, payload: bytes = b""):
+        """Append a record, the caller holds the storage lock."""
+        self._attach_segments()
+        key = data_id.encode("utf-8")
+        size = self.RECORD.size + len(key) + len(payload)
+        shm = self._segments[-1]
+        used, capacity, count = self.HEADER.unpack_from(shm.buf, 0)
+        if used + size > capacity:
+            shm = self._create_segment(len(self._segments), max(self.segment_bytes, self.HEADER.size + size))
+            used, capacity, count = self.HEADER.unpack_from(shm.buf, 0)
+        self.RECORD.pack_into(shm.buf, used, len(payload), op, len(key))
+        start = used + self.RECORD.size
+        shm.buf[start:start + len(key)] = key
+        shm.buf[start + len(key):start + len(key) + len(payload)] = payload
+        # publish
+        self.HEADER.pack_into(shm.buf, 0, used + size, capacity, count)
+
+    def sync(self):
+        """Apply the records appended since the last sync to the offset table."""
+        self._attach_segments()
+        index, offset = self._cursor
+        while index < len(self._segments):
+            buf = self._segments[index].buf
+            used = self.HEADER.unpack_from(buf, 0)[0]
+            while offset < used:
+                length, op, key_length = self.RECORD.unpack_from(buf, offset)
+                start = offset + self.RECORD.size
+                data_id = bytes(buf[start:start + key_length]).decode("utf-8")
+                size = self.RECORD.size + key_length + length
+                previous = self.table.pop(data_id, None)
+                if previous is not None:
+                    previous_size = self.RECORD.size + key_length + previous[2]
+                    self.live_bytes -= previous_size
+                    self.dead_bytes += previous_size
+                if op == _PUT:
+                    self.table[data_id] = (index, start + key_length, length)
+                    self.live_bytes += size
+                else:
+                    self.dead_bytes += size
+                offset += size
+                self.records += 1
+            if index == len(self._segments) - 1:
+                break
+            index, offset = index + 1, self.HEADER.size
+        self._cursor = (index, offset)
+
+    def payload(self, data_id: str) -> memoryview:
+        index, start, length = self.table[data_id]
+        return self._segments[index].buf[start:start + length]
+
+    def read(self, data_id: str):
+        location = self.table.get(data_id)
+        if location is None:
+            return None
+        # unpickled from the shared buffer without copying it
+        return pickle.loads(self.payload(data_id))
+
+    def items(self) -> list:
+        return [self.read(data_id) for data_id in list(self.table)]
+
+    def close(self, unlink: bool = False):
+        for shm in self._segments:
+            try:
+                shm.close()
+                if unlink:
+                    shm.unlink()
+            except (FileNotFoundError, BufferError) as e:
+                logger.debug(f"close shared memory {shm.name} failed: {e}")
+        self._segments = []
 
 
 class MultiProcessStorage(Storage):
+    """Storage shared by the processes forked (or spawned with it as an argument) from the creating process.
+
+    Every block is an append-only shared memory arena, a catalog arena maps block ids to their arenas.
+    Writes append one pickled item, reads unpickle only the requested items. Writers are serialized by
+    a process shared lock, there is no Manager server process. New items are refused when the storage
+    holds `max_capacity` items.
+    """
+
     def __init__(self, conf: MultiProcessConfig = None):
         if not conf:
             conf = MultiProcessConfig()
         super().__init__(conf)
-        manager = multiprocessing.Manager()
-        # block_id -> [data1, data2,...]
-        self._data: Dict[str, List[str]] = manager.dict()
-        self._fifo_queue: List[str] = manager.list()
         self._max_capacity = conf.max_capacity
-        self._lock: multiprocessing.Lock = manager.Lock()
+        self._uid = uuid.uuid4().hex[:8]
+        self._lock = multiprocessing.Lock()
+        # number of live items of all blocks, changed under the lock
+        self._count = multiprocessing.Value("q", 0, lock=False)
+        self._catalog = _Arena(f"aw_{self._uid}_c", conf.arena_segment_bytes, create=True)
+        self._arenas: Dict[str, _Arena] = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_catalog"] = None
+        state["_arenas"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._catalog = _Arena(f"aw_{self._uid}_c", self.conf.arena_segment_bytes)
 
     def backend(self):
         return self
 
-    def _save_to_shared_memory(self, datas: List[DataItem], block_id: str):
-        serialized_data = pickle.dumps(datas)
-        try:
-            if not self._data.get(block_id):
-                shm = multiprocessing.shared_memory.SharedMemory(create=True, name=block_id, size=len(serialized_data))
-                shm.buf[:len(serialized_data)] = serialized_data
-                self._data[block_id] = shm.name
-                shm.close()
-                return
+    def _arena_name(self, block_id: str, generation: int) -> str:
+        digest = hashlib.md5(block_id.encode("utf-8")).hexdigest()[:10]
+        return f"aw_{self._uid}_{digest}_{generation}"
 
-            shm = multiprocessing.shared_memory.SharedMemory(name=block_id, create=False)
-            if len(serialized_data) > shm.size:
-                shm.close()
-                shm.unlink()
-                shm = multiprocessing.shared_memory.SharedMemory(create=True, name=block_id, size=len(serialized_data))
-                shm.buf[:len(serialized_data)] = serialized_data
-                self._data[block_id] = shm.name
-            else:
-                shm.buf[:len(serialized_data)] = serialized_data
-        except FileNotFoundError:
-            shm = multiprocessing.shared_memory.SharedMemory(create=True, name=block_id, size=len(serialized_data))
-            shm.buf[:len(serialized_data)] = serialized_data
-            self._data[block_id] = shm.name
-        shm.close()
-
-    def _load_from_shared_memory(self, block_id: str) -> List[DataItem]:
-        if block_id not in self._data:
-            return []
+    def _arena(self, block_id: str, create: bool = False) -> Optional[_Arena]:
+        self._catalog.sync()
+        generation = self._catalog.read(block_id)
+        arena = self._arenas.get(block_id)
+        if arena is not None and (generation is None or arena.name != self._arena_name(block_id, generation)):
+            # deleted or recreated by another process
+            arena.close()
+            self._arenas.pop(block_id, None)
+            arena = None
+        if arena is None and generation is not None:
+            arena = _Arena(self._arena_name(block_id, generation), self.conf.arena_segment_bytes)
+            self._arenas[block_id] = arena
+        if arena is None and create:
+            with self._lock:
+                self._catalog.sync()
+                if self._catalog.read(block_id) is None:
+                    # every catalog record bumps the count, a recreated block never reuses an arena name
+                    generation = self._catalog.records
+                    arena = _Arena(self._arena_name(block_id, generation), self.conf.arena_segment_bytes, create=True)
+                    self._catalog.append(_PUT, block_id, pickle.dumps(generation))
+                    self._arenas[block_id] = arena
+                    return arena
+            return self._arena(block_id)
+        return arena
 
-        try:
-            try:
-                multiprocessing.shared_memory.SharedMemory(name=block_id, create=False)
-            except FileNotFoundError:
-                return []
-
-            shm = multiprocessing.shared_memory.SharedMemory(name=block_id)
-            datas = pickle.loads(shm.buf.tobytes())
-            shm.close()
-            return datas
-        except Exception as e:
-            stack_trace = traceback.format_exc()
-            logger.error(f"_load_from_shared_memory error: {e}\nStack trace:\n{stack_trace}")
-            return []
+    def _is_current(self, block_id: str, arena: _Arena) -> bool:
+        """Whether `arena` is still the arena of the block, the caller holds the lock."""
+        self._catalog.sync()
+        generation = self._catalog.read(block_id)
+        return generation is not None and arena.name == self._arena_name(block_id, generation)
 
-    def _delete_from_shared_memory(self, block_id: str, data_id: str = None, data: DataItem = None):
-        if block_id not in self._data:
-            logger.warning(f"{block_id} not in datas")
-            return
-
-        try:
-            shm = multiprocessing.shared_memory.SharedMemory(name=block_id)
-            if data_id or data:
-                datas = pickle.loads(shm.buf.tobytes())
-                for data_item in datas:
-                    if hasattr(data_item, "id"):
-                        if data_item.id == data_id:
-                            datas.remove(data_item)
-                            break
-                    elif data == data_item:
-                        datas.remove(data_item)
-                        break
+    def _compact(self, block_id: str, arena: _Arena):
+        """Rewrite the live records of a block into a new arena generation, the caller holds the lock.
 
-                shm.close()
-                self._save_to_shared_memory(datas, block_id)
-            else:
-                shm.close()
-                shm.unlink()
-                del self._data[block_id]
-        except FileNotFoundError:
-            print(traceback.format_exc())
+        Other processes move to the new generation on their next access of the block (`_arena`).
+        """
+        self._catalog.sync()
+        generation = self._catalog.records
+        compacted = _Arena(self._arena_name(block_id, generation), self.conf.arena_segment_bytes, create=True)
+        for data_id in list(arena.table):
+            compacted.append(_PUT, data_id, arena.payload(data_id))
+        self._catalog.append(_PUT, block_id, pickle.dumps(generation))
+        self._arenas[block_id] = compacted
+        arena.close(unlink=True)
+
+    def _should_compact(self, arena: _Arena) -> bool:
+        return arena.dead_bytes > max(self.conf.arena_compact_bytes, arena.live_bytes)
+
+    def _block_ids(self) -> List[str]:
+        self._catalog.sync()
+        return list(self._catalog.table)
+
+    @staticmethod
+    def _data_id(data: DataItem) -> str:
+        if hasattr(data, "id") and data.id:
+            return str(data.id)
+        return hashlib.md5(pickle.dumps(data)).hexdigest()
 
     async def create_data(self, data: DataItem, block_id: str = None, overwrite: bool = True) -> bool:
         block_id = str(data.block_id if hasattr(data, "block_id") and data.block_id else block_id)
-        with self._lock:
-            existing_data = self._load_from_shared_memory(block_id)
-            existing_data.append(data)
-            self._save_to_shared_memory(existing_data, block_id)
-            self._fifo_queue.append(block_id)
-        return True
+        data_id = self._data_id(data)
+        payload = pickle.dumps(data)
+        while True:
+            arena = self._arena(block_id, create=True)
+            with self._lock:
+                if not self._is_current(block_id, arena):
+                    # compacted or deleted by another process after it was resolved
+                    continue
+                arena.sync()
+                exists = data_id in arena.table
+                if exists and not overwrite:
+                    logger.warning(f"Data {data_id} has exists.")
+                    return False
+                if not exists and self._count.value >= self._max_capacity:
+                    logger.warning(f"Storage is full ({self._max_capacity} items), data {data_id} is not created.")
+                    return False
+                arena.append(_PUT, data_id, payload)
+                if not exists:
+                    self._count.value += 1
+                arena.sync()
+                if self._should_compact(arena):
+                    self._compact(block_id, arena)
+                return True
 
     async def delete_data(self,
                           data_id: str = None,
@@ -118,59 +277,99 @@ class MultiProcessStorage(Storage):
                           block_id: str = None,
                           exists: bool = False) -> bool:
         block_id = str(block_id)
-        with self._lock:
-            self._delete_from_shared_memory(block_id, data_id=data_id, data=data)
-            return True
+        data_id = str(data_id) if data_id else self._data_id(data)
+        while True:
+            arena = self._arena(block_id)
+            if arena is None:
+                logger.warning(f"{block_id} not in datas")
+                return not exists
+            with self._lock:
+                if not self._is_current(block_id, arena):
+                    continue
+                arena.sync()
+                if data_id not in arena.table:
+                    return not exists
+                arena.append(_DEL, data_id)
+                self._count.value -= 1
+                arena.sync()
+                if self._should_compact(arena):
+                    self._compact(block_id, arena)
+                return True
 
     async def size(self, condition: Condition = None) -> int:
+        if not condition:
+            total = 0
+            for block_id in self._block_ids():
+                arena = self._arena(block_id)
+                if arena is not None:
+                    arena.sync()
+                    total += len(arena.table)
+            return total
         return len(await self.select_data(condition))
 
     async def select_data(self, condition: Condition = None) -> List[DataItem]:
-        with self._lock:
-            datas: List[DataItem] = []
-            for key in list(self._data.keys()):
-                datas.extend(self._load_from_shared_memory(key))
-            if condition:
-                datas = ConditionFilter(condition).filter(datas)
-            return datas
+        datas: List[DataItem] = []
+        condition_filter = ConditionFilter(condition)
+        for block_id in self._block_ids():
+            datas.extend(condition_filter.filter(await self.get_data_items(block_id)))
+        return datas
 
     async def get_data_items(self, block_id: str = None) -> List[DataItem]:
         block_id = str(block_id)
-        with self._lock:
-            return self._load_from_shared_memory(block_id)
+        arena = self._arena(block_id)
+        if arena is None:
+            return []
+        arena.sync()
+        return arena.items()
 
     async def update_data(self, data: DataItem, block_id: str = None, exists: bool = False) -> bool:
         block_id = str(data.block_id if hasattr(data, "block_id") and data.block_id else block_id)
-        data_id = None
-        if hasattr(data, "id"):
-            data_id = data.id
-        with self._lock:
-            self._delete_from_shared_memory(block_id, data_id=data_id, data=data)
-            self._save_to_shared_memory([data], block_id)
-        return True
+        if exists:
+            arena = self._arena(block_id)
+            if arena is None:
+                return False
+            arena.sync()
+            if self._data_id(data) not in arena.table:
+                logger.warning(f"Data {self._data_id(data)} not exists to update.")
+                return False
+        return await self.create_data(data, block_id, overwrite=True)
 
     async def get_block(self, block_id: str) -> DataBlock:
         # unsupported
         return DataBlock(id=str(block_id))
 
     async def delete_block(self, block_id: str, exists: bool = False) -> bool:
-        with self._lock:
-            shm = multiprocessing.shared_memory.SharedMemory(name=str(block_id), create=False)
-            shm.close()
-            shm.unlink()
+        block_id = str(block_id)
+        while True:
+            arena = self._arena(block_id)
+            if arena is None:
+                return exists
+            with self._lock:
+                if not self._is_current(block_id, arena):
+                    continue
+                arena.sync()
+                self._count.value -= len(arena.table)
+                self._catalog.append(_DEL, block_id)
+            self._arenas.pop(block_id, None)
+            arena.close(unlink=True)
             return True
 
     async def create_block(self, block_id: str, overwrite: bool = True) -> bool:
-        try:
-            shm = multiprocessing.shared_memory.SharedMemory(name=str(block_id), create=False)
-            if overwrite:
-                shm.close()
-                shm.unlink()
-                self._data.pop(block_id)
-            return True
-        except FileNotFoundError:
-            return True
+        block_id = str(block_id)
+        if overwrite and self._arena(block_id) is not None:
+            await self.delete_block(block_id)
+        self._arena(block_id, create=True)
+        return True
 
     async def delete_all(self):
-        # unsupported
-        return
+        for block_id in self._block_ids():
+            await self.delete_block(block_id)
+
+    def close(self):
+        """Unlink the shared memory of the storage, called by the creating process when no process uses it."""
+        for block_id in self._block_ids():
+            arena = self._arena(block_id)
+            if arena is not None:
+                arena.close(unlink=True)
+        self._arenas = {}
+        self._catalog.close(unlink=True)
@@ -41,13 +41,14 @@ class OdpsSQLBuilder(ConditionBuilder):
             elif op == "lte":
                 return f"{field} <= {self._format_value(value)}"
             elif op == "in":
-                return f"{field} IN ({self._format_value(value)})"
+                return f"{field} IN ({self._format_value(value)})" if value else "FALSE"
             elif op == "not_in":
-                return f"{field} NOT IN ({self._format_value(value)})"
+                return f"{field} NOT IN ({self._format_value(value)})" if value else "TRUE"
             elif op == "like":
-                return f"{field} LIKE '{value}'"
+                # substring match, as ConditionFilter
+                return f"{field} LIKE {self._format_like(value)}"
             elif op == "not_like":
-                return f"{field} NOT LIKE '{value}'"
+                return f"{field} NOT LIKE {self._format_like(value)}"
             elif op == "is_null":
                 return f"{field} IS NULL"
             elif op == "is_not_null":
@@ -60,13 +61,25 @@ class OdpsSQLBuilder(ConditionBuilder):
 
         return ""
 
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("'", "\\'")
+
     def _format_value(self, value: Any) -> str:
         if isinstance(value, str):
-            return f"'{value}'"
-        elif isinstance(value, (list, tuple)):
+            return f"'{self._escape(value)}'"
+        elif isinstance(value, (list, tuple, set, frozenset)):
             return ", ".join(self._format_value(v) for v in value)
+        elif isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        elif value is None:
+            return "NULL"
         return str(value)
 
+    def _format_like(self, value: Any) -> str:
+        pattern = self._escape(str(value)).replace("%", "\\%").replace("_", "\\_")
+        return f"'%{pattern}%'"
+
     def build(self) -> str:
         return self._build_condition(self.condition)
 
@@ -1,6 +1,7 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
-from typing import Dict, List
+import re
+from typing import Dict, List, Iterable
 
 from aworld.config import StorageConfig
 from aworld.core.storage.base import DataItem, Storage
@@ -29,7 +30,30 @@ class RedisConfig(StorageConfig):
     data_schema: Dict[str, type] = {}
 
 
+_TAG_SPECIAL_CHARS = re.compile(r"([,.<>{}\[\]\"':;!@#$%^&*()\-+=~|/\\ ])")
+
+
 class RedisSearchQueryBuilder(ConditionBuilder):
+    """Push a condition down to a RediSearch query, numeric fields use range syntax, others tag syntax."""
+
+    def __init__(self, condition: Condition, numeric_fields: Iterable[str] = ()):
+        super().__init__(condition)
+        self.numeric_fields = set(numeric_fields)
+
+    @staticmethod
+    def _escape(value) -> str:
+        return _TAG_SPECIAL_CHARS.sub(r"\\\1", str(value))
+
+    def _eq(self, field: str, value) -> str:
+        if field in self.numeric_fields:
+            return f"@{field}:[{value} {value}]"
+        return f"@{field}:{{{self._escape(value)}}}"
+
+    def _in(self, field: str, values) -> str:
+        if field in self.numeric_fields:
+            return f"({'|'.join(self._eq(field, v) for v in values)})"
+        return f"@{field}:{{{'|'.join(self._escape(v) for v in values)}}}"
+
     def _build_condition(self, condition: Condition) -> str:
         if condition is None:
             return ""
@@ -40,32 +64,32 @@ class RedisSearchQueryBuilder(ConditionBuilder):
             value = condition.get("value")
 
             if op == "eq":
-                return f"@{field}:{{{value}}}"
+                return self._eq(field, value)
             elif op == "ne":
-                return f"-@{field}:{{{value}}}"
+                return f"-{self._eq(field, value)}"
             elif op == "gt":
-                return f"@{field}:[{value} +inf]"
+                return f"@{field}:[({value} +inf]"
             elif op == "gte":
                 return f"@{field}:[{value} +inf]"
             elif op == "lt":
-                return f"@{field}:[-inf {value}]"
+                return f"@{field}:[-inf ({value}]"
             elif op == "lte":
                 return f"@{field}:[-inf {value}]"
             elif op == "in":
-                return f"@{field}:{{{'|'.join(str(v) for v in value)}}}"
+                return self._in(field, value)
             elif op == "not_in":
-                return f"-@{field}:{{{'|'.join(str(v) for v in value)}}}"
+                return f"-{self._in(field, value)}"
             elif op == "like":
-                return f"@{field}:*{value}*"
+                return f"@{field}:*{self._escape(value)}*"
             elif op == "not_like":
-                return f"-@{field}:*{value}*"
+                return f"-@{field}:*{self._escape(value)}*"
             elif op == "is_null":
                 return f"-@{field}:*"
             elif op == "is_not_null":
                 return f"@{field}:*"
         elif "and_" in condition:
             conditions = [self._build_condition(c) for c in condition["and_"]]
-            return " ".join(conditions)
+            return f"({' '.join(conditions)})"
         elif "or_" in condition:
             conditions = [self._build_condition(c) for c in condition["or_"]]
             return f"({'|'.join(conditions)})"
@@ -84,8 +108,15 @@ class RedisStorage(Storage):
         self._key_prefix = conf.key_prefix
         self._index_name = conf.index_name
         self._recreate_idx_if_exists = conf.recreate_idx_if_exists
+        self._numeric_fields = [k for k, v in conf.data_schema.items() if self._is_numeric(v)]
         self._create_index(conf.data_schema)
 
+    @staticmethod
+    def _is_numeric(schema_type) -> bool:
+        if isinstance(schema_type, type):
+            return issubclass(schema_type, (int, float)) and not issubclass(schema_type, bool)
+        return isinstance(schema_type, (int, float))
+
     def backend(self) -> Redis:
         return self._redis
 
@@ -102,7 +133,7 @@ class RedisStorage(Storage):
 
             fields = []
             for k, v in schema.items():
-                if isinstance(v, (int, float)):
+                if self._is_numeric(v):
                     fields.append(NumericField(k))
                 else:
                     fields.append(TagField(k))
@@ -162,7 +193,7 @@ class RedisStorage(Storage):
         if not condition:
             result = self._redis.ft(self._index_name).search(Query("*"))
         else:
-            query_builder = RedisSearchQueryBuilder(condition)
+            query_builder = RedisSearchQueryBuilder(condition, self._numeric_fields)
             query = query_builder.build()
             result = self._redis.ft(self._index_name).search(query)
         return result.docs
@@ -171,7 +202,7 @@ class RedisStorage(Storage):
         if not condition:
             return self._redis.ft(self._index_name).info()['num_docs']
 
-        query_builder = RedisSearchQueryBuilder(condition)
+        query_builder = RedisSearchQueryBuilder(condition, self._numeric_fields)
         query = query_builder.build()
         return self._redis.ft(self._index_name).search(query).total
 
@@ -11,6 +11,13 @@ from aworld.dataset.trajectory_dataset import (
     generate_trajectory,
     generate_trajectory_from_strategy
 )
+from aworld.dataset.trajectory_sink import (
+    TrajectorySink,
+    JsonlTrajectorySink,
+    OssTrajectorySink,
+    StorageTrajectorySink,
+    StreamingTrajectoryRecorder
+)
 
 # Rebuild TaskConfig to resolve forward references after TrajectoryStrategy is imported
 from aworld.config.conf import TaskConfig
@@ -23,4 +30,9 @@ __all__ = [
     'TrajectoryDataset',
     'generate_trajectory',
     'generate_trajectory_from_strategy',
+    'TrajectorySink',
+    'JsonlTrajectorySink',
+    'OssTrajectorySink',
+    'StorageTrajectorySink',
+    'StreamingTrajectoryRecorder',
 ]
@@ -1,5 +1,9 @@
+import asyncio
 import random
-from typing import Generic, Iterable, Iterator, List, Optional, TypeVar, Callable, Union, Any
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (Generic, Iterable, Iterator, List, Optional, TypeVar, Callable, Union, Any, AsyncIterator,
+                    Deque)
 
 from aworld.dataset.sampler import Sampler
 
@@ -7,6 +11,37 @@ from aworld.dataset.sampler import Sampler
 _T_co = TypeVar("_T_co", covariant=True)
 _Batch = TypeVar("_Batch")
 
+WORKER_MODES = ("thread", "process")
+
+# Per-process state of process workers, set once by `_init_process_worker`
+# so the dataset is pickled once per worker instead of once per batch.
+_worker_dataset: Any = None
+_worker_collate_fn: Optional[Callable[[List[Any]], Any]] = None
+
+
+def _fetch_item(dataset: Any, idx: int) -> Any:
+    try:
+        return dataset.__getitem__(idx)
+    except NotImplementedError:
+        return dataset.data[idx]
+
+
+def _fetch_batch(dataset: Any, indices: List[int], collate_fn: Optional[Callable[[List[Any]], Any]]) -> Any:
+    batch = [_fetch_item(dataset, idx) for idx in indices]
+    if collate_fn is None:
+        return batch
+    return collate_fn(batch)
+
+
+def _init_process_worker(dataset: Any, collate_fn: Optional[Callable[[List[Any]], Any]]) -> None:
+    global _worker_dataset, _worker_collate_fn
+    _worker_dataset = dataset
+    _worker_collate_fn = collate_fn
+
+
+def _process_worker_fetch(indices: List[int]) -> Any:
+    return _fetch_batch(_worker_dataset, indices, _worker_collate_fn)
+
 
 class DataLoader(Generic[_T_co]):
     """A lightweight, framework-agnostic DataLoader.
@@ -21,6 +56,15 @@ class DataLoader(Generic[_T_co]):
         batch_sampler: Iterable yielding lists of indices per batch. Mutually exclusive with
             ``batch_size``, ``shuffle``, ``sampler``, and ``drop_last``.
         collate_fn: Optional function to merge a list of samples into a batch object.
+        num_workers: Number of background workers building batches. ``0`` builds every batch
+            inline in the consumer.
+        prefetch_factor: Batches prefetched per worker, bounding the number of in-flight batches
+            to ``num_workers * prefetch_factor``. Only valid when ``num_workers > 0``, defaults to 2.
+        worker_mode: ``"thread"`` or ``"process"``. Process workers require a picklable dataset
+            and ``collate_fn`` and suit CPU-bound transforms, thread workers suit I/O or GIL-releasing ones.
+
+    Batches are always yielded in sampling order, so the output is identical for any
+    ``num_workers`` given the same ``seed``/``sampler``.
     """
 
     def __init__(
@@ -34,6 +78,9 @@ class DataLoader(Generic[_T_co]):
         seed: Optional[int] = None,
         batch_sampler: Optional[Iterable[List[int]]] = None,
         collate_fn: Optional[Callable[[List[_T_co]], _Batch]] = None,
+        num_workers: int = 0,
+        prefetch_factor: Optional[int] = None,
+        worker_mode: str = "thread",
     ) -> None:
         # Validate exclusivity
         if batch_sampler is not None:
@@ -45,6 +92,15 @@ class DataLoader(Generic[_T_co]):
             if batch_size is None or batch_size <= 0:
                 raise ValueError("batch_size must be a positive integer")
 
+        if num_workers < 0:
+            raise ValueError("num_workers must be a non-negative integer")
+        if num_workers == 0 and prefetch_factor is not None:
+            raise ValueError("prefetch_factor is only valid when num_workers > 0")
+        if prefetch_factor is not None and prefetch_factor <= 0:
+            raise ValueError("prefetch_factor must be a positive integer")
+        if worker_mode not in WORKER_MODES:
+            raise ValueError(f"worker_mode must be one of {WORKER_MODES}, got {worker_mode!r}")
+
         self.dataset = dataset
         self.batch_size = batch_size
         self.sampler = sampler
@@ -53,8 +109,56 @@ class DataLoader(Generic[_T_co]):
         self.seed = seed
         self.batch_sampler = batch_sampler
         self.collate_fn = collate_fn
+        self.num_workers = num_workers
+        self.prefetch_factor = (prefetch_factor or 2) if num_workers > 0 else None
+        self.worker_mode = worker_mode
 
     def __iter__(self) -> Iterator[Union[List[_T_co], _Batch]]:
+        if self.num_workers == 0:
+            for batch_indices in self._iter_batch_indices():
+                yield self._fetch(batch_indices)
+            return
+
+        executor, fetch = self._create_executor()
+        try:
+            for future in self._iter_prefetched(executor, fetch):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aiter__(self) -> AsyncIterator[Union[List[_T_co], _Batch]]:
+        """Asynchronously iterate batches without blocking the running event loop.
+
+        Batches are built off-loop (in the default executor when ``num_workers == 0``)
+        and yielded in the same order as ``__iter__``.
+        """
+        loop = asyncio.get_running_loop()
+        if self.num_workers == 0:
+            for batch_indices in self._iter_batch_indices():
+                yield await loop.run_in_executor(None, self._fetch, batch_indices)
+            return
+
+        executor, fetch = self._create_executor()
+        try:
+            for future in self._iter_prefetched(executor, fetch):
+                yield await asyncio.wrap_future(future, loop=loop)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __len__(self) -> int:
+        if self.batch_sampler is not None:
+            # Try best-effort length when batch_sampler has __len__
+            if hasattr(self.batch_sampler, "__len__"):
+                return len(self.batch_sampler)  # type: ignore[arg-type]
+            raise TypeError("Length is not defined for the provided batch_sampler")
+
+        num_items = len(self.dataset)
+        assert self.batch_size is not None
+        if self.drop_last:
+            return num_items // self.batch_size
+        return (num_items + self.batch_size - 1) // self.batch_size
+
+    def _iter_batch_indices(self) -> Iterator[List[int]]:
         # If batch_sampler is provided, try to inject dataset length then iterate directly on its batches
         if self.batch_sampler is not None:
             # Best-effort: if batch_sampler wraps a sampler with set_length, inject length
@@ -68,14 +172,7 @@ class DataLoader(Generic[_T_co]):
             except Exception:
                 pass
             for batch_indices in self.batch_sampler:
-                batch: List[_T_co] = []
-                for idx in batch_indices:
-                    try:
-                        item = self.dataset.__getitem__(idx)  # type: ignore[attr-defined]
-                    except NotImplementedError:
-                        item = self.dataset.data[idx]  # type: ignore[attr-defined]
-                    batch.append(item)
-                yield self._maybe_collate(batch)
+                yield list(batch_indices)
             return
 
         # Resolve indices from sampler / shuffle
@@ -98,36 +195,35 @@ class DataLoader(Generic[_T_co]):
 
         # Batch iteration
         assert self.batch_size is not None
-        batch: List[_T_co] = []
-        for idx in indices:
-            try:
-                item = self.dataset.__getitem__(idx)  # type: ignore[attr-defined]
-            except NotImplementedError:
-                item = self.dataset.data[idx]  # type: ignore[attr-defined]
-            batch.append(item)
-            if len(batch) == self.batch_size:
-                yield self._maybe_collate(batch)
-                batch = []
-
-        if batch and not self.drop_last:
-            yield self._maybe_collate(batch)
-
-    def __len__(self) -> int:
-        if self.batch_sampler is not None:
-            # Try best-effort length when batch_sampler has __len__
-            if hasattr(self.batch_sampler, "__len__"):
-                return len(self.batch_sampler)  # type: ignore[arg-type]
-            raise TypeError("Length is not defined for the provided batch_sampler")
-
-        num_items = len(self.dataset)
-        assert self.batch_size is not None
-        if self.drop_last:
-            return num_items // self.batch_size
-        return (num_items + self.batch_size - 1) // self.batch_size
-
-    def _maybe_collate(self, batch: List[_T_co]) -> Union[List[_T_co], _Batch]:
-        if self.collate_fn is None:
-            return batch
-        return self.collate_fn(batch)
-
-
+        for start in range(0, len(indices), self.batch_size):
+            batch_indices = indices[start:start + self.batch_size]
+            if len(batch_indices) < self.batch_size and self.drop_last:
+                return
+            yield batch_indices
+
+    def _iter_prefetched(self, executor: Executor, fetch: Callable[[List[int]], Any]) -> Iterator[Future]:
+        """Submit batches ahead of the consumer, keeping at most ``num_workers * prefetch_factor`` in flight.
+
+        Futures are yielded in submission order, which keeps the output deterministic
+        regardless of which worker finishes first.
+        """
+        max_in_flight = self.num_workers * self.prefetch_factor
+        pending: Deque[Future] = deque()
+        for batch_indices in self._iter_batch_indices():
+            pending.append(executor.submit(fetch, batch_indices))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+    def _create_executor(self):
+        if self.worker_mode == "process":
+            executor = ProcessPoolExecutor(max_workers=self.num_workers,
+                                           initializer=_init_process_worker,
+                                           initargs=(self.dataset, self.collate_fn))
+            return executor, _process_worker_fetch
+        executor = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="aworld-dataloader")
+        return executor, self._fetch
+
+    def _fetch(self, batch_indices: List[int]) -> Union[List[_T_co], _Batch]:
+        return _fetch_batch(self.dataset, batch_indices, self.collate_fn)
@@ -8,7 +8,7 @@ from typing import TypeVar, Generic, Dict, List, Any, Iterator, Optional, Iterab
 
 from pydantic import BaseModel, Field
 
-from aworld import import_package
+from aworld.utils.import_package import import_package
 from aworld.dataset.sampler import Sampler
 from aworld.dataset.dataloader import DataLoader
 from aworld.logs.util import logger
@@ -252,6 +252,9 @@ class Dataset(BaseModel, Generic[_T_co]):
         seed: Optional[int] = None,
         batch_sampler: Optional[Iterable[List[int]]] = None,
         collate_fn: Optional[Callable[[List[_T_co]], Any]] = None,
+        num_workers: int = 0,
+        prefetch_factor: Optional[int] = None,
+        worker_mode: str = "thread",
     ) -> Iterator[List[_T_co]]:
         """A lightweight DataLoader-like iterator.
 
@@ -266,6 +269,9 @@ class Dataset(BaseModel, Generic[_T_co]):
             seed: Optional seed for deterministic shuffling.
             batch_sampler: Iterable yielding lists of indices per batch. Mutually exclusive
                 with `batch_size`, `shuffle`, `sampler`, and `drop_last`.
+            num_workers: Number of background workers prefetching batches, 0 builds batches inline.
+            prefetch_factor: Batches prefetched per worker when `num_workers` > 0.
+            worker_mode: "thread" or "process" workers.
 
         Yields:
             List of samples of length `batch_size` (except possibly the last one
@@ -280,6 +286,9 @@ class Dataset(BaseModel, Generic[_T_co]):
             seed=seed,
             batch_sampler=batch_sampler,
             collate_fn=collate_fn,
+            num_workers=num_workers,
+            prefetch_factor=prefetch_factor,
+            worker_mode=worker_mode,
         )
         return iter(loader)
 
@@ -369,7 +378,10 @@ def create_dataset(config: Union[DatasetConfig, ConfigDict, Dict[str, Any]]) ->
         drop_last=bool(dl_conf.get("drop_last", False)),
         seed=dl_conf.get("seed"),
         batch_sampler=dl_conf.get("batch_sampler"),
-        collate_fn=dl_conf.get("collate_fn")
+        collate_fn=dl_conf.get("collate_fn"),
+        num_workers=dl_conf.get("num_workers") or 0,
+        prefetch_factor=dl_conf.get("prefetch_factor"),
+        worker_mode=dl_conf.get("worker_mode") or "thread",
     )
     return ds, dl_iter
 
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional, Callable, Type, TYPE_CHECKING
 
 from pydantic import Field
 
-from aworld import import_package
+from aworld.utils.import_package import import_package
 from aworld.core.agent.base import is_agent_by_name
 from aworld.core.common import ActionModel
 from aworld.core.event.base import Message, Constants
@@ -202,20 +202,19 @@ class TrajectoryDataset(Dataset[DataRow]):
 
     @staticmethod
     async def _filter_replay_messages(messages: List[Message], task_id: str) -> List[Message]:
-        results = []
         logger.info(f"Retrieving agent messages for task: {task_id}")
-        for message in messages:
-            if message.task_id != task_id or message.category != Constants.AGENT:
-                continue
-            sender = message.sender
-            receiver = message.receiver
-            if not sender or not receiver or not is_agent_by_name(receiver):
-                continue
-            agent_as_tool = message.headers.get("agent_as_tool", False)
-            if agent_as_tool:
-                continue
-            results.append(message)
-        return results
+        return [message for message in messages if TrajectoryDataset.is_replay_message(message, task_id)]
+
+    @staticmethod
+    def is_replay_message(message: Message, task_id: str) -> bool:
+        """Whether the message is an agent step of the task that belongs to its trajectory."""
+        if message.task_id != task_id or message.category != Constants.AGENT:
+            return False
+        sender = message.sender
+        receiver = message.receiver
+        if not sender or not receiver or not is_agent_by_name(receiver):
+            return False
+        return not message.headers.get("agent_as_tool", False)
 
     def _get_llm_messages_from_memory(self, message: Message):
         context = message.context
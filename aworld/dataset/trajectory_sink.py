@@ -0,0 +1,180 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""
+Streaming trajectory capture.
+
+Trajectory rows are built as soon as an agent step completes and written to a pluggable
+`TrajectorySink`, instead of replaying all task messages after the task ends.
+"""
+import abc
+import asyncio
+import json
+import os
+import traceback
+from typing import Any, Dict, List, Optional
+
+from aworld.core.event.base import Message
+from aworld.core.storage.base import Storage
+from aworld.dataset.trajectory_dataset import TrajectoryDataset
+from aworld.dataset.types import DataRow
+from aworld.logs.util import logger
+from aworld.runners.state_manager import RuntimeStateManager, EventRuntimeStateManager
+from aworld.utils.serialized_util import to_serializable
+
+
+class TrajectorySink(abc.ABC):
+    """Destination of trajectory rows, written one row at a time in step order."""
+
+    @abc.abstractmethod
+    async def write(self, row: Dict[str, Any], data_row: DataRow = None) -> None:
+        """Persist one serialized trajectory row.
+
+        Args:
+            row: Serialized row, the same dict format as `TaskResponse.trajectory` items.
+            data_row: The row before serialization, for sinks storing models.
+        """
+
+    async def close(self) -> None:
+        """Flush and release the sink, called once when the task ends."""
+
+
+class JsonlTrajectorySink(TrajectorySink):
+    """Append rows to a JSON lines file, each row is flushed so a crashed task leaves a partial trajectory."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    async def write(self, row: Dict[str, Any], data_row: DataRow = None) -> None:
+        line = json.dumps(row, ensure_ascii=False, default=str) + "\n"
+        await asyncio.to_thread(self._append, line)
+
+    def _append(self, line: str):
+        if self._file is None:
+            dir_name = os.path.dirname(self.path)
+            if dir_name:
+                os.makedirs(dir_name, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(line)
+        self._file.flush()
+
+    async def close(self) -> None:
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+
+
+class OssTrajectorySink(TrajectorySink):
+    """Append rows as JSON lines to an appendable OSS object, an existing object is appended to."""
+
+    def __init__(self, oss_key: str, oss_client=None):
+        from aworld.utils.oss import get_oss_client
+
+        self.oss_key = oss_key
+        self.oss_client = oss_client or get_oss_client(enable_export=True)
+        # append position, read from the object on the first write
+        self._position: Optional[int] = None
+        self._warned = False
+
+    async def write(self, row: Dict[str, Any], data_row: DataRow = None) -> None:
+        if not self.oss_client.initialize():
+            if not self._warned:
+                logger.warning(f"OSS client is not initialized, trajectory rows of {self.oss_key} are not exported.")
+                self._warned = True
+            return
+        bucket = self.oss_client.bucket
+        if self._position is None:
+            self._position = await asyncio.to_thread(self._object_length, bucket)
+        line = (json.dumps(row, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        result = await asyncio.to_thread(bucket.append_object, self.oss_key, self._position, line)
+        self._position = result.next_position
+
+    def _object_length(self, bucket) -> int:
+        if not bucket.object_exists(self.oss_key):
+            return 0
+        return bucket.head_object(self.oss_key).content_length
+
+
+class StorageTrajectorySink(TrajectorySink):
+    """Store rows as `DataRow` items in a block of a `Storage`."""
+
+    def __init__(self, storage: Storage[DataRow], block_id: str):
+        self.storage = storage
+        self.block_id = block_id
+        self._block_created = False
+
+    async def write(self, row: Dict[str, Any], data_row: DataRow = None) -> None:
+        if data_row is None:
+            data_row = DataRow.model_validate(row)
+        if not self._block_created:
+            await self.storage.create_block(self.block_id, overwrite=False)
+            self._block_created = True
+        await self.storage.create_data(data=data_row, block_id=self.block_id, overwrite=True)
+
+
+class StreamingTrajectoryRecorder:
+    """Build trajectory rows incrementally as agent steps of a task complete.
+
+    Rows are kept in memory for the task response and handed, in completion order,
+    to the optional sink by a single background writer.
+    """
+
+    def __init__(self,
+                 task_id: str,
+                 sink: Optional[TrajectorySink] = None,
+                 state_manager: RuntimeStateManager = None):
+        self.task_id = task_id
+        self.sink = sink
+        self.dataset = TrajectoryDataset(name=f"{task_id}_trajectory_dataset",
+                                         data=[],
+                                         state_manager=state_manager or EventRuntimeStateManager.instance(),
+                                         enable_storage=False)
+        self.rows: List[Dict[str, Any]] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def capture(self, message: Message) -> Optional[Dict[str, Any]]:
+        """Record the step of a finished message, if it is an agent step of the task."""
+        if self._closed or not TrajectoryDataset.is_replay_message(message, self.task_id):
+            return None
+        try:
+            data_row = self.dataset.message_to_datarow(message)
+            if data_row is None:
+                return None
+            row = to_serializable(data_row)
+        except Exception as e:
+            logger.warning(f"Failed to capture trajectory row of message {message.id}: {e}")
+            return None
+
+        self.rows.append(row)
+        if self.sink:
+            if self._queue is None:
+                self._queue = asyncio.Queue()
+                self._writer = asyncio.create_task(self._write_rows())
+            self._queue.put_nowait((row, data_row))
+        return row
+
+    async def _write_rows(self):
+        while True:
+            row, data_row = await self._queue.get()
+            try:
+                await self.sink.write(row, data_row)
+            except Exception:
+                logger.warning(f"Failed to write trajectory row {row.get('id')}: {traceback.format_exc()}")
+            finally:
+                self._queue.task_done()
+
+    async def close(self):
+        """Wait for pending rows and close the sink, safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._queue is not None:
+            await self._queue.join()
+            self._writer.cancel()
+        if self.sink:
+            try:
+                await self.sink.close()
+            except Exception as e:
+                logger.warning(f"Failed to close trajectory sink: {e}")
@@ -4,6 +4,7 @@ import pickle
 import traceback
 
 from aworld.config import BaseConfig
+from aworld.core.context.registry import context_registry
 from aworld.core.event.base import Message
 from aworld.events import InMemoryEventbus
 from aworld.logs.util import logger
@@ -25,6 +26,9 @@ class RedisEventbus(InMemoryEventbus):
 
         con_url = f"redis://{conf.user_name}:{conf.password}@{conf.host}:{conf.port}"
         self.client = aioredis.from_url(con_url, db=conf.db)
+        # revision of the context snapshots last written to or read from redis, a context is written again only
+        # when its revision changed, messages carry its reference and the revision of its snapshot
+        self._context_revisions = {}
 
     async def wait_consume_size(self, id: str) -> int:
         # not really reserved data size
@@ -35,6 +39,7 @@ class RedisEventbus(InMemoryEventbus):
 
         name = message.task_id
         try:
+            await self._publish_context(name, message)
             data = {"data": pickle.dumps(message)}
             msg_id = await self.client.xadd(name=name, id="*", fields=data)
             logger.info(f"redis add id {msg_id} to {name} channel.")
@@ -50,6 +55,7 @@ class RedisEventbus(InMemoryEventbus):
                 message_id = msg[0]
                 message_content = msg[1]
                 data = pickle.loads(message_content.get(b"data"))
+                await self._attach_context(name, data)
                 logger.info(f"Get message: {message_id} with content {data}")
                 await self.client.xdel(name, message_id)
                 return data
@@ -62,12 +68,50 @@ class RedisEventbus(InMemoryEventbus):
                 message_id = msg[0]
                 message_content = msg[1]
                 data = pickle.loads(message_content.get(b"data"))
+                await self._attach_context(message.task_id, data)
                 logger.debug(f"Get message: {message_id} with content {data}")
                 await self.client.xdel(message.task_id, message_id)
                 return data
         return None
 
+    @staticmethod
+    def _context_key(name: str) -> str:
+        return f"{name}:context"
+
+    async def _publish_context(self, name: str, message: Message):
+        ref = message.context_ref
+        context = ref.context if ref is not None else None
+        if context is None:
+            return
+        revision = context.revision
+        message.headers["context_revision"] = revision
+        if self._context_revisions.get(ref) == revision:
+            return
+        await self.client.hset(self._context_key(name), str(ref.version), pickle.dumps(context))
+        self._context_revisions[ref] = revision
+
+    async def _attach_context(self, name: str, message: Message):
+        """Register the context of a message published by another process, or its latest snapshot."""
+        ref = message.context_ref if isinstance(message, Message) else None
+        if ref is None:
+            return
+        revision = message.headers.get("context_revision")
+        known = self._context_revisions.get(ref)
+        if ref.context is not None and (known is None or known == revision):
+            # a context of this process, or its snapshot is already attached
+            return
+        data = await self.client.hget(self._context_key(name), str(ref.version))
+        if data is None:
+            logger.warning(f"context {ref} of message {message.id} not found.")
+            return
+        context = pickle.loads(data)
+        context_registry.register(context, ref=ref)
+        self._context_revisions[ref] = context.revision
+
     async def done(self, id: str):
+        await self.client.delete(self._context_key(id))
+        self._context_revisions = {ref: revision for ref, revision in self._context_revisions.items()
+                                  if ref.task_id != id}
         while True:
             response = await self.client.xread(streams={id: '0-0'}, count=10, block=1)
             if response:
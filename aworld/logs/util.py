@@ -170,8 +170,6 @@ class AWorldLogger:
                       formatter=format_str)
 
     def __getattr__(self, name: str):
-        from aworld.trace.base import get_trace_id
-
         if name in SUPPORTED_FUNC:
             frame = inspect.currentframe().f_back
             if frame.f_back and (
@@ -186,7 +184,9 @@ class AWorldLogger:
             line = frame.f_lineno
             func_name = getattr(frame.f_code, "co_qualname", frame.f_code.co_name).replace("<module>", "")
 
-            trace_id = get_trace_id()
+            # no span can be open before the trace package is imported, logging does not import it
+            get_trace_id = getattr(sys.modules.get('aworld.trace.base'), 'get_trace_id', None)
+            trace_id = get_trace_id() if get_trace_id else ''
             update = {"function": func_name, "line": line, "name": module, "extra": {"trace_id": trace_id, "logger_name": "Aworld"}}
 
             def patch(record):
@@ -477,22 +477,12 @@ class AntProvider(LLMProviderBase):
             index = tool_call.get("index", 0)
             name = tool_call.get("function", {}).get("name")
             arguments = tool_call.get("function", {}).get("arguments")
-            if index >= len(self.stream_tool_buffer):
-                self.stream_tool_buffer.append({
-                    "id": tool_call.get("id"),
-                    "type": "function",
-                    "function": {
-                        "name": name,
-                        "arguments": arguments
-                    }
-                })
-            else:
-                self.stream_tool_buffer[index]["function"]["arguments"] += arguments
+            self.stream_tool_buffer.add(index, id=tool_call.get("id"), name=name, arguments=arguments)
 
         if is_finished and self.stream_tool_buffer:
-            message_dict["tool_calls"] = self.stream_tool_buffer.copy()
+            message_dict["tool_calls"] = self.stream_tool_buffer.to_list()
             processed_tool_calls = []
-            for tool_call in self.stream_tool_buffer:
+            for tool_call in message_dict["tool_calls"]:
                 processed_tool_calls.append(ToolCall.from_dict(tool_call))
             tool_resp = ModelResponse(
                 id=response_id,
@@ -503,7 +493,7 @@ class AntProvider(LLMProviderBase):
                 raw_response=message,
                 message=message_dict
             )
-            self.stream_tool_buffer = []
+            self.stream_tool_buffer.clear()
             return tool_resp
 
         # Build and return ModelResponse object directly
@@ -166,17 +166,11 @@ class OpenAIProvider(LLMProviderBase):
                 index = tool_call.index if hasattr(tool_call, 'index') else tool_call["index"]
                 func_name = tool_call.function.name if hasattr(tool_call, 'function') else tool_call.get("function", {}).get("name")
                 func_args = tool_call.function.arguments if hasattr(tool_call, 'function') else tool_call.get("function", {}).get("arguments")
-                if index >= len(self.stream_tool_buffer):
-                    self.stream_tool_buffer.append({
-                        "id": tool_call.id if hasattr(tool_call, 'id') else tool_call.get("id"),
-                        "type": "function",
-                        "function": {
-                            "name": func_name,
-                            "arguments": func_args
-                        }
-                    })
-                else:
-                    self.stream_tool_buffer[index]["function"]["arguments"] += func_args
+                self.stream_tool_buffer.add(
+                    index,
+                    id=tool_call.id if hasattr(tool_call, 'id') else tool_call.get("id"),
+                    name=func_name,
+                    arguments=func_args)
             processed_chunk = chunk
             if hasattr(processed_chunk, 'choices'):
                 processed_chunk.choices[0].delta.tool_calls = None
@@ -200,12 +194,12 @@ class OpenAIProvider(LLMProviderBase):
                             "delta": {
                                 "role": "assistant",
                                 "content": "",
-                                "tool_calls": self.stream_tool_buffer
+                                "tool_calls": self.stream_tool_buffer.to_list()
                             }
                         }
                     ]
                 }
-                self.stream_tool_buffer = []
+                self.stream_tool_buffer.clear()
                 return ModelResponse.from_openai_stream_chunk(tool_call_chunk)
 
         return ModelResponse.from_openai_stream_chunk(chunk)
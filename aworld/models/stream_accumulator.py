@@ -0,0 +1,97 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+from typing import Any, Dict, List, Optional
+
+from aworld.models.model_response import ModelResponse, ToolCall
+from aworld.utils.common import nest_dict_counter
+
+
+class ToolCallDeltas:
+    """Tool call deltas of a stream merged by index, the argument fragments are joined once when read."""
+
+    def __init__(self):
+        self._calls: Dict[int, Dict[str, Any]] = {}
+
+    def add(self, index: int, id: str = None, name: str = None, arguments: str = None, type: str = None):
+        call = self._calls.get(index)
+        if call is None:
+            call = self._calls[index] = {"id": id, "type": type or "function", "name": name, "arguments": []}
+        else:
+            # only the first delta of a call carries its id and name
+            if id and not call["id"]:
+                call["id"] = id
+            if name and not call["name"]:
+                call["name"] = name
+        if arguments:
+            call["arguments"].append(arguments)
+
+    def __len__(self):
+        return len(self._calls)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Merged tool calls in the OpenAI format, ordered by index."""
+        return [{
+            "id": call["id"],
+            "type": call["type"],
+            "function": {
+                "name": call["name"],
+                "arguments": "".join(call["arguments"]) if call["arguments"] else None
+            }
+        } for _, call in sorted(self._calls.items())]
+
+    def clear(self):
+        self._calls = {}
+
+
+class StreamAccumulator:
+    """Assembles the chunks of a streamed model response into one `ModelResponse`.
+
+    Text is collected in list buffers, so the cost is linear in the number of chunks; the response is built once
+    by `response()`. Tool calls arrive complete, the providers merge their deltas by index (`ToolCallDeltas`),
+    they are appended in order and never merged, ids are not unique in every stream.
+    """
+
+    def __init__(self):
+        self.id = ""
+        self.model = ""
+        self.error: Optional[str] = None
+        self.usage: Dict[str, Any] = {}
+        self.chunks = 0
+        self._content: List[str] = []
+        self._reasoning: List[str] = []
+        self._tool_calls: List[ToolCall] = []
+        self._message: Dict[str, Any] = {}
+
+    def add(self, chunk: ModelResponse):
+        self.chunks += 1
+        if chunk.content:
+            self._content.append(chunk.content)
+        if chunk.reasoning_content:
+            self._reasoning.append(chunk.reasoning_content)
+        if chunk.tool_calls:
+            self._tool_calls.extend(chunk.tool_calls)
+        if chunk.error:
+            self.error = chunk.error
+        self.id = chunk.id or self.id
+        self.model = chunk.model or self.model
+        if chunk.usage:
+            self.usage = nest_dict_counter(self.usage, chunk.usage, ignore_zero=False)
+        if chunk.message:
+            for key, value in chunk.message.items():
+                if key not in ("content", "tool_calls", "is_chunk"):
+                    self._message[key] = value
+
+    def response(self) -> ModelResponse:
+        content = "".join(self._content)
+        tool_calls = list(self._tool_calls)
+        message = {"role": "assistant", **self._message, "content": content}
+        if tool_calls:
+            message["tool_calls"] = [tool_call.to_dict() for tool_call in tool_calls]
+        return ModelResponse(id=self.id,
+                             model=self.model,
+                             content=content,
+                             tool_calls=tool_calls,
+                             usage=self.usage or None,
+                             error=self.error,
+                             message=message,
+                             reasoning_content="".join(self._reasoning) if self._reasoning else None)
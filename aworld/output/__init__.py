@@ -1,8 +1,8 @@
 from aworld.output.base import Output, SearchOutput, SearchItem, ToolResultOutput, MessageOutput, ToolCallOutput, \
-    RUN_FINISHED_SIGNAL
+    TextDeltaOutput, RUN_FINISHED_SIGNAL
 from aworld.output.artifact import Artifact, ArtifactType
 from aworld.output.code_artifact import CodeArtifact, ShellArtifact
-from aworld.output.outputs import Outputs, StreamingOutputs
+from aworld.output.outputs import Outputs, StreamingOutputs, SlowConsumerPolicy
 from aworld.output.workspace import WorkSpace
 from aworld.output.observer import WorkspaceObserver,get_observer
 from aworld.output.storage.artifact_repository import ArtifactRepository, LocalArtifactRepository
@@ -23,8 +23,10 @@ __all__ = [
     "MessageOutput",
     "ToolCallOutput",
     "ToolResultOutput",
+    "TextDeltaOutput",
     "Outputs",
     "StreamingOutputs",
+    "SlowConsumerPolicy",
     "RUN_FINISHED_SIGNAL",
     "AworldUI",
     "PrinterAworldUI"
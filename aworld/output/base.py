@@ -83,6 +83,22 @@ class RunFinishedSignal(Output):
 RUN_FINISHED_SIGNAL = RunFinishedSignal()
 
 
+class TextDeltaOutput(Output):
+    """Incremental text of a streamed message, adjacent deltas of the same stream can be merged."""
+    delta: str = Field(default="", description="text delta")
+
+    def can_merge(self, other: Output) -> bool:
+        return (type(other) is type(self)
+                and other.task_id == self.task_id
+                and other.metadata == self.metadata)
+
+    def merge(self, other: 'TextDeltaOutput') -> 'TextDeltaOutput':
+        return self.model_copy(update={"delta": self.delta + other.delta})
+
+    def output_type(self):
+        return "text_delta"
+
+
 class MessageOutput(Output):
     """
     MessageOutput structure of LLM output
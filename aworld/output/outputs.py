@@ -2,12 +2,13 @@ import abc
 import asyncio
 import traceback
 from abc import abstractmethod
+from collections import deque
 from dataclasses import field, dataclass
 from typing import AsyncIterator, Any, Union, Iterator
 
 from aworld.logs.util import logger
 from aworld.output import Output
-from aworld.output.base import RUN_FINISHED_SIGNAL
+from aworld.output.base import RUN_FINISHED_SIGNAL, RunFinishedSignal, TextDeltaOutput
 
 
 @dataclass
@@ -104,10 +105,32 @@ class DefaultOutputs(Outputs):
         pass
 
 
+class SlowConsumerPolicy:
+    """What `StreamingOutputs` does when the buffer is full and a subscriber has not read its oldest output."""
+    # the producer waits until the slowest subscriber reads
+    BLOCK = "block"
+    # the oldest output is dropped, subscribers that did not read it skip it
+    DROP_OLDEST = "drop_oldest"
+    # adjacent text deltas in the buffer are merged to make room, waits like `BLOCK` if there are none
+    COALESCE = "coalesce"
+
+
+class _Cursor:
+    __slots__ = ("seq", "dropped")
+
+    def __init__(self, seq: int):
+        self.seq = seq
+        self.dropped = 0
+
+
 @dataclass
 class StreamingOutputs(AsyncOutputs):
     """Concrete implementation of AsyncOutputs that provides streaming functionality.
-    Manages a queue of outputs and handles streaming with error checking and task management."""
+
+    Outputs are kept in a ring buffer of at most `max_buffer` outputs, every `stream_events` call is an
+    independent subscriber reading from the oldest buffered output with its own cursor. Outputs read by all
+    subscribers are evicted when the buffer is full, otherwise `slow_consumer_policy` applies. A text delta
+    that no subscriber has read yet absorbs the following deltas of the same stream."""
 
     # Task and input related fields
     # task: Task = Field(default=None)  # The task associated with these outputs
@@ -118,30 +141,117 @@ class StreamingOutputs(AsyncOutputs):
     # State tracking
     is_complete: bool = field(default=False)  # Flag indicating if streaming is complete
 
-    # Queue for managing outputs
-    _output_queue: asyncio.Queue[Output] = field(
-        default_factory=asyncio.Queue, repr=False
-    )
+    # Buffer bound and the policy for subscribers lagging behind it
+    max_buffer: int = field(default=1024)
+    slow_consumer_policy: str = field(default=SlowConsumerPolicy.BLOCK)
+
+    # Ring buffer, `_head_seq` is the sequence number of its first output
+    _buffer: deque = field(default_factory=deque, repr=False)
+    _head_seq: int = field(default=0, repr=False)
+    _cursors: list = field(default_factory=list, repr=False)
+    # deltas merged into the unread last output, joined when it is read
+    _tail_deltas: list = field(default_factory=list, repr=False)
+    _readable: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    _writable: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
 
     # Internal state management
-    _visited_outputs: list[Output] = field(default_factory=list)
     _stored_exception: Exception | None = field(default=None, repr=False)  # Stores any exceptions that occur
     _run_impl_task: asyncio.Task[Any] | None = field(default=None, repr=False)  # The running task
 
     async def add_output(self, output: Output):
-        """Add an output to the queue asynchronously.
-        
+        """Add an output to the buffer, waits for slow subscribers if the policy is `block`.
+
         Args:
-            output (Output): The output to be added to the queue
+            output (Output): The output to be added to the buffer
         """
-        logger.info(f"StreamingOutputs|add_output|{self.task_id}|{output}")
+        # not logged per output, the logger costs more than buffering on a token stream
         # if different task take same Output instance, they will output to the same queue
         # if self.task_id != output.task_id:
         #     logger.warning(f"{self.task_id} unequals {output.task_id}, add ignored.")
-        self._output_queue.put_nowait(output)
+        if self._merge_into_tail(output):
+            return
+        # the finished signal is never dropped or delayed
+        while len(self._buffer) >= self.max_buffer and not isinstance(output, RunFinishedSignal):
+            if self._evict_consumed():
+                break
+            if self.slow_consumer_policy == SlowConsumerPolicy.DROP_OLDEST:
+                self._drop_oldest()
+                break
+            if self.slow_consumer_policy == SlowConsumerPolicy.COALESCE and self._coalesce():
+                break
+            self._writable.clear()
+            await self._writable.wait()
+        self._seal_tail()
+        self._buffer.append(output)
+        self._readable.set()
+
+    def _tail_unread(self) -> bool:
+        tail_seq = self._head_seq + len(self._buffer) - 1
+        return all(cursor.seq <= tail_seq for cursor in self._cursors)
+
+    def _merge_into_tail(self, output: Output) -> bool:
+        if not isinstance(output, TextDeltaOutput) or not self._buffer:
+            return False
+        tail = self._buffer[-1]
+        if not isinstance(tail, TextDeltaOutput) or not tail.can_merge(output) or not self._tail_unread():
+            return False
+        if not self._tail_deltas:
+            self._tail_deltas.append(tail.delta)
+        self._tail_deltas.append(output.delta)
+        return True
+
+    def _seal_tail(self):
+        if self._tail_deltas:
+            self._buffer[-1] = self._buffer[-1].model_copy(update={"delta": "".join(self._tail_deltas)})
+            self._tail_deltas.clear()
+
+    def _pop_oldest(self):
+        if len(self._buffer) == 1:
+            self._tail_deltas.clear()
+        self._buffer.popleft()
+        self._head_seq += 1
+
+    def _evict_consumed(self) -> bool:
+        """Evict the oldest output if all subscribers read it (or there is no subscriber)."""
+        if all(cursor.seq > self._head_seq for cursor in self._cursors):
+            self._pop_oldest()
+            return True
+        return False
+
+    def _drop_oldest(self):
+        self._pop_oldest()
+        for cursor in self._cursors:
+            if cursor.seq < self._head_seq:
+                cursor.seq = self._head_seq
+                cursor.dropped += 1
+                logger.debug(f"StreamingOutputs|drop_oldest|{self.task_id}|dropped {cursor.dropped}")
+
+    def _coalesce(self) -> bool:
+        """Merge the first pair of adjacent text deltas that no subscriber is between."""
+        self._seal_tail()
+        positions = {cursor.seq for cursor in self._cursors}
+        for i in range(len(self._buffer) - 1):
+            first, second = self._buffer[i], self._buffer[i + 1]
+            if (isinstance(first, TextDeltaOutput) and first.can_merge(second)
+                    and self._head_seq + i + 1 not in positions):
+                self._buffer[i] = first.merge(second)
+                del self._buffer[i + 1]
+                for cursor in self._cursors:
+                    if cursor.seq > self._head_seq + i + 1:
+                        cursor.seq -= 1
+                return True
+        return False
+
+    def _read(self, cursor: _Cursor) -> Output:
+        index = cursor.seq - self._head_seq
+        if index == len(self._buffer) - 1:
+            self._seal_tail()
+        cursor.seq += 1
+        self._writable.set()
+        return self._buffer[index]
 
     async def stream_events(self) -> AsyncIterator[Output]:
-        """Stream outputs asynchronously, handling cached outputs and new outputs from the queue.
+        """Stream the buffered outputs and the new ones as an independent subscriber.
         Includes error checking and task cleanup.
         
         Yields:
@@ -150,45 +260,42 @@ class StreamingOutputs(AsyncOutputs):
         Raises:
             Exception: Any stored exception that occurred during streaming
         """
-        # First yield any cached outputs
-        for output in self._visited_outputs:
-            if output == RUN_FINISHED_SIGNAL:
-                self._output_queue.task_done()
-                return
-            # if self.task_id != output.task_id:
-            #     logger.warning(f"{self.task_id} unequals {output.task_id}")
-            #     return
-            yield output
-
-        # Main streaming loop
-        while True:
-            self._check_errors()
-            if self._stored_exception:
-                logger.info("Breaking due to stored exception")
-                self.is_complete = True
-                break
-
-            if self.is_complete and self._output_queue.empty():
-                logger.info(f"StreamingOutputs|stream_events|finished|{self.task_id}")
-                break
-
-            try:
-                output = await self._output_queue.get()
-                logger.info("Outputs got output: {}".format(output.output_type()))
-                self._visited_outputs.append(output)
-
-            except asyncio.CancelledError as err:
-                logger.info(f"StreamingOutputs|stream_events|CancelledError|{self.task_id}|{err}")
-                break
-
-            if output == RUN_FINISHED_SIGNAL:
-                logger.info(f"StreamingOutputs|stream_events|RUN_FINISHED_SIGNAL|{self.task_id}|{output}")
-                self._output_queue.task_done()
+        cursor = _Cursor(self._head_seq)
+        self._cursors.append(cursor)
+        if self._run_impl_task:
+            # wake up the subscribers if the task fails without finishing the outputs
+            self._run_impl_task.add_done_callback(lambda _: self._readable.set())
+        try:
+            # Main streaming loop
+            while True:
                 self._check_errors()
-                break
-
-            yield output
-            self._output_queue.task_done()
+                if self._stored_exception:
+                    logger.info("Breaking due to stored exception")
+                    self.is_complete = True
+                    break
+
+                if cursor.seq >= self._head_seq + len(self._buffer):
+                    if self.is_complete:
+                        logger.info(f"StreamingOutputs|stream_events|finished|{self.task_id}")
+                        break
+                    self._readable.clear()
+                    try:
+                        await self._readable.wait()
+                    except asyncio.CancelledError as err:
+                        logger.info(f"StreamingOutputs|stream_events|CancelledError|{self.task_id}|{err}")
+                        break
+                    continue
+
+                output = self._read(cursor)
+                if isinstance(output, RunFinishedSignal):
+                    logger.info(f"StreamingOutputs|stream_events|RUN_FINISHED_SIGNAL|{self.task_id}|{output}")
+                    self._check_errors()
+                    break
+
+                yield output
+        finally:
+            self._cursors.remove(cursor)
+            self._writable.set()
 
         self._cleanup_tasks()
 
@@ -212,5 +319,5 @@ class StreamingOutputs(AsyncOutputs):
             self._run_impl_task.cancel()
 
     async def mark_completed(self) -> None:
-        """Mark the streaming process as completed by adding a RUN_FINISHED_SIGNAL to the queue."""
-        await self._output_queue.put(RUN_FINISHED_SIGNAL)
+        """Mark the streaming process as completed by adding a RUN_FINISHED_SIGNAL to the buffer."""
+        await self.add_output(RUN_FINISHED_SIGNAL)
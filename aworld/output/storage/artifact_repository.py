@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 import time
 import uuid
 from enum import Enum
@@ -8,10 +9,16 @@ from typing import Dict, Any, Optional, List
 
 from pydantic import BaseModel
 
+from aworld.logs.util import logger
 from aworld.output import Artifact
+from aworld.output.storage.blob_store import LocalBlobStore, encode_content, decode_content
 
 
 class ArtifactRepository:
+    # whether the repository persists index changes with `append_index_journal`,
+    # otherwise the workspace rewrites the whole index with `save_index`
+    supports_index_journal: bool = False
+
     def __init__(self):
         """
         Initialize the artifact repository
@@ -25,6 +32,10 @@ class ArtifactRepository:
     def save_index(self, index_data: Dict[str, Any]) -> None:
         """Save index to file"""
 
+    def append_index_journal(self, entries: List[str]) -> None:
+        """Append JSON encoded index entries (`put`, `delete` or `workspace` operations) to the index journal,
+        only called on repositories with `supports_index_journal`"""
+
     def store_artifact(self,
                        artifact: Artifact
                        ) -> str:
@@ -64,6 +75,17 @@ class ArtifactRepository:
     def super_path(self) -> str:
         pass
 
+    def _resolve_content(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        content_ref = data.pop("content_ref", None)
+        # records written before the blob store keep the content inline
+        if content_ref is not None:
+            content = self.blob_store.get(content_ref["hash"])
+            if content is None:
+                logger.warning(f"Missing content blob {content_ref['hash']} of artifact {data.get('artifact_id')}")
+                return None
+            data["content"] = decode_content(content, content_ref.get("encoding", "json"))
+        return data
+
     def artifact_path(self, artifact_id):
         return self.super_path() + f"/artifact/{artifact_id}/index.json"
 
@@ -98,41 +120,125 @@ class EnumDecoder(json.JSONDecoder):
 
 
 class LocalArtifactRepository(ArtifactRepository):
-    """Artifact storage layer: manages versioned artifacts through content-addressable storage"""
+    """Artifact storage layer: manages versioned artifacts through content-addressable storage
+
+    The workspace index is an `index.json` snapshot plus an append-only `index.journal` of changes,
+    the journal is folded into the snapshot once it holds `journal_compact_threshold` entries.
+    Artifact content is kept in a `LocalBlobStore` under `blobs/`, the artifact record and its
+    `versions.jsonl` only reference content hashes.
+    """
+
+    supports_index_journal = True
 
-    def __init__(self, storage_path: str):
+    def __init__(self, storage_path: str, journal_compact_threshold: int = 1000, compression: Optional[str] = None):
         """
         Initialize the artifact repository
         
         Args:
             storage_path: Directory path for storing data
+            journal_compact_threshold: Number of journal entries triggering an index compaction
+            compression: Blob compression, "zstd" or None
         """
         super().__init__()
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.index_path = self.storage_path / "index.json"
+        self.journal_path = self.storage_path / "index.journal"
+        self.journal_compact_threshold = journal_compact_threshold
+        self.journal_length = 0
+        self._index_lock = threading.RLock()
+        self.blob_store = LocalBlobStore(str(self.storage_path), compression=compression)
         self.index = self.load_index()
 
     def load_index(self) -> Dict[str, Any]:
-        """Load or create index file"""
-        if self.index_path.exists():
-            try:
-                with open(self.index_path, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return {"artifacts": [], "versions": []}
-        else:
-            index = {"artifacts": [], "versions": []}
-            self._save_index(index)
+        """Load or create index file, replaying the journal over the snapshot"""
+        with self._index_lock:
+            if self.index_path.exists():
+                try:
+                    with open(self.index_path, 'r') as f:
+                        index = json.load(f)
+                except json.JSONDecodeError:
+                    index = {"artifacts": [], "versions": []}
+            else:
+                index = {"artifacts": [], "versions": []}
+                self._save_index(index)
+
+            entries = self._read_journal()
+            self.journal_length = len(entries)
+            if entries:
+                index = self._replay_journal(index, entries)
             return index
 
     def save_index(self, workspace_data) -> None:
-        self._save_index(workspace_data)
+        with self._index_lock:
+            self._save_index(workspace_data)
+            self._truncate_journal()
 
     def _save_index(self, index: Dict[str, Any]) -> None:
         """Save index to file"""
-        with open(self.index_path, 'w') as f:
-            json.dump(index, f, indent=2, ensure_ascii=False, cls=CommonEncoder)
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f, ensure_ascii=False, cls=CommonEncoder)
+        os.replace(tmp_path, self.index_path)
+
+    def append_index_journal(self, entries: List[str]) -> None:
+        """Append JSON encoded index entries to the journal, compacting it when it grows above the threshold"""
+        if not entries:
+            return
+        with self._index_lock:
+            with open(self.journal_path, 'a') as f:
+                f.write("\n".join(entries) + "\n")
+            self.journal_length += len(entries)
+            if self.journal_length >= self.journal_compact_threshold:
+                self.compact_index()
+
+    def compact_index(self) -> None:
+        """Fold the journal into the index snapshot"""
+        with self._index_lock:
+            self.save_index(self.load_index())
+
+    def _truncate_journal(self) -> None:
+        if self.journal_path.exists():
+            open(self.journal_path, 'w').close()
+        self.journal_length = 0
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        if not self.journal_path.exists():
+            return []
+        entries = []
+        with open(self.journal_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # a torn write of the last batch
+                    logger.warning(f"Skip invalid workspace index journal entry in {self.journal_path}")
+        return entries
+
+    @staticmethod
+    def _replay_journal(index: Dict[str, Any], entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # replaying is idempotent, entries already folded into the snapshot are harmless
+        artifacts = {item.get("artifact_id"): item for item in index.get("artifacts", [])}
+        for entry in entries:
+            op = entry.get("op")
+            if op == "put":
+                artifacts[entry["artifact_id"]] = {
+                    "artifact_id": entry["artifact_id"],
+                    "type": entry.get("type"),
+                    "metadata": entry.get("metadata", {})
+                }
+            elif op == "delete":
+                artifacts.pop(entry["artifact_id"], None)
+            elif op == "workspace":
+                for key in ("updated_at", "metadata"):
+                    if key in entry:
+                        index[key] = entry[key]
+        index["artifacts"] = list(artifacts.values())
+        index["artifact_ids"] = list(artifacts.keys())
+        return index
 
     def store_artifact(self,
                        artifact: Artifact
@@ -146,22 +252,27 @@ class LocalArtifactRepository(ArtifactRepository):
         Returns:
             Version identifier
         """
-        # Create version record
-        version = {
-            "hash": artifact.artifact_id,
-            "timestamp": time.time(),
-            "metadata": artifact.metadata or {}
-        }
-
-        # Update index
-
         data = artifact.to_dict()
-        # Store content
+        # Store content, unchanged content is not written again
+        content, encoding = encode_content(data.pop("content"), CommonEncoder)
+        digest = self.blob_store.put(content)
+        data["content_ref"] = {"hash": digest, "size": len(content), "encoding": encoding}
+
         content_path = Path(self.artifact_path(artifact.artifact_id))
         content_path.parent.mkdir(parents=True, exist_ok=True)
         with open(content_path, 'w') as f:
             json.dump(data, f, indent=2, ensure_ascii=False, cls=CommonEncoder)
 
+        # Create version record
+        version = {
+            "hash": digest,
+            "timestamp": time.time(),
+            "status": data["status"],
+            "size": len(content)
+        }
+        with open(content_path.parent / "versions.jsonl", 'a') as f:
+            f.write(json.dumps(version) + "\n")
+
         if artifact.attachments:
             for attachment in artifact.attachments:
                 attachment_path = content_path.parent / attachment.filename
@@ -171,7 +282,7 @@ class LocalArtifactRepository(ArtifactRepository):
                     with open(attachment_path, 'w') as f:
                         f.write(attachment.content)
 
-        return "success"
+        return digest
 
     def retrieve_latest_artifact(self, artifact_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -189,7 +300,8 @@ class LocalArtifactRepository(ArtifactRepository):
             return None
 
         with open(artifact_path, 'r') as f:
-            return json.load(f)
+            data = json.load(f)
+        return self._resolve_content(data)
 
     def get_artifact_versions(self, artifact_id: str) -> List[Dict[str, Any]]:
         """
@@ -201,15 +313,17 @@ class LocalArtifactRepository(ArtifactRepository):
         Returns:
             List of version information
         """
-        if artifact_id not in self.index["artifacts"]:
+        versions_path = Path(self.artifact_path(artifact_id)).parent / "versions.jsonl"
+        if not versions_path.exists():
             return []
 
         versions = []
-        for version_id in self.index["artifacts"][artifact_id]:
-            version_info = self.index["versions"][version_id].copy()
-            version_info["id"] = version_id
-            versions.append(version_info)
-
+        with open(versions_path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    version_info = json.loads(line)
+                    version_info["id"] = version_info["hash"]
+                    versions.append(version_info)
         return versions
     
     def delete_artifact(self, artifact_id: str) -> bool:
@@ -265,6 +379,9 @@ class LocalArtifactRepository(ArtifactRepository):
             }
             if os.path.isdir(path):
                 for entry in sorted(os.listdir(path)):
+                    if depth == 1 and entry == "blobs":
+                        # content store, not part of the workspace layout
+                        continue
                     full_path = os.path.join(path, entry)
                     node["children"].append(build_tree(full_path, node["id"], depth + 1))
             return node
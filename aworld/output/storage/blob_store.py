@@ -0,0 +1,196 @@
+import abc
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from aworld.logs.util import logger
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# first byte of a stored blob, the codec of the payload
+_RAW = b"R"
+_ZSTD = b"Z"
+
+
+def encode_content(content: Any, encoder: Optional[type] = None) -> Tuple[bytes, str]:
+    """Serialize artifact content to bytes, returns the bytes and their encoding (`bytes`, `text` or `json`)."""
+    if isinstance(content, bytes):
+        return content, "bytes"
+    if isinstance(content, str):
+        return content.encode("utf-8"), "text"
+    return json.dumps(content, ensure_ascii=False, cls=encoder).encode("utf-8"), "json"
+
+
+def decode_content(data: bytes, encoding: str) -> Any:
+    if encoding == "bytes":
+        return data
+    if encoding == "text":
+        return data.decode("utf-8")
+    return json.loads(data.decode("utf-8"))
+
+
+class BlobStore(abc.ABC):
+    """
+    Content addressed blobs, the key of a blob is the sha256 of its raw bytes so identical
+    payloads (e.g. a screenshot repeated across versions) are stored once.
+
+    Blobs of at least `min_compress_bytes` are zstd compressed if `compression="zstd"` and the
+    `zstandard` package is installed, reading does not depend on the configured compression.
+    """
+
+    def __init__(self, compression: Optional[str] = None, compression_level: int = 3, min_compress_bytes: int = 1024):
+        if compression not in (None, "zstd"):
+            raise ValueError(f"Unsupported blob compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed, blobs are stored uncompressed. Install it with 'pip install zstandard'.")
+            compression = None
+        self.compression = compression
+        self.compression_level = compression_level
+        self.min_compress_bytes = min_compress_bytes
+        self._known = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def blob_key(digest: str) -> str:
+        return f"blobs/{digest[:2]}/{digest}"
+
+    def put(self, data: bytes) -> str:
+        """Store the bytes if no blob has the same content, returns the blob digest."""
+        digest = self.digest(data)
+        with self._lock:
+            if digest in self._known:
+                return digest
+        if not self._exists(self.blob_key(digest)):
+            self._write(self.blob_key(digest), self._encode(data))
+        with self._lock:
+            self._known.add(digest)
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        payload = self._read(self.blob_key(digest))
+        return None if payload is None else self._decode(payload)
+
+    def _encode(self, data: bytes) -> bytes:
+        if self.compression == "zstd" and len(data) >= self.min_compress_bytes:
+            compressed = zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+            if len(compressed) < len(data):
+                return _ZSTD + compressed
+        return _RAW + data
+
+    @staticmethod
+    def _decode(payload: bytes) -> bytes:
+        codec, data = payload[:1], payload[1:]
+        if codec == _ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read compressed blobs, install it with 'pip install zstandard'.")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return data
+
+    @abc.abstractmethod
+    def _exists(self, key: str) -> bool:
+        """Whether a blob is stored under the key."""
+
+    @abc.abstractmethod
+    def _read(self, key: str) -> Optional[bytes]:
+        """Stored payload of the key, None if there is none."""
+
+    @abc.abstractmethod
+    def _write(self, key: str, payload: bytes) -> None:
+        """Store the payload under the key."""
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs stored as files under the root directory."""
+
+    def __init__(self, root: str, **kwargs):
+        super().__init__(**kwargs)
+        self.root = Path(root)
+
+    def _exists(self, key: str) -> bool:
+        return (self.root / key).exists()
+
+    def _read(self, key: str) -> Optional[bytes]:
+        path = self.root / key
+        if not path.exists():
+            return None
+        return path.read_bytes()
+
+    def _write(self, key: str, payload: bytes) -> None:
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+
+class OSSBlobStore(BlobStore):
+    """Blobs stored as OSS objects under the prefix, written in the background by an `OSSUploadQueue`."""
+
+    def __init__(self, bucket, prefix: str, upload_queue=None, **kwargs):
+        super().__init__(**kwargs)
+        self.bucket = bucket
+        self.prefix = prefix
+        self.upload_queue = upload_queue
+        # queued and failed uploads by digest, succeeded ones are dropped when they finish
+        self._uploads: Dict[str, Future] = {}
+
+    def put(self, data: bytes) -> str:
+        digest = self.digest(data)
+        future = self._uploads.get(digest)
+        if future is not None and future.done() and future.exception() is not None:
+            # upload it again
+            with self._lock:
+                self._known.discard(digest)
+            self._uploads.pop(digest, None)
+        return super().put(data)
+
+    def upload_of(self, digest: str) -> Optional[Future]:
+        """The queued upload of the blob, None if it is stored already."""
+        future = self._uploads.get(digest)
+        if future is not None and future.done() and future.exception() is None:
+            return None
+        return future
+
+    def _exists(self, key: str) -> bool:
+        if self.upload_queue is not None:
+            # checked by the upload job, off the caller thread
+            return False
+        return self.bucket.object_exists(self.prefix + key)
+
+    def _read(self, key: str) -> Optional[bytes]:
+        import oss2
+
+        if self.upload_queue is not None:
+            pending = self.upload_queue.pending_data(self.prefix + key)
+            if pending is not None:
+                return pending
+        try:
+            return self.bucket.get_object(self.prefix + key).read()
+        except oss2.exceptions.NoSuchKey:
+            return None
+
+    def _write(self, key: str, payload: bytes) -> None:
+        if self.upload_queue is None:
+            self.bucket.put_object(self.prefix + key, payload)
+            return
+        digest = key.rsplit("/", 1)[-1]
+        future = self.upload_queue.submit(self.prefix + key, payload, skip_existing=True)
+        self._uploads[digest] = future
+        future.add_done_callback(lambda f: self._upload_done(digest, f))
+
+    def _upload_done(self, digest: str, future: Future):
+        # failed uploads are kept, the next put of the blob uploads it again
+        if future.exception() is None and self._uploads.get(digest) is future:
+            self._uploads.pop(digest, None)
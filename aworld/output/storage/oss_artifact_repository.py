@@ -3,21 +3,30 @@ import json
 import time
 import uuid
 from typing import Dict, Any, Optional, List, Literal
+from concurrent.futures import Future
 from .artifact_repository import ArtifactRepository, CommonEncoder
+from .blob_store import OSSBlobStore, encode_content
 from aworld.output.artifact import Artifact, ArtifactAttachment
+from aworld.utils.oss import OSSUploadQueue
 from ...logs.util import logger
 
 
 class OSSArtifactRepository(ArtifactRepository):
     """
     Artifact storage implementation based on Alibaba Cloud OSS, similar to LocalArtifactRepository but using OSS as backend.
+
+    Content is stored once per hash in an `OSSBlobStore`. With `async_upload` the objects are written by an
+    `OSSUploadQueue` in the background, reads of this repository see the queued writes, call `flush` to wait for them.
     """
     def __init__(self,
                  access_key_id: str,
                  access_key_secret: str,
                  endpoint: str,
                  bucket_name: str,
-                 storage_path: str = "aworld/workspaces/"):
+                 storage_path: str = "aworld/workspaces/",
+                 compression: Optional[str] = None,
+                 async_upload: bool = True,
+                 upload_concurrency: int = 4):
         """
         Initialize OSS artifact repository
         Args:
@@ -26,6 +35,9 @@ class OSSArtifactRepository(ArtifactRepository):
             endpoint: OSS service endpoint
             bucket_name: OSS bucket name
             storage_path: Storage prefix, defaults to "aworld/workspaces/"
+            compression: Blob compression, "zstd" or None
+            async_upload: Upload in the background instead of blocking the caller
+            upload_concurrency: Maximum number of concurrent background uploads
         """
         import oss2
 
@@ -34,8 +46,29 @@ class OSSArtifactRepository(ArtifactRepository):
         self.bucket = oss2.Bucket(self.auth, endpoint, bucket_name)
         self.prefix = storage_path.rstrip('/') + '/'
         self.index_key = f"{self.prefix}index.json"
+        self.upload_queue = OSSUploadQueue(self.bucket, max_concurrency=upload_concurrency) if async_upload else None
+        self.blob_store = OSSBlobStore(self.bucket, self.prefix, self.upload_queue, compression=compression)
         self.index = self.load_index()
 
+    def _put(self, key: str, content: bytes, depends_on: Optional[Future] = None) -> None:
+        if self.upload_queue is None:
+            self.bucket.put_object(key, content)
+        else:
+            self.upload_queue.submit(key, content, depends_on=depends_on)
+
+    def _get(self, key: str) -> bytes:
+        if self.upload_queue is not None:
+            pending = self.upload_queue.pending_data(key)
+            if pending is not None:
+                return pending
+        return self.bucket.get_object(key).read()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the background uploads, return False on timeout."""
+        if self.upload_queue is None:
+            return True
+        return self.upload_queue.flush(timeout)
+
     def load_index(self) -> Dict[str, Any]:
         """
         Load or create index file from OSS
@@ -45,8 +78,7 @@ class OSSArtifactRepository(ArtifactRepository):
         import oss2
 
         try:
-            result = self.bucket.get_object(self.index_key)
-            content = result.read().decode('utf-8')
+            content = self._get(self.index_key).decode('utf-8')
             return json.loads(content)
         except oss2.exceptions.NoSuchKey:
             index = {"artifacts": [], "versions": []}
@@ -69,8 +101,8 @@ class OSSArtifactRepository(ArtifactRepository):
             index: Index dictionary
         """
         try:
-            content = json.dumps(index, indent=2, ensure_ascii=False, cls=CommonEncoder)
-            self.bucket.put_object(self.index_key, content.encode('utf-8'))
+            content = json.dumps(index, ensure_ascii=False, cls=CommonEncoder)
+            self._put(self.index_key, content.encode('utf-8'))
         except Exception as e:
             logger.warning(f"Failed to save index file: {e}")
             raise
@@ -102,28 +134,30 @@ class OSSArtifactRepository(ArtifactRepository):
         Args:
             artifact: Artifact instance to be stored
         Returns:
-            Version identifier (always 'success' for now)
+            Version identifier, the hash of the artifact content
         """
-        import oss2
-
         try:
+            # Store artifact content, the record references it by hash
+            data = artifact.to_dict()
+            content, encoding = encode_content(data.pop("content"), CommonEncoder)
+            digest = self.blob_store.put(content)
+            data["content_ref"] = {"hash": digest, "size": len(content), "encoding": encoding}
             # Prepare version record
             version = {
-                "hash": artifact.artifact_id,
+                "hash": digest,
                 "timestamp": time.time(),
                 "metadata": artifact.metadata or {}
             }
-            # Store artifact content
-            data = artifact.to_dict()
             content_key = self.artifact_path(artifact.artifact_id)
-            content = json.dumps(data, indent=2, ensure_ascii=False, cls=CommonEncoder)
-            self.bucket.put_object(content_key, content.encode('utf-8'))
+            record = json.dumps(data, ensure_ascii=False, cls=CommonEncoder)
+            # the record is written once its blob is
+            self._put(content_key, record.encode('utf-8'), depends_on=self.blob_store.upload_of(digest))
             # Store attachments if any
             if artifact.attachments:
                 for attachment in artifact.attachments:
                     if isinstance(attachment, ArtifactAttachment):
                         attachment_key = self.attachment_path(artifact.artifact_id, attachment.filename)
-                        self.bucket.put_object(attachment_key, attachment.content.encode('utf-8'))
+                        self._put(attachment_key, attachment.content.encode('utf-8'))
             # Update index
             artifact_exists = False
             for item in self.index["artifacts"]:
@@ -138,7 +172,7 @@ class OSSArtifactRepository(ArtifactRepository):
                     'version': version
                 })
             self._save_index(self.index)
-            return "success"
+            return digest
         except Exception as e:
             logger.warning(f"Storage failed: {e}")
             raise
@@ -156,9 +190,8 @@ class OSSArtifactRepository(ArtifactRepository):
         try:
             content_key = self.artifact_path(artifact_id)
             try:
-                result = self.bucket.get_object(content_key)
-                content = result.read().decode('utf-8')
-                return json.loads(content)
+                content = self._get(content_key).decode('utf-8')
+                return self._resolve_content(json.loads(content))
             except oss2.exceptions.NoSuchKey:
                 logger.warning(f"Content file doesn't exist: {content_key}")
                 return None
@@ -195,6 +228,8 @@ class OSSArtifactRepository(ArtifactRepository):
         """
         import oss2
 
+        # queued uploads of the artifact must not land after the deletion
+        self.flush()
         try:
             # Delete artifact content
             content_key = self.artifact_path(artifact_id)
@@ -249,7 +284,8 @@ class OSSArtifactRepository(ArtifactRepository):
 
         all_keys = [obj.key for obj in oss2.ObjectIterator(self.bucket, prefix=self.prefix)]
         # remove root prefix
-        rel_keys = [key[len(self.prefix):] for key in all_keys if key != self.index_key]
+        rel_keys = [key[len(self.prefix):] for key in all_keys
+                    if key != self.index_key and not key.startswith(f"{self.prefix}blobs/")]
         # build tree
         root = {
             "name": workspace_name,
@@ -3,7 +3,7 @@ import traceback
 from aworld.logs.util import logger
 from aworld.output.utils import consume_content
 
-from aworld.output.base import MessageOutput, ToolResultOutput, StepOutput, Output
+from aworld.output.base import MessageOutput, ToolResultOutput, StepOutput, TextDeltaOutput, Output
 
 
 class AworldUI:
@@ -34,6 +34,12 @@ class AworldUI:
         """
         pass
 
+    async def text_delta(self, output: TextDeltaOutput):
+        """
+            streamed text of a llm response
+        """
+        pass
+
     async def custom_output(self, output: Output) -> str:
         """
             custom
@@ -53,6 +59,8 @@ class AworldUI:
                 return await ui.tool_result(output)
             elif isinstance(output, StepOutput):
                 return await ui.step(output)
+            elif isinstance(output, TextDeltaOutput):
+                return await ui.text_delta(output)
             else:
                 return await ui.custom_output(output)
         except Exception as err:
@@ -106,5 +114,9 @@ class PrinterAworldUI(AworldUI):
             return f"=============🛬💥FAILED {output.name}======================"
         return f"=============？UNKNOWN#{output.status} {output.name}======================"
 
+    async def text_delta(self, output: TextDeltaOutput) -> str:
+        print(output.delta, end="", flush=True)
+        return output.delta
+
     async def custom_output(self, output: Output) -> str:
         pass
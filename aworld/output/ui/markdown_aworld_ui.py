@@ -13,7 +13,7 @@ from aworld.output import (
     WorkSpace,
     SearchOutput,
 )
-from aworld.output.base import StepOutput, ToolResultOutput
+from aworld.output.base import StepOutput, TextDeltaOutput, ToolResultOutput
 from aworld.output.ui.template import tool_card_template
 from aworld.output.utils import consume_content
 
@@ -133,6 +133,9 @@ class MarkdownAworldUI(AworldUI):
         else:
             return f"\n\n{output.name} ❓❓❓UNKNOWN#{output.status} {emptyLine}"
 
+    async def text_delta(self, output: TextDeltaOutput):
+        return output.delta
+
     async def custom_output(self, output: Output):
         return output.data
 
@@ -1,15 +1,18 @@
+import asyncio
+import json
 import os
+import threading
 import traceback
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Union
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 from aworld.logs.util import logger
 from aworld.output.artifact import ArtifactType, Artifact
 from aworld.output.code_artifact import CodeArtifact
-from aworld.output.storage.artifact_repository import ArtifactRepository, LocalArtifactRepository
+from aworld.output.storage.artifact_repository import ArtifactRepository, LocalArtifactRepository, CommonEncoder
 from aworld.output.observer import WorkspaceObserver, get_observer
 from aworld.output.storage.oss_artifact_repository import OSSArtifactRepository
 
@@ -19,6 +22,9 @@ class WorkSpace(BaseModel):
     Artifact workspace, managing a group of related artifacts
     
     Provides collaborative editing features, supporting version management, update notifications, etc. for multiple Artifacts
+
+    Index changes are written in the background: they are batched and appended to the repository index journal
+    (or saved as a whole index by repositories without journal), call `flush` to wait for them.
     """
 
     workspace_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="unique identifier for the workspace")
@@ -33,6 +39,12 @@ class WorkSpace(BaseModel):
     repository: Optional[ArtifactRepository] = Field(default=None, description="local artifact repository", exclude=True)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    _pending_index_entries: List[str] = PrivateAttr(default_factory=list)
+    _index_dirty: bool = PrivateAttr(default=False)
+    _pending_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _write_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _flush_task: Optional[asyncio.Task] = PrivateAttr(default=None)
     
     def __init__(
             self,
@@ -87,7 +99,8 @@ class WorkSpace(BaseModel):
             Dictionary containing workspace data if exists, None otherwise
         """
         try:
-            # Get workspace versions
+            # pending index changes are part of the workspace
+            self._write_index_journal()
 
             workspace_data = self.repository.load_index()
 
@@ -120,6 +133,7 @@ class WorkSpace(BaseModel):
             else:
                 self.artifacts = []
                 self.metadata = {}
+            self._rebuild_artifact_id_index()
         except Exception as e:
             logger.warning(f"Error loading workspace data: {traceback.print_exc()}")
             return None
@@ -248,9 +262,6 @@ class WorkSpace(BaseModel):
         # Update workspace time
         self.updated_at = datetime.now().isoformat()
 
-        # Save workspace state to create new version
-        self.save()
-
         return artifacts  # Return the list of created artifacts
 
     async def add_artifact(
@@ -276,9 +287,6 @@ class WorkSpace(BaseModel):
         # Update workspace time
         self.updated_at = datetime.now().isoformat()
 
-        # Save workspace state to create new version
-        self.save()
-
         await self._notify_observers("create", artifact)
 
     async def mark_as_completed(self, artifact_id: str) -> None:
@@ -289,16 +297,15 @@ class WorkSpace(BaseModel):
         if artifact:
             artifact.mark_complete()
             self.repository.store_artifact(artifact)
+            self.updated_at = datetime.now().isoformat()
+            self._record_index_entry("put", artifact)
             logger.info(f"[📂WORKSPACE]🎉 Marking artifact as completed: {artifact_id}")
             await self._notify_observers("complete", artifact)
-        self.save()
 
     def get_artifact(self, artifact_id: str) -> Optional[Artifact]:
         """Get artifact with the specified ID"""
-        for artifact in self.artifacts:
-            if artifact.artifact_id == artifact_id:
-                return artifact
-        return None
+        idx = self._artifact_position(artifact_id)
+        return self.artifacts[idx] if idx >= 0 else None
 
     def get_artifact_data(self, artifact_id: str) -> Optional[Dict]:
         """Get artifact data with the specified ID"""
@@ -335,6 +342,7 @@ class WorkSpace(BaseModel):
 
             # Update storage
             await self._store_artifact(artifact)
+            self.updated_at = datetime.now().isoformat()
 
             return artifact
         return None
@@ -349,25 +357,22 @@ class WorkSpace(BaseModel):
         Returns:
             Whether deletion was successful
         """
-        existed = self._check_artifact_exists(artifact_id)
-        if not existed:
+        idx = self._artifact_position(artifact_id)
+        if idx < 0:
             return True
-        for i, artifact in enumerate(self.artifacts):
-            if artifact.artifact_id == artifact_id:
-                # Remove from list
-                self.artifacts.pop(i)
+        # Remove from list
+        artifact = self.artifacts.pop(idx)
+        self._rebuild_artifact_id_index()
 
-                # Update workspace time
-                self.updated_at = datetime.now().isoformat()
+        # Update workspace time
+        self.updated_at = datetime.now().isoformat()
 
-                self.repository.delete_artifact(artifact_id)
-                # Save workspace state to create new version
-                self.save()
+        self.repository.delete_artifact(artifact_id)
+        self._record_index_entry("delete", artifact)
 
-                # Notify observers
-                await self._notify_observers("delete", artifact)
-                return True
-        return False
+        # Notify observers
+        await self._notify_observers("delete", artifact)
+        return True
 
     def list_artifacts(self, filter_type: Optional[ArtifactType] = None) -> List[Artifact]:
         """
@@ -430,20 +435,28 @@ class WorkSpace(BaseModel):
         return results
     
     def _check_artifact_exists(self, artifact_id: str) -> bool:
-        return self.artifact_id_index.get(artifact_id, -1) >= 0
-
+        return self._artifact_position(artifact_id) >= 0
+
+    def _artifact_position(self, artifact_id: str) -> int:
+        idx = self.artifact_id_index.get(artifact_id, -1)
+        if 0 <= idx < len(self.artifacts) and self.artifacts[idx].artifact_id == artifact_id:
+            return idx
+        if idx < 0 and len(self.artifact_id_index) == len(self.artifacts):
+            return -1
+        # the artifact list was changed in place
+        self._rebuild_artifact_id_index()
+        return self.artifact_id_index.get(artifact_id, -1)
 
     def _append_artifact(self, artifact: Artifact) -> None:
         self.artifacts.append(artifact)
+        self.artifact_id_index[artifact.artifact_id] = len(self.artifacts) - 1
         logger.debug(f"[📂WORKSPACE]🆕 Appending artifact in repository: {artifact.artifact_id}")
 
-
     def _update_artifact(self, artifact: Artifact) -> None:
-        for i, a in enumerate(self.artifacts):
-            if a.artifact_id == artifact.artifact_id:
-                self.artifacts[i] = artifact
-                logger.info(f"[📂WORKSPACE]🔄 Updating artifact in repository: {artifact.artifact_id}")
-                break
+        idx = self._artifact_position(artifact.artifact_id)
+        if idx >= 0:
+            self.artifacts[idx] = artifact
+            logger.info(f"[📂WORKSPACE]🔄 Updating artifact in repository: {artifact.artifact_id}")
 
     
     async def _store_artifact(self, artifact: Artifact) -> None:
@@ -464,15 +477,97 @@ class WorkSpace(BaseModel):
 
         # Store in repository
         artifact.current_version = version_id
+        self._record_index_entry("put", artifact)
+
+    def _record_index_entry(self, op: str, artifact: Artifact) -> None:
+        """Queue an index change of the artifact, written by the background flush."""
+        entry = {"op": op, "artifact_id": artifact.artifact_id}
+        if op == "put":
+            entry["type"] = str(artifact.artifact_type)
+            entry["metadata"] = artifact.metadata
+        self._append_index_entry(entry)
+        self._schedule_index_flush()
+
+    def _append_index_entry(self, entry: Dict[str, Any]) -> None:
+        # encoded on the caller thread, the artifact may change while the batch is written
+        line = json.dumps(entry, ensure_ascii=False, cls=CommonEncoder)
+        with self._pending_lock:
+            self._pending_index_entries.append(line)
+            self._index_dirty = True
+
+    def _schedule_index_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_index_sync()
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_index())
+
+    async def _flush_index(self) -> None:
+        # changes recorded while a batch is written form the next batch
+        while self._index_dirty:
+            try:
+                if self.repository.supports_index_journal:
+                    self._append_index_entry({"op": "workspace", "updated_at": self.updated_at, "metadata": self.metadata})
+                    await asyncio.to_thread(self._write_index_journal)
+                else:
+                    self._index_dirty = False
+                    try:
+                        await asyncio.to_thread(self.repository.save_index, self._index_data())
+                    except Exception:
+                        self._index_dirty = True
+                        raise
+            except Exception as e:
+                # the changes stay pending, written by the next flush
+                logger.warning(f"[📂WORKSPACE] Failed to write workspace index: {e}")
+                return
+
+    def _flush_index_sync(self) -> None:
+        if self.repository.supports_index_journal:
+            self._write_index_journal()
+        elif self._index_dirty:
+            self.save()
+
+    def _write_index_journal(self) -> None:
+        if not self.repository.supports_index_journal:
+            return
+        with self._write_lock:
+            with self._pending_lock:
+                entries, self._pending_index_entries = self._pending_index_entries, []
+                self._index_dirty = False
+            if not entries:
+                return
+            try:
+                self.repository.append_index_journal(entries)
+            except Exception:
+                # back in front of the changes recorded meanwhile, in order
+                with self._pending_lock:
+                    self._pending_index_entries[:0] = entries
+                    self._index_dirty = True
+                raise
+
+    async def flush(self) -> None:
+        """Wait until the pending index changes are written to the repository."""
+        if self._index_dirty:
+            # pending changes of a failed write are retried
+            self._schedule_index_flush()
+        while self._flush_task is not None and not self._flush_task.done():
+            await asyncio.shield(self._flush_task)
 
     def save(self) -> None:
         """
-        Save workspace state
-
-        Returns:
-            Workspace storage ID
+        Save the whole workspace index, replacing the pending index changes
         """
-        workspace_data = {
+        with self._write_lock:
+            with self._pending_lock:
+                self._pending_index_entries = []
+                self._index_dirty = False
+            # Store workspace information with workspace_id in metadata
+            self.repository.save_index(self._index_data())
+
+    def _index_data(self) -> Dict[str, Any]:
+        return {
             "workspace_id": self.workspace_id,
             "name": self.name,
             "created_at": self.created_at,
@@ -489,10 +584,6 @@ class WorkSpace(BaseModel):
             ]
         }
 
-        # Store workspace information with workspace_id in metadata
-        self.repository.save_index(workspace_data)
-        self._rebuild_artifact_id_index()
-
     def get_file_content_by_artifact_id(self, artifact_id: str) -> str:
         """
         Get concatenated content of all artifacts with the same filename.
@@ -504,10 +595,9 @@ class WorkSpace(BaseModel):
             Raw unescaped concatenated content of all matching artifacts
         """
         filename = artifact_id
-        for artifact in self.artifacts:
-            if artifact.artifact_id == artifact_id:
-                filename = artifact.metadata.get('filename')
-                break
+        artifact = self.get_artifact(artifact_id)
+        if artifact:
+            filename = artifact.metadata.get('filename')
 
         result = ""
         for artifact in self.artifacts:
@@ -1,5 +1,6 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
+import asyncio
 import json
 import time
 import traceback
@@ -13,6 +14,7 @@ from aworld.core.agent.base import is_agent
 from aworld.agents.llm_agent import Agent
 from aworld.core.common import Observation, ActionModel, ActionResult
 from aworld.core.context.base import Context
+from aworld.core.context.registry import context_registry
 from aworld.core.event.base import Message, ToolMessage, AgentMessage
 from aworld.core.tool.base import ToolFactory, Tool, AsyncTool
 from aworld.core.tool.tool_desc import is_tool_by_name
@@ -24,6 +26,7 @@ from aworld.runners.task_runner import TaskRunner
 from aworld.runners.utils import endless_detect
 from aworld.sandbox import Sandbox
 from aworld.tools.utils import build_observation
+from aworld.trace.attributes import lazy_attribute
 from aworld.utils.common import override_in_subclass
 from aworld.utils.serialized_util import NumpyEncoder
 
@@ -39,13 +42,25 @@ def action_result_transform(message: Message, sandbox: Sandbox) -> Tuple[Observa
                              action_result=action_results), 1.0, result.is_done, result.is_done, {}
 
 
+def _observation_json(observation: Observation) -> str:
+    return json.dumps(observation.model_dump(exclude_none=True), ensure_ascii=False, cls=NumpyEncoder)
+
+
+def _actions_json(actions: List[ActionModel]) -> str:
+    return json.dumps([action.model_dump() for action in actions], ensure_ascii=False)
+
+
 class WorkflowRunner(TaskRunner):
     def __init__(self, task: Task, *args, **kwargs):
         super().__init__(task=task, *args, **kwargs)
 
     async def do_run(self, context: Context = None) -> TaskResponse:
         self.max_steps = self.conf.get("max_steps", 100)
-        resp = await self._do_run(context)
+        try:
+            resp = await self._do_run(context)
+        finally:
+            # messages of the task no longer keep its contexts alive
+            context_registry.release(self.task.id)
         self._task_response = resp
         return resp
 
@@ -102,172 +117,295 @@ class WorkflowRunner(TaskRunner):
 
     async def _common_process(self, task_span):
         start = time.time()
-        step = 1
-        pre_agent_name = None
-        observation = self.observation
+        self._cur_step = 1
+        self._pre_agent_name = None
+        agent_graph = self.swarm.agent_graph
+        if any(len(level) > 1 for level in agent_graph.levels):
+            return await self._dag_process(task_span, start)
 
+        observation = self.observation
         for idx, agent in enumerate(self.swarm.ordered_agents):
-            observation.from_agent_name = agent.id()
-            observations = [observation]
-            policy = None
-            cur_agent = agent
-            while step <= self.max_steps:
-                await self.outputs.add_output(
-                    StepOutput.build_start_output(name=f"Step{step}", step_num=step, task_id=self.task.id))
+            observation, response = await self._run_agent(agent,
+                                                          observation,
+                                                          task_span,
+                                                          start,
+                                                          last=idx == len(self.swarm.ordered_agents) - 1)
+            if response:
+                return response
+
+    async def _dag_process(self, task_span, start: float):
+        """Run the workflow DAG, an agent starts as soon as all its predecessors finished.
+
+        Agents without dependency on each other run concurrently, at most `max_parallel_agents` at a time,
+        the observation of an agent with multiple predecessors is the dict of their outputs by agent id.
+        """
+        agent_graph = self.swarm.agent_graph
+        # ordered agents may be replaced by the loopable version of the agent
+        agents = {agent.id(): agent for agent in self.swarm.ordered_agents}
+        end_agents = [agent_id for agent_id in agents if not agent_graph.successor.get(agent_id)]
+        semaphore = asyncio.Semaphore(max(self.conf.get("max_parallel_agents", 8) or 1, 1))
+        agent_tasks: Dict[str, asyncio.Task] = {}
+
+        async def _run_node(agent_id: str):
+            all_input = {}
+            for pre_id in agent_graph.predecessor.get(agent_id, {}):
+                pre_observation, pre_response = await agent_tasks[pre_id]
+                if pre_response:
+                    # the workflow ends with the predecessor
+                    return pre_observation, None
+                all_input[pre_id] = pre_observation.content
+            if all_input:
+                observation = Observation(content=all_input if len(all_input) > 1 else list(all_input.values())[0])
+            else:
+                observation = self.observation.model_copy()
+            # every branch writes its own copy of the context, merged back when the branch finished
+            context, forked = self._fork_context()
+            try:
+                async with semaphore:
+                    return await self._run_agent(agents[agent_id],
+                                                 observation,
+                                                 task_span,
+                                                 start,
+                                                 last=len(end_agents) == 1 and agent_id in end_agents,
+                                                 concurrent=True,
+                                                 context=context)
+            finally:
+                self._join_context(context, forked)
 
-                terminated = False
+        for level in agent_graph.levels:
+            for agent_id in level:
+                agent_tasks[agent_id] = asyncio.create_task(_run_node(agent_id))
 
-                observation = self.swarm.action_to_observation(policy, observations)
-                observation.from_agent_name = observation.from_agent_name or cur_agent.id()
+        try:
+            pending = set(agent_tasks.values())
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for agent_task in done:
+                    _, response = agent_task.result()
+                    if response:
+                        # as in the sequential process, a response ends the workflow, the other branches are cancelled
+                        return response
+        finally:
+            for agent_task in agent_tasks.values():
+                if not agent_task.done():
+                    agent_task.cancel()
+            await asyncio.gather(*agent_tasks.values(), return_exceptions=True)
+
+        if len(end_agents) == 1:
+            return agent_tasks[end_agents[0]].result()[1]
+        return TaskResponse(answer={agent_id: agent_tasks[agent_id].result()[0].content for agent_id in end_agents},
+                            success=True,
+                            id=self.task.id,
+                            time_cost=(time.time() - start),
+                            usage=self.context.token_usage)
+
+    def _fork_context(self) -> Tuple[Context, tuple]:
+        """Copy of the task context for a concurrent branch, with the token usage and state it started from."""
+        context = self.context.deep_copy()
+        if context is self.context:
+            # contexts sharing their state by design, e.g. ApplicationContext
+            return context, None
+        context.set_task(self.context.get_task())
+        return context, (dict(context.token_usage), context.context_info.local_dict())
+
+    def _join_context(self, context: Context, forked: tuple):
+        """Merge what a branch changed in its context copy back into the task context."""
+        if forked is None:
+            return
+        usage, state = forked
+        self.context.add_token({key: value - usage.get(key, 0) for key, value in context.token_usage.items()
+                                if isinstance(value, (int, float)) and value > usage.get(key, 0)})
+        # state values the branch set, the copy holds the values it started with
+        changed = {key: value for key, value in context.context_info.local_dict().items()
+                   if key not in state or state[key] is not value}
+        if changed:
+            self.context.context_info.update(changed)
+        for key, value in context.trajectories.items():
+            self.context.trajectories.setdefault(key, value)
+        for agent_id, trajectories in context._agent_token_id_traj.items():
+            self.context._agent_token_id_traj.setdefault(agent_id, trajectories)
+        self.context.mark_changed()
+
+    async def _run_agent(self,
+                         agent: Agent,
+                         observation: Observation,
+                         task_span,
+                         start: float,
+                         last: bool = False,
+                         concurrent: bool = False,
+                         context: Context = None) -> Tuple[Observation, TaskResponse]:
+        """Run the steps of one workflow agent until it finished.
 
-                if observation.to_agent_name and observation.to_agent_name != cur_agent.id():
-                    cur_agent = self.swarm.agents.get(observation.to_agent_name)
+        Args:
+            context: Context the agent writes, the task context by default.
 
-                exp_id = self._get_step_span_id(step, cur_agent.id())
-                with trace.span(f"step_execution_{exp_id}") as step_span:
-                    try:
-                        step_span.set_attributes({
-                            "exp_id": exp_id,
-                            "task_id": self.task.id,
-                            "task_name": self.task.name,
-                            "trace_id": trace.get_current_span().get_trace_id(),
-                            "step": step,
-                            "agent_id": cur_agent.id(),
-                            "pre_agent": pre_agent_name,
-                            "observation": json.dumps(observation.model_dump(exclude_none=True),
-                                                      ensure_ascii=False,
-                                                      cls=NumpyEncoder)
-                        })
-                    except:
-                        pass
-                    pre_agent_name = cur_agent.id()
-                    agent_message = AgentMessage(
-                        payload=observation,
-                        session_id=self.context.session_id,
-                        headers={"context": self.context}
-                    )
+        Returns:
+            The observation for the successors, and the task response if the task ends with the agent.
+        """
+        context = context or self.context
+        observation.from_agent_name = agent.id()
+        observations = [observation]
+        policy = None
+        cur_agent = agent
+        while self._cur_step <= self.max_steps:
+            step = self._cur_step
+            self._cur_step += 1
+            await self.outputs.add_output(
+                StepOutput.build_start_output(name=f"Step{step}", step_num=step, task_id=self.task.id))
+
+            terminated = False
+
+            observation = self.swarm.action_to_observation(policy, observations)
+            observation.from_agent_name = observation.from_agent_name or cur_agent.id()
+
+            if observation.to_agent_name and observation.to_agent_name != cur_agent.id():
+                cur_agent = self.swarm.agents.get(observation.to_agent_name)
+
+            exp_id = self._get_step_span_id(step, cur_agent.id())
+            with trace.span(f"step_execution_{exp_id}") as step_span:
+                try:
+                    step_span.set_attributes({
+                        "exp_id": exp_id,
+                        "task_id": self.task.id,
+                        "task_name": self.task.name,
+                        "trace_id": trace.get_current_span().get_trace_id(),
+                        "step": step,
+                        "agent_id": cur_agent.id(),
+                        "pre_agent": self._pre_agent_name,
+                        "observation": lazy_attribute(_observation_json, observation, snapshot=True)
+                    })
+                except:
+                    pass
+                self._pre_agent_name = cur_agent.id()
+                agent_message = AgentMessage(
+                    payload=observation,
+                    session_id=context.session_id,
+                    headers={"context": context}
+                )
 
-                    if not override_in_subclass('async_policy', cur_agent.__class__, Agent):
-                        message = cur_agent.run(agent_message,
-                                                step=step,
-                                                outputs=self.outputs,
-                                                stream=self.conf.get("stream", False),
-                                                exp_id=exp_id)
+                if not override_in_subclass('async_policy', cur_agent.__class__, Agent):
+                    run_kwargs = dict(step=step,
+                                      outputs=self.outputs,
+                                      stream=self.conf.get("stream", False),
+                                      exp_id=exp_id)
+                    if concurrent and context is not self.context:
+                        # keep the loop free for the agents running in parallel, each writes its own context
+                        message = await asyncio.to_thread(cur_agent.run, agent_message, **run_kwargs)
                     else:
-                        message = await cur_agent.async_run(agent_message,
-                                                            step=step,
-                                                            outputs=self.outputs,
-                                                            stream=self.conf.get("stream",
-                                                                                 False),
-                                                            exp_id=exp_id)
-                    policy = message.payload
-                    step_span.set_attribute("actions",
-                                            json.dumps([action.model_dump() for action in policy],
-                                                       ensure_ascii=False))
-                    observation.content = None
-                    logger.info(f"{cur_agent.id()} policy: {policy}")
-                    if not policy:
-                        logger.warning(f"current agent {cur_agent.id()} no policy to use.")
-                        await self.outputs.add_output(
-                            StepOutput.build_failed_output(name=f"Step{step}",
-                                                           step_num=step,
-                                                           data=f"current agent {cur_agent.id()} no policy to use.",
-                                                           task_id=self.context.task_id)
-                        )
-                        if not self.task.is_sub_task:
-                            await self.outputs.mark_completed()
-                        task_span.set_attributes({
-                            "end_time": time.time(),
-                            "duration": time.time() - start,
-                            "status": "failed",
-                            "error": f"current agent {cur_agent.id()} no policy to use."
-                        })
-                        return TaskResponse(msg=f"current agent {cur_agent.id()} no policy to use.",
-                                            answer="",
-                                            success=False,
-                                            id=self.task.id,
-                                            time_cost=(time.time() - start),
-                                            usage=self.context.token_usage)
-
-                    if is_agent(policy[0]):
-                        status, info = await self._agent(agent, observation, policy, step)
-                        if status == 'normal':
-                            if info:
-                                observations.append(observation)
-                        elif status == 'break':
-                            observation = self.swarm.action_to_observation(policy, observations)
-                            if idx == len(self.swarm.ordered_agents) - 1:
-                                return TaskResponse(
-                                    answer=observation.content,
-                                    success=True,
-                                    id=self.task.id,
-                                    time_cost=(time.time() - start),
-                                    usage=self.context.token_usage
-                                )
-                            break
-                        elif status == 'return':
-                            await self.outputs.add_output(
-                                StepOutput.build_finished_output(name=f"Step{step}",
-                                                                 step_num=step,
-                                                                 task_id=self.context.task_id)
+                        message = cur_agent.run(agent_message, **run_kwargs)
+                else:
+                    message = await cur_agent.async_run(agent_message,
+                                                        step=step,
+                                                        outputs=self.outputs,
+                                                        stream=self.conf.get("stream",
+                                                                             False),
+                                                        exp_id=exp_id)
+                policy = message.payload
+                step_span.set_attribute("actions", lazy_attribute(_actions_json, policy, snapshot=True))
+                observation.content = None
+                logger.info(f"{cur_agent.id()} policy: {policy}")
+                if not policy:
+                    logger.warning(f"current agent {cur_agent.id()} no policy to use.")
+                    await self.outputs.add_output(
+                        StepOutput.build_failed_output(name=f"Step{step}",
+                                                       step_num=step,
+                                                       data=f"current agent {cur_agent.id()} no policy to use.",
+                                                       task_id=context.task_id)
+                    )
+                    if not self.task.is_sub_task:
+                        await self.outputs.mark_completed()
+                    task_span.set_attributes({
+                        "end_time": time.time(),
+                        "duration": time.time() - start,
+                        "status": "failed",
+                        "error": f"current agent {cur_agent.id()} no policy to use."
+                    })
+                    return observation, TaskResponse(msg=f"current agent {cur_agent.id()} no policy to use.",
+                                                     answer="",
+                                                     success=False,
+                                                     id=self.task.id,
+                                                     time_cost=(time.time() - start),
+                                                     usage=context.token_usage)
+
+                if is_agent(policy[0]):
+                    status, info = await self._agent(agent, observation, policy, step)
+                    if status == 'normal':
+                        if info:
+                            observations.append(observation)
+                    elif status == 'break':
+                        observation = self.swarm.action_to_observation(policy, observations)
+                        if last:
+                            return observation, TaskResponse(
+                                answer=observation.content,
+                                success=True,
+                                id=self.task.id,
+                                time_cost=(time.time() - start),
+                                usage=context.token_usage
                             )
-                            info.time_cost = (time.time() - start)
-                            task_span.set_attributes({
-                                "end_time": time.time(),
-                                "duration": info.time_cost,
-                                "status": "success"
-                            })
-                            return info
-                    elif is_tool_by_name(policy[0].tool_name):
-                        # todo sandbox
-                        msg, reward, terminated = await self._tool_call(policy, observations, step,
-                                                                        cur_agent)
-                        step_span.set_attribute("reward", reward)
-
-                    else:
-                        logger.warning(f"Unrecognized policy: {policy[0]}")
+                        return observation, None
+                    elif status == 'return':
                         await self.outputs.add_output(
-                            StepOutput.build_failed_output(
-                                name=f"Step{step}",
-                                step_num=step,
-                                data=f"Unrecognized policy: {policy[0]}, need to check prompt or agent / tool.",
-                                task_id=self.context.task_id
-                            )
+                            StepOutput.build_finished_output(name=f"Step{step}",
+                                                             step_num=step,
+                                                             task_id=context.task_id)
                         )
-                        if not self.task.is_sub_task:
-                            logger.info(f"FINISHED|WorkflowRunner|outputs|{self.task.id} {self.task.is_sub_task}")
-                            await self.outputs.mark_completed()
+                        info.time_cost = (time.time() - start)
                         task_span.set_attributes({
                             "end_time": time.time(),
-                            "duration": time.time() - start,
-                            "status": "failed",
-                            "error": f"Unrecognized policy: {policy[0]}, need to check prompt or agent / tool."
+                            "duration": info.time_cost,
+                            "status": "success"
                         })
-                        return TaskResponse(
-                            msg=f"Unrecognized policy: {policy[0]}, need to check prompt or agent / tool.",
-                            answer="",
-                            success=False,
+                        return observation, info
+                elif is_tool_by_name(policy[0].tool_name):
+                    # todo sandbox
+                    msg, reward, terminated = await self._tool_call(policy, observations, step,
+                                                                    cur_agent, context=context)
+                    step_span.set_attribute("reward", reward)
+
+                else:
+                    logger.warning(f"Unrecognized policy: {policy[0]}")
+                    await self.outputs.add_output(
+                        StepOutput.build_failed_output(
+                            name=f"Step{step}",
+                            step_num=step,
+                            data=f"Unrecognized policy: {policy[0]}, need to check prompt or agent / tool.",
+                            task_id=context.task_id
+                        )
+                    )
+                    if not self.task.is_sub_task:
+                        logger.info(f"FINISHED|WorkflowRunner|outputs|{self.task.id} {self.task.is_sub_task}")
+                        await self.outputs.mark_completed()
+                    task_span.set_attributes({
+                        "end_time": time.time(),
+                        "duration": time.time() - start,
+                        "status": "failed",
+                        "error": f"Unrecognized policy: {policy[0]}, need to check prompt or agent / tool."
+                    })
+                    return observation, TaskResponse(
+                        msg=f"Unrecognized policy: {policy[0]}, need to check prompt or agent / tool.",
+                        answer="",
+                        success=False,
+                        id=self.task.id,
+                        time_cost=(time.time() - start),
+                        usage=context.token_usage
+                    )
+                await self.outputs.add_output(
+                    StepOutput.build_finished_output(name=f"Step{step}",
+                                                     step_num=step,
+                                                     task_id=context.task_id)
+                )
+                if terminated and agent.finished:
+                    logger.info(f"{agent.id()} finished")
+                    if last:
+                        return observations[-1], TaskResponse(
+                            answer=observations[-1].content,
+                            success=True,
                             id=self.task.id,
                             time_cost=(time.time() - start),
-                            usage=self.context.token_usage
+                            usage=context.token_usage
                         )
-                    await self.outputs.add_output(
-                        StepOutput.build_finished_output(name=f"Step{step}",
-                                                         step_num=step,
-                                                         task_id=self.context.task_id)
-                    )
-                    step += 1
-                    if terminated and agent.finished:
-                        logger.info(f"{agent.id()} finished")
-                        if idx == len(self.swarm.ordered_agents) - 1:
-                            return TaskResponse(
-                                answer=observations[-1].content,
-                                success=True,
-                                id=self.task.id,
-                                time_cost=(time.time() - start),
-                                usage=self.context.token_usage
-                            )
-                        break
+                    return observations[-1], None
+        return observation, None
 
     async def _agent(self, agent: Agent, observation: Observation, policy: List[ActionModel], step: int):
         # only one agent, and get agent from policy
@@ -310,7 +448,13 @@ class WorkflowRunner(TaskRunner):
         return status, None
 
     # todo sandbox
-    async def _tool_call(self, policy: List[ActionModel], observations: List[Observation], step: int, agent: Agent):
+    async def _tool_call(self,
+                         policy: List[ActionModel],
+                         observations: List[Observation],
+                         step: int,
+                         agent: Agent,
+                         context: Context = None):
+        context = context or self.context
         msg = None
         terminated = False
         # group action by tool name
@@ -335,8 +479,8 @@ class WorkflowRunner(TaskRunner):
         for tool_name, action in tool_mapping.items():
             tool_message = ToolMessage(
                 payload=action,
-                session_id=self.context.session_id,
-                headers={"context": self.context}
+                session_id=context.session_id,
+                headers={"context": context}
             )
             # Execute action using browser tool and unpack all return values
             if isinstance(self.tools[tool_name], Tool):
@@ -437,7 +581,11 @@ class HandoffRunner(TaskRunner):
         super().__init__(task=task, *args, **kwargs)
 
     async def do_run(self, context: Context = None) -> TaskResponse:
-        resp = await self._do_run(context)
+        try:
+            resp = await self._do_run(context)
+        finally:
+            # messages of the task no longer keep its contexts alive
+            context_registry.release(self.task.id)
         self._task_response = resp
         return resp
 
@@ -573,10 +721,8 @@ class HandoffRunner(TaskRunner):
                     "step": step,
                     "agent_id": self.swarm.cur_agent.id(),
                     "pre_agent": pre_agent_name,
-                    "observation": json.dumps(observation.model_dump(exclude_none=True),
-                                              ensure_ascii=False,
-                                              cls=NumpyEncoder),
-                    "actions": json.dumps([action.model_dump() for action in policy], ensure_ascii=False)
+                    "observation": lazy_attribute(_observation_json, observation, snapshot=True),
+                    "actions": lazy_attribute(_actions_json, policy, snapshot=True)
                 })
             return {"msg": f"current agent {self.swarm.cur_agent.id()} no policy to use.",
                     "steps": step,
@@ -604,10 +750,8 @@ class HandoffRunner(TaskRunner):
                             "step": step,
                             "agent_id": self.swarm.cur_agent.id(),
                             "pre_agent": pre_agent_name,
-                            "observation": json.dumps(cur_observation.model_dump(exclude_none=True),
-                                                      ensure_ascii=False,
-                                                      cls=NumpyEncoder),
-                            "actions": json.dumps([action.model_dump() for action in policy], ensure_ascii=False)
+                            "observation": lazy_attribute(_observation_json, cur_observation, snapshot=True),
+                            "actions": lazy_attribute(_actions_json, policy, snapshot=True)
                         })
                     except:
                         pass
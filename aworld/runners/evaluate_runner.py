@@ -13,6 +13,7 @@ from aworld.evaluations.recoder.eval_task_recorder import EvalTaskRecorder, Defa
 from aworld.evaluations.recoder.eval_dataset_recorder import EvalDatasetManager, DefaultEvalDatasetManager
 from aworld.evaluations.recoder.eval_result_recorder import EvalResultRecorder, DefaultEvalResultRecorder
 from aworld.dataset.dataset import Dataset
+from aworld.dataset.dataloader import DataLoader
 from aworld.logs.util import logger
 from aworld.evaluations.scorers.scorer_registry import get_scorer_instances_for_criterias
 from aworld.evaluations.scorers.metrics import MetricNames
@@ -136,11 +137,17 @@ class EvaluateRunner(Runner):
             dataset.load_from(eval_config.eval_dataset_id_or_file_path, preload_transform=preload_transform)
             eval_cases: List[EvalDataCase] = []
             eval_dataset_id = uuid.uuid4().hex
-            for data_row in dataset.to_dataloader(batch_size=1,
-                                                  shuffle=eval_config.eval_dataset_load_config.shuffle,
-                                                  drop_last=eval_config.eval_dataset_load_config.drop_last,
-                                                  seed=eval_config.eval_dataset_load_config.seed,
-                                                  sampler=eval_config.eval_dataset_load_config.sampler):
+            load_config = eval_config.eval_dataset_load_config
+            loader = DataLoader(dataset,
+                                batch_size=1,
+                                shuffle=load_config.shuffle,
+                                drop_last=load_config.drop_last,
+                                seed=load_config.seed,
+                                sampler=load_config.sampler,
+                                num_workers=load_config.num_workers,
+                                prefetch_factor=load_config.prefetch_factor,
+                                worker_mode=load_config.worker_mode)
+            async for data_row in loader:
                 if data_row:
                     eval_cases.append(EvalDataCase(eval_dataset_id=eval_dataset_id, case_data=data_row[0]))
 
@@ -13,10 +13,12 @@ from aworld.agents.llm_agent import Agent
 from aworld.core.agent.base import BaseAgent
 from aworld.core.common import TaskItem, ActionModel
 from aworld.core.context.base import Context
+from aworld.core.context.registry import context_registry
 from aworld.core.event.base import Message, Constants, TopicType, ToolMessage, AgentMessage
 from aworld.core.exceptions import AWorldRuntimeException
 from aworld.core.task import Task, TaskResponse
 from aworld.dataset.trajectory_dataset import generate_trajectory_from_strategy
+from aworld.dataset.trajectory_sink import StreamingTrajectoryRecorder
 from aworld.events.manager import EventManager
 from aworld.logs.util import logger
 from aworld.runners import HandlerFactory
@@ -39,6 +41,7 @@ class TaskEventRunner(TaskRunner):
         self.init_messages = []
         self.background_tasks = set()
         self.state_manager = EventRuntimeStateManager.instance()
+        self.trajectory_recorder = None
 
     async def do_run(self, context: Context = None):
         if self.swarm and not self.swarm.initialized:
@@ -57,6 +60,11 @@ class TaskEventRunner(TaskRunner):
                             f', time cost: {time.time() - self.start_time}s, token cost: {self.context.token_usage}.')
                 return resp
             finally:
+                if self.trajectory_recorder:
+                    # keep the partial trajectory of a failed task in the sink
+                    await self.trajectory_recorder.close()
+                # stored messages no longer keep the contexts of the task alive
+                context_registry.release(self.task.id)
                 # the last step mark output finished
                 if not self.task.is_sub_task:
                     logger.info(f'main task {self.task.id} will mark outputs finished')
@@ -76,6 +84,12 @@ class TaskEventRunner(TaskRunner):
 
         self._build_first_message()
 
+        if not self.conf.get('trajectory_strategy', None):
+            # the default trajectory is captured step by step instead of replayed at the end of the task
+            self.trajectory_recorder = StreamingTrajectoryRecorder(task_id=self.task.id,
+                                                                   sink=self.conf.get('trajectory_sink', None),
+                                                                   state_manager=self.state_manager)
+
         if self.swarm:
             logger.debug(f"swarm: {self.swarm}")
             # register agent handler
@@ -96,6 +110,8 @@ class TaskEventRunner(TaskRunner):
                 await self.event_mng.register(Constants.TOOL, Constants.TOOL, tool.step)
 
         self._stopped = asyncio.Event()
+        # independent agents of a workflow are dispatched together, bound the number running at the same time
+        self.agent_semaphore = asyncio.Semaphore(max(self.conf.get("max_parallel_agents", 8) or 1, 1))
 
         # handler of process in framework
         handler_list = self.conf.get("handlers")
@@ -198,21 +214,27 @@ class TaskEventRunner(TaskRunner):
     def _task_done_callback(self, task, message: Message, group: dict = None):
         self.background_tasks.discard(task)
         if not group:
-            self.state_manager.end_message_node(message)
+            self._end_message_node(message)
         else:
             group[task] = True
             if all([v for _, v in group.items()]):
-                self.state_manager.end_message_node(message)
+                self._end_message_node(message)
+
+    def _end_message_node(self, message: Message):
+        self.state_manager.end_message_node(message)
+        if self.trajectory_recorder:
+            self.trajectory_recorder.capture(message)
 
     async def _handle_task(self, message: Message, handler: Callable[..., Any]):
         con = message
         async with trace.handler_span(message=message, handler=handler):
             try:
                 logger.info(f"process start message id: {message.id} of task {self.task.id}")
-                if asyncio.iscoroutinefunction(handler):
-                    con = await handler(con)
+                if message.category == Constants.AGENT:
+                    async with self.agent_semaphore:
+                        con = await self._call_handler(handler, con)
                 else:
-                    con = handler(con)
+                    con = await self._call_handler(handler, con)
 
                 logger.info(f"process end message id: {message.id} of task {self.task.id}")
                 if isinstance(con, Message):
@@ -243,6 +265,11 @@ class TaskEventRunner(TaskRunner):
                                                               result=error_msg)
                 await self.event_mng.emit_message(error_msg)
 
+    async def _call_handler(self, handler: Callable[..., Any], message: Message):
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(message)
+        return handler(message)
+
     async def _raw_task(self, messages: List[Message]):
         # process in framework
         async for event in self._inner_handler_process(
@@ -354,6 +381,10 @@ class TaskEventRunner(TaskRunner):
 
     async def _save_trajectories(self):
         try:
+            if self.trajectory_recorder:
+                await self.trajectory_recorder.close()
+                self._task_response.trajectory = self.trajectory_recorder.rows or None
+                return
             trajectory_strategy = self.conf.get('trajectory_strategy', None)
             trajectory = await generate_trajectory_from_strategy(self.task.id, trajectory_strategy, self)
             self._task_response.trajectory = trajectory
@@ -1,7 +1,7 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 import abc
-from typing import AsyncGenerator, Tuple
+from typing import Any, AsyncGenerator, Tuple
 
 from aworld.agents.loop_llm_agent import LoopableAgent
 from aworld.core.agent.base import is_agent, AgentFactory
@@ -14,7 +14,6 @@ from aworld.logs.util import logger
 from aworld.runners import HandlerFactory
 from aworld.runners.handler.base import DefaultHandler
 from aworld.runners.handler.tool import DefaultToolHandler
-from aworld.runners.state_manager import RunNode, RunNodeStatus, RunNodeBusiType
 from aworld.runners.utils import endless_detect
 from aworld.output.base import StepOutput
 
@@ -30,6 +29,8 @@ class AgentHandler(DefaultHandler):
         self.task_id = runner.task.id
 
         self.agent_calls = []
+        # outputs of the finished workflow agents by agent id, joined as the input of their successors
+        self.workflow_outputs = {}
 
     @classmethod
     def name(cls):
@@ -321,6 +322,8 @@ class DefaultAgentHandler(AgentHandler):
             )
         else:
             agent_graph: AgentGraph = self.swarm.agent_graph
+            # recorded before checking the successors, so only the last finished predecessor of a join agent sends it
+            self._record_workflow_output(agent_graph, agent_name, action.policy_info)
             # next
             successor = agent_graph.successor.get(agent_name)
             if not successor:
@@ -339,40 +342,38 @@ class DefaultAgentHandler(AgentHandler):
                 if not predecessor:
                     raise AWorldRuntimeException(f"{k} has no predecessor {agent_name}, may changed during iteration.")
 
-                all_input = {}
-                pre_finished = True
-                for pre_k, _ in predecessor.items():
-                    if pre_k == agent_name:
-                        all_input[agent_name] = action.policy_info
-                        continue
-                    # check all predecessor agent finished
-                    run_node: RunNode = self.runner.state_manager.query_by_task(
-                        task_id=message.context.get_task().id,
-                        busi_typ=RunNodeBusiType.AGENT,
-                        busi_id=pre_k
-                    )
-                    if run_node:
-                        run_node = run_node[0]
-                    else:
-                        raise AWorldRuntimeException(f"{pre_k} can't find in task: {message.context.get_task().id}.")
-                    if run_node.status == RunNodeStatus.RUNNING or run_node.status == RunNodeStatus.INIT:
-                        # mean not finished
-                        pre_finished = False
-                        logger.info(f"{pre_k} not finished, will wait it.")
-                    else:
-                        logger.info(f"{pre_k} finished, result is: {run_node.results}")
-                        payload = run_node.results[-1].result.payload[0]
-                        all_input[pre_k] = payload.policy_info
-
-                if pre_finished:
-                    yield Message(
-                        category=Constants.AGENT,
-                        payload=Observation(content=all_input if len(all_input) > 1 else all_input.get(agent_name)),
-                        sender=agent.id(),
-                        session_id=session_id,
-                        receiver=k,
-                        headers=message.headers
-                    )
+                unfinished = [pre_k for pre_k in predecessor if pre_k not in self.workflow_outputs]
+                if unfinished:
+                    # the last finished one will send it
+                    logger.info(f"{unfinished} of {k} not finished, will wait them.")
+                    continue
+
+                all_input = {pre_k: self.workflow_outputs[pre_k] for pre_k in predecessor}
+                yield Message(
+                    category=Constants.AGENT,
+                    payload=Observation(content=all_input if len(all_input) > 1 else all_input.get(agent_name)),
+                    sender=agent.id(),
+                    session_id=session_id,
+                    receiver=k,
+                    headers=message.headers
+                )
+
+    def _record_workflow_output(self, agent_graph: AgentGraph, agent_name: str, output: Any):
+        """Record the output of a finished workflow agent.
+
+        The outputs of the agents after it belong to the previous round of the workflow (e.g. of a loop going back
+        to the agent), they are dropped so a join agent only starts with the outputs of the current round.
+        """
+        visited = {agent_name}
+        pending = list(agent_graph.successor.get(agent_name, {}))
+        while pending:
+            successor = pending.pop()
+            if successor in visited:
+                continue
+            visited.add(successor)
+            self.workflow_outputs.pop(successor, None)
+            pending.extend(agent_graph.successor.get(successor, {}))
+        self.workflow_outputs[agent_name] = output
 
     async def _team_stop_check(self, action: ActionModel, message: Message) -> AsyncGenerator[Message, None]:
         caller = message.caller
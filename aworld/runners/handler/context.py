@@ -1,12 +1,12 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 import abc
-import asyncio
 import traceback
 from typing import Optional, List, Tuple, AsyncGenerator
 
 from aworld.core.context.amni.payload import ContextMessagePayload, BaseMessagePayload
 from aworld.core.context.amni.processor import ProcessorFactory
+from aworld.core.context.amni.processor.worker_pool import get_processor_worker_pool
 from aworld.core.event.base import Constants, Message, ContextMessage
 from aworld.logs.util import logger
 from aworld.runners import HandlerFactory
@@ -132,7 +132,7 @@ class ContextProcessorHandler(DefaultHandler):
         """process a single processor"""
         try:
             # Create processor
-            processor = ProcessorFactory.create(processor_config=processor_config)
+            processor = ProcessorFactory.get_or_create(processor_config)
             if not processor:
                 logger.warning(f"Failed to create processor: {processor_config.name} {traceback.format_exc()}")
                 return None
@@ -147,66 +147,10 @@ class ContextProcessorHandler(DefaultHandler):
             return (processor_config.name, None)
 
     def _start_async_processors(self, async_processors: List, event: BaseMessagePayload):
-        """Start async processors running in the background without waiting for completion"""
+        """Queue async processors on the shared worker pool without waiting for completion"""
+        pool = get_processor_worker_pool()
         for processor_config in async_processors:
-            # Create background task without waiting for completion
-            asyncio.create_task(
-                self._run_processor_in_thread_pool(processor_config, event.deep_copy()
-                                                   ))
-            logger.info(f"Started async processor {processor_config.name} in background")
-
-    async def _run_processor_in_thread_pool(self, processor_config, event: BaseMessagePayload) -> Optional[Tuple[str, any]]:
-        """Run processor in thread pool"""
-        try:
             self.log_start(event, processor_config)
-            # Dynamically create processor instance
-            processor = ProcessorFactory.create(processor_config=processor_config)
-            if not processor:
-                logger.warning(f"Failed to create async processor: {processor_config.name} {traceback.format_exc()}")
-                return None
-
-            logger.info(f"Processing async with {processor.__class__.__name__}")
-
-            # Run the processor's process method in thread pool
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self.thread_pool,
-                self._sync_wrapper,
-                processor,
-                event.context,
-                event
-            )
-
-            logger.info(f"Async processor {processor.__class__.__name__} completed")
-            self.log_end(event, processor_config)
-            return (processor.__class__.__name__, result)
-
-        except Exception as e:
-            logger.error(f"Async processor {processor_config.name} failed: {e} {traceback.print_exc()}")
-            return (processor_config.name, None)
-
-    def _sync_wrapper(self, processor, context, event: BaseMessagePayload):
-        """Synchronous wrapper for running async methods in thread pool"""
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        # try:
-        return loop.run_until_complete(processor.process(context, event=event))
-        # except Exception as e:
-        #     logger.error(f"Error in sync wrapper: {e}")
-        #     return None
-        # finally:
-        #     # Ensure all tasks complete before closing the loop
-        #     try:
-        #         pending = asyncio.all_tasks(loop)
-        #         if pending:
-        #             loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-        #     except Exception as e:
-        #         logger.warning(f"Error waiting for tasks to complete: {e}")
-        #     finally:
-        #         loop.close()
-
-    def __del__(self):
-        """Clean up thread pool resources"""
-        if hasattr(self, 'thread_pool'):
-            self.thread_pool.shutdown(wait=True)
-
+            # every background processor gets its own snapshot, they run concurrently on the pool
+            if pool.submit(processor_config, event.deep_copy()):
+                logger.info(f"Queued async processor {processor_config.name} in background")
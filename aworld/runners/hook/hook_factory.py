@@ -1,16 +1,28 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 import sys
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from aworld.core.factory import Factory
 from aworld.logs.util import logger
 from aworld.runners.hook.hooks import Hook, StartHook, HookPoint
 
+_NO_HOOKS: Tuple[Hook, ...] = ()
+
 
 class HookManager(Factory):
+    """Hook factory with a versioned dispatch table.
+
+    The registered hooks are instantiated once per version of the registry and grouped by hook point,
+    a registration or unregistration bumps the version and the table is rebuilt on the next lookup.
+    Hook instances are shared by all the calls, so hooks must not keep per call state.
+    """
+
     def __init__(self, type_name: str = None):
         super(HookManager, self).__init__(type_name)
+        self._version = 0
+        self._dispatch_version = -1
+        self._dispatch: Dict[str, Tuple[Hook, ...]] = {}
 
     def __call__(self, name: str, **kwargs):
         if name is None:
@@ -27,17 +39,49 @@ class HookManager(Factory):
             act = None
         return act
 
-    def hooks(self, name: str = None) -> Dict[str, List[Hook]]:
-        vals = list(filter(lambda s: not s.startswith('__'), dir(HookPoint)))
-        results = {val.lower(): [] for val in vals}
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def register(self, name: str, desc: str = '', prio: int = 0, **kwargs):
+        register = super(HookManager, self).register(name, desc, prio, **kwargs)
 
-        for k, v in self._cls.items():
-            hook = v()
-            if name and hook.point() != name:
-               continue
+        def func(cls):
+            res = register(cls)
+            self._version += 1
+            return res
 
-            results.get(hook.point(), []).append(hook)
+        return func
 
+    def unregister(self, name: str):
+        super(HookManager, self).unregister(name)
+        self._version += 1
+
+    def _build_dispatch(self) -> Dict[str, Tuple[Hook, ...]]:
+        dispatch: Dict[str, List[Hook]] = {}
+        for name, cls in self._cls.items():
+            try:
+                hook = cls()
+            except Exception:
+                logger.warning(f"Failed to create hook with name {name}:\n{sys.exc_info()[1]}")
+                continue
+            dispatch.setdefault(hook.point(), []).append(hook)
+        return {point: tuple(hooks) for point, hooks in dispatch.items()}
+
+    def hooks_of(self, point: str) -> Tuple[Hook, ...]:
+        """Hooks of the hook point, a shared empty tuple if there is none."""
+        if self._dispatch_version != self._version:
+            self._dispatch = self._build_dispatch()
+            self._dispatch_version = self._version
+        return self._dispatch.get(point, _NO_HOOKS)
+
+    def hooks(self, name: str = None) -> Dict[str, List[Hook]]:
+        vals = list(filter(lambda s: not s.startswith('__'), dir(HookPoint)))
+        results = {val.lower(): [] for val in vals}
+        for point in results:
+            if name and point != name:
+                continue
+            results[point].extend(self.hooks_of(point))
         return results
 
 
@@ -1,13 +1,26 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 
-import importlib
 import inspect
-import os
+import traceback
 from typing import Callable, Any
 
-from aworld.runners.hook.template import HOOK_TEMPLATE
-from aworld.utils.common import snake_to_camel
+from aworld.core.context.base import Context
+from aworld.core.event.base import Message, Constants, TopicType
+from aworld.logs.util import logger
+from aworld.runners.hook.hook_factory import HookFactory
+from aworld.runners.hook.hooks import (Hook, HookPoint, StartHook, FinishedHook, ErrorHook, PreLLMCallHook,
+                                       PostLLMCallHook, OutputProcessHook)
+from aworld.utils.common import convert_to_snake
+
+POINT_HOOKS = {
+    HookPoint.START: StartHook,
+    HookPoint.FINISHED: FinishedHook,
+    HookPoint.ERROR: ErrorHook,
+    HookPoint.PRE_LLM_CALL: PreLLMCallHook,
+    HookPoint.POST_LLM_CALL: PostLLMCallHook,
+    HookPoint.OUTPUT_PROCESS: OutputProcessHook,
+}
 
 
 def hook(hook_point: str, name: str = None):
@@ -27,29 +40,41 @@ def hook(hook_point: str, name: str = None):
         hook_point: Hook point that wants to process the message.
         name: Hook name.
     """
+    if hook_point not in POINT_HOOKS:
+        raise ValueError(f"Unknown hook point: {hook_point}")
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        # converts python function into a hoop with associated hoop point
-        func_import = func.__module__
-        if func_import == '__main__':
-            path = inspect.getsourcefile(func)
-            package = path.replace(os.getcwd(), '').replace('.py', '')
-            if package[0] == '/':
-                package = package[1:]
-            func_import = f"from {package} "
-        else:
-            func_import = f"from {func_import} "
-
+        # converts python function into a hook class with associated hook point, registered in memory
         real_name = name if name else func.__name__
-        con = HOOK_TEMPLATE.format(func_import=func_import,
-                                   func=func.__name__,
-                                   point=snake_to_camel(hook_point),
-                                   name=real_name,
-                                   topic=hook_point,
-                                   desc='')
-        with open(f"{real_name}.py", 'w+') as write:
-            write.writelines(con)
-        importlib.import_module(real_name)
+
+        async def exec(self, message: Message, context: Context = None) -> Message:
+            session_id = message.context.session_id if message.context else message.session_id
+            try:
+                res = func(message)
+                if inspect.isawaitable(res):
+                    res = await res
+                if not res:
+                    raise ValueError(f"{func.__name__} no result return.")
+                return Message(payload=res,
+                               session_id=session_id,
+                               sender=real_name,
+                               category=Constants.TASK,
+                               topic=hook_point)
+            except Exception as e:
+                logger.error(traceback.format_exc())
+                return Message(payload=str(e),
+                               session_id=session_id,
+                               sender=real_name,
+                               category=Constants.TASK,
+                               topic=TopicType.ERROR)
+
+        cls = type(real_name, (POINT_HOOKS[hook_point],), {
+            "__module__": func.__module__,
+            "__doc__": func.__doc__,
+            "name": lambda self: convert_to_snake(real_name),
+            "exec": exec,
+        })
+        HookFactory.register(name=real_name, desc=func.__doc__ or '')(cls)
         return func
 
     return decorator
@@ -1,4 +1,4 @@
-import time
+import asyncio
 import datetime
 import random
 import string
@@ -6,6 +6,7 @@ from typing import Dict, List, Any, Optional
 
 from aworld.logs.util import logger
 from aworld.sandbox.api.base_sandbox_api import BaseSandboxApi
+from aworld.sandbox.api.kubernetes.warm_pool import KubernetesSandboxPool, PooledSandbox
 from aworld.sandbox.env_client.kubernetes.client import KubernetesApiClient
 from aworld.sandbox.models import SandboxStatus, SandboxEnvType, SandboxK8sResponse
 from aworld.sandbox.run.mcp_servers import McpServers
@@ -15,7 +16,11 @@ class KubernetesSandboxApi(BaseSandboxApi):
     """
     API implementation for Kubernetes sandbox operations.
     """
-    
+    # seconds to wait for the pod and the service of a sandbox created on demand
+    ready_timeout: int = 60
+    # sandboxes are leased from the warm pool if it has an idle one, see `KubernetesSandboxPool`
+    warm_pool: Optional[KubernetesSandboxPool] = None
+
     @classmethod
     def _create_sandbox(
         cls,
@@ -29,6 +34,23 @@ class KubernetesSandboxApi(BaseSandboxApi):
         """
         Create a Kubernetes sandbox based on the reference implementation.
         """
+        if cls.warm_pool:
+            pooled = cls.warm_pool.lease_nowait()
+            if pooled:
+                return cls._pooled_response(pooled, mcp_servers, mcp_config, skill_configs)
+            logger.info("No idle sandbox in the warm pool, create one on demand")
+        return cls._create_on_demand(mcp_servers=mcp_servers, mcp_config=mcp_config, skill_configs=skill_configs)
+
+    @classmethod
+    def _create_on_demand(
+        cls,
+        mcp_servers: Optional[List[str]] = None,
+        mcp_config: Optional[Any] = None,
+        skill_configs: Optional[Any] = None,
+    ) -> SandboxK8sResponse:
+        """
+        Create the pod and the service of a sandbox and wait until they are ready, blocking.
+        """
         # Initialize these variables outside the try block to avoid accessing undefined variables in exception handling
         client = None
         pod_name = None
@@ -48,23 +70,10 @@ class KubernetesSandboxApi(BaseSandboxApi):
             pod_result = client.create_pod_from_yaml(pod_name=pod_name)
             if not pod_result:
                 return None
-                
-            max_attempts = 30
-            attempts = 0
-            wait_seconds = 2
-            pod_ready = False
-            pod_info = None
-            
-            while attempts < max_attempts:
-                pod_info = client.get_pod_info(pod_name)
-                pod_ready = pod_info and pod_info.get("status") == SandboxStatus.RUNNING
-                if pod_ready:
-                    break
-                attempts += 1
-                if attempts < max_attempts:
-                    logger.info(f"Waiting for Pod to be ready, attempt {attempts}/{max_attempts}")
-                    time.sleep(wait_seconds)
-                    
+
+            # watch the pod instead of polling it
+            pod_info = client.wait_pod_running(pod_name, timeout=cls.ready_timeout)
+            pod_ready = bool(pod_info)
             if not pod_ready:
                 logger.warning("Timed out waiting for Pod and Service to be ready")
                 client.delete_pod(pod_name)
@@ -75,26 +84,8 @@ class KubernetesSandboxApi(BaseSandboxApi):
                 client.delete_pod(pod_name)
                 return None
 
-            max_attempts = 30
-            attempts = 0
-            wait_seconds = 2
-            service_ready = False
-            service_info = None
-            
-            while attempts < max_attempts:
-                service_info = client.get_service_info(service_name)
-                if service_info and ('LoadBalancer' == service_info.get("type") and service_info.get('host')):
-                    service_ready = True
-                elif service_info and 'ClusterIP' == service_info.get("type"):
-                    service_ready = True
-                if service_ready:
-                    time.sleep(wait_seconds)
-                    break
-                attempts += 1
-                if attempts < max_attempts:
-                    logger.info(f"Waiting for Service to be ready, attempt {attempts}/{max_attempts}")
-                    time.sleep(wait_seconds)
-                    
+            service_info = client.wait_service_ready(service_name, timeout=cls.ready_timeout)
+            service_ready = bool(service_info)
             if not service_ready:
                 client.delete_pod(pod_name)
                 client.delete_service(service_name)
@@ -144,6 +135,68 @@ class KubernetesSandboxApi(BaseSandboxApi):
                     client.delete_service(service_name)
             return None
     
+    @classmethod
+    async def _acreate_sandbox(
+        cls,
+        env_type: int,
+        env_config: Any,
+        mcp_servers: Optional[List[str]] = None,
+        mcp_config: Optional[Any] = None,
+        black_tool_actions: Optional[Dict[str, List[str]]] = None,
+        skill_configs: Optional[Any] = None,
+    ) -> SandboxK8sResponse:
+        """
+        Create a Kubernetes sandbox without blocking the event loop.
+
+        A sandbox is leased from the warm pool, provisioned by the pool if none is idle, otherwise it is
+        created on demand in a worker thread.
+        """
+        if cls.warm_pool:
+            pooled = await cls.warm_pool.lease(timeout=cls.ready_timeout)
+            if pooled:
+                return cls._pooled_response(pooled, mcp_servers, mcp_config, skill_configs)
+            logger.info("No sandbox leased from the warm pool, create one on demand")
+        return await asyncio.to_thread(
+            cls._create_on_demand,
+            mcp_servers=mcp_servers,
+            mcp_config=mcp_config,
+            skill_configs=skill_configs,
+        )
+
+    @classmethod
+    def _pooled_response(
+        cls,
+        pooled: PooledSandbox,
+        mcp_servers: Optional[List[str]] = None,
+        mcp_config: Optional[Any] = None,
+        skill_configs: Optional[Any] = None,
+    ) -> SandboxK8sResponse:
+        metadata = {
+            "pod_name": pooled.pod_name,
+            "service_name": pooled.service_name,
+            "status": pooled.pod_info.get("status"),
+            "cluster_ip": pooled.service_info.get("cluster_ip"),
+            "host": pooled.service_info.get("host"),
+        }
+        if mcp_servers:
+            mcp_config = cls._get_mcp_configs(
+                mcp_servers=mcp_servers,
+                mcp_config=mcp_config,
+                metadata=metadata,
+                env_type=SandboxEnvType.K8S
+            ) or mcp_config
+        return SandboxK8sResponse(
+            pod_name=pooled.pod_name,
+            service_name=pooled.service_name,
+            status=metadata["status"],
+            cluster_ip=metadata["cluster_ip"],
+            host=metadata["host"],
+            mcp_config=mcp_config,
+            env_type=SandboxEnvType.K8S,
+            skill_configs=skill_configs,
+            pooled=True,
+        )
+
     @classmethod
     def generate_random_string(cls, length=6):
         """
@@ -210,7 +263,11 @@ class KubernetesSandboxApi(BaseSandboxApi):
             if not pod_name or not service_name:
                 logger.warning(f"pod_name={pod_name} or service_name={service_name} is None")
                 return False
-                
+
+            if metadata.get("pooled") and cls.warm_pool:
+                # recycled or destroyed by the pool
+                return await cls.warm_pool.release(pod_name)
+
             client = KubernetesApiClient()
             client.delete_pod(pod_name)
             client.delete_service(service_name)
@@ -0,0 +1,226 @@
+import asyncio
+import datetime
+import random
+import string
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from aworld.logs.util import logger
+
+
+class RecyclePolicy:
+    """What the pool does with a sandbox returned by its lessee."""
+    # back to the idle sandboxes until it was leased `max_uses` times, after the pool's `reset` hook
+    # cleaned it. Without a hook the next lessee sees the files and processes of the previous one.
+    RECYCLE = "recycle"
+    # deleted, the pool provisions a fresh one
+    DESTROY = "destroy"
+
+
+@dataclass
+class PooledSandbox:
+    pod_name: str
+    service_name: str
+    pod_info: Dict[str, Any] = field(default_factory=dict)
+    service_info: Dict[str, Any] = field(default_factory=dict)
+    uses: int = 0
+    created_at: float = field(default_factory=time.time)
+
+
+class KubernetesSandboxPool:
+    """Warm pool of ready Kubernetes sandboxes (a pod and its service).
+
+    The pool keeps at least `min_size` idle sandboxes while it has less than `max_size` in total, a lease
+    returns an idle sandbox immediately and the pool replenishes in the background. Provisioning runs the
+    blocking Kubernetes calls in worker threads and waits for readiness with a watch, the event loop is
+    never blocked.
+
+    Returned sandboxes are destroyed by default, sandboxes are not shared by lessees. With
+    `RecyclePolicy.RECYCLE` they are reused after the `reset` hook, a sandbox it fails to reset is destroyed.
+
+    Examples:
+        >>> pool = KubernetesSandboxPool(min_size=2, max_size=8)
+        >>> await pool.start()
+        >>> KubernetesSandboxApi.warm_pool = pool
+    """
+
+    def __init__(self,
+                 min_size: int = 2,
+                 max_size: int = 8,
+                 recycle_policy: str = RecyclePolicy.DESTROY,
+                 max_uses: int = 20,
+                 ready_timeout: int = 120,
+                 client: Any = None,
+                 reset: Callable[[PooledSandbox], Awaitable[bool]] = None):
+        if min_size > max_size:
+            raise ValueError(f"min_size {min_size} is larger than max_size {max_size}")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.recycle_policy = recycle_policy
+        self.max_uses = max_uses
+        self.ready_timeout = ready_timeout
+        self.reset = reset
+        self._client = client
+        self._idle: List[PooledSandbox] = []
+        self._leased: Dict[str, PooledSandbox] = {}
+        self._provisioning = 0
+        self._tasks = set()
+        self._available = asyncio.Event()
+        self._closed = False
+
+    @property
+    def client(self):
+        if self._client is None:
+            from aworld.sandbox.env_client.kubernetes.client import KubernetesApiClient
+
+            self._client = KubernetesApiClient()
+        return self._client
+
+    def size(self) -> int:
+        return len(self._idle) + len(self._leased) + self._provisioning
+
+    def stats(self) -> Dict[str, int]:
+        return {"idle": len(self._idle), "leased": len(self._leased), "provisioning": self._provisioning}
+
+    async def start(self):
+        """Start provisioning the idle sandboxes, returns without waiting for them."""
+        self._fill()
+
+    def _fill(self):
+        if self._closed:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # replenished by the next lease or release on the loop
+            return
+        missing = min(self.min_size - len(self._idle) - self._provisioning, self.max_size - self.size())
+        for _ in range(max(missing, 0)):
+            self._provisioning += 1
+            task = asyncio.create_task(self._provision_idle())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _provision_idle(self):
+        try:
+            sandbox = await self._provision()
+        finally:
+            self._provisioning -= 1
+        if sandbox is None:
+            return
+        if self._closed:
+            await self._destroy(sandbox)
+            return
+        self._idle.append(sandbox)
+        self._available.set()
+
+    async def _provision(self) -> Optional[PooledSandbox]:
+        date_prefix = datetime.datetime.now().strftime("%y%m%d%H%M%S")
+        random_str = ''.join(random.choice(string.ascii_lowercase + string.digits) for _ in range(6))
+        sandbox = PooledSandbox(pod_name=f"pod-{date_prefix}-{random_str}",
+                                service_name=f"service-{date_prefix}-{random_str}")
+        client = self.client
+        try:
+            if not await asyncio.to_thread(client.create_pod_from_yaml, pod_name=sandbox.pod_name):
+                return None
+            sandbox.pod_info = await asyncio.to_thread(client.wait_pod_running, sandbox.pod_name,
+                                                       timeout=self.ready_timeout)
+            if not sandbox.pod_info:
+                raise RuntimeError(f"Pod {sandbox.pod_name} is not running in {self.ready_timeout}s")
+            if not await asyncio.to_thread(client.create_service_from_yaml,
+                                           service_name=sandbox.service_name,
+                                           selector_name=sandbox.pod_name):
+                raise RuntimeError(f"Failed to create service {sandbox.service_name}")
+            sandbox.service_info = await asyncio.to_thread(client.wait_service_ready, sandbox.service_name,
+                                                           timeout=self.ready_timeout)
+            if not sandbox.service_info:
+                raise RuntimeError(f"Service {sandbox.service_name} is not ready in {self.ready_timeout}s")
+            logger.info(f"Provisioned sandbox {sandbox.pod_name}")
+            return sandbox
+        except Exception as e:
+            logger.warning(f"Failed to provision sandbox {sandbox.pod_name}: {e}")
+            await self._destroy(sandbox)
+            return None
+
+    async def _destroy(self, sandbox: PooledSandbox):
+        try:
+            await asyncio.to_thread(self.client.delete_pod, sandbox.pod_name)
+            await asyncio.to_thread(self.client.delete_service, sandbox.service_name)
+        except Exception as e:
+            logger.warning(f"Failed to delete sandbox {sandbox.pod_name}: {e}")
+
+    def lease_nowait(self) -> Optional[PooledSandbox]:
+        """Lease an idle sandbox, None if there is none."""
+        if self._closed or not self._idle:
+            return None
+        sandbox = self._idle.pop()
+        sandbox.uses += 1
+        self._leased[sandbox.pod_name] = sandbox
+        self._fill()
+        return sandbox
+
+    async def lease(self, timeout: float = None) -> Optional[PooledSandbox]:
+        """Lease a sandbox, provisioned on demand if none is idle and the pool is not full,
+        otherwise waits for one to be provisioned or returned. None if the timeout expired."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while not self._closed:
+            sandbox = self.lease_nowait()
+            if sandbox:
+                return sandbox
+            if self.size() < self.max_size:
+                self._provisioning += 1
+                try:
+                    sandbox = await self._provision()
+                finally:
+                    self._provisioning -= 1
+                if sandbox:
+                    sandbox.uses += 1
+                    self._leased[sandbox.pod_name] = sandbox
+                    return sandbox
+                continue
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                return None
+            self._available.clear()
+            try:
+                await asyncio.wait_for(self._available.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+        return None
+
+    async def release(self, pod_name: str, healthy: bool = True) -> bool:
+        """Return a leased sandbox, recycled or destroyed according to the policy."""
+        sandbox = self._leased.get(pod_name)
+        if sandbox is None:
+            return False
+        recycle = (healthy and not self._closed and self.recycle_policy == RecyclePolicy.RECYCLE
+                   and sandbox.uses < self.max_uses and await self._reset(sandbox))
+        # counted as leased while it is reset
+        self._leased.pop(pod_name, None)
+        if recycle and not self._closed:
+            self._idle.append(sandbox)
+            self._available.set()
+            return True
+        await self._destroy(sandbox)
+        self._available.set()
+        self._fill()
+        return True
+
+    async def _reset(self, sandbox: PooledSandbox) -> bool:
+        if self.reset is None:
+            return True
+        try:
+            return await self.reset(sandbox)
+        except Exception as e:
+            logger.warning(f"Failed to reset sandbox {sandbox.pod_name}: {e}")
+            return False
+
+    async def close(self):
+        """Delete the idle sandboxes, the leased ones are deleted when they are returned."""
+        self._closed = True
+        for task in list(self._tasks):
+            await asyncio.gather(task, return_exceptions=True)
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*[self._destroy(sandbox) for sandbox in idle])
+        self._available.set()
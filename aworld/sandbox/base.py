@@ -151,6 +151,10 @@ class Sandbox(SandboxSetup):
         """
         pass
 
+    async def wait_ready(self) -> None:
+        """Wait until the sandbox is created, sandboxes created in the background finish here."""
+        pass
+
     def __del__(self):
         """Ensure resources are cleaned up when the object is garbage collected."""
         # NOTE: use logging in __del__ for log
@@ -9,7 +9,7 @@ import os
 
 import yaml
 from dotenv import load_dotenv
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client import V1DeleteOptions
 from kubernetes.client.rest import ApiException
 
@@ -287,6 +287,7 @@ class KubernetesApiClient:
                 "pod_name": pod.metadata.name,
                 "namespace": pod.metadata.namespace,
                 "status": pod.status.phase,  # Pending, Running, Succeeded, Failed, Unknown
+                "ready": self._pod_ready(pod),
                 "pod_ip": pod.status.pod_ip,
                 "host_ip": pod.status.host_ip,
                 "start_time": start_time,
@@ -298,6 +299,48 @@ class KubernetesApiClient:
             logger.warning(f"Failed to get Pod information for {namespace}/{name}: {e}")
             return None
 
+    @staticmethod
+    def _pod_ready(pod) -> bool:
+        """Whether the Pod runs and passes its readiness probes (condition Ready=True)"""
+        if pod.status.phase != "Running":
+            return False
+        return any(condition.type == "Ready" and condition.status == "True"
+                   for condition in pod.status.conditions or [])
+
+    def wait_pod_running(self, name, namespace="default", timeout=60):
+        """
+        Wait until a Pod is running and ready (condition Ready=True) by watching its events instead of polling
+
+        Args:
+            name: Pod name
+            namespace: Namespace where the Pod is located
+            timeout: Seconds to wait at most
+
+        Returns:
+            dict: Pod information of the ready Pod, see `get_pod_info`
+            None: If the Pod failed or was not ready in time
+        """
+        pod_info = self.get_pod_info(name, namespace)
+        if pod_info and pod_info.get("ready"):
+            return pod_info
+        w = watch.Watch()
+        try:
+            for event in w.stream(self.core_v1.list_namespaced_pod,
+                                  namespace=namespace,
+                                  field_selector=f"metadata.name={name}",
+                                  timeout_seconds=timeout):
+                phase = event["object"].status.phase
+                if self._pod_ready(event["object"]):
+                    return self.get_pod_info(name, namespace)
+                if phase in ("Failed", "Succeeded") or event["type"] == "DELETED":
+                    logger.warning(f"Pod {namespace}/{name} will not run, phase: {phase}")
+                    return None
+        except ApiException as e:
+            logger.warning(f"Failed to watch Pod {namespace}/{name}: {e}")
+        finally:
+            w.stop()
+        return None
+
     # ===================== Deployment Operations =====================
 
     def get_deployment(self, name, namespace="default"):
@@ -594,6 +637,44 @@ class KubernetesApiClient:
             print(f"Failed to get Service information for {namespace}/{name}: {e}")
             return None
 
+    def wait_service_ready(self, name, namespace="default", timeout=60):
+        """
+        Wait until a Service is reachable (a ClusterIP, or a LoadBalancer with an ingress host) by watching its events
+
+        Args:
+            name: Service name
+            namespace: Namespace where the Service is located
+            timeout: Seconds to wait at most
+
+        Returns:
+            dict: Service information of the ready Service, see `get_service_info`
+            None: If the Service was not ready in time
+        """
+
+        def ready(info):
+            return info and (info.get("type") == "ClusterIP"
+                             or (info.get("type") == "LoadBalancer" and info.get("host")))
+
+        service_info = self.get_service_info(name, namespace)
+        if ready(service_info):
+            return service_info
+        w = watch.Watch()
+        try:
+            for event in w.stream(self.core_v1.list_namespaced_service,
+                                  namespace=namespace,
+                                  field_selector=f"metadata.name={name}",
+                                  timeout_seconds=timeout):
+                if event["type"] == "DELETED":
+                    return None
+                service_info = self.get_service_info(name, namespace)
+                if ready(service_info):
+                    return service_info
+        except ApiException as e:
+            logger.warning(f"Failed to watch Service {namespace}/{name}: {e}")
+        finally:
+            w.stop()
+        return None
+
     # ===================== Namespace Operations =====================
 
     def get_namespace(self, name):
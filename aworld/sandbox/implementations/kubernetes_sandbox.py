@@ -63,9 +63,19 @@ class KubernetesSandbox(BaseSandbox, KubernetesSandboxApi):
         # Ensure sandbox_id has a value in all cases
         self._sandbox_id = sandbox_id or str(uuid.uuid4())
 
+        # Initialize McpServers, configured once the sandbox is created
+        self._mcpservers = McpServers(
+            mcp_servers,
+            self._mcp_config,
+            sandbox=self,
+            black_tool_actions=self._black_tool_actions,
+            skill_configs=self._skill_configs
+        )
+
         # If no sandbox_id provided, create a new sandbox
+        self._creating = None
         if not sandbox_id:
-            response = self._create_sandbox(
+            create_kwargs = dict(
                 env_type=self._env_type,
                 env_config=None,
                 mcp_servers=mcp_servers,
@@ -73,37 +83,49 @@ class KubernetesSandbox(BaseSandbox, KubernetesSandboxApi):
                 black_tool_actions=self._black_tool_actions,
                 skill_configs=self._skill_configs,
             )
-
-            if not response:
-                self._status = SandboxStatus.ERROR
-                # If creation fails, keep the generated UUID as the ID
-                logger.warning(f"Failed to create K8s sandbox, using generated ID: {self._sandbox_id}")
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                self._on_created(self._create_sandbox(**create_kwargs))
             else:
-                self._sandbox_id = response.sandbox_id
-                self._status = SandboxStatus.RUNNING
-                self._metadata = {
-                    "pod_name": getattr(response, 'pod_name', None),
-                    "service_name": getattr(response, 'service_name', None),
-                    "status": getattr(response, 'status', None),
-                    "cluster_ip": getattr(response, 'cluster_ip', None),
-                    "host": getattr(response, 'host', None),
-                    "mcp_config": getattr(response, 'mcp_config', None),
-                    "env_type": getattr(response, 'env_type', None),
-                }
-                self._mcp_config = getattr(response, 'mcp_config', None)
-                self._skill_configs = getattr(response, 'skill_configs', None)
-
-        # Initialize McpServers
-        self._mcpservers = McpServers(
-            mcp_servers,
-            self._mcp_config,
-            sandbox=self,
-            black_tool_actions=self._black_tool_actions,
-            skill_configs=self._skill_configs
-        )
+                # created in the background on the event loop, waited for by `wait_ready`
+                self._creating = asyncio.ensure_future(self._acreate(create_kwargs))
+
+    async def _acreate(self, create_kwargs: Dict[str, Any]):
+        self._on_created(await self._acreate_sandbox(**create_kwargs))
+
+    def _on_created(self, response) -> None:
+        if not response:
+            self._status = SandboxStatus.ERROR
+            # If creation fails, keep the generated UUID as the ID
+            logger.warning(f"Failed to create K8s sandbox, using generated ID: {self._sandbox_id}")
+            return
+
+        self._sandbox_id = response.sandbox_id
+        self._status = SandboxStatus.RUNNING
+        self._metadata = {
+            "pod_name": getattr(response, 'pod_name', None),
+            "service_name": getattr(response, 'service_name', None),
+            "status": getattr(response, 'status', None),
+            "cluster_ip": getattr(response, 'cluster_ip', None),
+            "host": getattr(response, 'host', None),
+            "mcp_config": getattr(response, 'mcp_config', None),
+            "env_type": getattr(response, 'env_type', None),
+            "pooled": getattr(response, 'pooled', False),
+        }
+        self._mcp_config = getattr(response, 'mcp_config', None)
+        self._skill_configs = getattr(response, 'skill_configs', None)
+        self._mcpservers.mcp_config = self._mcp_config
+        self._mcpservers.skill_configs = self._skill_configs or {}
+
+    async def wait_ready(self) -> None:
+        """Wait until the sandbox created on the event loop is running or failed."""
+        if self._creating is not None:
+            await self._creating
 
     async def remove(self) -> None:
         """Remove sandbox."""
+        await self.wait_ready()
         await self._remove_sandbox(
             sandbox_id=self.sandbox_id,
             metadata=self._metadata,
@@ -37,6 +37,8 @@ class SandboxK8sResponse(SandboxCreateResponse):
     service_name: Optional[str] = None
     cluster_ip: Optional[str] = None
     host: Optional[str] = None
+    # leased from the warm pool, returned to it on removal
+    pooled: bool = False
 
 
 @dataclass
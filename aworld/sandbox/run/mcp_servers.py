@@ -49,6 +49,7 @@ class McpServers:
     async def list_tools(self, context: Context = None) -> List[Dict[str, Any]]:
         if self.tool_list:
             return self.tool_list
+        await self._wait_sandbox()
         if not self.mcp_servers or not self.mcp_config:
             return []
         try:
@@ -129,6 +130,7 @@ class McpServers:
         results = []
         if not action_list:
             return None
+        await self._wait_sandbox()
 
         try:
             for action in action_list:
@@ -306,6 +308,11 @@ class McpServers:
 
         return results
 
+    async def _wait_sandbox(self):
+        # the config of a sandbox created in the background is set once it is ready
+        if self.sandbox is not None:
+            await self.sandbox.wait_ready()
+
     def _update_metadata(self, result_key: str, result: Any, operation_info: Dict[str, Any]):
         """
         Update sandbox metadata with a single tool call result
@@ -1,95 +1,209 @@
+import asyncio
 import os
 import pickle
+import sqlite3
 import threading
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from typing_extensions import override
 from datetime import datetime
 from aworld.cmd.data_model import SessionModel, ChatCompletionMessage
 from aworld.logs.util import logger
 from .base_session_service import BaseSessionService
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    name TEXT,
+    description TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (user_id, session_id)
+);
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_session ON messages (user_id, session_id, id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
 
 class SimpleSessionService(BaseSessionService):
-    def __init__(self):
-        self.data_file = os.path.join(os.curdir, "data", "session.bin")
-        os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-        self._lock = threading.Lock()
+    """Sessions stored in a WAL-mode SQLite database, one row per session and one row per message.
+
+    Appending messages inserts only the new rows of the session, so the cost does not depend on the
+    number of stored sessions; readers are not blocked by the writer. Database calls run in worker
+    threads, each thread has its own connection. Sessions of the legacy `session.bin` pickle are
+    imported on first use.
+    """
+
+    def __init__(self, data_dir: str = None):
+        self.data_dir = data_dir or os.path.join(os.curdir, "data")
+        self.db_file = os.path.join(self.data_dir, "session.db")
+        self.data_file = os.path.join(self.data_dir, "session.bin")
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
 
-    def _load_sessions(self) -> dict:
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        os.makedirs(self.data_dir, exist_ok=True)
+        conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript(_SCHEMA)
+                self._import_legacy(conn)
+                self._initialized = True
+        self._local.conn = conn
+        return conn
+
+    async def _run(self, func, *args):
+        return await asyncio.to_thread(func, *args)
+
+    def _import_legacy(self, conn: sqlite3.Connection):
         if not os.path.exists(self.data_file):
-            return {}
+            return
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+            return
         try:
             with open(self.data_file, "rb") as f:
-                return pickle.load(f)
+                sessions: Dict[str, SessionModel] = pickle.load(f)
         except Exception as e:
-            logger.error(f"Error loading sessions: {e}")
-            return {}
+            logger.error(f"Error loading legacy sessions: {e}")
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for session in sessions.values():
+                conn.execute(
+                    "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?)",
+                    (session.user_id, session.session_id, session.name, session.description,
+                     _format_time(session.created_at), _format_time(session.updated_at)),
+                )
+                conn.executemany(
+                    "INSERT INTO messages (user_id, session_id, data) VALUES (?, ?, ?)",
+                    [(session.user_id, session.session_id, message.model_dump_json())
+                     for message in session.messages or []],
+                )
+            conn.execute("INSERT INTO meta VALUES ('legacy_imported', ?)", (datetime.now().isoformat(),))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info(f"Imported {len(sessions)} sessions from {self.data_file}")
+
+    def _load_messages(self, conn: sqlite3.Connection, user_id: str, session_id: str) -> List[ChatCompletionMessage]:
+        rows = conn.execute(
+            "SELECT data FROM messages WHERE user_id = ? AND session_id = ? ORDER BY id",
+            (user_id, session_id),
+        )
+        return [ChatCompletionMessage.model_validate_json(data) for data, in rows]
+
+    def _get_session(self, user_id: str, session_id: str) -> Optional[SessionModel]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT user_id, session_id, name, description, created_at, updated_at "
+            "FROM sessions WHERE user_id = ? AND session_id = ?",
+            (user_id, session_id),
+        ).fetchone()
+        if row is None:
+            return None
+        return _session_model(row, self._load_messages(conn, user_id, session_id))
 
-    def _save_sessions(self, sessions: dict):
+    def _list_sessions(self, user_id: str) -> List[SessionModel]:
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT user_id, session_id, name, description, created_at, updated_at "
+            "FROM sessions WHERE user_id = ? ORDER BY created_at DESC",
+            (user_id,),
+        ).fetchall()
+        return [_session_model(row, self._load_messages(conn, row[0], row[1])) for row in rows]
+
+    def _delete_session(self, user_id: str, session_id: str):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
         try:
-            temp_file = self.data_file + ".tmp"
-            with open(temp_file, "wb") as f:
-                pickle.dump(sessions, f)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(temp_file, self.data_file)
-        except Exception as e:
-            logger.error(f"Error saving sessions: {e}")
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            cursor = conn.execute(
+                "DELETE FROM sessions WHERE user_id = ? AND session_id = ?", (user_id, session_id)
+            )
+            conn.execute("DELETE FROM messages WHERE user_id = ? AND session_id = ?", (user_id, session_id))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if not cursor.rowcount:
+            logger.warning(f"Session {user_id}:{session_id} not found")
+
+    def _append_messages(self, user_id: str, session_id: str, messages: List[ChatCompletionMessage]):
+        conn = self._connect()
+        now = _format_time(datetime.now())
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                "UPDATE sessions SET updated_at = ? WHERE user_id = ? AND session_id = ?",
+                (now, user_id, session_id),
+            )
+            if not cursor.rowcount:
+                logger.info(f"Session {user_id}:{session_id} not found, creating new session")
+                conn.execute(
+                    "INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?)",
+                    (user_id, session_id, messages[0].content, messages[0].content, now, now),
+                )
+            conn.executemany(
+                "INSERT INTO messages (user_id, session_id, data) VALUES (?, ?, ?)",
+                [(user_id, session_id, message.model_dump_json()) for message in messages],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
             raise
 
     @override
     async def get_session(
         self, user_id: str, session_id: str
     ) -> Optional[SessionModel]:
-        session_key = f"{user_id}:{session_id}"
-        with self._lock:
-            sessions = self._load_sessions()
-            return sessions.get(session_key)
+        return await self._run(self._get_session, user_id, session_id)
 
     @override
     async def list_sessions(self, user_id: str) -> List[SessionModel]:
-        with self._lock:
-            sessions = self._load_sessions()
-            user_sessions = [
-                session for key, session in sessions.items() if key.startswith(user_id)
-            ]
-            # Sort by created_at in descending order (newest first)
-            return sorted(user_sessions, key=lambda x: x.created_at, reverse=True)
+        # Sorted by created_at in descending order (newest first)
+        return await self._run(self._list_sessions, user_id)
 
     @override
     async def delete_session(self, user_id: str, session_id: str) -> None:
-        session_key = f"{user_id}:{session_id}"
-        with self._lock:
-            sessions = self._load_sessions()
-            if session_key not in sessions:
-                logger.warning(f"Session {session_key} not found")
-                return
-            del sessions[session_key]
-            self._save_sessions(sessions)
+        await self._run(self._delete_session, user_id, session_id)
 
     @override
     async def append_messages(
         self, user_id: str, session_id: str, messages: List[ChatCompletionMessage]
     ) -> None:
-        session_key = f"{user_id}:{session_id}"
-        with self._lock:
-            sessions = self._load_sessions()
-
-            if session_key not in sessions:
-                logger.info(f"Session {session_key} not found, creating new session")
-                sessions[session_key] = SessionModel(
-                    user_id=user_id,
-                    session_id=session_id,
-                    name=messages[0].content,
-                    description=messages[0].content,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                    messages=[],
-                )
+        if not messages:
+            return
+        await self._run(self._append_messages, user_id, session_id, messages)
+
+
+def _format_time(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
 
-            sessions[session_key].messages.extend(messages)
-            sessions[session_key].updated_at = datetime.now()
-            self._save_sessions(sessions)
+def _session_model(row, messages: List[ChatCompletionMessage]) -> SessionModel:
+    user_id, session_id, name, description, created_at, updated_at = row
+    return SessionModel(
+        user_id=user_id,
+        session_id=session_id,
+        name=name,
+        description=description,
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+        messages=messages,
+    )
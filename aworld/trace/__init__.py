@@ -18,6 +18,7 @@ from aworld.trace.instrumentation.tool import get_tool_name, get_tool_span_attri
 from aworld.trace.instrumentation import semconv
 from aworld.trace.instrumentation.uni_llmmodel.model_response_parse import covert_to_jsonstr
 from aworld.trace.config import configure, ObservabilityConfig
+from aworld.trace.attributes import lazy_attribute
 from typing import Callable, Any
 
 
@@ -48,7 +49,7 @@ def message_span(message: 'aworld.core.event.base.Message' = None, attributes: d
     if message:
         span_name, run_type = get_span_name_from_message(message)
         message_span_attribute = {
-            "event.payload": str(message.payload),
+            "event.payload": lazy_attribute(str, message.payload, snapshot=True),
             "event.topic": message.topic or "",
             "event.receiver": message.receiver or "",
             "event.sender": message.sender or "",
@@ -103,7 +104,7 @@ def task_span(session_id: str, task: 'aworld.core.task.Task' = None, attributes:
             semconv.TASK_INPUT: task.input,
             semconv.TASK_IS_SUB_TASK: task.is_sub_task,
             semconv.TASK_GROUP_ID: task.group_id,
-            semconv.TASK: covert_to_jsonstr(task)
+            semconv.TASK: lazy_attribute(covert_to_jsonstr, task, snapshot=True)
         }
         message_span_attribute.update(attributes)
         return GLOBAL_TRACE_MANAGER.span(
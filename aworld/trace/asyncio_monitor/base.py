@@ -2,8 +2,8 @@ import asyncio
 import os
 import threading
 import contextvars
+import sys
 import time
-import inspect
 from concurrent.futures import ThreadPoolExecutor
 from typing import Coroutine, Generator, TypeVar, Any, List, Dict
 from aworld.trace.asyncio_monitor.detectors import MonitorDetector, TaskCountDetector, PendingReasonDetector, \
@@ -36,11 +36,13 @@ class MonitoredTask(asyncio.Task):
 
     def _get_create_location(self):
         try:
-            stack = inspect.stack()[3:]
-            for frame_info in stack:
-                if 'asyncio' not in frame_info.filename and 'asyncio_monitor.py' not in frame_info.filename:
-                    filename = os.path.basename(frame_info.filename)
-                    return f"{filename}:{frame_info.function}:{frame_info.lineno}"
+            # walk frames directly, inspect.stack() reads source lines of the whole stack
+            frame = sys._getframe(3)
+            while frame is not None:
+                filename = frame.f_code.co_filename
+                if 'asyncio' not in filename:
+                    return f"{os.path.basename(filename)}:{frame.f_code.co_name}:{frame.f_lineno}"
+                frame = frame.f_back
             return "Unknown location"
         except Exception:
             return "Failed to get location"
@@ -54,10 +56,13 @@ class AsyncioMonitor:
                  shot_file_name: bool = True,
                  report_table_width: int = 100,
                  slow_task_ms: int = 1000,
+                 debug: bool = False,
                  ):
         self._monitored_loop = loop or asyncio.get_event_loop()
-        self._monitored_loop.set_debug(True)
-        self._monitored_loop.slow_callback_duration = 0.1
+        if debug:
+            # asyncio debug mode is expensive, use LoopProfiler to find blocking calls in production
+            self._monitored_loop.set_debug(True)
+            self._monitored_loop.slow_callback_duration = 0.1
         self.hot_location_top_n = hot_location_top_n
         self.detect_duration_second = detect_duration_second
         self.shot_file_name = shot_file_name
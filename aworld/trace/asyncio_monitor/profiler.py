@@ -0,0 +1,332 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""
+Low overhead event loop profiler for production use.
+
+- A loop lag probe scheduled every `probe_interval` seconds measures how late the loop runs it.
+- A watchdog thread samples the stack of the loop thread with `sys._current_frames` only
+  while the loop is blocked longer than `slow_callback_ms`.
+- Task coroutines are wrapped to attribute wall and CPU time of each step to the coroutine.
+
+Slow steps are reported as `asyncio.blocking` events of the span active in the blocking task,
+lag and per coroutine time are exported through `aworld.metrics` when metrics are configured.
+"""
+import asyncio
+import collections.abc
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+from aworld.logs.util import asyncio_monitor_logger as logger
+from aworld.metrics.context_manager import MetricContext
+from aworld.metrics.metric import MetricType
+from aworld.metrics.template import MetricTemplate
+from aworld.trace.base import get_tracer_provider_silent
+
+BLOCKING_EVENT_NAME = "asyncio.blocking"
+
+loop_lag_histogram = MetricTemplate(
+    type=MetricType.HISTOGRAM,
+    name="asyncio_loop_lag",
+    unit="ms",
+    description="Delay of the event loop running a scheduled probe",
+)
+
+loop_blocking_counter = MetricTemplate(
+    type=MetricType.COUNTER,
+    name="asyncio_loop_blocking_count",
+    unit="1",
+    description="Number of times the event loop was blocked longer than the slow callback threshold",
+    labels=["location"]
+)
+
+coroutine_cpu_counter = MetricTemplate(
+    type=MetricType.COUNTER,
+    name="asyncio_coroutine_cpu_time",
+    unit="s",
+    description="CPU time spent on the event loop thread by coroutine",
+    labels=["coroutine"]
+)
+
+coroutine_step_histogram = MetricTemplate(
+    type=MetricType.HISTOGRAM,
+    name="asyncio_coroutine_max_step",
+    unit="ms",
+    description="Longest step of a coroutine within a report interval",
+    labels=["coroutine"]
+)
+
+_SKIP_FILES = (os.sep + "asyncio" + os.sep, "asyncio_monitor" + os.sep + "profiler.py")
+
+
+class CoroutineStats:
+    """Accumulated run time of one coroutine on the loop thread."""
+
+    __slots__ = ("steps", "cpu_time", "wall_time", "max_step")
+
+    def __init__(self):
+        self.steps = 0
+        self.cpu_time = 0.0
+        self.wall_time = 0.0
+        self.max_step = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "steps": self.steps,
+            "cpu_time": self.cpu_time,
+            "wall_time": self.wall_time,
+            "max_step": self.max_step
+        }
+
+
+class _ProfiledCoroutine(collections.abc.Coroutine):
+    """Coroutine proxy timing every `send`/`throw`, i.e. every step of the task running it."""
+
+    __slots__ = ("_coro", "_name", "_profiler")
+
+    def __init__(self, coro, name: str, profiler: "LoopProfiler"):
+        self._coro = coro
+        self._name = name
+        self._profiler = profiler
+
+    def send(self, value):
+        return self._profiler._run_step(self._name, self._coro.send, value)
+
+    def throw(self, *args):
+        return self._profiler._run_step(self._name, self._coro.throw, *args)
+
+    def close(self):
+        return self._coro.close()
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    def __getattr__(self, name: str):
+        # cr_frame, cr_await, etc. used by task stack inspection
+        return getattr(self._coro, name)
+
+    def __repr__(self):
+        return repr(self._coro)
+
+
+def _coroutine_name(coro) -> str:
+    name = getattr(coro, "__qualname__", None) or getattr(coro, "__name__", None)
+    return name or type(coro).__name__
+
+
+def format_frame_stack(frame, max_frames: int = 20) -> List[str]:
+    """Format the stack of a frame as `file:lineno:function` lines, innermost last."""
+    stack = traceback.extract_stack(frame, limit=max_frames)
+    return [f"{item.filename}:{item.lineno}:{item.name}" for item in stack
+            if not any(skip in item.filename for skip in _SKIP_FILES)]
+
+
+class LoopProfiler:
+    """Sampling profiler of an asyncio event loop.
+
+    Unlike `AsyncioMonitor` it leaves the loop in non debug mode and inspects stacks only when
+    the loop is actually blocked, so it can stay enabled under real load.
+
+    Example:
+        >>> async def main():
+        >>>     with LoopProfiler(slow_callback_ms=100):
+        >>>         await run_agents()
+    """
+
+    def __init__(self,
+                 loop: asyncio.AbstractEventLoop = None,
+                 probe_interval: float = 0.1,
+                 slow_callback_ms: float = 100,
+                 report_interval: float = 10,
+                 track_coroutines: bool = True,
+                 max_stack_frames: int = 20):
+        self._monitored_loop = loop
+        self.probe_interval = probe_interval
+        self.slow_callback_ms = slow_callback_ms
+        self.report_interval = report_interval
+        self.track_coroutines = track_coroutines
+        self.max_stack_frames = max_stack_frames
+
+        self._running = False
+        self._loop_thread_id: Optional[int] = None
+        self._probe_handle: Optional[asyncio.TimerHandle] = None
+        self._previous_task_factory = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # written on the loop thread, read by the watchdog
+        self._last_beat = 0.0
+        self._step_started: Optional[float] = None
+        # written by the watchdog, read on the loop thread
+        self._sample: Optional[tuple] = None
+
+        self._last_report = 0.0
+        self._coroutine_stats: Dict[str, CoroutineStats] = {}
+        self.max_lag = 0.0
+        self.blocking_events: collections.deque = collections.deque(maxlen=100)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def start(self):
+        """Start profiling, must be called from the thread running the monitored loop."""
+        if self._running:
+            logger.warning("LoopProfiler is already running")
+            return
+        loop = self._monitored_loop or asyncio.get_event_loop()
+        self._monitored_loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._running = True
+        self._stop_event.clear()
+        self._last_beat = time.perf_counter()
+        self._last_report = self._last_beat
+
+        if self.track_coroutines:
+            self._previous_task_factory = loop.get_task_factory()
+            loop.set_task_factory(self._create_task)
+        self._schedule_probe()
+        self._watchdog = threading.Thread(target=self._run_watchdog, name="aworld-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        self._stop_event.set()
+        if self._probe_handle:
+            self._probe_handle.cancel()
+            self._probe_handle = None
+        if self.track_coroutines and self._monitored_loop.get_task_factory() == self._create_task:
+            self._monitored_loop.set_task_factory(self._previous_task_factory)
+        if self._watchdog:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+        self._report_coroutine_stats()
+
+    def coroutine_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Accumulated stats of the current report interval by coroutine name."""
+        return {name: stats.to_dict() for name, stats in self._coroutine_stats.items()}
+
+    def _create_task(self, loop, coro, **kwargs):
+        if asyncio.iscoroutine(coro) and not isinstance(coro, _ProfiledCoroutine):
+            coro = _ProfiledCoroutine(coro, _coroutine_name(coro), self)
+        if self._previous_task_factory is not None:
+            return self._previous_task_factory(loop, coro, **kwargs)
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    def _run_step(self, name: str, method, *args):
+        start_cpu = time.thread_time()
+        start = time.perf_counter()
+        self._step_started = start
+        try:
+            return method(*args)
+        finally:
+            end = time.perf_counter()
+            self._step_started = None
+            duration = end - start
+            stats = self._coroutine_stats.get(name)
+            if stats is None:
+                stats = self._coroutine_stats[name] = CoroutineStats()
+            stats.steps += 1
+            stats.cpu_time += time.thread_time() - start_cpu
+            stats.wall_time += duration
+            if duration > stats.max_step:
+                stats.max_step = duration
+            if duration * 1000 >= self.slow_callback_ms:
+                self._on_slow_step(name, start, duration)
+
+    def _take_sample(self, since: float) -> List[str]:
+        sample = self._sample
+        if sample and sample[0] >= since:
+            self._sample = None
+            return sample[1]
+        return []
+
+    def _on_slow_step(self, name: str, start: float, duration: float):
+        stack = self._take_sample(start)
+        location = stack[-1] if stack else name
+        event = {
+            "coroutine": name,
+            "duration_ms": round(duration * 1000, 3),
+            "location": location,
+            "stack": stack,
+        }
+        self.blocking_events.append(event)
+        logger.warning(f"Event loop blocked {event['duration_ms']}ms by coroutine {name} at {location}")
+
+        provider = get_tracer_provider_silent()
+        if provider:
+            try:
+                span = provider.get_current_span()
+                if span and span.is_recording():
+                    span.add_event(BLOCKING_EVENT_NAME, attributes=event)
+            except Exception as e:
+                logger.debug(f"Failed to add blocking event to span: {e}")
+        if MetricContext.metric_initialized():
+            MetricContext.count(loop_blocking_counter, 1, labels={"location": location})
+
+    def _schedule_probe(self):
+        self._probe_handle = self._monitored_loop.call_later(
+            self.probe_interval, self._probe, time.perf_counter() + self.probe_interval)
+
+    def _probe(self, expected: float):
+        now = time.perf_counter()
+        self._last_beat = now
+        lag = max(now - expected, 0.0)
+        if lag > self.max_lag:
+            self.max_lag = lag
+        try:
+            if MetricContext.metric_initialized():
+                MetricContext.histogram_record(loop_lag_histogram, lag * 1000)
+            if lag * 1000 >= self.slow_callback_ms:
+                # blocked outside of a profiled task step, e.g. by a plain callback
+                stack = self._take_sample(expected - self.probe_interval)
+                if stack:
+                    logger.warning(f"Event loop lagged {lag * 1000:.1f}ms, blocked at {stack[-1]}")
+                    if MetricContext.metric_initialized():
+                        MetricContext.count(loop_blocking_counter, 1, labels={"location": stack[-1]})
+            if now - self._last_report >= self.report_interval:
+                self._report_coroutine_stats()
+                self._last_report = now
+        except Exception as e:
+            logger.warning(f"LoopProfiler probe failed: {e}")
+        finally:
+            if self._running:
+                self._schedule_probe()
+
+    def _report_coroutine_stats(self):
+        stats, self._coroutine_stats = self._coroutine_stats, {}
+        if not stats or not MetricContext.metric_initialized():
+            return
+        for name, item in stats.items():
+            MetricContext.count(coroutine_cpu_counter, item.cpu_time, labels={"coroutine": name})
+            MetricContext.histogram_record(coroutine_step_histogram, item.max_step * 1000,
+                                           labels={"coroutine": name})
+
+    def _run_watchdog(self):
+        threshold = self.slow_callback_ms / 1000
+        check_interval = max(min(threshold / 2, self.probe_interval), 0.005)
+        sampled_since = None
+        while not self._stop_event.wait(check_interval):
+            step_started = self._step_started
+            blocked_since = step_started if step_started is not None else self._last_beat + self.probe_interval
+            if blocked_since == sampled_since or time.perf_counter() - blocked_since < threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            try:
+                self._sample = (blocked_since, format_frame_stack(frame, self.max_stack_frames))
+            except Exception as e:
+                logger.debug(f"Failed to sample loop thread stack: {e}")
+            finally:
+                del frame
+            sampled_since = blocked_since
@@ -0,0 +1,119 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""
+Span attribute pipeline.
+
+- `LazyAttribute` wraps the serialization of a payload, it is evaluated only if the span is recording,
+  and by the OTLP provider on the exporter thread instead of the traced code path.
+- `limit_attribute_value` caps string payloads to a byte budget, oversized values are truncated
+  and suffixed with the size and digest of the full payload.
+"""
+import copy
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from aworld.logs.util import trace_logger as logger
+
+DEFAULT_MAX_ATTRIBUTE_BYTES = int(os.environ.get("AWORLD_TRACE_MAX_ATTRIBUTE_BYTES", 32 * 1024))
+
+_max_attribute_bytes = DEFAULT_MAX_ATTRIBUTE_BYTES
+
+
+def set_max_attribute_bytes(max_bytes: int):
+    """Set the byte budget of a string attribute value, 0 or negative means unlimited."""
+    global _max_attribute_bytes
+    _max_attribute_bytes = max_bytes
+
+
+def get_max_attribute_bytes() -> int:
+    return _max_attribute_bytes
+
+
+class LazyAttribute:
+    """Attribute value computed on first use, the result is cached and shared by all exporters."""
+
+    __slots__ = ("_func", "_args", "_kwargs", "_value", "_resolved", "_lock")
+
+    def __init__(self, func: Callable[..., Any], *args, **kwargs):
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._value = None
+        self._resolved = False
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        if self._resolved:
+            return self._value
+        with self._lock:
+            if not self._resolved:
+                try:
+                    self._value = self._func(*self._args, **self._kwargs)
+                except Exception as e:
+                    logger.debug(f"Failed to resolve lazy span attribute: {e}")
+                    self._value = None
+                # release the payload
+                self._func = self._args = self._kwargs = None
+                self._resolved = True
+        return self._value
+
+    def __repr__(self):
+        return f"LazyAttribute({self._value!r})" if self._resolved else "LazyAttribute(<unresolved>)"
+
+
+def _snapshot(value: Any) -> Any:
+    try:
+        return copy.copy(value)
+    except Exception:
+        return value
+
+
+def lazy_attribute(func: Callable[..., Any], *args, snapshot: bool = False, **kwargs) -> LazyAttribute:
+    """Defer `func(*args, **kwargs)` until the span attribute is exported.
+
+    Args:
+        func: Serialization function, e.g. `json.dumps`.
+        snapshot: Shallow copy the arguments, for payloads the traced code mutates after setting the attribute.
+    """
+    if snapshot:
+        args = tuple(_snapshot(arg) for arg in args)
+    return LazyAttribute(func, *args, **kwargs)
+
+
+def split_lazy_attributes(attributes: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, LazyAttribute]]:
+    """Split attributes into the eager ones and the lazy ones."""
+    if not attributes:
+        return {}, {}
+    eager, lazy = {}, {}
+    for key, value in attributes.items():
+        if isinstance(value, LazyAttribute):
+            lazy[key] = value
+        else:
+            eager[key] = value
+    return eager, lazy
+
+
+def limit_attribute_value(value: Any, max_bytes: int = None) -> Any:
+    """Truncate string values, and string items of sequence values, above the byte budget."""
+    max_bytes = _max_attribute_bytes if max_bytes is None else max_bytes
+    if max_bytes <= 0:
+        return value
+    if isinstance(value, str):
+        return _limit_str(value, max_bytes)
+    if isinstance(value, (list, tuple)) and any(isinstance(item, str) for item in value):
+        return [_limit_str(item, max_bytes) if isinstance(item, str) else item for item in value]
+    return value
+
+
+def _limit_str(value: str, max_bytes: int) -> str:
+    # a character is at most 4 bytes in utf-8, skip encoding the short ones
+    if len(value) * 4 <= max_bytes:
+        return value
+    data = value.encode("utf-8", errors="replace")
+    if len(data) <= max_bytes:
+        return value
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    return (data[:max_bytes].decode("utf-8", errors="ignore")
+            + f"...[truncated {len(data)} bytes, sha256:{digest}]")
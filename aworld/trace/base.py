@@ -232,6 +232,17 @@ class Span(ABC):
             escaped: Whether the exception was escaped.
         """
 
+    def add_event(self,
+                  name: str,
+                  attributes: dict[str, Any] = None,
+                  timestamp: Optional[int] = None) -> None:
+        """Adds an event to the span.
+        Args:
+            name: The name of the event.
+            attributes: A dictionary of attributes of the event.
+            timestamp: The timestamp of the event, defaults to now.
+        """
+
     @abstractmethod
     def get_trace_id(self) -> str:
         """Returns the trace ID of the span.
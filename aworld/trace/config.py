@@ -40,6 +40,8 @@ class ObservabilityConfig():
     trace_server_port: Optional[int] = field(default=7079)
     # The id generator to use for trace ids
     trace_id_generator: Optional[Any] = field(default=None)
+    # byte budget of a string span attribute, larger values are truncated, None uses AWORLD_TRACE_MAX_ATTRIBUTE_BYTES
+    trace_max_attribute_bytes: Optional[int] = field(default=None)
     metrics_provider: Optional[str] = field(default=None)
     metrics_backend: Optional[str] = field(default=None)
     metrics_base_url: Optional[str] = field(default=None)
@@ -84,7 +86,8 @@ def _trace_configure(config: ObservabilityConfig):
         server_enabled=config.trace_server_enabled,
         server_port=config.trace_server_port,
         storage=config.trace_storage,
-        id_generator=config.trace_id_generator
+        id_generator=config.trace_id_generator,
+        max_attribute_bytes=config.trace_max_attribute_bytes
     )
 
 
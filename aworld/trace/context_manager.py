@@ -278,6 +278,13 @@ class ContextSpan(Span):
             self._span.record_exception(
                 exception, attributes, timestamp, escaped)
 
+    def add_event(self,
+                  name: str,
+                  attributes: dict[str, Any] = None,
+                  timestamp: Optional[int] = None) -> None:
+        if self._span:
+            self._span.add_event(name, attributes, timestamp)
+
     def get_trace_id(self) -> str:
         if self._span:
             return self._span.get_trace_id()
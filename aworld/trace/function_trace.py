@@ -3,6 +3,7 @@ import contextlib
 import functools
 import json
 from typing import TYPE_CHECKING, Callable, Any, Union, Iterable, Sequence
+from aworld.trace.attributes import lazy_attribute
 from aworld.trace.base import (
     AttributeValueType
 )
@@ -121,7 +122,12 @@ def pre_process_func_args(args: dict):
     for k, v in args.items():
         if (v and not isinstance(v, (str, bool, int, float)) and
                 not (isinstance(v, Sequence) and all(isinstance(i, (str, bool, int, float)) for i in v))):
-            args[k] = json.dumps(to_serializable(v), ensure_ascii=False)
+            # serialized when the span is exported and only if it is recording, copied to keep the value of the call
+            args[k] = lazy_attribute(_dumps_arg, v, snapshot=True)
+
+
+def _dumps_arg(value: Any) -> str:
+    return json.dumps(to_serializable(value), ensure_ascii=False)
 
 
 def get_function_meta(func: Any,
@@ -2,6 +2,7 @@ import copy
 import json
 import aworld.trace.instrumentation.semconv as semconv
 from aworld.models.model_response import ModelResponse, ToolCall
+from aworld.trace.attributes import lazy_attribute
 from aworld.trace.base import Span
 from aworld.trace.instrumentation.openai.inout_parse import should_trace_prompts, need_flatten_messages
 from aworld.logs.util import logger
@@ -37,7 +38,7 @@ async def handle_request(span: Span, kwargs, instance):
                 attributes.update(parse_request_message(messages))
             else:
                 attributes.update({
-                    semconv.GEN_AI_PROMPT: covert_to_jsonstr(messages)
+                    semconv.GEN_AI_PROMPT: lazy_attribute(covert_to_jsonstr, messages, snapshot=True)
                 })
         tools = kwargs.get("tools")
         if tools:
@@ -45,7 +46,7 @@ async def handle_request(span: Span, kwargs, instance):
                 attributes.update(parse_prompt_tools(tools))
             else:
                 attributes.update({
-                    semconv.GEN_AI_PROMPT_TOOLS: covert_to_jsonstr(tools)
+                    semconv.GEN_AI_PROMPT_TOOLS: lazy_attribute(covert_to_jsonstr, tools)
                 })
 
         filterd_attri = {k: v for k, v in attributes.items()
@@ -1,11 +1,13 @@
 import sys
 import os
+import queue
+import threading
 import traceback
 import time
 import datetime
 import requests
 from threading import Lock
-from typing import Any, Iterator, Sequence, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Iterator, Sequence, Optional, TYPE_CHECKING
 from contextvars import Token
 from urllib.parse import urljoin
 import opentelemetry.context as otlp_context_api
@@ -20,6 +22,7 @@ from opentelemetry.trace import (
 from opentelemetry.trace.status import StatusCode
 from opentelemetry.sdk.trace import (
     ReadableSpan,
+    SpanProcessor,
     SynchronousMultiSpanProcessor,
     Tracer as SDKTracer,
     Span as SDKSpan,
@@ -39,6 +42,12 @@ from aworld.trace.base import (
     TraceContext,
     set_tracer_provider
 )
+from aworld.trace.attributes import (
+    LazyAttribute,
+    limit_attribute_value,
+    set_max_attribute_bytes,
+    split_lazy_attributes
+)
 from aworld.trace.span_cosumer import SpanConsumer
 from aworld.trace.propagator import get_global_trace_context
 from aworld.trace.baggage.sofa_tracer import SofaSpanHelper
@@ -121,11 +130,10 @@ class OTLPTracer(Tracer):
             otel_context = self._get_otel_context_from_trace_context(
                 trace_context)
         start_time = start_time or time.time_ns()
-        attributes = {**(attributes or {})}
+        attributes, lazy_attributes = split_lazy_attributes(attributes)
         attributes.setdefault(ATTRIBUTES_MESSAGE_KEY, name)
         SofaSpanHelper.set_sofa_context_to_attr(attributes)
-        attributes = {k: v for k, v in attributes.items(
-        ) if is_valid_attribute_value(k, v)}
+        attributes = clean_attributes(attributes)
 
         span_kind = self._convert_to_span_kind(
             span_type) if span_type else SpanKind.INTERNAL
@@ -136,7 +144,9 @@ class OTLPTracer(Tracer):
                                        start_time=start_time,
                                        record_exception=record_exception,
                                        set_status_on_exception=set_status_on_exception)
-        return OTLPSpan(span)
+        otlp_span = OTLPSpan(span)
+        otlp_span.set_lazy_attributes(lazy_attributes)
+        return otlp_span
 
     def start_as_current_span(
             self,
@@ -151,11 +161,10 @@ class OTLPTracer(Tracer):
     ) -> Iterator["Span"]:
 
         start_time = start_time or time.time_ns()
-        attributes = {**(attributes or {})}
+        attributes, lazy_attributes = split_lazy_attributes(attributes)
         attributes.setdefault(ATTRIBUTES_MESSAGE_KEY, name)
         SofaSpanHelper.set_sofa_context_to_attr(attributes)
-        attributes = {k: v for k, v in attributes.items(
-        ) if is_valid_attribute_value(k, v)}
+        attributes = clean_attributes(attributes)
 
         span_kind = self._convert_to_span_kind(
             span_type) if span_type else SpanKind.INTERNAL
@@ -168,6 +177,7 @@ class OTLPTracer(Tracer):
         class _OTLPSpanContextManager:
             def __init__(self, tracer: SDKTracer):
                 self._span_cm = None
+                self._span = None
                 self._tracer = tracer
 
             def __enter__(self):
@@ -182,10 +192,16 @@ class OTLPTracer(Tracer):
                     end_on_exit=end_on_exit
                 )
                 inner_span = self._span_cm.__enter__()
-                return OTLPSpan(inner_span)
+                self._span = inner_span
+                otlp_span = OTLPSpan(inner_span)
+                otlp_span.set_lazy_attributes(lazy_attributes)
+                return otlp_span
 
             def __exit__(self, exc_type, exc_val, exc_tb):
-                return self._span_cm.__exit__(exc_type, exc_val, exc_tb)
+                if not end_on_exit:
+                    return self._span_cm.__exit__(exc_type, exc_val, exc_tb)
+                return _end_with_lazy_attributes(self._span,
+                                                 lambda: self._span_cm.__exit__(exc_type, exc_val, exc_tb))
 
         return _OTLPSpanContextManager(self._tracer)
 
@@ -239,23 +255,36 @@ class OTLPSpan(Span, ReadableSpan):
     def end(self, end_time: Optional[int] = None) -> None:
         self._remove_from_open_spans()
         end_time = end_time or time.time_ns()
-        if not self._span._status or self._span._status.status_code == StatusCode.UNSET:
+        # sampled out spans are NonRecordingSpan without status
+        if self._span.is_recording() and (
+                not self._span._status or self._span._status.status_code == StatusCode.UNSET):
             self._span.set_status(
                 status=StatusCode.OK,
                 description="",
             )
-        self._span.end(end_time=end_time)
+        _end_with_lazy_attributes(self._span, lambda: self._span.end(end_time=end_time))
         self._detach()
 
     def set_attribute(self, key: str, value: Any) -> None:
+        if isinstance(value, LazyAttribute):
+            self.set_lazy_attributes({key: value})
+            return
+        value = limit_attribute_value(value)
         if not is_valid_attribute_value(key, value):
             return
         self._span.set_attribute(key=key, value=value)
 
     def set_attributes(self, attributes: dict[str, Any]) -> None:
-        attributes = {k: v for k, v in attributes.items(
-        ) if is_valid_attribute_value(k, v)}
-        self._span.set_attributes(attributes=attributes)
+        attributes, lazy_attributes = split_lazy_attributes(attributes)
+        self._span.set_attributes(attributes=clean_attributes(attributes))
+        self.set_lazy_attributes(lazy_attributes)
+
+    def set_lazy_attributes(self, attributes: Dict[str, LazyAttribute]) -> None:
+        """Attach attributes resolved at export time, dropped without evaluation if the span is not recording."""
+        if not attributes or not self._span.is_recording():
+            return
+        # kept on the sdk span, shared by the wrappers of the current span and dropped with it
+        self._span.__dict__.setdefault(_LAZY_ATTRIBUTES, {}).update(attributes)
 
     def is_recording(self) -> bool:
         return self._span.is_recording()
@@ -290,6 +319,12 @@ class OTLPSpan(Span, ReadableSpan):
             description=str(exception),
         )
 
+    def add_event(self,
+                  name: str,
+                  attributes: dict[str, Any] = None,
+                  timestamp: Optional[int] = None) -> None:
+        self._span.add_event(name=name, attributes=clean_attributes(attributes), timestamp=timestamp)
+
     def get_trace_id(self) -> str:
         """Get the trace ID of the span.
         Returns:
@@ -339,6 +374,8 @@ def configure_otlp_provider(
     """
     from aworld.metrics.opentelemetry.opentelemetry_adapter import build_otel_resource
     backends = backends or ["logfire"]
+    if kwargs.get("max_attribute_bytes") is not None:
+        set_max_attribute_bytes(kwargs.get("max_attribute_bytes"))
     processor = SynchronousMultiSpanProcessor()
     processor.add_span_processor(BatchSpanProcessor(
         SpanConsumerExporter(span_consumers)))
@@ -379,7 +416,7 @@ def configure_otlp_provider(
             processor.add_span_processor(BatchSpanProcessor(span_exporter))
 
     id_generator = kwargs.get("id_generator")
-    set_tracer_provider(OTLPTraceProvider(SDKTracerProvider(active_span_processor=processor,
+    set_tracer_provider(OTLPTraceProvider(SDKTracerProvider(active_span_processor=DeferredAttributeSpanProcessor(processor),
                                                             resource=build_otel_resource(),
                                                             id_generator=id_generator)))
 
@@ -426,6 +463,117 @@ def _configure_otlp_exporter(base_url: str = None, **kwargs) -> None:
     )
 
 
+class DeferredAttributeSpanProcessor(SpanProcessor):
+    """Span processor resolving the lazy attributes of ended spans on its worker thread.
+
+    Spans without lazy attributes are passed to the delegate processor directly, the others once their
+    attributes are serialized, so the traced code only pays for building the lazy attribute.
+    """
+
+    def __init__(self, delegate: SpanProcessor, max_queue_size: int = 2048):
+        self._delegate = delegate
+        self._queue: queue.Queue = queue.Queue(max_queue_size)
+        self._worker = threading.Thread(target=self._run, name="aworld-trace-attributes", daemon=True)
+        self._worker.start()
+
+    def on_start(self, span, parent_context=None) -> None:
+        self._delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        # handed over by `_end_with_lazy_attributes`, on_end runs in the `end` call of the span
+        lazy_attributes, _ending.lazy_attributes = getattr(_ending, "lazy_attributes", None), None
+        if not lazy_attributes:
+            self._delegate.on_end(span)
+            return
+        try:
+            self._queue.put_nowait((span, lazy_attributes))
+        except queue.Full:
+            # backpressure, serialize on the caller
+            self._delegate.on_end(self._resolve(span, lazy_attributes))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                span, lazy_attributes = item
+                self._delegate.on_end(self._resolve(span, lazy_attributes))
+            except Exception as e:
+                logger.warning(f"Failed to export span with lazy attributes: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _resolve(self, span: ReadableSpan, lazy_attributes: Dict[str, LazyAttribute]) -> ReadableSpan:
+        return ReadableSpan(name=span.name,
+                            context=span.context,
+                            parent=span.parent,
+                            resource=span.resource,
+                            attributes={**(span.attributes or {}), **resolve_lazy_attributes(lazy_attributes)},
+                            events=span.events,
+                            links=span.links,
+                            kind=span.kind,
+                            status=span.status,
+                            start_time=span.start_time,
+                            end_time=span.end_time,
+                            instrumentation_scope=span.instrumentation_scope)
+
+    def _wait_queue(self, timeout_millis: int) -> bool:
+        deadline = time.monotonic() + timeout_millis / 1000
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        timeout_millis = 30000 if timeout_millis is None else timeout_millis
+        flushed = self._wait_queue(timeout_millis)
+        return self._delegate.force_flush(timeout_millis) and flushed
+
+    def shutdown(self) -> None:
+        self._wait_queue(30000)
+        self._queue.put(None)
+        self._worker.join(timeout=5)
+        self._delegate.shutdown()
+
+
+# attribute of the sdk spans holding their lazy attributes
+_LAZY_ATTRIBUTES = "_aworld_lazy_attributes"
+# lazy attributes of the span ending on the thread, for the `DeferredAttributeSpanProcessor`
+_ending = threading.local()
+
+
+def _end_with_lazy_attributes(span: SDKSpan, end: Callable[[], Any]) -> Any:
+    """End the span by `end`, its lazy attributes go to the deferred processor or are resolved before."""
+    lazy_attributes = getattr(span, "__dict__", {}).pop(_LAZY_ATTRIBUTES, None)
+    if not lazy_attributes:
+        return end()
+    if not isinstance(getattr(span, "_span_processor", None), DeferredAttributeSpanProcessor):
+        # no processor resolving them on export, resolve before the span is read only
+        span.set_attributes(resolve_lazy_attributes(lazy_attributes))
+        return end()
+    _ending.lazy_attributes = lazy_attributes
+    try:
+        return end()
+    finally:
+        _ending.lazy_attributes = None
+
+
+def resolve_lazy_attributes(attributes: Dict[str, LazyAttribute]) -> Dict[str, Any]:
+    return clean_attributes({k: v.resolve() for k, v in attributes.items()})
+
+
+def clean_attributes(attributes: Optional[dict]) -> dict:
+    """Valid attributes with the string values capped to the attribute byte budget."""
+    result = {}
+    for k, v in (attributes or {}).items():
+        v = limit_attribute_value(v)
+        if is_valid_attribute_value(k, v):
+            result[k] = v
+    return result
+
+
 def is_valid_attribute_value(k, v):
     valid = True
     if not v:
@@ -1,6 +1,9 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
 import asyncio
+import atexit
+import concurrent.futures
+import contextvars
 import importlib.util
 import inspect
 import json
@@ -188,17 +191,152 @@ def asyncio_loop():
     return loop
 
 
+class BackgroundLoop:
+    """Process-wide event loop running in a daemon thread, to run coroutines from sync code.
+
+    Coroutines are submitted thread-safely and run as tasks of the loop in the context (contextvars) of
+    the caller, so resources bound to the loop, like connection pools, are reused across calls. At most
+    `max_concurrency` submissions run at the same time, the loop is stopped at exit and recreated lazily
+    in forked children.
+    """
+
+    def __init__(self, max_concurrency: int = 256):
+        self.max_concurrency = max_concurrency
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop = None
+        self._thread: threading.Thread = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    ready = threading.Event()
+                    self._thread = threading.Thread(target=self._run, args=(loop, ready),
+                                                    name="aworld-background-loop", daemon=True)
+                    self._thread.start()
+                    ready.wait()
+                    self._loop = loop
+        return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and self._thread is threading.current_thread()
+
+    def submit(self, async_func: Callable[..., Any], args: tuple = (), kwargs: dict = None,
+               timeout: float = None) -> Any:
+        """Run the coroutine function in the loop and wait for its result.
+
+        Raises:
+            TimeoutError: The result is not available in `timeout` seconds, the task is cancelled.
+        """
+        if self.in_loop_thread():
+            raise RuntimeError("BackgroundLoop.submit would block its own loop.")
+        if not self._semaphore.acquire(timeout=-1 if timeout is None else timeout):
+            raise TimeoutError(f"No free slot of the background loop in {timeout}s")
+        try:
+            loop = self.loop
+            future = concurrent.futures.Future()
+            tasks = []
+
+            def start():
+                # runs in the caller's context, copied by the task
+                try:
+                    task = loop.create_task(async_func(*args, **(kwargs or {})))
+                except BaseException as e:
+                    future.set_exception(e)
+                    return
+                tasks.append(task)
+                task.add_done_callback(lambda t: _copy_result(t, future))
+
+            loop.call_soon_threadsafe(start, context=contextvars.copy_context())
+            try:
+                return future.result(timeout)
+            except concurrent.futures.TimeoutError:
+                loop.call_soon_threadsafe(lambda: [task.cancel() for task in tasks])
+                raise TimeoutError(f"{getattr(async_func, '__name__', async_func)} timeout after {timeout}s")
+        finally:
+            self._semaphore.release()
+
+    def shutdown(self, timeout: float = 5):
+        """Cancel the pending tasks and stop the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or loop.is_closed():
+            return
+
+        async def _cancel():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Background loop shutdown: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    def _reset_after_fork(self):
+        # the loop thread does not exist in the child
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._loop, self._thread = None, None
+
+
+def _copy_result(task: asyncio.Task, future: concurrent.futures.Future):
+    if future.done():
+        return
+    if task.cancelled():
+        future.cancel()
+    elif task.exception() is not None:
+        future.set_exception(task.exception())
+    else:
+        future.set_result(task.result())
+
+
+_background_loop = BackgroundLoop(int(os.environ.get("AWORLD_SYNC_EXEC_CONCURRENCY", 256)))
+atexit.register(_background_loop.shutdown)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_background_loop._reset_after_fork)
+
+
+def background_loop() -> BackgroundLoop:
+    """The process-wide background loop used by `sync_exec`."""
+    return _background_loop
+
+
 def sync_exec(async_func: Callable[..., Any], *args, **kwargs):
-    """Async function to sync execution."""
+    """Async function to sync execution.
+
+    In a thread with a running loop, the coroutine runs in the process-wide background loop, the timeout
+    is `AWORLD_SYNC_EXEC_TIMEOUT` seconds if set.
+    """
     if not asyncio.iscoroutinefunction(async_func):
         return async_func(*args, **kwargs)
 
     loop = asyncio_loop()
     if loop and loop.is_running():
-        thread = ReturnThread(async_func, *args, **kwargs)
-        thread.start()
-        thread.join()
-        result = thread.result
+        if _background_loop.in_loop_thread():
+            # blocking the background loop on itself would deadlock
+            thread = ReturnThread(async_func, *args, **kwargs)
+            thread.start()
+            thread.join()
+            return thread.result
+        timeout = os.environ.get("AWORLD_SYNC_EXEC_TIMEOUT")
+        result = _background_loop.submit(async_func, args, kwargs, timeout=float(timeout) if timeout else None)
     else:
         try:
             loop = asyncio.get_event_loop()
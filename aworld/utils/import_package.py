@@ -1,10 +1,7 @@
 # coding: utf-8
 # Copyright (c) 2025 inclusionAI.
-import os.path
-import time
-import sys
+import functools
 import importlib
-import subprocess
 from importlib import metadata
 from aworld.logs.util import logger
 
@@ -17,6 +14,7 @@ class ModuleAlias:
         return getattr(self.module, name)
 
 
+@functools.lru_cache(maxsize=None)
 def is_package_installed(package_name: str, version: str = "") -> bool:
     """
     Check if package is already installed and matches version if specified.
@@ -32,15 +30,12 @@ def is_package_installed(package_name: str, version: str = "") -> bool:
         dist = metadata.distribution(package_name)
 
         if version and dist.version != version:
-            logger.info(f"Package {package_name} is installed but version {dist.version} "
-                        f"does not match required version {version}")
+            logger.debug(f"Package {package_name} is installed but version {dist.version} "
+                         f"does not match required version {version}")
             return False
-
-        logger.info(f"Package {package_name} is already installed (version: {dist.version})")
         return True
 
     except metadata.PackageNotFoundError:
-        logger.info(f"Package {package_name} is not installed")
         return False
     except Exception as e:
         logger.warning(f"Error checking if {package_name} is installed: {str(e)}")
@@ -49,7 +44,7 @@ def is_package_installed(package_name: str, version: str = "") -> bool:
 
 def import_packages(packages: list[str]) -> dict:
     """
-    Import and install multiple packages
+    Import multiple packages
 
     Args:
         packages: List of packages to import
@@ -76,181 +71,46 @@ def import_package(
         retry_delay: int = 5
 ) -> object:
     """
-    Import and install package if not available.
+    Import an optional dependency, the result of the probe is cached.
+
+    Nothing is installed at runtime, a missing package raises an ImportError with the command to install it.
+    `installer`, `timeout`, `retry_count` and `retry_delay` are kept for compatibility and are not used.
 
     Args:
         package_name: Name of the package to import
         alias: Alias to use for the imported module
         install_name: Name of the package to install (if different from import name)
-        version: Required version of the package
-        installer: Package installer to use ('pip' or 'conda')
-        timeout: Installation timeout in seconds
-        retry_count: Number of installation retries if install fails
-        retry_delay: Delay between retries in seconds
+        version: Expected version of the package, a mismatch is only warned
 
     Returns:
         Imported module
 
     Raises:
         ValueError: If input parameters are invalid
-        ImportError: If package cannot be imported or installed
-        TimeoutError: If installation exceeds timeout
+        ImportError: If package cannot be imported
     """
-    # Validate input parameters
     if not package_name:
         raise ValueError("Package name cannot be empty")
 
-    if installer not in ['pip', 'conda']:
-        raise ValueError(f"Unsupported installer: {installer}")
+    module = _probe(package_name, install_name or package_name, version)
+    return ModuleAlias(module) if alias else module
 
-    # Use package_name as install_name if not provided
-    real_install_name = install_name if install_name else package_name
 
-    # First, check if we need to install the package
-    need_install = False
-
-    # Try to import the module first
+@functools.lru_cache(maxsize=None)
+def _probe(package_name: str, install_name: str, version: str):
     try:
-        logger.debug(f"Attempting to import {package_name}")
         module = importlib.import_module(package_name)
-        logger.debug(f"Successfully imported {package_name}")
-
-        # If we successfully imported the module, check version if specified
-        if version:
-            try:
-                # For packages with different import and install names,
-                # we need to check the install name for version info
-                installed_version = metadata.version(real_install_name)
-                if installed_version != version:
-                    logger.warning(
-                        f"Package {real_install_name} version mismatch. "
-                        f"Required: {version}, Installed: {installed_version}"
-                    )
-                    need_install = True
-            except metadata.PackageNotFoundError:
-                logger.warning(f"Could not determine version for {real_install_name}")
-
-        # If no need to reinstall for version mismatch, return the module
-        if not need_install:
-            return ModuleAlias(module) if alias else module
-
-    except ImportError as import_err:
-        logger.info(f"Could not import {package_name}: {str(import_err)}")
-        # Check if the package is installed
-        if not is_package_installed(real_install_name, version):
-            need_install = True
-        else:
-            # If package is installed but import failed, there might be an issue with dependencies
-            # or the package itself. Still, let's try to reinstall it.
-            logger.warning(f"Package {real_install_name} is installed but import of {package_name} failed. "
-                           f"Will attempt reinstallation.")
-            need_install = True
-
-    # Install the package if needed
-    if need_install:
-        logger.info(f"Installation needed for {real_install_name}")
-
-        # Attempt installation with retries
-        for attempt in range(retry_count):
-            try:
-                cmd = _get_install_command(installer, real_install_name, version)
-                logger.info(f"Installing {real_install_name} with command: {' '.join(cmd)}")
-                _execute_install_command(cmd, timeout)
-
-                # Break out of retry loop if installation succeeds
-                break
-
-            except (ImportError, TimeoutError, subprocess.SubprocessError) as e:
-                if attempt < retry_count - 1:
-                    logger.warning(
-                        f"Installation attempt {attempt + 1} failed: {str(e)}. Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    logger.error(f"All installation attempts failed for {real_install_name}")
-                    raise ImportError(f"Failed to install {real_install_name} after {retry_count} attempts: {str(e)}")
-
-    # Try importing after installation
-    try:
-        logger.debug(f"Attempting to import {package_name} after installation")
-        module = importlib.import_module(package_name)
-        logger.debug(f"Successfully imported {package_name}")
-        return ModuleAlias(module) if alias else module
     except ImportError as e:
-        error_msg = f"Failed to import {package_name} even after installation of {real_install_name}: {str(e)}"
-        logger.error(error_msg)
-
-
-def _get_install_command(installer: str, package_name: str, version: str = "") -> list:
-    """
-    Generate installation command based on specified installer.
-
-    Args:
-        installer: Package installer to use ('pip' or 'conda')
-        package_name: Name of the package to install
-        version: Required version of the package
-
-    Returns:
-        list: Command as a list of strings
-
-    Raises:
-        ValueError: If unsupported installer is specified
-    """
-    if installer == 'pip':
-        # Use sys.executable to ensure the right Python interpreter is used
-        pytho3 = os.path.basename(sys.executable)
-        cmd = [sys.executable, '-m', 'pip', 'install', '--upgrade']
-        if version:
-            cmd.append(f'{package_name}=={version}')
-        else:
-            cmd.append(package_name)
-    elif installer == 'conda':
-        cmd = ['conda', 'install', '-y', package_name]
-        if version:
-            cmd.extend([f'={version}'])
-    else:
-        raise ValueError(f"Unsupported installer: {installer}")
-
-    return cmd
-
-
-def _execute_install_command(cmd: list, timeout: int) -> None:
-    """
-    Execute package installation command.
-
-    Args:
-        cmd: Installation command as list of strings
-        timeout: Installation timeout in seconds
-
-    Raises:
-        TimeoutError: If installation exceeds timeout
-        ImportError: If installation fails
-    """
-    logger.info(f"Executing: {' '.join(cmd)}")
-
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE
-    )
-
-    try:
-        stdout, stderr = process.communicate(timeout=timeout)
-
-        # Log installation output for debugging
-        if stdout:
-            logger.debug(f"Installation stdout: {stdout.decode()}")
-        if stderr:
-            logger.debug(f"Installation stderr: {stderr.decode()}")
-
-    except subprocess.TimeoutExpired:
-        process.kill()
-        error_msg = f"Package installation timed out after {timeout} seconds"
-        logger.error(error_msg)
-        raise TimeoutError(error_msg)
-
-    if process.returncode != 0:
-        error_msg = f"Installation failed with code {process.returncode}: {stderr.decode()}"
-        logger.error(error_msg)
-        raise ImportError(error_msg)
-
-    logger.info("Installation completed successfully")
\ No newline at end of file
+        requirement = f"{install_name}=={version}" if version else install_name
+        raise ImportError(f"Optional dependency {package_name} is not available, "
+                          f"install it with `pip install {requirement}`: {e}") from e
+
+    if version:
+        try:
+            installed_version = metadata.version(install_name)
+            if installed_version != version:
+                logger.warning(f"Package {install_name} version mismatch. "
+                               f"Required: {version}, Installed: {installed_version}")
+        except metadata.PackageNotFoundError:
+            logger.warning(f"Could not determine version for {install_name}")
+    return module
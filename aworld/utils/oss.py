@@ -4,9 +4,14 @@ oss.py
 Utility class for OSS (Object Storage Service) operations.
 Provides simple methods for data operations: upload, read, delete, update.
 """
+import asyncio
 import os
 import json
 import tempfile
+import threading
+import time
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, List, Any, Tuple, Union, BinaryIO, TextIO, IO, AnyStr
 
 from aworld.utils import import_package
@@ -135,6 +140,41 @@ class OSSClient:
             logger.warn(f"Failed to upload data to OSS: {str(e)}")
             return None
 
+    async def async_upload_data(self, data: Union[IO[AnyStr], str, bytes, dict], oss_key: str) -> Optional[dict]:
+        """
+        Upload data to OSS through the bounded upload queue without blocking the event loop,
+        accepts the same data types as `upload_data`.
+
+        Returns:
+            dict: {"oss_key": oss_key, "oss_url": url} if successful, None otherwise
+        """
+        if not self.initialize():
+            logger.warn("OSS client not initialized or export is disabled")
+            return None
+
+        if isinstance(data, str) and os.path.isfile(data):
+            future = self.upload_queue().submit(oss_key, filename=data)
+        else:
+            if hasattr(data, 'read'):
+                data = data.read()
+            if isinstance(data, dict):
+                data = json.dumps(data, ensure_ascii=False)
+            if isinstance(data, str):
+                data = data.encode('utf-8')
+            future = self.upload_queue().submit(oss_key, data)
+        try:
+            await asyncio.wrap_future(future)
+            return {"oss_key": oss_key, "oss_url": self.get_object_url(oss_key)}
+        except Exception as e:
+            logger.warn(f"Failed to upload data to OSS: {str(e)}")
+            return None
+
+    def upload_queue(self) -> "OSSUploadQueue":
+        """The upload queue of the client bucket, created on first use."""
+        if getattr(self, "_upload_queue", None) is None:
+            self._upload_queue = OSSUploadQueue(self.bucket)
+        return self._upload_queue
+
     def read_data(self, oss_key: str, as_json: bool = False) -> Union[bytes, dict, str, None]:
         """
         Read data from OSS.
@@ -428,6 +468,145 @@ class OSSClient:
         return True, uploaded_files
 
 
+class OSSUploadQueue:
+    """
+    Background OSS uploads with bounded concurrency and retries.
+
+    Uploads of the same key are applied in submission order, payloads above `multipart_threshold`
+    are sent as multipart uploads. `submit` returns a `concurrent.futures.Future`, use
+    `asyncio.wrap_future` to await it from a coroutine.
+    """
+
+    def __init__(self,
+                 bucket,
+                 max_concurrency: int = 4,
+                 max_retries: int = 3,
+                 retry_backoff: float = 0.5,
+                 multipart_threshold: int = 8 * 1024 * 1024,
+                 part_size: int = 4 * 1024 * 1024):
+        self.bucket = bucket
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.multipart_threshold = multipart_threshold
+        self.part_size = part_size
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="oss-upload")
+        self._lock = threading.Lock()
+        # latest upload and its payload by key, for ordering and read-your-writes
+        self._last: Dict[str, Future] = {}
+        self._pending: Dict[str, bytes] = {}
+
+    def submit(self,
+               oss_key: str,
+               data: Optional[bytes] = None,
+               filename: Optional[str] = None,
+               depends_on: Optional[Future] = None,
+               skip_existing: bool = False) -> Future:
+        """
+        Queue the upload of `data`, or of the local file `filename`, to `oss_key`.
+
+        Args:
+            oss_key: The key (path) in OSS where the data will be stored
+            data: Bytes to upload
+            filename: Local file to upload instead of data
+            depends_on: Upload which must succeed before this one starts, e.g. the blob a record references
+            skip_existing: Do not upload if the key exists, for content addressed keys
+        """
+        with self._lock:
+            previous = self._last.get(oss_key)
+            future = self._executor.submit(self._upload, oss_key, data, filename, previous, depends_on, skip_existing)
+            self._last[oss_key] = future
+            if data is not None:
+                self._pending[oss_key] = data
+            else:
+                self._pending.pop(oss_key, None)
+        future.add_done_callback(lambda f: self._done(oss_key, f))
+        return future
+
+    def pending_data(self, oss_key: str) -> Optional[bytes]:
+        """The payload of a queued upload of the key which is not finished yet."""
+        with self._lock:
+            return self._pending.get(oss_key)
+
+    def _done(self, oss_key: str, future: Future):
+        with self._lock:
+            if self._last.get(oss_key) is future:
+                self._last.pop(oss_key, None)
+                self._pending.pop(oss_key, None)
+        if future.exception() is not None:
+            logger.warn(f"Failed to upload {oss_key} to OSS: {future.exception()}")
+
+    def _upload(self,
+                oss_key: str,
+                data: Optional[bytes],
+                filename: Optional[str],
+                previous: Optional[Future],
+                depends_on: Optional[Future],
+                skip_existing: bool = False):
+        # both were submitted before this upload, the executor is FIFO so they are running or done
+        if previous is not None:
+            # an earlier upload of the same key only orders this one, its failure is not ours
+            try:
+                previous.result()
+            except Exception:
+                pass
+        if depends_on is not None:
+            depends_on.result()
+
+        size = os.path.getsize(filename) if filename else len(data)
+        for attempt in range(self.max_retries + 1):
+            try:
+                if skip_existing and self.bucket.object_exists(oss_key):
+                    return oss_key
+                if size > self.multipart_threshold:
+                    self._multipart_upload(oss_key, data, filename, size)
+                elif filename:
+                    self.bucket.put_object_from_file(oss_key, filename)
+                else:
+                    self.bucket.put_object(oss_key, data)
+                return oss_key
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+                logger.info(f"Upload {oss_key} to OSS failed ({e}), retry {attempt + 1}/{self.max_retries}")
+                time.sleep(self.retry_backoff * (2 ** attempt))
+
+    def _multipart_upload(self, oss_key: str, data: Optional[bytes], filename: Optional[str], size: int):
+        from oss2.models import PartInfo
+
+        upload_id = self.bucket.init_multipart_upload(oss_key).upload_id
+        try:
+            parts = []
+            with (open(filename, 'rb') if filename else nullcontext()) as f:
+                for number, offset in enumerate(range(0, size, self.part_size), start=1):
+                    chunk = f.read(self.part_size) if filename else data[offset:offset + self.part_size]
+                    result = self.bucket.upload_part(oss_key, upload_id, number, chunk)
+                    parts.append(PartInfo(number, result.etag))
+            self.bucket.complete_multipart_upload(oss_key, upload_id, parts)
+        except Exception:
+            self.bucket.abort_multipart_upload(oss_key, upload_id)
+            raise
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the queued uploads, return False on timeout."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                futures = list(self._last.values())
+            if not futures:
+                return True
+            for future in futures:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                try:
+                    future.result(remaining)
+                except Exception:
+                    pass
+
+    def close(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+
 def get_oss_client(access_key_id: Optional[str] = None,
                    access_key_secret: Optional[str] = None,
                    endpoint: Optional[str] = None,
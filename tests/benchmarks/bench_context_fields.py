@@ -0,0 +1,76 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""Logical schema field resolution in a deep `ApplicationContext` hierarchy, as done by prompt templates.
+
+The fields are spread over the levels of the hierarchy and resolved from the deepest context. `cold` renders
+write the hierarchy before each render, every field walks up the parent chain; `warm` renders reuse the
+resolutions memoized for the current hierarchy generation.
+
+Usage: python -m tests.benchmarks.bench_context_fields [--depth 10] [--fields 100] [--missing 10] [--renders 200]
+"""
+import argparse
+import json
+import time
+
+from aworld.core.context.amni import ApplicationContext, StateScopes
+from aworld.core.context.amni.state import ApplicationTaskContextState, TaskInput, TaskWorkingState, TaskOutput
+
+
+def build_hierarchy(depth: int, fields: int, missing: int) -> ApplicationContext:
+    """Contexts of `depth` levels, field `i` is put at level `i % depth`, the last `missing` fields nowhere."""
+    contexts = []
+    for level in range(depth):
+        task_input = TaskInput(user_id="user", session_id="session", task_id=f"task_{level}",
+                               task_content=f"task {level}", origin_user_input="question")
+        contexts.append(ApplicationContext(
+            task_state=ApplicationTaskContextState(task_input=task_input,
+                                                   working_state=TaskWorkingState(kv_store={}),
+                                                   task_output=TaskOutput()),
+            parent=contexts[-1] if contexts else None))
+    for i in range(fields - missing):
+        contexts[i % depth].put(f"field_{i}", f"value_{i}")
+    return contexts[-1]
+
+
+def render(context: ApplicationContext, keys) -> list:
+    return [ApplicationContext.get_logical_schema_field(key=key, context=context) for key in keys]
+
+
+def measure(context: ApplicationContext, keys, renders: int, cold: bool) -> float:
+    root = context.root
+    begin = time.perf_counter()
+    for _ in range(renders):
+        if cold:
+            root.bump_state_version(StateScopes.WORKING_STATE)
+        render(context, keys)
+    return (time.perf_counter() - begin) / renders * 1e6
+
+
+def main(depth: int, fields: int, missing: int, renders: int):
+    context = build_hierarchy(depth, fields, missing)
+    keys = [f"field_{i}" for i in range(fields)]
+    # resolutions are identical, cached or not
+    context.root.bump_state_version(StateScopes.WORKING_STATE)
+    assert render(context, keys) == render(context, keys)
+
+    cold = measure(context, keys, max(renders // 10, 1), cold=True)
+    warm = measure(context, keys, renders, cold=False)
+    print(json.dumps({
+        "depth": depth,
+        "fields_per_render": fields,
+        "missing_fields": missing,
+        "cold_render_us": round(cold, 3),
+        "warm_render_us": round(warm, 3),
+        "warm_field_us": round(warm / fields, 3),
+        "speedup": round(cold / warm, 1),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--fields", type=int, default=100)
+    parser.add_argument("--missing", type=int, default=10, help="fields found in no context, a full walk")
+    parser.add_argument("--renders", type=int, default=200)
+    args = parser.parse_args()
+    main(args.depth, args.fields, args.missing, args.renders)
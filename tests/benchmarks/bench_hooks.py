@@ -0,0 +1,78 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""Overhead of `Agent.run_hooks` per model call, without hooks and with registered hooks.
+
+Usage: python -m tests.benchmarks.bench_hooks [--calls 100000] [--hooks 2]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from aworld.agents.llm_agent import Agent
+from aworld.config.conf import AgentConfig
+from aworld.core.context.base import Context
+from aworld.core.event.base import Message
+from aworld.runners.hook.hook_factory import HookFactory
+from aworld.runners.hook.hooks import HookPoint, PreLLMCallHook
+
+
+class NoopHook(PreLLMCallHook):
+    async def exec(self, message: Message, context: Context = None) -> Message:
+        return None
+
+
+def legacy_hooks(name: str):
+    """The dispatch before the cached table, rebuilt and re-instantiated on every call."""
+    vals = list(filter(lambda s: not s.startswith('__'), dir(HookPoint)))
+    results = {val.lower(): [] for val in vals}
+    for k, v in HookFactory._cls.items():
+        hook = v()
+        if name and hook.point() != name:
+            continue
+        results.get(hook.point(), []).append(hook)
+    return results
+
+
+async def run_hooks(agent: Agent, context: Context, calls: int) -> float:
+    begin = time.perf_counter()
+    for _ in range(calls):
+        async for _ in agent.run_hooks(context, HookPoint.PRE_LLM_CALL):
+            pass
+    return (time.perf_counter() - begin) / calls * 1e6
+
+
+def legacy(calls: int) -> float:
+    begin = time.perf_counter()
+    for _ in range(calls):
+        legacy_hooks(HookPoint.PRE_LLM_CALL).get(HookPoint.PRE_LLM_CALL, [])
+    return (time.perf_counter() - begin) / calls * 1e6
+
+
+async def main(calls: int, hooks: int):
+    agent = Agent(name="bench", conf=AgentConfig(llm_provider="openai", llm_model_name="bench",
+                                                 llm_api_key="bench", llm_base_url="http://localhost"))
+    context = Context()
+    results = {"calls": calls,
+               "no_hooks_us": round(await run_hooks(agent, context, calls), 3),
+               "legacy_no_hooks_dispatch_us": round(legacy(calls), 3)}
+
+    names = [f"bench_noop_{i}" for i in range(hooks)]
+    for name in names:
+        HookFactory.register(name=name)(type(name, (NoopHook,), {}))
+    try:
+        results["hooks"] = hooks
+        results["with_hooks_us"] = round(await run_hooks(agent, context, calls // 10), 3)
+        results["legacy_with_hooks_dispatch_us"] = round(legacy(calls // 10), 3)
+    finally:
+        for name in names:
+            HookFactory.unregister(name)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=100000)
+    parser.add_argument("--hooks", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.hooks))
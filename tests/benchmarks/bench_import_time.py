@@ -0,0 +1,54 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""Startup cost of `import aworld`, measured with `python -X importtime` in fresh interpreters.
+
+Usage: python -m tests.benchmarks.bench_import_time [--module aworld] [--runs 5] [--top 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def import_time(module: str = "aworld", then: str = "") -> Dict[str, int]:
+    """Cumulative import time in microseconds of every module imported by `import <module>`,
+    and by the statements `then` run after it."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}\n{then}"],
+                            capture_output=True, text=True, env=env, cwd=ROOT, check=True)
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+def main(module: str, runs: int, top: int):
+    samples = [import_time(module) for _ in range(runs)]
+    totals = [sample[module] for sample in samples]
+    slowest = sorted(samples[-1].items(), key=lambda item: -item[1])[:top]
+    print(json.dumps({
+        "module": module,
+        "runs": runs,
+        "p50_ms": round(statistics.median(totals) / 1000, 2),
+        "max_ms": round(max(totals) / 1000, 2),
+        "modules": len(samples[-1]),
+        "slowest_ms": {name: round(total / 1000, 2) for name, total in slowest},
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default="aworld")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    main(args.module, args.runs, args.top)
@@ -0,0 +1,218 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""End-to-end `TaskEventRunner` benchmark with a local mock LLM provider and a mock tool.
+
+Runs N concurrent tasks of M steps. Each step goes through message building, the event bus, the
+handlers, the agent, one tool call, and the memory and trace writes. The LLM and tool latencies and the
+token sizes are configurable and deterministic. The result is printed as JSON, to compare with a
+saved baseline offline.
+
+Usage: python -m tests.benchmarks.bench_runner [--tasks 8] [--steps 5] [--llm-latency 0.01]
+       [--tool-latency 0.005] [--tokens 200] [--log-level WARNING] [--tracemalloc] [--output result.json]
+"""
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from aworld.agents.llm_agent import Agent
+from aworld.config.conf import AgentConfig
+from aworld.core.common import ToolActionInfo, ParamInfo, ActionModel, ActionResult
+from aworld.core.llm_provider import LLMProviderBase
+from aworld.core.task import Task
+from aworld.core.tool.action import ToolAction, ExecutableAction
+from aworld.core.tool.action_factory import ActionFactory
+from aworld.core.tool.base import ToolFactory
+from aworld.logs.util import logger
+from aworld.models.llm import register_llm_provider
+from aworld.models.model_response import ModelResponse, ToolCall, Function
+from aworld.runner import Runners
+from aworld.tools.async_template_tool import TemplateTool
+
+PROVIDER = "bench_mock"
+TOOL = "bench_tool"
+ACTION = "bench_action"
+# registered with `asyn`, the name of the tool instance
+ASYNC_TOOL = f"async_{TOOL}"
+
+
+class BenchSettings:
+    steps = 5
+    llm_latency = 0.01
+    tool_latency = 0.005
+    tokens = 200
+    # task input -> monotonic times of the model calls
+    calls: Dict[str, List[float]] = defaultdict(list)
+    tool_calls = 0
+
+
+class BenchAction(ToolAction):
+    BENCH_ACTION = ToolActionInfo(
+        name=ACTION,
+        input_params={"payload": ParamInfo(name="payload", type="str", required=True, desc="payload")},
+        desc="benchmark action.")
+
+
+@ActionFactory.register(name=ACTION, desc="benchmark action.", tool_name=TOOL)
+class BenchExecuteAction(ExecutableAction):
+    async def async_act(self, action: ActionModel, **kwargs) -> Tuple[ActionResult, Any]:
+        await asyncio.sleep(BenchSettings.tool_latency)
+        BenchSettings.tool_calls += 1
+        payload = action.params.get("payload", "")
+        return ActionResult(content=f"observed {len(payload)} chars", keep=True), None
+
+
+@ToolFactory.register(name=TOOL, desc="benchmark tool", asyn=True, supported_action=BenchAction)
+class BenchTool(TemplateTool):
+    """Benchmark tool, sleeps `tool_latency` per action."""
+
+
+class MockProvider(LLMProviderBase):
+    """Deterministic provider, calls the benchmark tool `steps - 1` times then answers."""
+
+    def _init_provider(self):
+        return None
+
+    def postprocess_response(self, response):
+        return response
+
+    def completion(self, messages, temperature=0.0, max_tokens=None, stop=None, **kwargs):
+        raise NotImplementedError("the benchmark provider is async only")
+
+    async def acompletion(self, messages, temperature=0.0, max_tokens=None, stop=None, **kwargs):
+        task_input = next((m["content"] for m in messages if m.get("role") == "user"), "")
+        calls = BenchSettings.calls[task_input]
+        calls.append(time.perf_counter())
+        step = len(calls) - 1
+        await asyncio.sleep(BenchSettings.llm_latency)
+
+        words = " ".join(f"w{i}" for i in range(BenchSettings.tokens))
+        usage = {"completion_tokens": BenchSettings.tokens, "prompt_tokens": len(messages) * 10,
+                 "total_tokens": BenchSettings.tokens + len(messages) * 10}
+        if step + 1 < BenchSettings.steps:
+            tool_call = ToolCall(id=f"call_{step}",
+                                 function=Function(name=f"{ASYNC_TOOL}__{ACTION}",
+                                                   arguments=json.dumps({"payload": words})))
+            return ModelResponse(id=f"bench_{step}", model="bench", content="", tool_calls=[tool_call],
+                                 usage=usage)
+        return ModelResponse(id=f"bench_{step}", model="bench", content=words, usage=usage)
+
+
+register_llm_provider(PROVIDER, MockProvider)
+
+
+def build_task(i: int) -> Task:
+    agent = Agent(name=f"bench_agent_{i}",
+                  conf=AgentConfig(llm_provider=PROVIDER, llm_model_name="bench", llm_api_key="bench",
+                                   llm_base_url="http://localhost"),
+                  system_prompt="You are a benchmark agent.",
+                  tool_names=[ASYNC_TOOL])
+    return Task(input=f"benchmark task {i}", agent=agent)
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(round(q / 100 * (len(values) - 1))), len(values) - 1)]
+
+
+async def run(tasks: int, concurrency: int) -> Dict[str, Any]:
+    BenchSettings.calls.clear()
+    BenchSettings.tool_calls = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            task = build_task(i)
+            return (await Runners.run_task(task))[task.id]
+
+    blocks = sys.getallocatedblocks()
+    begin = time.perf_counter()
+    responses = await asyncio.gather(*[one(i) for i in range(tasks)])
+    elapsed = time.perf_counter() - begin
+    blocks = sys.getallocatedblocks() - blocks
+
+    step_latencies = []
+    for times in BenchSettings.calls.values():
+        step_latencies.extend(later - earlier for earlier, later in zip(times, times[1:]))
+    steps = sum(len(times) for times in BenchSettings.calls.values())
+    fixed = BenchSettings.llm_latency + BenchSettings.tool_latency
+    return {
+        "succeeded": sum(1 for response in responses if response.success),
+        "steps": steps,
+        "tool_calls": BenchSettings.tool_calls,
+        "elapsed_s": round(elapsed, 4),
+        "tasks_per_s": round(tasks / elapsed, 3),
+        "steps_per_s": round(steps / elapsed, 3),
+        "step_latency_ms": {
+            "p50": round(percentile(step_latencies, 50) * 1000, 3),
+            "p90": round(percentile(step_latencies, 90) * 1000, 3),
+            "p99": round(percentile(step_latencies, 99) * 1000, 3),
+            "mean": round(statistics.fmean(step_latencies) * 1000, 3) if step_latencies else 0,
+        },
+        # the step latency without the mocked LLM and tool latencies
+        "step_overhead_ms_p50": round((percentile(step_latencies, 50) - fixed) * 1000, 3),
+        "retained_blocks_per_step": round(blocks / max(steps, 1), 1),
+    }
+
+
+async def main(args):
+    BenchSettings.steps = args.steps
+    BenchSettings.llm_latency = args.llm_latency
+    BenchSettings.tool_latency = args.tool_latency
+    BenchSettings.tokens = args.tokens
+    logger.reset_level(args.log_level)
+
+    # warm up imports, factories and the first model
+    await run(1, 1)
+    if args.tracemalloc:
+        tracemalloc.start()
+    result = await run(args.tasks, args.concurrency or args.tasks)
+    if args.tracemalloc:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["traced_peak_kb_per_step"] = round(peak / 1024 / max(result["steps"], 1), 2)
+        result["traced_retained_kb_per_step"] = round(current / 1024 / max(result["steps"], 1), 2)
+
+    report = {
+        "benchmark": "runner",
+        "params": {
+            "tasks": args.tasks,
+            "concurrency": args.concurrency or args.tasks,
+            "steps": args.steps,
+            "llm_latency_s": args.llm_latency,
+            "tool_latency_s": args.tool_latency,
+            "tokens": args.tokens,
+        },
+        "env": {"python": platform.python_version(), "platform": platform.platform()},
+        "result": result,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=0, help="concurrent tasks, all by default")
+    parser.add_argument("--steps", type=int, default=5)
+    parser.add_argument("--llm-latency", type=float, default=0.01)
+    parser.add_argument("--tool-latency", type=float, default=0.005)
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--log-level", default="WARNING", help="level of the aworld loggers during the run")
+    parser.add_argument("--tracemalloc", action="store_true", help="trace the allocations, slower")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,58 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""Session service append and get latency as the number of stored sessions grows.
+
+Usage: python -m tests.benchmarks.bench_session_service [--sessions 10000] [--samples 200]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+
+from aworld.cmd.data_model import ChatCompletionMessage
+from aworld.session.simple_session_service import SimpleSessionService
+
+
+def messages(i: int):
+    return [ChatCompletionMessage(role="user", content=f"question {i}"),
+            ChatCompletionMessage(role="assistant", content=f"answer {i} " * 20)]
+
+
+async def latency(service: SimpleSessionService, stored: int, samples: int):
+    append_costs, get_costs = [], []
+    for i in range(samples):
+        session_id = f"s{(i * 7919) % stored}"
+        begin = time.perf_counter()
+        await service.append_messages(f"u{(i * 7919) % stored % 100}", session_id, messages(i))
+        append_costs.append(time.perf_counter() - begin)
+        begin = time.perf_counter()
+        await service.get_session(f"u{(i * 7919) % stored % 100}", session_id)
+        get_costs.append(time.perf_counter() - begin)
+    return {
+        "sessions": stored,
+        "append_p50_ms": round(statistics.median(append_costs) * 1000, 3),
+        "get_p50_ms": round(statistics.median(get_costs) * 1000, 3),
+    }
+
+
+async def main(sessions: int, samples: int):
+    results = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        service = SimpleSessionService(data_dir)
+        stored = 0
+        for checkpoint in sorted({max(sessions // 100, 1), max(sessions // 10, 1), sessions}):
+            for i in range(stored, checkpoint):
+                await service.append_messages(f"u{i % 100}", f"s{i}", messages(i))
+            stored = checkpoint
+            results.append(await latency(service, stored, samples))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.samples))
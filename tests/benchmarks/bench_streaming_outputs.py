@@ -0,0 +1,77 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""Resident memory of StreamingOutputs over a long synthetic text-delta stream.
+
+A fast subscriber reads every chunk and a slow one lags behind with the configured policy.
+Usage: python -m tests.benchmarks.bench_streaming_outputs [--chunks 1000000] [--policy drop_oldest]
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import time
+
+from aworld.output import Output, StreamingOutputs, TextDeltaOutput
+
+
+def rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return round(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024, 1)
+    except OSError:
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+async def main(chunks: int, policy: str, max_buffer: int):
+    outputs = StreamingOutputs(max_buffer=max_buffer, slow_consumer_policy=policy)
+    fast = {"chars": 0, "outputs": 0}
+    slow = {"chars": 0, "outputs": 0}
+
+    async def consume(stats: dict, lag: int = 0):
+        async for output in outputs.stream_events():
+            stats["outputs"] += 1
+            if isinstance(output, TextDeltaOutput):
+                stats["chars"] += len(output.delta)
+            if lag and stats["outputs"] % lag == 0:
+                await asyncio.sleep(0.001)
+
+    consumers = [asyncio.create_task(consume(fast)), asyncio.create_task(consume(slow, lag=10))]
+    await asyncio.sleep(0)
+
+    samples = []
+    sent = 0
+    begin = time.perf_counter()
+    for i in range(chunks):
+        delta = f"token{i % 1000} "
+        sent += len(delta)
+        await outputs.add_output(TextDeltaOutput(delta=delta, task_id="bench"))
+        if i % 1000 == 0:
+            await outputs.add_output(Output(data=i))
+        await asyncio.sleep(0)
+        if i % (chunks // 10) == 0:
+            samples.append({"chunks": i, "rss_mb": rss_mb(), "buffered": len(outputs._buffer)})
+    await outputs.mark_completed()
+    await asyncio.gather(*consumers)
+
+    print(json.dumps({
+        "chunks": chunks,
+        "policy": policy,
+        "max_buffer": max_buffer,
+        "seconds": round(time.perf_counter() - begin, 2),
+        "sent_chars": sent,
+        "fast_chars": fast["chars"],
+        "fast_outputs": fast["outputs"],
+        "slow_chars": slow["chars"],
+        "slow_outputs": slow["outputs"],
+        "rss": samples,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunks", type=int, default=1000000)
+    parser.add_argument("--policy", default="coalesce")
+    parser.add_argument("--max-buffer", type=int, default=1024)
+    args = parser.parse_args()
+    asyncio.run(main(args.chunks, args.policy, args.max_buffer))
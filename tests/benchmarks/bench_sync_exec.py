@@ -0,0 +1,52 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+"""`sync_exec` called from a running loop, the background loop against a thread and a loop per call.
+
+Usage: python -m tests.benchmarks.bench_sync_exec [--calls 10000]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from aworld.utils.common import sync_exec, ReturnThread
+
+
+async def work(i: int):
+    await asyncio.sleep(0)
+    return i
+
+
+def thread_per_call(async_func, *args, **kwargs):
+    """`sync_exec` before the background loop."""
+    thread = ReturnThread(async_func, *args, **kwargs)
+    thread.start()
+    thread.join()
+    return thread.result
+
+
+async def measure(func, calls: int) -> float:
+    begin = time.perf_counter()
+    for i in range(calls):
+        assert func(work, i) == i
+    return time.perf_counter() - begin
+
+
+async def main(calls: int):
+    background = await measure(sync_exec, calls)
+    legacy = await measure(thread_per_call, calls)
+    print(json.dumps({
+        "calls": calls,
+        "background_loop_s": round(background, 3),
+        "background_loop_us_per_call": round(background / calls * 1e6, 1),
+        "thread_per_call_s": round(legacy, 3),
+        "thread_per_call_us_per_call": round(legacy / calls * 1e6, 1),
+        "speedup": round(legacy / background, 1),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=10000)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
@@ -0,0 +1,166 @@
+import copy
+import time
+import unittest
+
+from aworld.checkpoint import CheckpointMetadata
+from aworld.checkpoint.delta import DeltaCheckpointer, diff_values, apply_delta
+from aworld.checkpoint.inmemory import InMemoryCheckpointRepository
+from aworld.core.context.amni import ApplicationContext
+from aworld.core.context.amni.contexts import ContextManager
+from aworld.core.context.amni.state import ApplicationTaskContextState, TaskInput, TaskWorkingState, TaskOutput
+
+
+def state(size: int) -> dict:
+    return {
+        "task_id": "t",
+        "step": 0,
+        "trajectory": [{"step": i, "action": f"action {i}", "observation": "x" * 64} for i in range(size)],
+        "context": {"kv": {f"key_{i}": i for i in range(100)}, "agent": {"name": "a", "tokens": 0}},
+    }
+
+
+def advance(values: dict, step: int):
+    values["step"] = step
+    values["trajectory"].append({"step": step, "action": f"action {step}", "observation": "y" * 64})
+    values["context"]["agent"]["tokens"] += 10
+    values["context"]["kv"][f"new_{step}"] = step
+
+
+class DiffTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        old = state(10)
+        new = copy.deepcopy(old)
+        advance(new, 1)
+        new["trajectory"][-1]["action"] = "changed"
+        del new["task_id"]
+        new["extra"] = [1, 2]
+
+        delta = diff_values(old, new)
+        self.assertEqual({"set", "del", "append", "nested"}, set(delta))
+        self.assertEqual(1, len(delta["append"]["trajectory"]))
+        self.assertEqual(new, apply_delta(copy.deepcopy(old), delta))
+        self.assertEqual({}, diff_values(new, copy.deepcopy(new)))
+
+    def test_rewritten_list_is_set(self):
+        old = {"items": [1, 2, 3]}
+        self.assertEqual({"set": {"items": [1, 5]}}, diff_values(old, {"items": [1, 5]}))
+        self.assertEqual({"set": {"items": [9, 2, 3, 4]}}, diff_values(old, {"items": [9, 2, 3, 4]}))
+        # only the last previous item is compared
+        self.assertEqual({"append": {"items": [4]}}, diff_values(old, {"items": [9, 2, 3, 4]}, strict=False))
+
+
+class DeltaCheckpointerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.repo = InMemoryCheckpointRepository()
+        self.metadata = CheckpointMetadata(session_id="s", task_id="t")
+
+    def test_restore_equals_state(self):
+        checkpointer = DeltaCheckpointer(self.repo, full_every=4)
+        values = state(20)
+        saved = []
+        for step in range(1, 11):
+            advance(values, step)
+            checkpoint = checkpointer.save(values, self.metadata)
+            saved.append((checkpoint, copy.deepcopy(values)))
+
+        self.assertEqual([False, True, True, True] * 2 + [False, True],
+                         [checkpoint.is_delta() for checkpoint, _ in saved])
+        self.assertEqual(list(range(1, 11)), [checkpoint.version for checkpoint, _ in saved])
+        for checkpoint, expected in saved:
+            self.assertEqual(expected, checkpointer.restore(checkpoint.id))
+        # the restored state is a copy
+        checkpointer.restore(saved[-1][0].id)["trajectory"].clear()
+        self.assertEqual(values, checkpointer.restore(saved[-1][0]))
+        self.assertEqual(values, DeltaCheckpointer(self.repo).restore_session("s"))
+
+    def test_compact(self):
+        checkpointer = DeltaCheckpointer(self.repo, full_every=100)
+        values = state(5)
+        for step in range(1, 6):
+            advance(values, step)
+            checkpointer.save(values, self.metadata)
+
+        base = checkpointer.compact("s")
+        self.assertFalse(base.is_delta())
+        self.assertEqual([base], self.repo.list({"session_id": "s"}))
+        self.assertEqual(values, checkpointer.restore(base.id))
+
+        advance(values, 6)
+        self.assertTrue(checkpointer.save(values, self.metadata).is_delta())
+        self.assertEqual(values, checkpointer.restore_session("s"))
+
+    def test_in_place_edit(self):
+        checkpointer = DeltaCheckpointer(self.repo, strict=True)
+        values = {"trajectory": [{"reward": 0} for _ in range(3)]}
+        checkpointer.save(values, self.metadata)
+
+        values["trajectory"][0]["reward"] = 1
+        values["trajectory"].append({"reward": 2})
+        checkpoint = checkpointer.save(values, self.metadata)
+        self.assertTrue(checkpoint.is_delta())
+        self.assertEqual(values, checkpointer.restore(checkpoint.id))
+        self.assertEqual(values, DeltaCheckpointer(self.repo).restore_session("s"))
+
+    def test_sessions_evicted(self):
+        checkpointer = DeltaCheckpointer(self.repo, max_sessions=2)
+        values = state(5)
+        for session_id in ("a", "b", "c"):
+            checkpointer.save(values, CheckpointMetadata(session_id=session_id))
+        self.assertEqual(["b", "c"], list(checkpointer._last))
+
+        # an evicted session starts a new chain from the repository
+        advance(values, 1)
+        checkpoint = checkpointer.save(values, CheckpointMetadata(session_id="a"))
+        self.assertFalse(checkpoint.is_delta())
+        self.assertEqual(2, checkpoint.version)
+        self.assertEqual(values, checkpointer.restore_session("a"))
+
+        checkpointer.discard("a")
+        self.assertEqual(["c"], list(checkpointer._last))
+
+    def test_cost_follows_change(self):
+        def save_cost(size: int, strict: bool) -> float:
+            checkpointer = DeltaCheckpointer(InMemoryCheckpointRepository(), full_every=1000, strict=strict)
+            values = state(size)
+            checkpointer.save(values, self.metadata)
+            begin = time.perf_counter()
+            for step in range(1, 51):
+                advance(values, step)
+                checkpointer.save(values, self.metadata)
+            return time.perf_counter() - begin
+
+        full = time.perf_counter()
+        copy.deepcopy(state(100000))
+        full = time.perf_counter() - full
+        # the previous steps are compared, not copied
+        self.assertLess(min(save_cost(100000, strict=True) for _ in range(2)) / 50, full / 10)
+
+        # 100x the trajectory, append only lists are not compared
+        small = min(save_cost(1000, strict=False) for _ in range(2))
+        large = min(save_cost(100000, strict=False) for _ in range(2))
+        self.assertLess(large / 50, full / 100)
+        self.assertLess(large, small * 3)
+
+
+class ContextManagerCheckpointTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_delta_context_checkpoints(self):
+        manager = ContextManager(delta_checkpointer=DeltaCheckpointer(InMemoryCheckpointRepository()))
+        task_input = TaskInput(user_id="user", session_id="session", task_id="task",
+                               task_content="question", origin_user_input="question")
+        context = ApplicationContext(task_state=ApplicationTaskContextState(task_input=task_input,
+                                                                            working_state=TaskWorkingState(kv_store={}),
+                                                                            task_output=TaskOutput()))
+        self.assertFalse((await manager.save_context_checkpoint(context)).is_delta())
+
+        context.put("answer", "value")
+        checkpoint = await manager.save_context_checkpoint(context)
+        self.assertTrue(checkpoint.is_delta())
+        self.assertEqual(checkpoint, await manager.aget_checkpoint("session"))
+        self.assertEqual(context.to_dict(), manager.delta_checkpointer.restore(checkpoint))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from unittest import mock
+
+from aworld.core.context.amni import ApplicationContext
+from aworld.core.context.amni.state import (
+    ApplicationAgentState, ApplicationTaskContextState, TaskInput, TaskWorkingState, TaskOutput
+)
+from aworld.core.context.amni.state.agent_state import AgentWorkingState
+
+
+def build_context(parent: ApplicationContext = None, task_id: str = "task") -> ApplicationContext:
+    task_input = TaskInput(user_id="user", session_id="session", task_id=task_id,
+                           task_content="question", origin_user_input="question")
+    return ApplicationContext(task_state=ApplicationTaskContextState(task_input=task_input,
+                                                                     working_state=TaskWorkingState(kv_store={}),
+                                                                     task_output=TaskOutput()),
+                              parent=parent)
+
+
+class ContextFieldCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = build_context(task_id="root")
+        self.middle = build_context(self.root, task_id="middle")
+        self.leaf = build_context(self.middle, task_id="leaf")
+
+    def _resolve(self, key: str, context: ApplicationContext = None, **kwargs):
+        return ApplicationContext.get_logical_schema_field(key=key, context=context or self.leaf, **kwargs)
+
+    def test_generation_shared_by_hierarchy(self):
+        generation = self.root.get_hierarchy_generation()
+        self.assertEqual(generation, self.leaf.get_hierarchy_generation())
+
+        self.leaf.put("key", "value")
+        self.assertEqual(generation + 1, self.root.get_hierarchy_generation())
+        self.assertEqual(generation + 1, self.middle.get_hierarchy_generation())
+
+        other = build_context(task_id="other")
+        other.put("key", "value")
+        self.assertEqual(generation + 1, self.root.get_hierarchy_generation())
+
+    def test_resolution_memoized_until_written(self):
+        self.root.put("name", "root value")
+        resolve = ApplicationContext._resolve_logical_schema_field
+        with mock.patch.object(ApplicationContext, "_resolve_logical_schema_field",
+                               side_effect=resolve) as walk:
+            self.assertEqual("root value", self._resolve("name"))
+            walks = walk.call_count
+            self.assertEqual("root value", self._resolve("name"))
+            self.assertEqual(walks, walk.call_count)
+
+            # a write anywhere in the hierarchy, the field is resolved again
+            self.middle.put("unrelated", 1)
+            self.assertEqual("root value", self._resolve("name"))
+            self.assertGreater(walk.call_count, walks)
+
+    def test_callers_get_copies(self):
+        self.root.put("names", ["root"])
+        names = self._resolve("names")
+        names.append("changed")
+        self.assertEqual(["root"], self._resolve("names"))
+
+    def test_ancestor_writes_are_visible(self):
+        self.assertIsNone(self._resolve("name"))
+        self.root.put("name", "root value")
+        self.assertEqual("root value", self._resolve("name"))
+        self.middle.put("name", "middle value")
+        self.assertEqual("middle value", self._resolve("name"))
+        self.assertEqual("root value", self._resolve("parent.parent.name"))
+
+        self.root.task_output = "answer"
+        self.assertEqual("answer", self._resolve("root.task_output"))
+
+    def test_agent_state_writes_are_visible(self):
+        self.assertIsNone(self._resolve("name", agent_id="agent"))
+        self.leaf.set_agent_state("agent", ApplicationAgentState(working_state=AgentWorkingState(kv_store={})))
+        self.leaf.put("name", "agent value", namespace="agent")
+        self.assertEqual("agent value", self._resolve("name", agent_id="agent"))
+        # other agents are not affected
+        self.assertIsNone(self._resolve("name", agent_id="another"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import copy
+import gc
+import pickle
+import sys
+import types
+import unittest
+import weakref
+from unittest import mock
+
+from aworld.core.context.base import Context
+from aworld.core.context.registry import ContextRef, context_registry
+from aworld.core.event.base import Message
+from aworld.core.singleton import SingletonMeta
+from aworld.core.task import Task
+from aworld.events.redis_backend import RedisConfig, RedisEventbus
+
+
+class ContextRegistryTest(unittest.TestCase):
+
+    def tearDown(self):
+        context_registry.release("task_registry")
+
+    def test_message_carries_reference(self):
+        context = Context(task_id="task_registry")
+        context.context_info["payload"] = "x" * 100000
+        message = Message(payload="hello", headers={"context": context})
+
+        self.assertIsInstance(message.headers["context"], ContextRef)
+        self.assertIs(context, message.context)
+        # the same context object is referenced by the same version
+        self.assertEqual(message.context_ref, Message(payload="again", headers={"context": context}).context_ref)
+        self.assertNotEqual(message.context_ref, Message(headers={"context": context.deep_copy()}).context_ref)
+        self.assertIs(message.context_ref, copy.deepcopy(message).context_ref)
+        self.assertLess(len(pickle.dumps(message)), 1000)
+
+        # contexts without a task are carried inline
+        self.assertIsInstance(Message(payload="inline").headers["context"], Context)
+
+    def test_superseded_copies_dropped(self):
+        message = Message(payload="hello", headers={"context": Context(task_id="task_registry")})
+        first = weakref.ref(message.context)
+        # every step replaces the context of the message by a copy, as the handlers do
+        for step in range(50):
+            message.context = message.context.deep_copy()
+        gc.collect()
+
+        self.assertIsNone(first())
+        self.assertEqual(1, context_registry.size("task_registry"))
+        self.assertEqual("task_registry", message.context.task_id)
+
+        context = weakref.ref(message.context)
+        del message
+        gc.collect()
+        self.assertIsNone(context())
+        self.assertEqual(0, context_registry.size("task_registry"))
+
+    def test_attach_remote_context(self):
+        context = Context(task_id="task_registry")
+        data = pickle.dumps(Message(payload="hello", headers={"context": context}))
+        snapshot = pickle.dumps(context)
+        context_registry.release("task_registry")
+        del context
+        gc.collect()
+
+        # as a consumer in another process, the context arrives once and is bound to the reference
+        received = pickle.loads(data)
+        self.assertIsNone(received.context)
+        context_registry.register(pickle.loads(snapshot), ref=received.context_ref)
+        self.assertEqual("task_registry", received.context.task_id)
+
+
+class FakeRedis:
+    """Streams and hashes of a redis server shared by the buses of several processes."""
+
+    def __init__(self):
+        self.streams = {}
+        self.hashes = {}
+        self.hset_calls = 0
+
+    async def xadd(self, name, fields, id="*"):
+        stream = self.streams.setdefault(name, [])
+        stream.append((str(len(stream)), {key.encode(): value for key, value in fields.items()}))
+        return stream[-1][0]
+
+    async def xread(self, streams, count=1, block=0):
+        return [(name, self.streams[name][:count]) for name in streams if self.streams.get(name)]
+
+    async def xdel(self, name, message_id):
+        self.streams[name] = [msg for msg in self.streams[name] if msg[0] != message_id]
+
+    async def hset(self, name, key, value):
+        self.hset_calls += 1
+        self.hashes.setdefault(name, {})[key] = value
+
+    async def hget(self, name, key):
+        return self.hashes.get(name, {}).get(key)
+
+    async def delete(self, name):
+        self.hashes.pop(name, None)
+
+
+class RedisContextTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.producer = self._bus()
+        self.consumer = self._bus()
+
+    def _bus(self) -> RedisEventbus:
+        """The bus of a process, connected to the shared redis."""
+        aioredis = types.SimpleNamespace(from_url=lambda *args, **kwargs: self.redis)
+        with mock.patch.dict(sys.modules, {"aioredis": aioredis}), mock.patch.dict(SingletonMeta._instances, clear=True):
+            return RedisEventbus(RedisConfig())
+
+    def tearDown(self):
+        context_registry.release("task_registry")
+
+    async def _send(self, context: Context) -> Message:
+        await self.producer.publish(Message(payload="hello", headers={"context": context}))
+        return await self._receive()
+
+    async def _receive(self) -> Message:
+        consumer_context = Context(task_id="task_registry")
+        consumer_context.set_task(Task(id="task_registry"))
+        return await self.consumer.consume(Message(headers={"context": consumer_context}))
+
+    async def test_changed_context_published_again(self):
+        context = Context(task_id="task_registry")
+        context.set_task(Task(id="task_registry"))
+        context.context_info["step"] = 1
+        await self.producer.publish(Message(payload="hello", headers={"context": context}))
+        # the consumer runs in another process
+        context_registry.release("task_registry")
+        received = await self._receive()
+        self.assertIsNot(context, received.context)
+        self.assertEqual(1, received.context.context_info["step"])
+
+        # unchanged, the context is written once
+        received = await self._send(context)
+        self.assertEqual(1, self.redis.hset_calls)
+        self.assertEqual(1, received.context.context_info["step"])
+
+        context.context_info["step"] = 2
+        received = await self._send(context)
+        self.assertEqual(2, self.redis.hset_calls)
+        self.assertEqual(2, received.context.context_info["step"])
+
+    async def test_unchanged_context_not_serialized(self):
+        context = Context(task_id="task_registry")
+        context.set_task(Task(id="task_registry"))
+        dumps = pickle.dumps
+        with mock.patch("aworld.events.redis_backend.pickle.dumps", side_effect=dumps) as pickled:
+            for _ in range(5):
+                await self.producer.publish(Message(payload="hello", headers={"context": context}))
+            contexts = [call for call in pickled.call_args_list if call.args[0] is context]
+            self.assertEqual(1, len(contexts))
+
+            context.add_token({"total_tokens": 1})
+            await self.producer.publish(Message(payload="hello", headers={"context": context}))
+            contexts = [call for call in pickled.call_args_list if call.args[0] is context]
+            self.assertEqual(2, len(contexts))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from aworld.core.context.amni.config import AmniContextProcessorConfig
+from aworld.core.context.amni.payload import ContextMessagePayload
+from aworld.core.context.amni.processor import BaseContextProcessor, ProcessorWorkerPool
+from aworld.core.context.amni.processor.processor_factory import memory_processor
+from aworld.runners.handler.context import ContextProcessorHandler
+
+RUNS = []
+
+
+@memory_processor("test_recording_processor")
+class RecordingProcessor(BaseContextProcessor):
+
+    def __init__(self, processor_config: AmniContextProcessorConfig):
+        super().__init__(processor_config)
+
+    async def process(self, context, event: ContextMessagePayload, **kwargs):
+        await asyncio.sleep(0.05)
+        RUNS.append((context.session_id, event.event_id, id(self), threading.current_thread().name))
+
+
+def processor_config(name: str = "recorder") -> AmniContextProcessorConfig:
+    return AmniContextProcessorConfig(name=name, type="test_recording_processor", pipeline=None, is_async=True)
+
+
+def event(session_id: str, event_id: str) -> ContextMessagePayload:
+    return ContextMessagePayload(event_id=event_id, context=SimpleNamespace(session_id=session_id))
+
+
+class ProcessorWorkerPoolTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        RUNS.clear()
+        self.pool = ProcessorWorkerPool(num_workers=2)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    async def test_coalesce_per_session_and_processor(self):
+        config = processor_config()
+        self.pool.submit(config, event("s1", "e0"))
+        await asyncio.sleep(0.02)
+        # e0 is running, e1..e4 collapse into one waiting job
+        for i in range(1, 5):
+            self.pool.submit(config, event("s1", f"e{i}"))
+        self.pool.submit(config, event("s2", "other"))
+
+        self.assertTrue(await self.pool.drain(timeout=5))
+        s1_runs = [event_id for session_id, event_id, _, _ in RUNS if session_id == "s1"]
+        self.assertEqual(["e0", "e4"], s1_runs)
+        stats = self.pool.stats()
+        self.assertEqual(6, stats["submitted"])
+        self.assertEqual(3, stats["coalesced"])
+        self.assertEqual(3, stats["completed"])
+        self.assertEqual(0, stats["queue_depth"])
+
+    async def test_long_lived_workers_and_cached_processors(self):
+        config = processor_config()
+        for round_id in range(3):
+            for session_id in ("a", "b", "c", "d"):
+                self.pool.submit(config, event(session_id, f"{session_id}{round_id}"))
+            self.assertTrue(await self.pool.drain(timeout=5))
+
+        self.assertEqual(12, len(RUNS))
+        worker_threads = {thread for _, _, _, thread in RUNS}
+        self.assertLessEqual(len(worker_threads), 2)
+        # one processor instance per worker loop
+        self.assertEqual(len(worker_threads), len({instance for _, _, instance, _ in RUNS}))
+        # a session always runs on the same worker
+        for session_id in ("a", "b", "c", "d"):
+            self.assertEqual(1, len({thread for sid, _, _, thread in RUNS if sid == session_id}))
+
+    async def test_backlog_is_bounded(self):
+        pool = ProcessorWorkerPool(num_workers=1, max_concurrency=1, max_backlog=2)
+        try:
+            config = processor_config()
+            pool.submit(config, event("busy", "e"))
+            await asyncio.sleep(0.02)
+            results = [pool.submit(config, event(f"s{i}", f"e{i}")) for i in range(3)]
+            self.assertEqual([True, True, False], results)
+            self.assertTrue(await pool.drain(timeout=5))
+            self.assertEqual(1, pool.stats()["dropped"])
+            self.assertEqual(3, pool.stats()["completed"])
+        finally:
+            pool.shutdown()
+
+    def test_async_processors_get_own_event(self):
+        handler = object.__new__(ContextProcessorHandler)
+        source = mock.Mock(event_type="e", event_id="1")
+        source.deep_copy.side_effect = lambda: mock.Mock()
+        pool = mock.Mock()
+        with mock.patch("aworld.runners.handler.context.get_processor_worker_pool", return_value=pool):
+            handler._start_async_processors([processor_config("first"), processor_config("second")], source)
+
+        submitted = [call.args[1] for call in pool.submit.call_args_list]
+        self.assertEqual(2, len(submitted))
+        self.assertIsNot(submitted[0], submitted[1])
+        self.assertNotIn(source, submitted)
+
+
+if __name__ == '__main__':
+    unittest.main()
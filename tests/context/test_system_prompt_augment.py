@@ -0,0 +1,135 @@
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+from typing import List
+
+from aworld.core.context.amni import ApplicationContext, StateScopes
+from aworld.core.context.amni.config import AmniContextConfig, AgentContextConfig, AmniContextProcessorConfig
+from aworld.core.context.amni.payload import SystemPromptMessagePayload
+from aworld.core.context.amni.processor import ProcessorFactory
+from aworld.core.context.amni.processor.op.system_prompt_augment_op import SystemPromptAugmentOp
+from aworld.core.context.amni.prompt.neurons import Neuron, neuron_factory
+from aworld.core.context.amni.state import ApplicationTaskContextState, TaskInput, TaskWorkingState, TaskOutput
+from aworld.core.task import Task
+
+RENDER_SECONDS = 0.2
+
+
+class CountingNeuron(Neuron):
+    renders = 0
+
+    async def desc(self, context: ApplicationContext, namespace: str = None, **kwargs) -> str:
+        type(self).renders += 1
+        await asyncio.sleep(RENDER_SECONDS)
+        return f"<{self.name}>"
+
+    async def format_items(self, context: ApplicationContext, namespace: str = None, **kwargs) -> List[str]:
+        # sub contexts read the value of the task they belong to
+        return [str(context.root.get("value"))]
+
+    async def format(self, context: ApplicationContext, items: List[str] = None, namespace: str = None,
+                     **kwargs) -> str:
+        return ",".join(items)
+
+
+@neuron_factory.register(name="test_working_state", desc="test neuron", prio=1)
+class WorkingStateNeuron(CountingNeuron):
+    state_scopes = (StateScopes.WORKING_STATE,)
+
+
+@neuron_factory.register(name="test_constant", desc="test neuron", prio=2)
+class ConstantNeuron(CountingNeuron):
+    state_scopes = ()
+
+
+@neuron_factory.register(name="test_uncached", desc="test neuron", prio=3)
+class UncachedNeuron(CountingNeuron):
+    pass
+
+
+@neuron_factory.register(name="test_broken", desc="test neuron", prio=4)
+class BrokenNeuron(Neuron):
+    state_scopes = ()
+
+    async def desc(self, context: ApplicationContext, namespace: str = None, **kwargs) -> str:
+        raise RuntimeError("broken")
+
+
+class SystemPromptAugmentTest(unittest.IsolatedAsyncioTestCase):
+    neuron_names = ["test_working_state", "test_constant", "test_uncached", "test_broken"]
+
+    def setUp(self):
+        for neuron_cls in (WorkingStateNeuron, ConstantNeuron, UncachedNeuron):
+            neuron_cls.renders = 0
+        task_input = TaskInput(user_id="user", session_id="session", task_id="task",
+                               task_content="question", origin_user_input="question")
+        self.context = ApplicationContext(
+            task_state=ApplicationTaskContextState(task_input=task_input,
+                                                   working_state=TaskWorkingState(kv_store={}),
+                                                   task_output=TaskOutput()),
+            context_config=AmniContextConfig(agent_config=AgentContextConfig(enable_system_prompt_augment=True,
+                                                                             neuron_names=self.neuron_names)))
+        self.context.put("value", 1)
+        self.op = SystemPromptAugmentOp()
+        self.event = SimpleNamespace(agent_id="agent", namespace="default")
+
+    async def _process(self):
+        return await self.op._process_neurons(self.context, self.event)
+
+    async def test_neurons_render_concurrently(self):
+        start = time.time()
+        prompts = await self._process()
+        self.assertLess(time.time() - start, RENDER_SECONDS * 2)
+        self.assertEqual(["test_working_state", "test_constant", "test_uncached"], list(prompts.keys()))
+        self.assertEqual("<test_working_state>\n\n1", prompts["test_working_state"])
+
+    async def test_memoized_by_state_version(self):
+        first = await self._process()
+        second = await self._process()
+        self.assertEqual(first, second)
+        self.assertEqual(1, WorkingStateNeuron.renders)
+        self.assertEqual(1, ConstantNeuron.renders)
+        self.assertEqual(2, UncachedNeuron.renders)
+
+        self.context.put("value", 2)
+        third = await self._process()
+        self.assertEqual("<test_working_state>\n\n2", third["test_working_state"])
+        self.assertEqual(2, WorkingStateNeuron.renders)
+        self.assertEqual(1, ConstantNeuron.renders)
+
+        # rerank depends on the task input, all cached sections are rendered again
+        self.context.task_input = "another question"
+        await self._process()
+        self.assertEqual(3, WorkingStateNeuron.renders)
+        self.assertEqual(2, ConstantNeuron.renders)
+
+    async def test_parent_writes_render_again(self):
+        sub_context = await self.context.build_sub_context("sub question", sub_task_id="sub_task")
+        await self.op._process_neurons(sub_context, self.event)
+        await self.op._process_neurons(sub_context, self.event)
+        self.assertEqual(1, WorkingStateNeuron.renders)
+
+        # the sub context reads the working state of its parent through
+        self.context.put("value", 2)
+        prompts = await self.op._process_neurons(sub_context, self.event)
+        self.assertEqual("<test_working_state>\n\n2", prompts["test_working_state"])
+        self.assertEqual(2, WorkingStateNeuron.renders)
+
+    async def test_memoized_across_processors(self):
+        # every event may be handled by a new processor with new ops
+        config = AmniContextProcessorConfig(name="system_prompt", type="pipeline_memory_processor",
+                                            pipeline="system_prompt_augment")
+        self.context.set_task(Task(id="task", session_id="session", user_id="user", input="question"))
+        for _ in range(2):
+            event = SystemPromptMessagePayload(context=self.context, system_prompt="system", user_query="question",
+                                               agent_id="agent", agent_name="agent", namespace="default")
+            processor = ProcessorFactory.create(config)
+            result = await processor.process(event.context, event=event.deep_copy())
+            self.assertEqual(1, len(result["memory_commands"]))
+        self.assertEqual(1, WorkingStateNeuron.renders)
+        self.assertEqual(2, UncachedNeuron.renders)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import time
+import unittest
+
+from aworld.dataset.dataloader import DataLoader
+from aworld.dataset.dataset import Dataset
+
+
+def _double(item):
+    return item * 2
+
+
+class DataLoaderPrefetchTest(unittest.IsolatedAsyncioTestCase):
+
+    def _dataset(self, size: int = 23):
+        return Dataset[int](name="numbers", data=list(range(size)))
+
+    def test_workers_keep_sampling_order(self):
+        dataset = self._dataset()
+        expected = list(DataLoader(dataset, batch_size=4, shuffle=True, seed=7))
+        for num_workers in (1, 3):
+            loader = DataLoader(dataset, batch_size=4, shuffle=True, seed=7, num_workers=num_workers)
+            self.assertEqual(list(loader), expected)
+
+    def test_prefetch_is_bounded(self):
+        fetched = []
+
+        def record(item):
+            fetched.append(item)
+            return item
+
+        dataset = self._dataset().transform(record)
+        loader = DataLoader(dataset, batch_size=1, num_workers=2, prefetch_factor=2)
+        it = iter(loader)
+        self.assertEqual(next(it), [0])
+        time.sleep(0.1)
+        # at most num_workers * prefetch_factor batches are submitted ahead of the consumer
+        self.assertLessEqual(len(fetched), 2 * 2)
+        self.assertEqual(sum(1 for _ in it), 22)
+
+    def test_process_workers(self):
+        dataset = self._dataset().transform(_double)
+        loader = DataLoader(dataset, batch_size=5, drop_last=True, num_workers=2, worker_mode="process")
+        self.assertEqual([sum(batch) for batch in loader], [20, 70, 120, 170])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            DataLoader(self._dataset(), prefetch_factor=2)
+        with self.assertRaises(ValueError):
+            DataLoader(self._dataset(), num_workers=1, worker_mode="fiber")
+
+    async def test_async_iteration(self):
+        dataset = self._dataset()
+        expected = list(DataLoader(dataset, batch_size=3, shuffle=True, seed=1))
+        for num_workers in (0, 2):
+            loader = DataLoader(dataset, batch_size=3, shuffle=True, seed=1, num_workers=num_workers)
+            self.assertEqual([batch async for batch in loader], expected)
@@ -0,0 +1,92 @@
+import json
+import time
+import unittest
+
+from aworld.models.model_response import Function, ModelResponse, ToolCall
+from aworld.models.openai_provider import OpenAIProvider
+from aworld.models.stream_accumulator import StreamAccumulator
+
+
+def text_chunk(i: int) -> dict:
+    return {"id": "resp", "model": "replay", "choices": [{"delta": {"content": f"{i} "}, "finish_reason": None}]}
+
+
+def tool_call_chunks(index: int, call_id: str, name: str, arguments: str, size: int = 3):
+    fragments = [arguments[i:i + size] for i in range(0, len(arguments), size)]
+    for i, fragment in enumerate(fragments):
+        delta = {"index": index, "function": {"arguments": fragment}}
+        if i == 0:
+            delta.update(id=call_id, type="function")
+            delta["function"]["name"] = name
+        yield {"id": "resp", "model": "replay", "choices": [{"delta": {"tool_calls": [delta]}, "finish_reason": None}]}
+
+
+def finish_chunk() -> dict:
+    return {"id": "resp", "model": "replay",
+            "choices": [{"delta": {}, "finish_reason": "tool_calls"}],
+            "usage": {"completion_tokens": 7, "prompt_tokens": 3, "total_tokens": 10}}
+
+
+def replay(provider: OpenAIProvider, chunks) -> StreamAccumulator:
+    accumulator = StreamAccumulator()
+    for chunk in chunks:
+        resp = provider.postprocess_stream_response(chunk)
+        if resp:
+            accumulator.add(resp)
+    return accumulator
+
+
+class StreamAccumulatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = OpenAIProvider(api_key="replay", base_url="http://localhost", model_name="replay")
+
+    def test_replayed_stream(self):
+        search = json.dumps({"query": "streaming " * 50, "top_k": 5})
+        read = json.dumps({"path": "/tmp/a.txt"})
+        chunks = [text_chunk(i) for i in range(100000)]
+        # the deltas of the two calls are interleaved
+        chunks += [c for pair in zip(tool_call_chunks(0, "call_0", "search", search),
+                                     tool_call_chunks(1, "call_1", "read", read)) for c in pair]
+        chunks += list(tool_call_chunks(0, "call_0", "search", search))[len(read) // 3 + 1:]
+        chunks.append(finish_chunk())
+
+        response = replay(self.provider, chunks).response()
+        self.assertEqual("".join(f"{i} " for i in range(100000)), response.content)
+        self.assertEqual(["call_0", "call_1"], [tool_call.id for tool_call in response.tool_calls])
+        self.assertEqual(json.loads(search), json.loads(response.tool_calls[0].function.arguments))
+        self.assertEqual(json.loads(read), json.loads(response.tool_calls[1].function.arguments))
+        self.assertEqual("read", response.message["tool_calls"][1]["function"]["name"])
+
+    def test_calls_with_same_id_kept(self):
+        chunks = list(tool_call_chunks(0, "", "a", '{"x":1}')) + list(tool_call_chunks(1, "", "b", '{"y":2}'))
+        chunks.append(finish_chunk())
+
+        response = replay(self.provider, chunks).response()
+        self.assertEqual([("a", '{"x":1}'), ("b", '{"y":2}')],
+                         [(call.function.name, call.function.arguments) for call in response.tool_calls])
+
+    def test_complete_calls_appended(self):
+        accumulator = StreamAccumulator()
+        for name, arguments in (("a", '{"x":1}'), ("a", '{"y":2}')):
+            accumulator.add(ModelResponse(id="r", model="m", tool_calls=[
+                ToolCall(id="", function=Function(name=name, arguments=arguments))]))
+
+        self.assertEqual([("a", '{"x":1}'), ("a", '{"y":2}')],
+                         [(call.function.name, call.function.arguments) for call in accumulator.response().tool_calls])
+
+    def test_linear_scaling(self):
+        def cost(count: int) -> float:
+            chunks = [text_chunk(i) for i in range(count)]
+            begin = time.perf_counter()
+            replay(self.provider, chunks).response()
+            return time.perf_counter() - begin
+
+        cost(5000)
+        small, large = min(cost(10000) for _ in range(2)), min(cost(40000) for _ in range(2))
+        # 4x the chunks, quadratic assembly would be about 16x
+        self.assertLess(large / small, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
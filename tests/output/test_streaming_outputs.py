@@ -0,0 +1,154 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from aworld.agents.llm_agent import Agent
+from aworld.config.conf import AgentConfig
+from aworld.core.context.base import Context
+from aworld.core.event.base import Message
+from aworld.core.task import Task
+from aworld.models.model_response import ModelResponse
+from aworld.output import AworldUI, Output, StreamingOutputs, SlowConsumerPolicy, TextDeltaOutput
+from aworld.output.ui.markdown_aworld_ui import MarkdownAworldUI
+
+
+async def collect(outputs: StreamingOutputs, delay: float = 0):
+    collected = []
+    async for output in outputs.stream_events():
+        collected.append(output)
+        if delay:
+            await asyncio.sleep(delay)
+    return collected
+
+
+def text_of(outputs) -> str:
+    return "".join(output.delta for output in outputs if isinstance(output, TextDeltaOutput))
+
+
+class StreamingOutputsTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_fast_consumer_receives_every_chunk(self):
+        outputs = StreamingOutputs(max_buffer=16)
+        consumer = asyncio.create_task(collect(outputs))
+        await asyncio.sleep(0)
+        expected = []
+        for i in range(2000):
+            chunk = f"{i},"
+            expected.append(chunk)
+            await outputs.add_output(TextDeltaOutput(delta=chunk, task_id="t"))
+            if i % 3 == 0:
+                await outputs.add_output(Output(data=i))
+            await asyncio.sleep(0)
+        await outputs.mark_completed()
+
+        received = await consumer
+        self.assertEqual("".join(expected), text_of(received))
+        self.assertEqual(list(range(0, 2000, 3)), [output.data for output in received
+                                                    if not isinstance(output, TextDeltaOutput)])
+        # the finished signal does not wait for room
+        self.assertLessEqual(len(outputs._buffer), 16 + 1)
+
+    async def test_independent_subscribers(self):
+        outputs = StreamingOutputs(max_buffer=8)
+        fast = asyncio.create_task(collect(outputs))
+        slow = asyncio.create_task(collect(outputs, delay=0.001))
+        await asyncio.sleep(0)
+        for i in range(50):
+            await outputs.add_output(Output(data=i))
+        await outputs.mark_completed()
+
+        self.assertEqual(list(range(50)), [output.data for output in await fast])
+        self.assertEqual(list(range(50)), [output.data for output in await slow])
+
+    async def test_drop_oldest(self):
+        outputs = StreamingOutputs(max_buffer=4, slow_consumer_policy=SlowConsumerPolicy.DROP_OLDEST)
+        consumer = asyncio.create_task(collect(outputs))
+        await asyncio.sleep(0)
+        # the producer never waits for the consumer
+        for i in range(10):
+            await outputs.add_output(Output(data=i))
+        await outputs.mark_completed()
+
+        self.assertEqual([6, 7, 8, 9], [output.data for output in await consumer])
+
+    async def test_coalesce_lagging_deltas(self):
+        outputs = StreamingOutputs(max_buffer=4, slow_consumer_policy=SlowConsumerPolicy.COALESCE)
+        consumer = asyncio.create_task(collect(outputs))
+        await asyncio.sleep(0)
+        for i in range(10):
+            await outputs.add_output(TextDeltaOutput(delta=str(i), metadata={"i": i % 2}))
+        await outputs.mark_completed()
+
+        received = await consumer
+        self.assertEqual("0123456789", "".join(output.delta for output in received))
+
+    async def test_block_until_consumed(self):
+        outputs = StreamingOutputs(max_buffer=2)
+        subscriber = outputs.stream_events()
+        first = asyncio.ensure_future(anext(subscriber))
+        await asyncio.sleep(0)
+        producer = asyncio.create_task(self._produce(outputs, 5))
+        await asyncio.sleep(0.01)
+        # the output read by the subscriber is evicted, then the producer waits for it
+        self.assertFalse(producer.done())
+        self.assertEqual([1, 2], [output.data for output in outputs._buffer])
+
+        received = [(await first).data] + [(await anext(subscriber)).data for _ in range(4)]
+        await producer
+        self.assertEqual(list(range(5)), received)
+        await subscriber.aclose()
+
+    async def _produce(self, outputs: StreamingOutputs, count: int):
+        for i in range(count):
+            await outputs.add_output(Output(data=i))
+
+
+class StreamingAgentOutputTest(unittest.IsolatedAsyncioTestCase):
+
+    def _agent(self, **kwargs) -> Agent:
+        return Agent(conf=AgentConfig(llm_provider="openai", llm_model_name="fake", llm_api_key="fake",
+                                      llm_base_url="http://localhost", llm_stream_call=True, **kwargs),
+                     name="streaming")
+
+    async def _invoke(self, agent: Agent, outputs: StreamingOutputs):
+        chunks = ["Hel", "lo", " ", "world"]
+
+        async def llm_stream(*args, **kwargs):
+            for chunk in chunks:
+                yield ModelResponse(id="r", model="fake", content=chunk)
+
+        context = Context(task_id="task")
+        context.set_task(Task(id="task", input="hi", outputs=outputs))
+        send_message = mock.AsyncMock()
+        with mock.patch("aworld.agents.llm_agent.acall_llm_model_stream", llm_stream), \
+                mock.patch("aworld.agents.llm_agent.send_message", send_message), \
+                mock.patch.object(agent, "_log_messages"):
+            response = await agent.invoke_model([{"role": "user", "content": "hi"}],
+                                                message=Message(headers={"context": context}))
+        await outputs.mark_completed()
+        # deltas are written to the task outputs, not sent through the event bus
+        send_message.assert_not_called()
+        return response
+
+    async def test_agent_streams_text_deltas(self):
+        outputs = StreamingOutputs(max_buffer=4)
+        response = await self._invoke(self._agent(stream_text_delta=True), outputs)
+
+        self.assertEqual("Hello world", response.content)
+        received = await collect(outputs)
+        # nobody read the deltas while they were streamed, they are merged into one output
+        self.assertEqual(1, len(received))
+        self.assertEqual("Hello world", text_of(received))
+        self.assertEqual("streaming", received[0].metadata["agent_name"])
+        self.assertEqual("Hello world", await AworldUI.parse_output(received[0], MarkdownAworldUI()))
+
+    async def test_text_deltas_opt_in(self):
+        outputs = StreamingOutputs(max_buffer=4)
+        response = await self._invoke(self._agent(), outputs)
+
+        self.assertEqual("Hello world", response.content)
+        self.assertEqual([], await collect(outputs))
+
+
+if __name__ == '__main__':
+    unittest.main()
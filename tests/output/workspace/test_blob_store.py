@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from aworld.output import Artifact, ArtifactType
+from aworld.output.storage.artifact_repository import LocalArtifactRepository
+from aworld.output.storage.blob_store import OSSBlobStore, zstandard
+from aworld.utils.oss import OSSUploadQueue
+
+
+class FakeBucket:
+    """In-memory OSS bucket failing the first `failures` puts, records the concurrent puts."""
+
+    def __init__(self, failures: int = 0, delay: float = 0):
+        self.objects = {}
+        self.failures = failures
+        self.delay = delay
+        self.puts = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def object_exists(self, key):
+        return key in self.objects
+
+    def put_object(self, key, data):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.delay)
+            with self._lock:
+                if self.failures > 0:
+                    self.failures -= 1
+                    raise IOError("connection reset")
+                self.objects[key] = data
+                self.puts.append(key)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+class BlobStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _blob_files(self):
+        return [path for path in Path(self.tmp.name, "blobs").rglob("*") if path.is_file()]
+
+    def test_content_deduplicated(self):
+        repository = LocalArtifactRepository(self.tmp.name)
+        screenshot = "x" * 10000
+        for i in range(3):
+            repository.store_artifact(Artifact(artifact_id=f"a{i}", artifact_type=ArtifactType.TEXT, content=screenshot))
+        artifact = Artifact(artifact_id="page", artifact_type=ArtifactType.JSON, content={"title": "t"})
+        repository.store_artifact(artifact)
+        repository.store_artifact(artifact)
+
+        self.assertEqual(2, len(self._blob_files()))
+        self.assertEqual(screenshot, repository.retrieve_latest_artifact("a1")["content"])
+        self.assertEqual({"title": "t"}, repository.retrieve_latest_artifact("page")["content"])
+        with open(repository.artifact_path("a1")) as f:
+            self.assertNotIn("content", json.load(f))
+        versions = repository.get_artifact_versions("page")
+        self.assertEqual(2, len(versions))
+        self.assertEqual(versions[0]["hash"], versions[1]["hash"])
+
+    @unittest.skipUnless(zstandard, "zstandard is not installed")
+    def test_zstd_compression(self):
+        repository = LocalArtifactRepository(self.tmp.name, compression="zstd")
+        content = "screenshot " * 1000
+        repository.store_artifact(Artifact(artifact_id="a", artifact_type=ArtifactType.TEXT, content=content))
+
+        blob = self._blob_files()[0]
+        self.assertLess(blob.stat().st_size, len(content) // 10)
+        # readable without configured compression
+        self.assertEqual(content, LocalArtifactRepository(self.tmp.name).retrieve_latest_artifact("a")["content"])
+
+    @staticmethod
+    def _wait_uploads(store: OSSBlobStore, count: int):
+        # the done callbacks of the store run after the ones of the queue
+        deadline = time.monotonic() + 5
+        while len(store._uploads) > count and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_finished_uploads_dropped(self):
+        bucket = FakeBucket(failures=1)
+        queue = OSSUploadQueue(bucket, max_retries=0)
+        store = OSSBlobStore(bucket, "prefix/", upload_queue=queue)
+        failed = store.put(b"blob 0")
+        for i in range(1, 20):
+            store.put(f"blob {i}".encode())
+        self.assertTrue(queue.flush(timeout=5))
+        self._wait_uploads(store, 1)
+
+        # only the failed upload is kept, the next put uploads it again
+        self.assertEqual([failed], list(store._uploads))
+        self.assertIsNotNone(store.upload_of(failed).exception())
+        store.put(b"blob 0")
+        self.assertTrue(queue.flush(timeout=5))
+        self._wait_uploads(store, 0)
+        self.assertEqual({}, store._uploads)
+        self.assertEqual(20, len(bucket.objects))
+        queue.close()
+
+    def test_inline_record_readable(self):
+        repository = LocalArtifactRepository(self.tmp.name)
+        artifact = Artifact(artifact_id="legacy", artifact_type=ArtifactType.TEXT, content="inline")
+        path = Path(repository.artifact_path("legacy"))
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(artifact.to_dict()))
+
+        self.assertEqual("inline", repository.retrieve_latest_artifact("legacy")["content"])
+
+
+class OSSUploadQueueTest(unittest.TestCase):
+
+    def test_retry_and_concurrency(self):
+        bucket = FakeBucket(failures=2, delay=0.02)
+        queue = OSSUploadQueue(bucket, max_concurrency=3, retry_backoff=0.01)
+        futures = [queue.submit(f"k{i}", b"data") for i in range(12)]
+
+        self.assertTrue(queue.flush(timeout=5))
+        self.assertTrue(all(future.exception() is None for future in futures))
+        self.assertEqual(12, len(bucket.objects))
+        self.assertLessEqual(bucket.max_running, 3)
+        self.assertGreater(bucket.max_running, 1)
+        queue.close()
+
+    def test_ordering(self):
+        bucket = FakeBucket(delay=0.01)
+        queue = OSSUploadQueue(bucket, max_concurrency=4)
+        blob = queue.submit("blob", b"content")
+        queue.submit("record", b"ref", depends_on=blob)
+        for i in range(5):
+            queue.submit("index", str(i).encode())
+        self.assertEqual(b"4", queue.pending_data("index"))
+
+        queue.flush()
+        self.assertEqual(b"4", bucket.objects["index"])
+        self.assertLess(bucket.puts.index("blob"), bucket.puts.index("record"))
+        self.assertIsNone(queue.pending_data("index"))
+        queue.close()
+
+    def test_failed_dependency(self):
+        bucket = FakeBucket(failures=1)
+        queue = OSSUploadQueue(bucket, max_retries=0)
+        blob = queue.submit("blob", b"content")
+        record = queue.submit("record", b"ref", depends_on=blob)
+
+        queue.flush()
+        self.assertIsNotNone(record.exception())
+        self.assertNotIn("record", bucket.objects)
+        queue.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
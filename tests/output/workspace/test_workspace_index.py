@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import unittest
+
+from aworld.output import WorkSpace, ArtifactType
+from aworld.output.storage.artifact_repository import LocalArtifactRepository
+
+
+class FailingJournalRepository(LocalArtifactRepository):
+    """Fails the first `failures` journal writes."""
+
+    def __init__(self, *args, failures: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failures = failures
+
+    def append_index_journal(self, entries):
+        if self.failures:
+            self.failures -= 1
+            raise IOError("disk unavailable")
+        super().append_index_journal(entries)
+
+
+class WorkspaceIndexTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.storage_path = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _workspace(self, journal_compact_threshold: int = 1000) -> WorkSpace:
+        repository = LocalArtifactRepository(self.storage_path, journal_compact_threshold=journal_compact_threshold)
+        return WorkSpace(workspace_id="test", repository=repository, use_default_observer=False)
+
+    def _journal_lines(self):
+        path = os.path.join(self.storage_path, "index.journal")
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return [line for line in f if line.strip()]
+
+    async def test_journal_replayed_on_load(self):
+        workspace = self._workspace()
+        for i in range(20):
+            await workspace.create_artifact(ArtifactType.TEXT, f"a{i}", content=str(i), metadata={"i": i})
+        await workspace.delete_artifact("a3")
+        await workspace.mark_as_completed("a5")
+        await workspace.flush()
+
+        self.assertEqual("a7", workspace.get_artifact("a7").artifact_id)
+        self.assertIsNone(workspace.get_artifact("a3"))
+        self.assertTrue(self._journal_lines())
+        with open(os.path.join(self.storage_path, "index.json")) as f:
+            self.assertEqual([], json.load(f)["artifacts"])
+
+        reloaded = self._workspace()
+        ids = [artifact.artifact_id for artifact in reloaded.list_artifacts()]
+        self.assertEqual([f"a{i}" for i in range(20) if i != 3], ids)
+        self.assertEqual({"i": 19}, reloaded.get_artifact("a19").metadata)
+        self.assertEqual("19", reloaded.get_artifact("a19").content)
+
+    async def test_journal_compaction(self):
+        workspace = self._workspace(journal_compact_threshold=10)
+        for i in range(25):
+            await workspace.create_artifact(ArtifactType.TEXT, f"a{i}", content=str(i))
+            await workspace.flush()
+
+        self.assertLess(len(self._journal_lines()), 10)
+        with open(os.path.join(self.storage_path, "index.json")) as f:
+            self.assertGreaterEqual(len(json.load(f)["artifacts"]), 15)
+        reloaded = self._workspace()
+        self.assertEqual(25, len(reloaded.list_artifacts()))
+
+    async def test_save_replaces_journal(self):
+        workspace = self._workspace()
+        await workspace.create_artifact(ArtifactType.TEXT, "a0", content="0")
+        await workspace.flush()
+        workspace.metadata = {"owner": "test"}
+        workspace.save()
+
+        self.assertEqual([], self._journal_lines())
+        reloaded = self._workspace()
+        self.assertEqual(["a0"], [artifact.artifact_id for artifact in reloaded.list_artifacts()])
+        self.assertEqual({"owner": "test"}, reloaded.metadata)
+
+    async def test_lookup_after_in_place_change(self):
+        workspace = self._workspace()
+        for i in range(3):
+            await workspace.create_artifact(ArtifactType.TEXT, f"a{i}", content=str(i))
+        workspace.artifacts.pop(0)
+
+        self.assertIsNone(workspace.get_artifact("a0"))
+        self.assertEqual("a2", workspace.get_artifact("a2").artifact_id)
+        await workspace.flush()
+
+    async def test_failed_journal_write_retried(self):
+        repository = FailingJournalRepository(self.storage_path)
+        workspace = WorkSpace(workspace_id="test", repository=repository, use_default_observer=False)
+        await workspace.create_artifact(ArtifactType.TEXT, "a0", content="0")
+        await workspace.flush()
+        self.assertEqual(0, repository.failures)
+        self.assertEqual([], self._journal_lines())
+
+        await workspace.create_artifact(ArtifactType.TEXT, "a1", content="1")
+        await workspace.flush()
+        reloaded = self._workspace()
+        self.assertEqual(["a0", "a1"], [artifact.artifact_id for artifact in reloaded.list_artifacts()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+
+from aworld.core.context.base import Context
+from aworld.core.event.base import Message, TopicType
+from aworld.runners.hook.hook_factory import HookManager, HookFactory
+from aworld.runners.hook.hooks import HookPoint, StartHook
+from aworld.runners.hook.utils import hook
+
+
+class CountedStartHook(StartHook):
+    created = 0
+
+    def __init__(self):
+        CountedStartHook.created += 1
+
+    async def exec(self, message: Message, context: Context = None) -> Message:
+        return message
+
+
+class HookManagerTest(unittest.TestCase):
+
+    def test_no_hooks_shares_empty_dispatch(self):
+        manager = HookManager("hook_type")
+        self.assertEqual((), manager.hooks_of(HookPoint.PRE_LLM_CALL))
+        self.assertIs(manager.hooks_of(HookPoint.PRE_LLM_CALL), manager.hooks_of(HookPoint.POST_LLM_CALL))
+        self.assertEqual([], manager.hooks(HookPoint.START)[HookPoint.START])
+
+    def test_dispatch_cached_until_registration(self):
+        manager = HookManager("hook_type")
+        CountedStartHook.created = 0
+        manager.register(name="counted")(CountedStartHook)
+
+        first = manager.hooks_of(HookPoint.START)
+        self.assertIs(first, manager.hooks_of(HookPoint.START))
+        self.assertEqual(1, CountedStartHook.created)
+
+        version = manager.version
+        manager.register(name="counted_again")(type("CountedAgain", (CountedStartHook,), {}))
+        self.assertGreater(manager.version, version)
+        self.assertEqual(2, len(manager.hooks_of(HookPoint.START)))
+
+        manager.unregister("counted_again")
+        self.assertEqual(1, len(manager.hooks_of(HookPoint.START)))
+
+
+class HookDecoratorTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_registered_in_memory(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                @hook(hook_point=HookPoint.ERROR, name="test_in_memory_error_hook")
+                def error_process(message: Message):
+                    return f"handled {message.payload}" if message.payload else None
+
+                self.assertEqual([], os.listdir(tmp))
+            finally:
+                os.chdir(cwd)
+
+        try:
+            hooks = [h for h in HookFactory.hooks_of(HookPoint.ERROR)
+                     if h.REGISTERED_NAME == "test_in_memory_error_hook"]
+            self.assertEqual(1, len(hooks))
+            res = await hooks[0].exec(Message(payload="boom", session_id="s"))
+            self.assertEqual("handled boom", res.payload)
+            self.assertEqual(HookPoint.ERROR, res.topic)
+
+            res = await hooks[0].exec(Message(payload=None, session_id="s"))
+            self.assertEqual(TopicType.ERROR, res.topic)
+        finally:
+            HookFactory.unregister("test_in_memory_error_hook")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from tests.benchmarks import bench_runner
+from tests.benchmarks.bench_runner import BenchSettings
+
+
+class RunnerBenchmarkTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        BenchSettings.steps = 2
+        BenchSettings.llm_latency = 0
+        BenchSettings.tool_latency = 0
+
+    async def test_tasks_run_all_steps(self):
+        result = await bench_runner.run(tasks=2, concurrency=2)
+
+        self.assertEqual(2, result["succeeded"])
+        # one tool call and the final answer per task
+        self.assertEqual(4, result["steps"])
+        self.assertEqual(2, result["tool_calls"])
+        self.assertGreater(result["step_latency_ms"]["p50"], 0)
+        self.assertEqual(2, len(BenchSettings.calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from aworld.agents.llm_agent import Agent
+from aworld.config.conf import AgentConfig, TaskConfig
+from aworld.core.llm_provider import LLMProviderBase
+from aworld.core.task import Task
+from aworld.dataset.trajectory_sink import JsonlTrajectorySink, OssTrajectorySink, TrajectorySink
+from aworld.models.llm import register_llm_provider
+from aworld.models.model_response import ModelResponse
+from aworld.runner import Runners
+
+
+class EchoProvider(LLMProviderBase):
+    def _init_provider(self):
+        return None
+
+    def postprocess_response(self, response):
+        return response
+
+    def completion(self, messages, temperature=0.0, max_tokens=None, stop=None, **kwargs):
+        return ModelResponse(id="echo", model="echo", content=f"echo: {messages[-1]['content']}")
+
+    async def acompletion(self, messages, temperature=0.0, max_tokens=None, stop=None, **kwargs):
+        return self.completion(messages)
+
+
+register_llm_provider("echo_trajectory", EchoProvider)
+
+
+class FailingSink(TrajectorySink):
+    def __init__(self):
+        self.rows = []
+        self.closed = False
+
+    async def write(self, row, data_row=None):
+        self.rows.append(row)
+        raise IOError("sink unavailable")
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBucket:
+    def __init__(self, objects=None):
+        self.objects = dict(objects or {})
+
+    def object_exists(self, key):
+        return key in self.objects
+
+    def head_object(self, key):
+        return SimpleNamespace(content_length=len(self.objects[key]))
+
+    def append_object(self, key, position, data):
+        content = self.objects.get(key, b"")
+        if position != len(content):
+            raise ValueError(f"position {position} is not the length {len(content)}")
+        self.objects[key] = content + data
+        return SimpleNamespace(next_position=len(self.objects[key]))
+
+
+class FakeOssClient:
+    def __init__(self, bucket=None):
+        self.bucket = bucket
+
+    def initialize(self):
+        return self.bucket is not None
+
+
+class TrajectoryStreamingTest(unittest.IsolatedAsyncioTestCase):
+
+    def _agent(self):
+        return Agent(conf=AgentConfig(llm_provider="echo_trajectory",
+                                      llm_model_name="echo",
+                                      llm_api_key="fake",
+                                      llm_base_url="http://localhost"),
+                     name="echo_agent",
+                     system_prompt="You echo.")
+
+    async def test_rows_streamed_to_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "trajectory", "rows.jsonl")
+            task = Task(input="hello", agent=self._agent(), conf=TaskConfig(trajectory_sink=JsonlTrajectorySink(path)))
+            response = (await Runners.run_task(task))[task.id]
+
+            self.assertTrue(response.success)
+            self.assertEqual(len(response.trajectory), 1)
+            with open(path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual([line["id"] for line in lines], [row["id"] for row in response.trajectory])
+            self.assertEqual(lines[0]["exp_meta"]["agent_id"], response.trajectory[0]["exp_meta"]["agent_id"])
+
+    async def test_sink_failure_does_not_fail_task(self):
+        sink = FailingSink()
+        task = Task(input="hello", agent=self._agent(), conf=TaskConfig(trajectory_sink=sink))
+        response = (await Runners.run_task(task))[task.id]
+
+        self.assertTrue(response.success)
+        self.assertEqual(len(sink.rows), 1)
+        self.assertTrue(sink.closed)
+        self.assertEqual(len(response.trajectory), 1)
+
+    async def test_oss_sink_appends_to_existing_object(self):
+        bucket = FakeBucket({"trajectory.jsonl": b'{"id": "previous"}\n'})
+        sink = OssTrajectorySink("trajectory.jsonl", oss_client=FakeOssClient(bucket))
+        await sink.write({"id": "a"})
+        await sink.write({"id": "b"})
+
+        lines = [json.loads(line) for line in bucket.objects["trajectory.jsonl"].decode().splitlines()]
+        self.assertEqual(["previous", "a", "b"], [line["id"] for line in lines])
+
+    async def test_oss_sink_warns_once_without_client(self):
+        sink = OssTrajectorySink("trajectory.jsonl", oss_client=FakeOssClient())
+        with mock.patch("aworld.dataset.trajectory_sink.logger") as logger:
+            await sink.write({"id": "a"})
+            await sink.write({"id": "b"})
+        self.assertEqual(1, logger.warning.call_count)
@@ -0,0 +1,185 @@
+import asyncio
+import time
+import types
+import unittest
+
+from aworld.agents.llm_agent import Agent
+from aworld.config.conf import AgentConfig, TaskConfig
+from aworld.core.agent.swarm import HandoffSwarm, Swarm
+from aworld.core.common import ActionModel
+from aworld.core.context.registry import context_registry
+from aworld.core.task import Task
+from aworld.runner import Runners
+from aworld.runners.handler.agent import DefaultAgentHandler
+
+
+class SleepAgent(Agent):
+    """Agent answering after a delay, records how many agents run at the same time."""
+
+    running = 0
+    max_running = 0
+
+    def __init__(self, name: str, delay: float):
+        super().__init__(conf=AgentConfig(llm_provider="openai",
+                                          llm_model_name="fake",
+                                          llm_api_key="fake",
+                                          llm_base_url="http://localhost"),
+                         name=name)
+        self.delay = delay
+        self.ran = False
+
+    async def async_policy(self, observation, info=None, message=None, **kwargs):
+        self.ran = True
+        SleepAgent.running += 1
+        SleepAgent.max_running = max(SleepAgent.max_running, SleepAgent.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            SleepAgent.running -= 1
+        self._finished = True
+        content = observation.content
+        if isinstance(content, dict):
+            content = ",".join(content[key] for key in sorted(content))
+        return [ActionModel(agent_name=self.id(), policy_info=f"{self.name()}({content})")]
+
+
+class HandoffAgent(SleepAgent):
+    """Agent handing off to the end agent, which is not one of its handoffs."""
+
+    async def async_policy(self, observation, info=None, message=None, **kwargs):
+        self._finished = True
+        return [ActionModel(agent_name=self.target, policy_info="handoff")]
+
+
+class ThreadAgent(Agent):
+    """Agent with a blocking policy, run in a worker thread, records the context it wrote."""
+
+    contexts = {}
+
+    def __init__(self, name: str, delay: float):
+        super().__init__(conf=AgentConfig(llm_provider="openai",
+                                          llm_model_name="fake",
+                                          llm_api_key="fake",
+                                          llm_base_url="http://localhost"),
+                         name=name)
+        self.delay = delay
+
+    def policy(self, observation, info=None, message=None, **kwargs):
+        time.sleep(self.delay)
+        ThreadAgent.contexts[self.name()] = message.context
+        message.context.add_token({"total_tokens": 1})
+        message.context.context_info[self.name()] = True
+        self._finished = True
+        content = observation.content
+        if isinstance(content, dict):
+            content = ",".join(content[key] for key in sorted(content))
+        return [ActionModel(agent_name=self.id(), policy_info=f"{self.name()}({content})")]
+
+
+class WorkflowDagTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        SleepAgent.running = 0
+        SleepAgent.max_running = 0
+
+    def _fan_out_task(self, event_driven: bool, max_parallel_agents: int = 8) -> Task:
+        # start -> (b, c, d) -> end
+        start = SleepAgent("start", 0.05)
+        branches = [SleepAgent(name, 0.3) for name in ("b", "c", "d")]
+        end = SleepAgent("end", 0.05)
+        topology = [(start, agent) for agent in branches] + [(agent, end) for agent in branches]
+        swarm = Swarm(topology=topology)
+        return Task(input="q", swarm=swarm, event_driven=event_driven,
+                    conf=TaskConfig(max_parallel_agents=max_parallel_agents))
+
+    async def _run(self, task: Task):
+        begin = time.monotonic()
+        response = (await Runners.run_task(task))[task.id]
+        return response, time.monotonic() - begin
+
+    async def test_call_driven_runs_branches_concurrently(self):
+        response, cost = await self._run(self._fan_out_task(event_driven=False))
+
+        self.assertTrue(response.success)
+        self.assertEqual("end(b(start(q)),c(start(q)),d(start(q)))", response.answer)
+        self.assertEqual(3, SleepAgent.max_running)
+        # critical path is 0.4s, sequential execution takes 1s
+        self.assertLess(cost, 0.8)
+
+    async def test_call_driven_concurrency_cap(self):
+        response, _ = await self._run(self._fan_out_task(event_driven=False, max_parallel_agents=2))
+
+        self.assertTrue(response.success)
+        self.assertEqual(2, SleepAgent.max_running)
+
+    async def test_event_driven_joins_once(self):
+        response, cost = await self._run(self._fan_out_task(event_driven=True))
+
+        self.assertTrue(response.success)
+        self.assertEqual("end(b(start(q)),c(start(q)),d(start(q)))", response.answer)
+        self.assertEqual(3, SleepAgent.max_running)
+        self.assertLess(cost, 0.8)
+
+    async def test_event_driven_concurrency_cap(self):
+        response, _ = await self._run(self._fan_out_task(event_driven=True, max_parallel_agents=1))
+
+        self.assertTrue(response.success)
+        self.assertEqual(1, SleepAgent.max_running)
+
+    async def test_call_driven_branches_write_own_context(self):
+        ThreadAgent.contexts = {}
+        start, end = ThreadAgent("start", 0.01), ThreadAgent("end", 0.01)
+        branches = [ThreadAgent(name, 0.1) for name in ("b", "c", "d")]
+        swarm = Swarm(topology=[(start, agent) for agent in branches] + [(agent, end) for agent in branches])
+        task = Task(input="q", swarm=swarm, event_driven=False)
+        response, _ = await self._run(task)
+
+        self.assertTrue(response.success)
+        self.assertEqual("end(b(start(q)),c(start(q)),d(start(q)))", response.answer)
+        self.assertEqual(5, len({id(ThreadAgent.contexts[name]) for name in ("start", "b", "c", "d", "end")}))
+        # the writes of the branches are merged into the context of the end agent
+        self.assertEqual(5, response.usage["total_tokens"])
+        self.assertTrue(all(ThreadAgent.contexts["end"].context_info.get(name) for name in ("b", "c", "d")))
+
+    async def test_call_driven_response_ends_workflow(self):
+        start, end = SleepAgent("start", 0.01), SleepAgent("end", 0.01)
+        failing, slow = HandoffAgent("b", 0.01), SleepAgent("c", 0.3)
+        swarm = Swarm(topology=[(start, failing), (start, slow), (failing, end), (slow, end)])
+        failing.target, failing.handoffs = end.id(), [slow.id()]
+        response, cost = await self._run(Task(input="q", swarm=swarm, event_driven=False))
+
+        self.assertFalse(response.success)
+        self.assertIn(f"Can not handoffs {end.id()} agent", response.msg)
+        self.assertFalse(end.ran)
+        self.assertLess(cost, 0.3)
+
+    def test_workflow_outputs_of_previous_round_dropped(self):
+        handler = object.__new__(DefaultAgentHandler)
+        handler.workflow_outputs = {}
+        # start -> (b, c) -> end, a loop agent going back to start begins the next round
+        graph = types.SimpleNamespace(successor={"start": {"b": 1, "c": 1}, "b": {"end": 1}, "c": {"end": 1}})
+        for agent in ("start", "b", "c", "end"):
+            handler._record_workflow_output(graph, agent, f"{agent}-1")
+
+        handler._record_workflow_output(graph, "start", "start-2")
+        handler._record_workflow_output(graph, "b", "b-2")
+        self.assertEqual({"start": "start-2", "b": "b-2"}, handler.workflow_outputs)
+
+    async def test_call_driven_releases_contexts(self):
+        task = self._fan_out_task(event_driven=False)
+        response, _ = await self._run(task)
+
+        self.assertTrue(response.success)
+        self.assertEqual(0, context_registry.size(task.id))
+
+    async def test_handoff_releases_contexts(self):
+        first, second = SleepAgent("first", 0.01), SleepAgent("second", 0.01)
+        task = Task(input="q", swarm=HandoffSwarm((first, second)), event_driven=False)
+        response, _ = await self._run(task)
+
+        self.assertTrue(response.success)
+        self.assertEqual(0, context_registry.size(task.id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from aworld.sandbox.api.kubernetes.sandbox_api import KubernetesSandboxApi
+from aworld.sandbox.api.kubernetes.warm_pool import KubernetesSandboxPool, RecyclePolicy
+from aworld.sandbox.env_client.kubernetes.client import KubernetesApiClient
+from aworld.sandbox.implementations.kubernetes_sandbox import KubernetesSandbox
+from aworld.sandbox.models import SandboxStatus
+
+
+class FakeKubernetesApi:
+    """In-process stand-in of `KubernetesApiClient`, pods take `cold_start` seconds to run."""
+
+    def __init__(self, cold_start: float = 0.2):
+        self.cold_start = cold_start
+        self.pods = {}
+        self.services = {}
+        self.created = 0
+        self._lock = threading.Lock()
+
+    def create_pod_from_yaml(self, pod_name=None, **kwargs):
+        with self._lock:
+            self.pods[pod_name] = time.monotonic() + self.cold_start
+            self.created += 1
+        return {"name": pod_name}
+
+    def wait_pod_running(self, name, namespace="default", timeout=60):
+        # a blocking watch, like the kubernetes client
+        ready_at = self.pods.get(name)
+        if ready_at is None:
+            return None
+        time.sleep(max(ready_at - time.monotonic(), 0))
+        return {"pod_name": name, "status": "Running"}
+
+    def create_service_from_yaml(self, service_name=None, selector_name=None, **kwargs):
+        self.services[service_name] = selector_name
+        return {"name": service_name}
+
+    def wait_service_ready(self, name, namespace="default", timeout=60):
+        return {"service_name": name, "type": "ClusterIP", "cluster_ip": "10.0.0.1", "host": ""}
+
+    def delete_pod(self, name, namespace="default"):
+        with self._lock:
+            self.pods.pop(name, None)
+
+    def delete_service(self, name, namespace="default"):
+        self.services.pop(name, None)
+
+
+class KubernetesWarmPoolTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.api = FakeKubernetesApi()
+
+    async def _wait_idle(self, pool: KubernetesSandboxPool, count: int):
+        while pool.stats()["idle"] < count:
+            await asyncio.sleep(0.01)
+
+    async def test_warm_lease_is_immediate(self):
+        pool = KubernetesSandboxPool(min_size=2, max_size=4, client=self.api)
+        await pool.start()
+        await asyncio.wait_for(self._wait_idle(pool, 2), 5)
+
+        begin = time.perf_counter()
+        sandbox = await pool.lease()
+        self.assertLess(time.perf_counter() - begin, 0.01)
+        self.assertIn(sandbox.pod_name, self.api.pods)
+        # replenished in the background
+        self.assertEqual({"idle": 1, "leased": 1, "provisioning": 1}, pool.stats())
+
+        self.assertTrue(await pool.release(sandbox.pod_name))
+        await pool.close()
+        self.assertEqual({}, self.api.pods)
+
+    def _heartbeat(self, gaps: list) -> asyncio.Task:
+        async def heartbeat():
+            last = time.perf_counter()
+            while True:
+                await asyncio.sleep(0.005)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        return asyncio.create_task(heartbeat())
+
+    async def test_loop_not_blocked_while_provisioning(self):
+        pool = KubernetesSandboxPool(min_size=3, max_size=3, client=self.api)
+        gaps = []
+        beat = self._heartbeat(gaps)
+        await pool.start()
+        # a cold lease while the pool is provisioning waits for a sandbox without blocking
+        sandbox = await pool.lease()
+        await asyncio.wait_for(self._wait_idle(pool, 2), 5)
+        beat.cancel()
+
+        self.assertIsNotNone(sandbox)
+        self.assertLess(max(gaps), 0.1)
+        await pool.release(sandbox.pod_name)
+        await pool.close()
+
+    async def test_loop_not_blocked_by_cold_sandbox(self):
+        # no warm pool, the sandbox is created on demand
+        gaps = []
+        beat = self._heartbeat(gaps)
+        with mock.patch("aworld.sandbox.api.kubernetes.sandbox_api.KubernetesApiClient", return_value=self.api):
+            begin = time.perf_counter()
+            sandbox = KubernetesSandbox(mcp_servers=["search"])
+            self.assertLess(time.perf_counter() - begin, 0.05)
+            self.assertEqual(SandboxStatus.INIT, sandbox.status)
+            await sandbox.wait_ready()
+            beat.cancel()
+
+            self.assertLess(max(gaps), 0.1)
+            self.assertEqual(SandboxStatus.RUNNING, sandbox.status)
+            self.assertEqual("http://10.0.0.1:80/search",
+                             sandbox.mcpservers.mcp_config["mcpServers"]["search"]["url"])
+            await sandbox.remove()
+        self.assertEqual({}, self.api.pods)
+
+    async def test_recycle_and_destroy_policies(self):
+        resets = []
+
+        async def reset(sandbox):
+            resets.append(sandbox.pod_name)
+            return True
+
+        pool = KubernetesSandboxPool(min_size=0, max_size=1, recycle_policy=RecyclePolicy.RECYCLE, max_uses=2,
+                                     client=self.api, reset=reset)
+        first = await pool.lease()
+        await pool.release(first.pod_name)
+        self.assertEqual([first.pod_name], resets)
+        self.assertIs(first, await pool.lease())
+        # leased max_uses times, destroyed on return
+        await pool.release(first.pod_name)
+        self.assertNotIn(first.pod_name, self.api.pods)
+
+        # the pool is full, the lease waits for a return
+        leased = await pool.lease()
+        waiting = asyncio.create_task(pool.lease(timeout=5))
+        await asyncio.sleep(0.05)
+        self.assertFalse(waiting.done())
+        await pool.release(leased.pod_name)
+        self.assertIs(leased, await waiting)
+        self.assertIsNone(await pool.lease(timeout=0.05))
+        await pool.release(leased.pod_name)
+        await pool.close()
+
+        # destroyed by default
+        destroying = KubernetesSandboxPool(min_size=0, max_size=1, client=self.api)
+        sandbox = await destroying.lease()
+        await destroying.release(sandbox.pod_name)
+        self.assertEqual({}, self.api.pods)
+        self.assertEqual({"idle": 0, "leased": 0, "provisioning": 0}, destroying.stats())
+
+        # a sandbox that failed to reset is not reused
+        async def failing_reset(sandbox):
+            raise RuntimeError("reset failed")
+
+        resetting = KubernetesSandboxPool(min_size=0, max_size=1, recycle_policy=RecyclePolicy.RECYCLE,
+                                          client=self.api, reset=failing_reset)
+        sandbox = await resetting.lease()
+        await resetting.release(sandbox.pod_name)
+        self.assertEqual({}, self.api.pods)
+        self.assertEqual(0, resetting.stats()["idle"])
+
+    async def test_sandbox_api_leases_from_pool(self):
+        pool = KubernetesSandboxPool(min_size=1, max_size=1, recycle_policy=RecyclePolicy.RECYCLE, client=self.api)
+        await pool.start()
+        await asyncio.wait_for(self._wait_idle(pool, 1), 5)
+        KubernetesSandboxApi.warm_pool = pool
+        try:
+            response = KubernetesSandboxApi._create_sandbox(env_type=2, env_config=None, mcp_servers=["search"])
+            self.assertTrue(response.pooled)
+            self.assertEqual("http://10.0.0.1:80/search", response.mcp_config["mcpServers"]["search"]["url"])
+
+            removed = await KubernetesSandboxApi._remove_sandbox(
+                sandbox_id="s", metadata={"pod_name": response.pod_name, "service_name": response.service_name,
+                                          "pooled": True})
+            self.assertTrue(removed)
+            self.assertEqual(1, pool.stats()["idle"])
+            self.assertEqual(1, self.api.created)
+        finally:
+            KubernetesSandboxApi.warm_pool = None
+            await pool.close()
+
+
+def fake_pod(phase: str, ready: bool = False):
+    conditions = [SimpleNamespace(type="Ready", status="True" if ready else "False")]
+    return SimpleNamespace(metadata=SimpleNamespace(name="pod", namespace="default"),
+                           spec=SimpleNamespace(node_name="node"),
+                           status=SimpleNamespace(phase=phase, conditions=conditions, pod_ip="10.0.0.2",
+                                                  host_ip="10.0.1.1", start_time=None))
+
+
+class WaitPodRunningTest(unittest.TestCase):
+
+    def test_waits_for_ready_condition(self):
+        pods = [fake_pod("Pending"), fake_pod("Running"), fake_pod("Running", ready=True)]
+        api = KubernetesApiClient.__new__(KubernetesApiClient)
+        api.core_v1 = mock.Mock()
+        # the current pod is read before the watch and once it is ready
+        api.core_v1.read_namespaced_pod.side_effect = [pods[0], pods[2]]
+        with mock.patch("aworld.sandbox.env_client.kubernetes.client.watch.Watch") as watch:
+            events = [{"type": "MODIFIED", "object": pod} for pod in pods]
+            watch.return_value.stream.return_value = iter(events)
+            pod_info = api.wait_pod_running("pod")
+        self.assertTrue(pod_info["ready"])
+
+        api.core_v1.read_namespaced_pod.side_effect = [pods[1]]
+        with mock.patch("aworld.sandbox.env_client.kubernetes.client.watch.Watch") as watch:
+            # running but never ready
+            watch.return_value.stream.return_value = iter([{"type": "MODIFIED", "object": pods[1]}])
+            self.assertIsNone(api.wait_pod_running("pod"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import pickle
+import tempfile
+import unittest
+from datetime import datetime
+
+from aworld.cmd.data_model import ChatCompletionMessage, SessionModel
+from aworld.session.simple_session_service import SimpleSessionService
+
+
+def user_message(content: str) -> ChatCompletionMessage:
+    return ChatCompletionMessage(role="user", content=content)
+
+
+class SimpleSessionServiceTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    async def test_append_get_list_delete(self):
+        service = SimpleSessionService(self.tmp.name)
+        await service.append_messages("u1", "s1", [user_message("hello")])
+        await service.append_messages("u1", "s1", [ChatCompletionMessage(role="assistant", content="hi", trace_id="t")])
+        await service.append_messages("u1", "s2", [user_message("second")])
+        await service.append_messages("u10", "s3", [user_message("other user")])
+
+        session = await service.get_session("u1", "s1")
+        self.assertEqual("hello", session.name)
+        self.assertEqual(["hello", "hi"], [message.content for message in session.messages])
+        self.assertEqual("t", session.messages[1].trace_id)
+        self.assertGreaterEqual(session.updated_at, session.created_at)
+        self.assertIsNone(await service.get_session("u1", "missing"))
+
+        self.assertEqual(["s2", "s1"], [session.session_id for session in await service.list_sessions("u1")])
+
+        await service.delete_session("u1", "s1")
+        self.assertIsNone(await service.get_session("u1", "s1"))
+        # reopened from the database
+        reopened = SimpleSessionService(self.tmp.name)
+        self.assertEqual(["s2"], [session.session_id for session in await reopened.list_sessions("u1")])
+
+    async def test_import_legacy_pickle(self):
+        now = datetime.now()
+        sessions = {
+            "u1:s1": SessionModel(user_id="u1", session_id="s1", name="legacy", description="legacy",
+                                  created_at=now, updated_at=now,
+                                  messages=[user_message("a"), user_message("b")]),
+        }
+        with open(os.path.join(self.tmp.name, "session.bin"), "wb") as f:
+            pickle.dump(sessions, f)
+
+        service = SimpleSessionService(self.tmp.name)
+        session = await service.get_session("u1", "s1")
+        self.assertEqual(["a", "b"], [message.content for message in session.messages])
+        self.assertEqual(now, session.created_at)
+
+        await service.append_messages("u1", "s1", [user_message("c")])
+        # imported once
+        reopened = SimpleSessionService(self.tmp.name)
+        session = await reopened.get_session("u1", "s1")
+        self.assertEqual(["a", "b", "c"], [message.content for message in session.messages])
+
+
+if __name__ == '__main__':
+    unittest.main()
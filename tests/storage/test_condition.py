@@ -0,0 +1,95 @@
+import random
+import unittest
+from dataclasses import dataclass
+
+from aworld.core.storage.condition import ConditionFilter, compile_condition
+from aworld.core.storage.data import Data
+from aworld.core.storage.inmemory_store import InmemoryStorage, InmemoryConfig
+
+
+@dataclass
+class Step:
+    task: str
+    step: int
+    tool: str = None
+
+
+def make_items(count: int):
+    rand = random.Random(7)
+    return [Data(block_id=f"b{i % 5}", id=f"d{i}",
+                 value=Step(task=f"t{rand.randint(0, 9)}", step=rand.randint(0, 99),
+                            tool=rand.choice([None, "search", "browser"])))
+            for i in range(count)]
+
+
+CONDITIONS = [
+    {"field": "task", "value": "t3", "op": "eq"},
+    {"field": "step", "value": 50, "op": "gte"},
+    {"field": "task", "value": ["t1", "t2"], "op": "in"},
+    {"field": "task", "value": ["t1", "t2"], "op": "not_in"},
+    {"field": "tool", "op": "is_null", "value": None},
+    {"field": "tool", "value": "sea", "op": "like"},
+    {"and_": [{"field": "task", "value": "t3", "op": "eq"}, {"field": "step", "value": 10, "op": "lt"}]},
+    {"or_": [{"field": "task", "value": "t3", "op": "eq"},
+             {"and_": [{"field": "step", "value": 90, "op": "gt"}, {"field": "tool", "op": "is_not_null", "value": None}]}]},
+    {"field": "task", "value": "t3", "op": "unknown"},
+]
+
+
+class ConditionTest(unittest.IsolatedAsyncioTestCase):
+
+    def test_compiled_matches_interpreted(self):
+        items = make_items(500)
+        for condition in CONDITIONS:
+            condition_filter = ConditionFilter(condition)
+            predicate = compile_condition(condition)
+            for item in items:
+                if condition.get("op") == "like" and item.value.tool is None:
+                    continue
+                self.assertEqual(bool(condition_filter.check_condition(item, condition)), predicate(item),
+                                 f"{condition} {item}")
+
+    def test_dict_value(self):
+        item = Data(value={"task": "t1", "step": 3})
+        self.assertTrue(compile_condition({"field": "task", "value": "t1", "op": "eq"})(item))
+        self.assertTrue(ConditionFilter(None).check_condition(item, {"field": "step", "value": 2, "op": "gt"}))
+
+    async def test_index_pushdown(self):
+        indexed = InmemoryStorage(InmemoryConfig(index_fields=["task", "tool"]))
+        scanned = InmemoryStorage()
+        items = make_items(1000)
+        for item in items:
+            await indexed.create_data(item)
+            await scanned.create_data(item)
+        # updates and deletes keep the index in sync
+        updated = Data(block_id="b0", id="d0", value=Step(task="t42", step=1))
+        await indexed.update_data(updated)
+        await scanned.update_data(updated)
+        await indexed.delete_data("d5", block_id="b0")
+        await scanned.delete_data("d5", block_id="b0")
+
+        conditions = CONDITIONS[:4] + CONDITIONS[6:8] + [{"field": "task", "value": "t42", "op": "eq"}]
+        for condition in conditions:
+            expected = [item.id for item in await scanned.select_data(condition)]
+            self.assertEqual(expected, [item.id for item in await indexed.select_data(condition)], condition)
+
+        self.assertEqual(["d0"], [item.id for item in await indexed.select_data(conditions[-1])])
+        self.assertIsNotNone(indexed._field_index.candidates(CONDITIONS[0]))
+        self.assertIsNone(indexed._field_index.candidates(CONDITIONS[1]))
+
+    async def test_index_keeps_scan_order(self):
+        indexed = InmemoryStorage(InmemoryConfig(index_fields=["task"]))
+        scanned = InmemoryStorage()
+        for storage in (indexed, scanned):
+            for block_id, data_id in (("x", "x1"), ("y", "y1"), ("x", "x2")):
+                await storage.create_data(Data(block_id=block_id, id=data_id, value=Step(task="t", step=0)))
+            # overwritten in place, not moved to the end
+            await storage.create_data(Data(block_id="x", id="x1", value=Step(task="t", step=1)))
+
+        condition = {"field": "task", "value": "t", "op": "eq"}
+        self.assertEqual(["x1", "x2", "y1"], [item.id for item in await scanned.select_data(condition)])
+        self.assertEqual(["x1", "x2", "y1"], [item.id for item in await indexed.select_data(condition)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from aworld.core.storage.data import Data
+from aworld.core.storage.file_store import FileStorage, FileConfig
+
+
+class FileStorageTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _storage(self, **kwargs) -> FileStorage:
+        return FileStorage(FileConfig(root_dir=self.tmp.name, **kwargs))
+
+    def _segment_files(self, block_id: str):
+        return sorted(Path(self.tmp.name, block_id, "segments").glob("*.log"))
+
+    async def test_crud_and_reopen(self):
+        storage = self._storage()
+        for i in range(100):
+            await storage.create_data(Data(block_id="task", id=f"d{i}", value={"step": i}))
+        await storage.update_data(Data(block_id="task", id="d1", value={"step": -1}))
+        await storage.delete_data("d2", block_id="task")
+        self.assertFalse(await storage.create_data(Data(block_id="task", id="d3", value={}), overwrite=False))
+
+        self.assertEqual(1, len(self._segment_files("task")))
+        self.assertEqual(99, await storage.size())
+
+        reopened = self._storage()
+        items = {item.id: item.value for item in await reopened.get_data_items("task")}
+        self.assertEqual(99, len(items))
+        self.assertEqual({"step": -1}, items["d1"])
+        self.assertNotIn("d2", items)
+
+    async def test_segment_roll_and_compaction(self):
+        storage = self._storage(segment_max_bytes=2048, compact_min_bytes=4096, compact_dead_ratio=0.5)
+        for round_ in range(5):
+            for i in range(20):
+                await storage.update_data(Data(block_id="task", id=f"d{i}", value={"round": round_}))
+        await storage.compact("task")
+
+        segments = storage._block_segments("task")
+        self.assertEqual(0, sum(segments.dead.values()))
+        self.assertLessEqual(sum(segments.sizes.values()), 20 * 200)
+
+        reopened = self._storage()
+        items = await reopened.get_data_items("task")
+        self.assertEqual(20, len(items))
+        self.assertTrue(all(item.value == {"round": 4} for item in items))
+
+    async def test_torn_tail_ignored(self):
+        storage = self._storage()
+        await storage.create_data(Data(block_id="task", id="d0", value={"a": 1}))
+        storage._close_blocks()
+        with open(self._segment_files("task")[0], "ab") as f:
+            f.write(b'put\t"d1"\t{"val')
+
+        reopened = self._storage()
+        self.assertEqual(["d0"], [item.id for item in await reopened.get_data_items("task")])
+        await reopened.create_data(Data(block_id="task", id="d2", value={"a": 2}))
+        self.assertEqual(2, len(await self._storage().get_data_items("task")))
+
+    async def test_legacy_layout_imported(self):
+        data_dir = Path(self.tmp.name, "task", "data")
+        data_dir.mkdir(parents=True)
+        Path(self.tmp.name, "task", "meta.json").write_text(json.dumps({"id": "task"}))
+        (data_dir / "old.json").write_text(json.dumps(Data(block_id="task", id="old", value={"a": 1}).to_dict()))
+
+        storage = self._storage()
+        self.assertEqual(["old"], [item.id for item in await storage.get_data_items("task")])
+        self.assertFalse(data_dir.exists())
+
+    async def test_select_prunes_blocks(self):
+        storage = self._storage()
+        for block in range(10):
+            for i in range(10):
+                await storage.create_data(Data(block_id=f"b{block}", id=f"d{i}", value={"step": block * 10 + i}))
+
+        loaded = []
+        load = storage._load_all_data_in_block
+        storage._load_all_data_in_block = lambda block_id: loaded.append(block_id) or load(block_id)
+        await storage.select_data({"field": "step", "value": 42, "op": "eq"})
+        self.assertEqual(["b4"], loaded)
+
+        loaded.clear()
+        await storage.select_data({"or_": [{"field": "step", "value": 3, "op": "eq"},
+                                           {"field": "step", "value": [97, 98], "op": "in"}]})
+        self.assertEqual(["b0", "b9"], sorted(loaded))
+
+        loaded.clear()
+        await storage.select_data({"field": "missing", "value": 1, "op": "eq"})
+        self.assertEqual([], loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import asyncio
+import multiprocessing
+import unittest
+
+from aworld.core.storage.data import Data
+from aworld.core.storage.multi_process_store import MultiProcessStorage, MultiProcessConfig
+
+
+def write_items(storage: MultiProcessStorage, worker: int, count: int):
+    async def _write():
+        for i in range(count):
+            await storage.create_data(Data(block_id="task", id=f"w{worker}_{i}", value={"worker": worker, "i": i}))
+        await storage.delete_data(f"w{worker}_0", block_id="task")
+
+    asyncio.run(_write())
+
+
+def overwrite_items(storage: MultiProcessStorage, worker: int, count: int):
+    async def _write():
+        for i in range(count):
+            await storage.create_data(Data(block_id="task", id=f"w{worker}", value=i))
+
+    asyncio.run(_write())
+
+
+class MultiProcessStorageTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        # small segments so the arenas grow over several segments
+        self.storage = MultiProcessStorage(MultiProcessConfig(arena_segment_bytes=4096))
+
+    def tearDown(self):
+        self.storage.close()
+
+    async def test_crud(self):
+        for i in range(100):
+            await self.storage.create_data(Data(block_id="task", id=f"d{i}", value={"step": i}))
+        await self.storage.update_data(Data(block_id="task", id="d1", value={"step": -1}))
+        await self.storage.delete_data("d2", block_id="task")
+        self.assertFalse(await self.storage.create_data(Data(block_id="task", id="d3", value={}), overwrite=False))
+        self.assertFalse(await self.storage.update_data(Data(block_id="task", id="x", value={}), exists=True))
+
+        items = {item.id: item.value for item in await self.storage.get_data_items("task")}
+        self.assertEqual(99, len(items))
+        self.assertEqual({"step": -1}, items["d1"])
+        self.assertNotIn("d2", items)
+        self.assertEqual(99, await self.storage.size())
+
+        selected = await self.storage.select_data({"field": "step", "value": 5, "op": "eq"})
+        self.assertEqual(["d5"], [item.id for item in selected])
+
+    async def test_delete_and_recreate_block(self):
+        await self.storage.create_data(Data(block_id="task", id="d0", value=0))
+        await self.storage.delete_block("task")
+        self.assertEqual([], await self.storage.get_data_items("task"))
+
+        await self.storage.create_data(Data(block_id="task", id="d1", value=1))
+        self.assertEqual(["d1"], [item.id for item in await self.storage.get_data_items("task")])
+        await self.storage.delete_all()
+        self.assertEqual(0, await self.storage.size())
+
+    async def test_overwrites_compacted(self):
+        storage = MultiProcessStorage(MultiProcessConfig(arena_segment_bytes=4096, arena_compact_bytes=8192))
+        try:
+            for step in range(1000):
+                await storage.create_data(Data(block_id="task", id=f"d{step % 10}", value={"step": step}))
+            await storage.delete_data("d0", block_id="task")
+            arena = storage._arena("task")
+            self.assertLessEqual(arena.dead_bytes, 8192)
+            # the records of 1000 writes take about 100 segments
+            self.assertLess(arena._segment_count(), 10)
+
+            items = {item.id: item.value for item in await storage.get_data_items("task")}
+            self.assertEqual(9, len(items))
+            self.assertEqual({"step": 999}, items["d9"])
+            self.assertEqual(9, await storage.size())
+        finally:
+            storage.close()
+
+    async def test_max_capacity(self):
+        storage = MultiProcessStorage(MultiProcessConfig(max_capacity=3))
+        try:
+            for i in range(3):
+                self.assertTrue(await storage.create_data(Data(block_id=f"task{i % 2}", id=f"d{i}", value=i)))
+            self.assertFalse(await storage.create_data(Data(block_id="task0", id="d3", value=3)))
+            # overwrites do not take capacity
+            self.assertTrue(await storage.create_data(Data(block_id="task0", id="d0", value=-1)))
+
+            await storage.delete_data("d1", block_id="task1")
+            self.assertTrue(await storage.create_data(Data(block_id="task0", id="d3", value=3)))
+            await storage.delete_block("task0")
+            self.assertTrue(await storage.create_data(Data(block_id="task1", id="d4", value=4)))
+            self.assertEqual(1, await storage.size())
+        finally:
+            storage.close()
+
+    async def test_processes_share_blocks(self):
+        await self.storage.create_data(Data(block_id="task", id="parent", value={}))
+        # read before the children write, the offset table is synced incrementally afterwards
+        self.assertEqual(1, len(await self.storage.get_data_items("task")))
+
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=write_items, args=(self.storage, worker, 50)) for worker in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(30)
+            self.assertEqual(0, process.exitcode)
+
+        items = await self.storage.get_data_items("task")
+        ids = {item.id for item in items}
+        self.assertEqual(1 + 3 * 49, len(items))
+        self.assertIn("parent", ids)
+        self.assertNotIn("w1_0", ids)
+        self.assertEqual({"worker": 2, "i": 49}, next(item.value for item in items if item.id == "w2_49"))
+
+    async def test_processes_follow_compaction(self):
+        storage = MultiProcessStorage(MultiProcessConfig(arena_segment_bytes=4096, arena_compact_bytes=4096))
+        try:
+            await storage.create_data(Data(block_id="task", id="parent", value={}))
+            self.assertEqual(1, len(await storage.get_data_items("task")))
+            context = multiprocessing.get_context("fork")
+            processes = [context.Process(target=overwrite_items, args=(storage, worker, 200)) for worker in range(3)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join(30)
+                self.assertEqual(0, process.exitcode)
+
+            items = {item.id: item.value for item in await storage.get_data_items("task")}
+            self.assertEqual({"parent": {}, "w0": 199, "w1": 199, "w2": 199}, items)
+        finally:
+            storage.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from tests.benchmarks.bench_import_time import import_time
+
+# regression budget of `import aworld`, measured at about 15ms
+IMPORT_BUDGET_MS = 300
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_import_within_budget(self):
+        cost = min(import_time("aworld")["aworld"] for _ in range(3)) / 1000
+        self.assertLess(cost, IMPORT_BUDGET_MS)
+
+    def test_heavy_modules_deferred(self):
+        imported = import_time("aworld")
+        for module in ("aworld.trace", "aworld.runner", "openai", "opentelemetry", "fastapi"):
+            self.assertNotIn(module, imported)
+
+    def test_logging_does_not_import_trace(self):
+        imported = import_time("aworld", "from aworld.logs.util import logger\nlogger.info('ok')")
+        self.assertNotIn("aworld.trace", imported)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+import asyncio
+import time
+import unittest
+
+import aworld.trace.base as trace_base
+from aworld.trace.asyncio_monitor.profiler import LoopProfiler, BLOCKING_EVENT_NAME
+
+
+class RecordingSpan(trace_base.NoOpSpan):
+    def __init__(self):
+        self.events = []
+
+    def is_recording(self) -> bool:
+        return True
+
+    def add_event(self, name, attributes=None, timestamp=None):
+        self.events.append((name, attributes))
+
+
+class RecordingProvider:
+    def __init__(self, span):
+        self.span = span
+
+    def get_current_span(self):
+        return self.span
+
+
+def blocking_call(seconds: float):
+    time.sleep(seconds)
+
+
+async def blocking_handler():
+    await asyncio.sleep(0)
+    blocking_call(0.3)
+    return "done"
+
+
+async def friendly_handler():
+    for _ in range(5):
+        await asyncio.sleep(0.01)
+
+
+class LoopProfilerTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.span = RecordingSpan()
+        self.origin_provider = trace_base._GLOBAL_TRACER_PROVIDER
+        trace_base.set_tracer_provider(RecordingProvider(self.span))
+
+    def tearDown(self):
+        trace_base.set_tracer_provider(self.origin_provider)
+
+    async def test_blocking_step_is_sampled_and_reported(self):
+        with LoopProfiler(probe_interval=0.02, slow_callback_ms=100) as profiler:
+            results = await asyncio.gather(asyncio.create_task(blocking_handler()),
+                                           asyncio.create_task(friendly_handler()))
+            stats = profiler.coroutine_stats()
+        self.assertEqual("done", results[0])
+
+        self.assertEqual(1, len(profiler.blocking_events))
+        event = profiler.blocking_events[0]
+        self.assertEqual("blocking_handler", event["coroutine"])
+        self.assertGreaterEqual(event["duration_ms"], 300)
+        # the watchdog captured the stack while the loop was blocked
+        self.assertIn("blocking_call", event["location"])
+        self.assertTrue(any("blocking_handler" in line for line in event["stack"]))
+
+        self.assertEqual([BLOCKING_EVENT_NAME], [name for name, _ in self.span.events])
+        self.assertGreaterEqual(profiler.max_lag, 0.2)
+
+        self.assertEqual(2, stats["blocking_handler"]["steps"])
+        self.assertGreaterEqual(stats["blocking_handler"]["max_step"], 0.3)
+        self.assertEqual(6, stats["friendly_handler"]["steps"])
+        self.assertLess(stats["friendly_handler"]["max_step"], 0.1)
+
+    async def test_stop_restores_task_factory(self):
+        loop = asyncio.get_running_loop()
+        origin = loop.get_task_factory()
+        profiler = LoopProfiler(probe_interval=0.02)
+        profiler.start()
+        self.assertIsNotNone(loop.get_task_factory())
+        await asyncio.create_task(friendly_handler())
+        profiler.stop()
+        self.assertIs(origin, loop.get_task_factory())
+        self.assertEqual([], list(profiler.blocking_events))
+
+
+if __name__ == '__main__':
+    unittest.main()
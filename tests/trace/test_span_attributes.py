@@ -0,0 +1,121 @@
+# coding: utf-8
+# Copyright (c) 2025 inclusionAI.
+import threading
+import unittest
+
+from opentelemetry.sdk.trace import TracerProvider as SDKTracerProvider, SynchronousMultiSpanProcessor
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_OFF
+
+from aworld.trace.attributes import lazy_attribute, limit_attribute_value
+from aworld.trace.function_trace import pre_process_func_args
+from aworld.trace.opentelemetry.opentelemetry_adapter import OTLPTraceProvider, DeferredAttributeSpanProcessor
+
+
+class CountingSerializer:
+    def __init__(self, value: str):
+        self.value = value
+        self.calls = 0
+        self.thread = None
+
+    def __call__(self):
+        self.calls += 1
+        self.thread = threading.get_ident()
+        return self.value
+
+
+def build_provider(deferred: bool = True, sampler=None):
+    exporter = InMemorySpanExporter()
+    processor = SynchronousMultiSpanProcessor()
+    processor.add_span_processor(SimpleSpanProcessor(exporter))
+    if deferred:
+        processor = DeferredAttributeSpanProcessor(processor)
+    sdk_provider = SDKTracerProvider(active_span_processor=processor, sampler=sampler)
+    return OTLPTraceProvider(sdk_provider), exporter
+
+
+class SpanAttributesTest(unittest.TestCase):
+
+    def test_limit_attribute_value(self):
+        self.assertEqual("small", limit_attribute_value("small", max_bytes=16))
+        limited = limit_attribute_value("x" * 100, max_bytes=16)
+        self.assertTrue(limited.startswith("x" * 16 + "...[truncated 100 bytes, sha256:"))
+        # multibyte characters are cut on a character boundary
+        limited = limit_attribute_value("中" * 10, max_bytes=16)
+        self.assertTrue(limited.startswith("中" * 5 + "...[truncated 30 bytes"))
+        self.assertEqual(["ab", 1], limit_attribute_value(["ab", 1], max_bytes=16))
+        self.assertEqual("x" * 100, limit_attribute_value("x" * 100, max_bytes=0))
+
+    def test_lazy_attribute_skipped_when_not_recording(self):
+        provider, exporter = build_provider(sampler=ALWAYS_OFF)
+        serializer = CountingSerializer("payload")
+        span = provider.get_tracer("test").start_span("step", attributes={"observation": lazy_attribute(serializer)})
+        span.set_attribute("actions", lazy_attribute(serializer))
+        span.end()
+        provider.force_flush()
+
+        self.assertEqual(0, serializer.calls)
+        self.assertEqual((), exporter.get_finished_spans())
+        provider.shutdown()
+
+    def test_lazy_attribute_resolved_on_export_thread(self):
+        provider, exporter = build_provider()
+        serializer = CountingSerializer("o" * 100)
+        span = provider.get_tracer("test").start_span("step", attributes={"observation": lazy_attribute(serializer)})
+        span.set_attributes({"step": 1, "actions": lazy_attribute(str, ["search"])})
+        self.assertEqual(0, serializer.calls)
+        span.end()
+        provider.force_flush()
+
+        spans = exporter.get_finished_spans()
+        self.assertEqual(1, len(spans))
+        self.assertEqual(1, serializer.calls)
+        self.assertNotEqual(threading.get_ident(), serializer.thread)
+        self.assertEqual("o" * 100, spans[0].attributes["observation"])
+        self.assertEqual("['search']", spans[0].attributes["actions"])
+        self.assertEqual(1, spans[0].attributes["step"])
+        provider.shutdown()
+
+    def test_lazy_attribute_resolved_on_end_without_deferred_processor(self):
+        provider, exporter = build_provider(deferred=False)
+        span = provider.get_tracer("test").start_span("step")
+        span.set_attribute("observation", lazy_attribute(lambda: "observed"))
+        span.end()
+
+        self.assertEqual("observed", exporter.get_finished_spans()[0].attributes["observation"])
+        provider.shutdown()
+
+    def test_snapshot_isolates_later_mutation(self):
+        provider, exporter = build_provider()
+        payload = {"content": "before"}
+        span = provider.get_tracer("test").start_span("step")
+        span.set_attribute("payload", lazy_attribute(lambda value: value["content"], payload, snapshot=True))
+        payload["content"] = None
+        span.end()
+        provider.force_flush()
+
+        self.assertEqual("before", exporter.get_finished_spans()[0].attributes["payload"])
+        provider.shutdown()
+
+    def test_current_span_lazy_attribute(self):
+        provider, exporter = build_provider()
+        serializer = CountingSerializer("observed")
+        with provider.get_tracer("test").start_as_current_span("step") as span:
+            span.set_attribute("observation", lazy_attribute(serializer))
+        provider.force_flush()
+
+        self.assertEqual("observed", exporter.get_finished_spans()[0].attributes["observation"])
+        self.assertNotEqual(threading.get_ident(), serializer.thread)
+        provider.shutdown()
+
+    def test_function_args_snapshot(self):
+        payload = {"content": "before"}
+        args = {"payload": payload}
+        pre_process_func_args(args)
+        payload["content"] = "after"
+        self.assertEqual('{"content": "before"}', args["payload"].resolve())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import unittest
+from typing import Any, Dict, List
+
+from tokenizers import Tokenizer, decoders, models, pre_tokenizers, trainers
+from transformers import PreTrainedTokenizerFast
+
+from train.adapter.common import MessageEncoder, encode_messages, encode_messages_batch
+
+# Qwen2.5 style template: default system prompt, tools in system turn, tool turns grouped as user.
+CHAT_TEMPLATE = (
+    "{%- if tools %}{{- '<|im_start|>system\\n' }}"
+    "{%- if messages[0]['role'] == 'system' %}{{- messages[0]['content'] }}"
+    "{%- else %}{{- 'You are a helpful assistant.' }}{%- endif %}"
+    "{{- '\\n\\n# Tools\\n<tools>' }}{%- for tool in tools %}{{- '\\n' }}{{- tool | tojson }}{%- endfor %}"
+    "{{- '\\n</tools><|im_end|>\\n' }}"
+    "{%- else %}{%- if messages[0]['role'] == 'system' %}"
+    "{{- '<|im_start|>system\\n' + messages[0]['content'] + '<|im_end|>\\n' }}"
+    "{%- else %}{{- '<|im_start|>system\\nYou are a helpful assistant.<|im_end|>\\n' }}{%- endif %}{%- endif %}"
+    "{%- for message in messages %}"
+    "{%- if (message.role == 'user') or (message.role == 'system' and not loop.first) "
+    "or (message.role == 'assistant' and not message.tool_calls) %}"
+    "{{- '<|im_start|>' + message.role + '\\n' + message.content + '<|im_end|>' + '\\n' }}"
+    "{%- elif message.role == 'assistant' %}{{- '<|im_start|>' + message.role }}"
+    "{%- if message.content %}{{- '\\n' + message.content }}{%- endif %}"
+    "{%- for tool_call in message.tool_calls %}{{- '\\n<tool_call>\\n{\"name\": \"' }}"
+    "{{- tool_call.function.name }}{{- '\", \"arguments\": ' }}{{- tool_call.function.arguments }}"
+    "{{- '}\\n</tool_call>' }}{%- endfor %}{{- '<|im_end|>\\n' }}"
+    "{%- elif message.role == 'tool' %}"
+    "{%- if (loop.index0 == 0) or (messages[loop.index0 - 1].role != 'tool') %}{{- '<|im_start|>user' }}{%- endif %}"
+    "{{- '\\n<tool_response>\\n' }}{{- message.content }}{{- '\\n</tool_response>' }}"
+    "{%- if loop.last or (messages[loop.index0 + 1].role != 'tool') %}{{- '<|im_end|>\\n' }}{%- endif %}"
+    "{%- endif %}{%- endfor %}"
+    "{%- if add_generation_prompt %}{{- '<|im_start|>assistant\\n' }}{%- endif %}"
+)
+
+TOOLS = [{"type": "function", "function": {"name": "search", "description": "Search the web",
+                                           "parameters": {"type": "object",
+                                                          "properties": {"query": {"type": "string"}}}}}]
+
+
+def build_tokenizer() -> PreTrainedTokenizerFast:
+    corpus = [CHAT_TEMPLATE, json.dumps(TOOLS), "What is the capital of France? Paris is the capital.",
+              "search query weather tool_response result\n\n  \n"]
+    tokenizer = Tokenizer(models.BPE())
+    tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=False)
+    tokenizer.decoder = decoders.ByteLevel()
+    trainer = trainers.BpeTrainer(vocab_size=400,
+                                  special_tokens=["<|im_start|>", "<|im_end|>"],
+                                  initial_alphabet=pre_tokenizers.ByteLevel.alphabet())
+    tokenizer.train_from_iterator(corpus, trainer=trainer)
+    fast = PreTrainedTokenizerFast(tokenizer_object=tokenizer, eos_token="<|im_end|>")
+    fast.add_special_tokens({"additional_special_tokens": ["<|im_start|>"]})
+    fast.chat_template = CHAT_TEMPLATE
+    return fast
+
+
+def reference_encode(tokenizer, messages: List[Dict[str, Any]], response_length: int = 128000, tools=None):
+    """Previous implementation: template every turn and diff the token prefix of tool turns."""
+    if tools is None:
+        tools = []
+    prompt_ids, response_ids, response_mask, chat_list = [], [], [], []
+    i = 0
+    while i < len(messages):
+        role = messages[i].get("role")
+        if role == "system":
+            chat_list.append(messages[i])
+            i += 1
+            continue
+        if role == "user":
+            chat_list.append(messages[i])
+            if i == 0 or messages[i - 1].get("role") == "system":
+                prompt_ids = tokenizer.apply_chat_template(chat_list, tools=tools, add_generation_prompt=True,
+                                                           tokenize=True, return_dict=False)
+            else:
+                ids = tokenizer.apply_chat_template(chat_list, add_generation_prompt=False, tokenize=True,
+                                                    return_dict=False)
+                response_ids += ids
+                response_mask += [0] * len(ids)
+            chat_list = []
+            i += 1
+            continue
+        if role == "assistant":
+            chat_list.append(messages[i])
+            ids = tokenizer.apply_chat_template(chat_list, add_generation_prompt=False, tokenize=True,
+                                                return_dict=False)
+            chat_list = []
+            response_ids += ids
+            response_mask += [1] * len(ids)
+            i += 1
+            continue
+        if role == "tool":
+            chat_list.append(messages[i - 1])
+            token_assistant = tokenizer.apply_chat_template(chat_list, add_generation_prompt=False, tokenize=True,
+                                                            return_dict=False)
+            while i < len(messages) and messages[i].get("role") == "tool":
+                chat_list.append(messages[i])
+                i += 1
+            token_assistant_tool = tokenizer.apply_chat_template(chat_list, add_generation_prompt=False,
+                                                                 tokenize=True, return_dict=False)
+            ids = token_assistant_tool[len(token_assistant):]
+            chat_list = []
+            response_ids += ids
+            response_mask += [0] * len(ids)
+    max_response_length = min(response_length, len(response_ids))
+    return prompt_ids, response_ids[:max_response_length], response_mask[:max_response_length]
+
+
+def tool_call(call_id: str, query: str) -> Dict[str, Any]:
+    return {"id": call_id, "type": "function",
+            "function": {"name": "search", "arguments": json.dumps({"query": query})}}
+
+
+TRAJECTORIES = {
+    "single_turn": [
+        {"role": "system", "content": "You are an agent."},
+        {"role": "user", "content": "What is the capital of France?"},
+        {"role": "assistant", "content": "Paris."},
+    ],
+    "no_system": [
+        {"role": "user", "content": "What is the capital of France?"},
+        {"role": "assistant", "content": "\n\nParis is the capital."},
+        {"role": "user", "content": "  \n and Italy?"},
+        {"role": "assistant", "content": "Rome "},
+    ],
+    "tool_calls": [
+        {"role": "system", "content": "You are an agent."},
+        {"role": "user", "content": "search weather"},
+        {"role": "assistant", "content": None, "tool_calls": [tool_call("1", "weather")]},
+        {"role": "tool", "tool_call_id": "1", "content": "sunny"},
+        {"role": "assistant", "content": "Let me check again.", "tool_calls": [tool_call("2", "weather today")]},
+        {"role": "tool", "tool_call_id": "2", "content": "\nrain\n"},
+        {"role": "assistant", "content": "It is raining."},
+    ],
+    "parallel_tool_calls": [
+        {"role": "user", "content": "search two"},
+        {"role": "assistant", "content": "", "tool_calls": [tool_call("1", "a"), tool_call("2", "b")]},
+        {"role": "tool", "tool_call_id": "1", "content": "result a"},
+        {"role": "tool", "tool_call_id": "2", "content": "result b"},
+        {"role": "assistant", "content": "done"},
+        {"role": "user", "content": "thanks"},
+    ],
+}
+
+for _trajectory in TRAJECTORIES.values():
+    for _message in _trajectory:
+        if _message.get("content") is None:
+            _message["content"] = ""
+
+
+class EncodeMessagesParityTest(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tokenizer = build_tokenizer()
+
+    def test_parity(self):
+        encoder = MessageEncoder(self.tokenizer)
+        for name, messages in TRAJECTORIES.items():
+            for tools in (None, TOOLS):
+                with self.subTest(name=name, tools=bool(tools)):
+                    self.assertEqual(encoder.encode(messages, tools=tools),
+                                     reference_encode(self.tokenizer, messages, tools=tools))
+
+    def test_response_length(self):
+        encoder = MessageEncoder(self.tokenizer)
+        messages = TRAJECTORIES["tool_calls"]
+        self.assertEqual(encoder.encode(messages, response_length=7),
+                         reference_encode(self.tokenizer, messages, response_length=7))
+
+    def test_chunks_tokenized_once(self):
+        encoder = MessageEncoder(self.tokenizer)
+        self.assertIsNotNone(encoder._split_pattern)
+        calls = []
+        encode = encoder._encode
+        encoder._encode = lambda text: calls.append(text) or encode(text)
+
+        encoder.encode(TRAJECTORIES["tool_calls"], tools=TOOLS)
+        first = len(calls)
+        encoder.encode(TRAJECTORIES["tool_calls"], tools=TOOLS)
+        self.assertEqual(len(calls), first)
+        self.assertEqual(len(calls), len(set(calls)))
+
+    async def test_encode_messages(self):
+        for name, messages in TRAJECTORIES.items():
+            result = await encode_messages(self.tokenizer, messages, tools=TOOLS)
+            self.assertEqual(result, reference_encode(self.tokenizer, messages, tools=TOOLS))
+
+        batch = await encode_messages_batch(self.tokenizer, list(TRAJECTORIES.values()), tools=TOOLS)
+        self.assertEqual(batch, [reference_encode(self.tokenizer, messages, tools=TOOLS)
+                                 for messages in TRAJECTORIES.values()])
+
+    def test_encode_continuation(self):
+        encoder = MessageEncoder(self.tokenizer)
+        placeholder = [{"role": "assistant", "content": "some random message."}]
+        prefix_ids = self.tokenizer.apply_chat_template(placeholder, tokenize=True, return_dict=False)
+        for messages in ([{"role": "user", "content": "\nnext question"}],
+                         [{"role": "tool", "tool_call_id": "1", "content": "a"},
+                          {"role": "tool", "tool_call_id": "2", "content": "b"}]):
+            full_ids = self.tokenizer.apply_chat_template(placeholder + messages, tokenize=True,
+                                                          add_generation_prompt=True, return_dict=False)
+            self.assertEqual(encoder.encode_continuation(placeholder, messages, add_generation_prompt=True),
+                             full_ids[len(prefix_ids):])
@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from aworld.core.context.base import Context, TokenIdView
+from train.adapter.rollout_llm_provider import RolloutLLMProvider, TokenIdModelResponse
+
+
+class FakeTokenizer:
+    def decode(self, token_ids, skip_special_tokens=True):
+        return " ".join(str(token_id) for token_id in token_ids)
+
+
+class FakeToolParser:
+    async def extract_tool_calls(self, content):
+        return content, []
+
+
+class JsonRolloutProvider(RolloutLLMProvider):
+    """Serializes and extends the prompt, like providers posting it to an inference server."""
+
+    def postprocess_response(self, response):
+        return response
+
+    def _get_current_step_input_token_ids(self, messages):
+        return [len(messages)]
+
+    async def agenerate(self, input_ids, temperature=0.0, max_tokens=None, stop=None, **kwargs):
+        # a view over the trajectory buffer, the history is not copied per step
+        self.views.append(input_ids)
+        self.payloads.append(json.loads(json.dumps({"input_ids": input_ids.copy()})))
+        self.extended = input_ids + [0]
+        return TokenIdModelResponse(output_token_ids=[100 + len(self.payloads)])
+
+
+class RolloutLLMProviderTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_agenerate_gets_a_view(self):
+        provider = JsonRolloutProvider(params={"tokenizer": FakeTokenizer(), "tool_parser": FakeToolParser()})
+        provider.payloads = []
+        provider.views = []
+        context = Context()
+        context.agent_info["current_agent_id"] = "agent"
+
+        messages = [{"role": "user", "content": "question"}]
+        for response in ("101", "102"):
+            context.get_agent_token_id_traj().new_step()
+            result = await provider.acompletion(messages, context=context)
+            self.assertEqual(response, result.content)
+            messages = messages + [{"role": "assistant", "content": result.content},
+                                   {"role": "user", "content": "next"}]
+
+        self.assertEqual([{"input_ids": [1]}, {"input_ids": [1, 101, 3]}], provider.payloads)
+        self.assertEqual([1, 101, 3, 0], provider.extended)
+        self.assertTrue(all(isinstance(view, TokenIdView) for view in provider.views))
+        trajectory = context.get_agent_token_id_traj()
+        self.assertIsInstance(trajectory.all_token_id_seq, list)
+        self.assertEqual([1, 101, 3, 102], trajectory.all_token_id_seq)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import copy
 import unittest
 import json
 from typing import Dict, List
@@ -26,3 +27,26 @@ class SingleStepTest(unittest.IsolatedAsyncioTestCase):
         agent_token_id_traj: Dict[str, List[AgentTokenIdTrajectory]] = {}
         agent_token_id_traj["agent_1"] = [trajectory]
         print(json.dumps(to_serializable(agent_token_id_traj)))
+
+    def test_token_buffer(self):
+        trajectory = AgentTokenIdTrajectory(agent_id="agent_1")
+        trajectory.new_step()
+        prompt = trajectory.stage_input([1, 2])
+        trajectory.commit_llm_call([1, 2], [3])
+        trajectory.new_step()
+
+        # failed call is rolled back, the retried one stages again
+        trajectory.stage_input([4])
+        trajectory.rollback_input()
+        second_prompt = trajectory.stage_input([4, 5])
+        trajectory.commit_llm_call([4, 5], [6, 7])
+
+        self.assertEqual(prompt, [1, 2])
+        self.assertEqual(second_prompt, [1, 2, 3, 4, 5])
+        self.assertEqual(second_prompt.copy(), [1, 2, 3, 4, 5])
+        self.assertEqual(list(trajectory.all_token_id_seq), [1, 2, 3, 4, 5, 6, 7])
+
+        trajectory.get_current_step().prompt_token_ids = second_prompt
+        data = json.loads(json.dumps(to_serializable({"agent_1": [copy.deepcopy(trajectory)]})))
+        self.assertEqual(data["agent_1"][0]["all_token_id_seq"], [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(data["agent_1"][0]["token_id_steps"][1]["prompt_token_ids"], [1, 2, 3, 4, 5])
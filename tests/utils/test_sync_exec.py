@@ -0,0 +1,64 @@
+import asyncio
+import contextvars
+import unittest
+
+from aworld.utils.common import sync_exec, background_loop, BackgroundLoop
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+async def running_loop(timeout: float = 0):
+    await asyncio.sleep(timeout)
+    return asyncio.get_running_loop()
+
+
+async def read_request_id():
+    return request_id.get()
+
+
+async def fail():
+    raise ValueError("fail")
+
+
+async def nested():
+    return sync_exec(running_loop)
+
+
+class SyncExecTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_reuses_background_loop(self):
+        loops = {sync_exec(running_loop) for _ in range(20)}
+        self.assertEqual({background_loop().loop}, loops)
+        self.assertIsNot(asyncio.get_running_loop(), background_loop().loop)
+
+    async def test_context_and_arguments(self):
+        request_id.set("r1")
+        self.assertEqual("r1", sync_exec(read_request_id))
+        # the arguments of the function are not taken by sync_exec
+        self.assertIsNotNone(sync_exec(running_loop, timeout=0.01))
+        with self.assertRaises(ValueError):
+            sync_exec(fail)
+
+    async def test_nested_in_background_loop(self):
+        loop = sync_exec(nested)
+        self.assertIsNot(background_loop().loop, loop)
+
+
+class BackgroundLoopTest(unittest.TestCase):
+
+    def test_timeout_and_shutdown(self):
+        runner = BackgroundLoop(max_concurrency=2)
+        with self.assertRaises(TimeoutError):
+            runner.submit(running_loop, (5,), timeout=0.05)
+        self.assertIs(runner.loop, runner.submit(running_loop))
+
+        loop = runner.loop
+        runner.shutdown()
+        self.assertTrue(loop.is_closed())
+        # started again on demand
+        self.assertIsNotNone(runner.submit(running_loop))
+        runner.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,16 @@
 import asyncio
 import json
 import os
+import re
+import threading
 import traceback
+import weakref
+from collections import OrderedDict
 from typing import List, Dict, Any, Tuple, Optional
 from transformers import AutoTokenizer
 
+from aworld.logs.util import logger
+
 def turns_num(messages: List[Dict[str, Any]]) -> int:
     # Normalize messages to satisfy chat templates expectations
     def _normalize_message(msg: Dict[str, Any]) -> Dict[str, Any]:
@@ -44,124 +50,276 @@ def turns_num(messages: List[Dict[str, Any]]) -> int:
     return num_turns
 
 
-async def encode_messages(tokenizer: AutoTokenizer,
-                          messages: List[Dict[str, Any]],
-                          response_length: int = 128000,
-                          tools: Dict[str, Any] = None,
-                          chat_template: Optional[str] = None) -> Tuple[List[int], List[int], List[int]]:
-    """Encode messages to IDs.
+class MessageEncoder:
+    """Incremental, linear-time encoder of OpenAI-format messages into training token ids.
 
-    Args:
-        tokenizer (AutoTokenizer): Tokenizer for tokenize messages.
-        messages (List[Dict[str, Any]]): List of messages in OpenAI request format.
-        response_length (int): Max length of response.
-        tools: Tool list used by the agent.
+    Produces exactly the ids of templating every turn with `tokenizer.apply_chat_template`, but:
+    - renders the chat template to text and tokenizes each new piece of text once; the tool
+      response turn reuses the rendered assistant turn instead of templating it again and
+      diffing the token prefix;
+    - splits rendered text after added/special tokens (where HF tokenizers split anyway) and
+      caches the ids of every chunk, so template prefixes shared across turns and trajectories
+      (default system prompt, tool schemas, role headers) are tokenized once per role and tools.
 
-    Returns:
-        prompt_ids, response_ids, response_mask.
+    Exact parity relies on added tokens not stripping surrounding whitespace (`lstrip`/`rstrip`),
+    which holds for the chat tokens of common templates.
     """
-    # Ensure tools is iterable for chat templates that iterate over tools
-    if tools is None:
-        tools = []
 
-    if not messages:
-        return [], [], []
+    def __init__(self, tokenizer: AutoTokenizer, chat_template: Optional[str] = None, max_cached_chunks: int = 8192):
+        self.tokenizer = tokenizer
+        self.chat_template = chat_template
+        self.max_cached_chunks = max_cached_chunks
+        self._chunk_ids: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._prefixes: Dict[str, Tuple[str, List[int]]] = {}
+        self._lock = threading.Lock()
+        self._added_tokens: Tuple[str, ...] = self._get_added_tokens(tokenizer)
+        self._split_pattern = None
+        if self._added_tokens:
+            # longest first so that overlapping tokens match greedily like the tokenizer trie
+            alternatives = "|".join(re.escape(token) for token in self._added_tokens)
+            self._split_pattern = re.compile(f"(?:{alternatives})")
+            if not self._chunking_matches_tokenizer():
+                logger.warning(f"{type(tokenizer).__name__} does not split on added tokens, chunk cache disabled.")
+                self._added_tokens = ()
+                self._split_pattern = None
 
-    prompt_ids = []
-    response_ids = []
-    response_mask = []
-    chat_list = []
-    loop = asyncio.get_running_loop()
-    # system_prompt_prefix_ids = self.tokenizer.apply_chat_template([{}], add_generation_prompt=False, tokenize=True)
-    i = 0
-    print(f"tokenizer={tokenizer}")
-    try:
+    @staticmethod
+    def _get_added_tokens(tokenizer) -> Tuple[str, ...]:
+        try:
+            if hasattr(tokenizer, "get_added_vocab"):
+                added_tokens = list(tokenizer.get_added_vocab().keys())
+            else:
+                added_tokens = list(getattr(tokenizer, "all_special_tokens", []) or [])
+        except Exception:
+            added_tokens = []
+        return tuple(sorted((token for token in added_tokens if token), key=len, reverse=True))
+
+    def _chunking_matches_tokenizer(self) -> bool:
+        probe = [{"role": "system", "content": "probe"},
+                 {"role": "user", "content": " \n probe"},
+                 {"role": "assistant", "content": "\n\nprobe "}]
+        try:
+            text = self.render(probe)
+            return self.tokenize(text) == self._encode(text)
+        except Exception:
+            return False
+
+    def render(self, messages: List[Dict[str, Any]], add_generation_prompt: bool = False, tools=None) -> str:
+        kwargs = {}
+        if tools is not None:
+            kwargs["tools"] = tools
+        return self.tokenizer.apply_chat_template(messages,
+                                                  add_generation_prompt=add_generation_prompt,
+                                                  tokenize=False,
+                                                  chat_template=self.chat_template,
+                                                  **kwargs)
+
+    def tokenize(self, text: str) -> List[int]:
+        """Tokenize rendered template text, chunk by chunk with a per-chunk id cache."""
+        if not text:
+            return []
+        if self._split_pattern is None:
+            return self._encode(text)
+        ids = []
+        start = 0
+        for match in self._split_pattern.finditer(text):
+            ids.extend(self._chunk(text[start:match.end()]))
+            start = match.end()
+        if start < len(text):
+            ids.extend(self._chunk(text[start:]))
+        return ids
+
+    def is_boundary(self, text: str, pos: int) -> bool:
+        """Whether tokenizing `text[:pos]` and `text[pos:]` separately yields the ids of `text`."""
+        if pos <= 0 or pos >= len(text):
+            return True
+        if not self._added_tokens:
+            return False
+        return text.startswith(self._added_tokens, pos) or text.endswith(self._added_tokens, 0, pos)
+
+    def encode_continuation(self,
+                            prefix_messages: List[Dict[str, Any]],
+                            messages: List[Dict[str, Any]],
+                            add_generation_prompt: bool = False) -> List[int]:
+        """Token ids that templating `messages` adds after `prefix_messages`.
+
+        Same as templating both and slicing off the prefix ids, but the prefix is rendered and
+        tokenized once per encoder and only the new text is tokenized.
+        """
+        key = json.dumps(prefix_messages, sort_keys=True, ensure_ascii=False)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prefix_text = self.render(prefix_messages)
+            prefix = (prefix_text, self.tokenize(prefix_text))
+            self._prefixes[key] = prefix
+        prefix_text, prefix_ids = prefix
+        text = self.render(prefix_messages + messages, add_generation_prompt=add_generation_prompt)
+        if text.startswith(prefix_text) and self.is_boundary(text, len(prefix_text)):
+            return self.tokenize(text[len(prefix_text):])
+        return self.tokenize(text)[len(prefix_ids):]
+
+    def encode(self,
+               messages: List[Dict[str, Any]],
+               response_length: int = 128000,
+               tools=None) -> Tuple[List[int], List[int], List[int]]:
+        """Encode one trajectory, see `encode_messages`."""
+        if tools is None:
+            tools = []
+        if not messages:
+            return [], [], []
+
+        prompt_ids = []
+        response_ids = []
+        response_mask = []
+        chat_list = []
+        # rendered text of the last single assistant turn, reused by the following tool turn
+        last_assistant: Tuple[int, str] = (-1, "")
+        i = 0
         while i < len(messages):
-            if messages[i].get("role") == "system":
+            role = messages[i].get("role")
+            if role == "system":
                 chat_list.append(messages[i])
                 i += 1
                 continue
             # initial chat completion
-            if messages[i].get("role") == "user":
+            if role == "user":
+                chat_list.append(messages[i])
                 if i == 0 or messages[i - 1].get("role") == "system":
-                    chat_list.append(messages[i])
-                    prompt_ids = await loop.run_in_executor(
-                        None,
-                        lambda: tokenizer.apply_chat_template(
-                            chat_list,
-                            tools=tools,
-                            add_generation_prompt=True,
-                            tokenize=True,
-                            chat_template=chat_template
-                        ),
-                    )
+                    prompt_ids = self.tokenize(self.render(chat_list, add_generation_prompt=True, tools=tools))
                 else:
-                    chat_list.append(messages[i])
-                    cur_response_ids = await loop.run_in_executor(
-                        None,
-                        lambda: tokenizer.apply_chat_template(
-                            chat_list,
-                            add_generation_prompt=False,
-                            tokenize=True,
-                            chat_template=chat_template
-                        ),
-                    )
+                    cur_response_ids = self.tokenize(self.render(chat_list))
                     response_ids += cur_response_ids
                     response_mask += [0] * len(cur_response_ids)
                 chat_list = []
                 i += 1
                 continue
             # assistant message
-            if messages[i].get("role") == "assistant":
+            if role == "assistant":
+                single_turn = not chat_list
                 chat_list.append(messages[i])
-                cur_response_ids = await loop.run_in_executor(
-                    None,
-                    lambda: tokenizer.apply_chat_template(
-                        chat_list,
-                        add_generation_prompt=False,
-                        tokenize=True,
-                        chat_template=chat_template
-                    ),
-                )
+                text = self.render(chat_list)
+                if single_turn:
+                    last_assistant = (i, text)
+                cur_response_ids = self.tokenize(text)
                 chat_list = []
                 response_ids += cur_response_ids
                 response_mask += [1] * len(cur_response_ids)
                 i += 1
                 continue
             # follow up chat completion with tool response:
-            if messages[i].get("role") == "tool":
-                last_assistant_message = messages[i - 1]
-                chat_list.append(last_assistant_message)
-                token_assistant = await loop.run_in_executor(
-                    None,
-                    lambda: tokenizer.apply_chat_template(
-                        chat_list,
-                        add_generation_prompt=False,
-                        tokenize=True,
-                        chat_template=chat_template
-                    ),
-                )
+            if role == "tool":
+                if not chat_list and last_assistant[0] == i - 1:
+                    assistant_text = last_assistant[1]
+                    chat_list.append(messages[i - 1])
+                else:
+                    chat_list.append(messages[i - 1])
+                    assistant_text = self.render(chat_list)
                 while i < len(messages) and messages[i].get("role") == "tool":
                     chat_list.append(messages[i])
                     i += 1
-                token_assistant_tool = await loop.run_in_executor(
-                    None,
-                    lambda: tokenizer.apply_chat_template(
-                        chat_list,
-                        add_generation_prompt=False,
-                        tokenize=True,
-                        chat_template=chat_template
-                    ),
-                )
-                tool_response_ids = token_assistant_tool[len(token_assistant):]
+                full_text = self.render(chat_list)
+                prefix_len = len(assistant_text)
+                if full_text.startswith(assistant_text) and self.is_boundary(full_text, prefix_len):
+                    tool_response_ids = self.tokenize(full_text[prefix_len:])
+                else:
+                    tool_response_ids = self.tokenize(full_text)[len(self.tokenize(assistant_text)):]
                 chat_list = []
                 response_ids += tool_response_ids
                 response_mask += [0] * len(tool_response_ids)
-    except Exception as e:
-        raise Exception(f"Failed to convert messages to agentloop_output: {messages}. {traceback.format_exc()}")
+                continue
+            raise ValueError(f"Unsupported message role: {role}")
+
+        max_response_length = min(response_length, len(response_ids))
+        return prompt_ids, response_ids[:max_response_length], response_mask[:max_response_length]
+
+    def encode_batch(self,
+                     trajectories: List[List[Dict[str, Any]]],
+                     response_length: int = 128000,
+                     tools=None) -> List[Tuple[List[int], List[int], List[int]]]:
+        return [self.encode(messages, response_length=response_length, tools=tools) for messages in trajectories]
 
-    max_response_length = min(response_length, len(response_ids))
-    return prompt_ids, response_ids[:max_response_length], response_mask[:max_response_length]
+    def _chunk(self, chunk: str) -> List[int]:
+        with self._lock:
+            ids = self._chunk_ids.get(chunk)
+            if ids is not None:
+                self._chunk_ids.move_to_end(chunk)
+                return ids
+        ids = self._encode(chunk)
+        with self._lock:
+            self._chunk_ids[chunk] = ids
+            if len(self._chunk_ids) > self.max_cached_chunks:
+                self._chunk_ids.popitem(last=False)
+        return ids
+
+    def _encode(self, text: str) -> List[int]:
+        return list(self.tokenizer.encode(text, add_special_tokens=False))
+
+
+_encoders: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_encoders_lock = threading.Lock()
+
+
+def get_message_encoder(tokenizer: AutoTokenizer, chat_template: Optional[str] = None) -> MessageEncoder:
+    """Process-wide encoder of the tokenizer and template, sharing its chunk cache across trajectories."""
+    with _encoders_lock:
+        try:
+            per_template = _encoders.setdefault(tokenizer, {})
+        except TypeError:
+            # tokenizer not weak-referenceable, no sharing
+            return MessageEncoder(tokenizer, chat_template)
+        encoder = per_template.get(chat_template)
+        if encoder is None:
+            encoder = MessageEncoder(tokenizer, chat_template)
+            per_template[chat_template] = encoder
+        return encoder
+
+
+async def encode_messages(tokenizer: AutoTokenizer,
+                          messages: List[Dict[str, Any]],
+                          response_length: int = 128000,
+                          tools: Dict[str, Any] = None,
+                          chat_template: Optional[str] = None) -> Tuple[List[int], List[int], List[int]]:
+    """Encode messages to IDs.
+
+    Args:
+        tokenizer (AutoTokenizer): Tokenizer for tokenize messages.
+        messages (List[Dict[str, Any]]): List of messages in OpenAI request format.
+        response_length (int): Max length of response.
+        tools: Tool list used by the agent.
+
+    Returns:
+        prompt_ids, response_ids, response_mask.
+    """
+    if not messages:
+        return [], [], []
+
+    results = await encode_messages_batch(tokenizer,
+                                          [messages],
+                                          response_length=response_length,
+                                          tools=tools,
+                                          chat_template=chat_template)
+    return results[0]
+
+
+async def encode_messages_batch(tokenizer: AutoTokenizer,
+                                trajectories: List[List[Dict[str, Any]]],
+                                response_length: int = 128000,
+                                tools: Dict[str, Any] = None,
+                                chat_template: Optional[str] = None) -> List[Tuple[List[int], List[int], List[int]]]:
+    """Encode many trajectories in one executor call, same output as `encode_messages` per trajectory.
+
+    Returns:
+        List of (prompt_ids, response_ids, response_mask), in the order of `trajectories`.
+    """
+    encoder = get_message_encoder(tokenizer, chat_template)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            None,
+            lambda: encoder.encode_batch(trajectories, response_length=response_length, tools=tools)
+        )
+    except Exception as e:
+        raise Exception(f"Failed to convert messages to agentloop_output: {trajectories}. {traceback.format_exc()}")
 
 
 def get_agent_tool_env_and_servers(
@@ -3,13 +3,16 @@ import abc
 import uuid
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Literal
+from typing import List, Dict, Literal, Sequence
 
 from aworld.core.llm_provider import LLMProviderBase
 from aworld.models.model_response import ModelResponse, ToolCall, Function
 from aworld.utils.common import sync_exec
 from aworld.core.context.base import Context
 from aworld.logs.util import logger
+from train.adapter.common import get_message_encoder
+
+PLACEHOLDER_MESSAGES = [{"role": "assistant", "content": "some random message."}]
 
 
 @dataclass
@@ -47,13 +50,16 @@ class RolloutLLMProvider(LLMProviderBase):
         pass
 
     @abc.abstractmethod
-    async def agenerate(self, input_ids: List[int],
+    async def agenerate(self, input_ids: Sequence[int],
                         temperature: float = 0.0,
                         max_tokens: int = None,
                         stop: List[str] = None,
                         **kwargs) -> TokenIdModelResponse:
         """
         Generate token ids asynchronously.
+
+        `input_ids` is a read-only view over the token buffer of the trajectory, valid during the call;
+        implementations copy it (`input_ids.copy()`) to keep or modify it.
         """
 
     def completion(self, messages: List[Dict[str, str]], temperature: float = 0.0, max_tokens: int = None,
@@ -71,8 +77,13 @@ class RolloutLLMProvider(LLMProviderBase):
         current_step_input_token_ids = await loop.run_in_executor(None, self._get_current_step_input_token_ids, messages)
         current_agent_token_id_traj = context.get_agent_token_id_traj()
 
-        input_ids = current_agent_token_id_traj.all_token_id_seq + current_step_input_token_ids
-        token_id_response = await self.agenerate(input_ids, temperature, max_tokens, stop, **kwargs)
+        # prompt is a view over the trajectory token buffer, no per-step copy of the history is kept
+        input_ids = current_agent_token_id_traj.stage_input(current_step_input_token_ids)
+        try:
+            token_id_response = await self.agenerate(input_ids, temperature, max_tokens, stop, **kwargs)
+        except BaseException:
+            current_agent_token_id_traj.rollback_input()
+            raise
 
         content = await loop.run_in_executor(
             None,
@@ -96,11 +107,12 @@ class RolloutLLMProvider(LLMProviderBase):
         Get the token ids of the current step input.
         Only use messages after the last assistant message.
         """
-        # Find the last assistant message
+        # Find the last assistant message, scanning back only over the new messages
         last_assistant_index = -1
-        for i, message in enumerate(messages):
-            if message.get('role') == 'assistant':
+        for i in range(len(messages) - 1, -1, -1):
+            if messages[i].get('role') == 'assistant':
                 last_assistant_index = i
+                break
 
         # Get messages after the last assistant message
         # If no assistant message found, use all messages
@@ -111,12 +123,13 @@ class RolloutLLMProvider(LLMProviderBase):
     def apply_chat_template(self, messages: List[Dict[str, str]]) -> List[int]:
         """
         Apply the chat template to the messages.
+
+        Returns the tokens the messages add after a placeholder assistant turn, the placeholder
+        prefix is rendered and tokenized once per tokenizer and template.
         """
-        placeholder_messages = [{"role": "assistant", "content": "some random message."}]
-        s1 = self.tokenizer.apply_chat_template(placeholder_messages, tokenize=True)
-        messages = placeholder_messages + messages
-        s2 = self.tokenizer.apply_chat_template(messages, tokenize=True, add_generation_prompt=True)
-        return s2[len(s1):]
+        return get_message_encoder(self.tokenizer).encode_continuation(PLACEHOLDER_MESSAGES,
+                                                                       messages,
+                                                                       add_generation_prompt=True)
 
 
 class HermesToolParser: